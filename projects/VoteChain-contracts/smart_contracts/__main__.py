@@ -4,7 +4,7 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from smart_contracts._helpers.build import build
+from smart_contracts._helpers.build import build_all, verify_build
 from smart_contracts._helpers.config import contracts
 from smart_contracts._helpers.deploy import deploy
 
@@ -34,9 +34,9 @@ def main(action: str, contract_name: str | None = None) -> None:
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            # Contracts are built concurrently (logs are written per contract as its build finishes)
+            logger.info(f"Building apps at {[str(contract.path) for contract in filtered_contracts]}")
+            build_all([(artifact_path / contract.name, contract.path) for contract in filtered_contracts])
         case "deploy":
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
@@ -52,19 +52,145 @@ def main(action: str, contract_name: str | None = None) -> None:
                     raise Exception("Could not deploy app, .arc32.json file not found")
                 app_spec_path = output_dir / app_spec_file_name
                 if contract.deploy:
+                    # Refuse to deploy artifacts that were not built from the current contract sources
+                    verify_build(output_dir, contract.path)
                     logger.info(f"Deploying app {contract.name}")
                     deploy(app_spec_path, contract.deploy)
         case "all":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                app_spec_path = build(artifact_path / contract.name, contract.path)
+            # Every contract is built before the first deploy, deploys run in order
+            logger.info(f"Building apps at {[str(contract.path) for contract in filtered_contracts]}")
+            app_spec_paths = build_all(
+                [(artifact_path / contract.name, contract.path) for contract in filtered_contracts]
+            )
+            for contract, app_spec_path in zip(filtered_contracts, app_spec_paths, strict=True):
                 if contract.deploy:
                     logger.info(f"Deploying {contract.path.name}")
                     deploy(app_spec_path, contract.deploy)
 
 
+def sweep(app_id: int, poll_id: int) -> None:
+    # Imported here so building does not depend on a previously generated App client
+    from algokit_utils import get_account, get_algod_client
+
+    from smart_contracts.artifacts.vote_chain.vote_chain_client import VoteChainClient
+    from smart_contracts.vote_chain.sweep import sweep_poll
+
+    # The deployer account is the App creator, the only account allowed to sweep
+    algod_client = get_algod_client()
+    creator = get_account(algod_client, "DEPLOYER", fund_with_algos=0)
+    app_client = VoteChainClient(
+        algod_client=algod_client,
+        app_id=app_id,
+        sender=creator.address,
+        signer=creator.signer,
+    )
+
+    logger.info(f"Sweeping ballot boxes of poll {poll_id} in App {app_id}")
+    swept_total = sweep_poll(app_client, poll_id)
+    logger.info(f"Sweep complete, {swept_total} ballot boxes released")
+
+
+def follow(app_id: int, start_round: int | None = None) -> None:
+    from algokit_utils import get_algod_client
+
+    from smart_contracts.vote_chain.follower import BlockFollower
+
+    # The checkpoint lets a restarted follower resume where it stopped
+    follower = BlockFollower(
+        get_algod_client(),
+        app_id,
+        start_round=start_round,
+        checkpoint_path=Path(f"follower_{app_id}.json"),
+    )
+
+    for update in follower.follow():
+        if update.has_events:
+            tallies = {poll_id: poll.tally for poll_id, poll in update.state.polls.items()}
+            logger.info(f"Round {update.round_num}: {update.votes} new votes, tallies {tallies}")
+
+
+def export(app_id: int, output_path: Path, poll_id: int | None = None) -> None:
+    from algokit_utils import get_indexer_client
+
+    from smart_contracts.vote_chain.export import export_vote_history
+
+    # The output format follows the file extension ('.csv' or '.parquet')
+    logger.info(f"Exporting vote history of App {app_id} to {output_path}")
+    export_vote_history(get_indexer_client(), app_id, output_path, poll_id)
+
+
+def load(app_id: int, voter_count: int, rate: float, *, in_process: bool = False) -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    from algokit_utils import (
+        Account,
+        get_account,
+        get_algod_client,
+        get_default_localnet_config,
+        get_localnet_default_account,
+    )
+    from algokit_utils.beta.account_manager import AddressAndSigner
+
+    from smart_contracts.artifacts.vote_chain.vote_chain_client import VoteChainClient
+    from smart_contracts.vote_chain.loadgen import AlgodTarget, InProcessTarget, LoadGenerator, LoadTarget
+
+    target: LoadTarget
+    if in_process:
+        # The in-process stand-in answers every algod call (no node, the contract is not evaluated), the algod client
+        # is only handed to the App client that builds the transactions and is never contacted
+        target = InProcessTarget()
+        algod_client = get_algod_client(get_default_localnet_config("algod"))
+        account = Account.new_account()
+        creator = AddressAndSigner(address=account.address, signer=account.signer)
+        funder = creator
+    else:
+        # The deployer account is the App creator (sets up the load poll), the localnet dispenser funds the voters
+        target = AlgodTarget(algod_client := get_algod_client())
+        deployer = get_account(algod_client, "DEPLOYER", fund_with_algos=0)
+        dispenser = get_localnet_default_account(algod_client)
+        creator = AddressAndSigner(address=deployer.address, signer=deployer.signer)
+        funder = AddressAndSigner(address=dispenser.address, signer=dispenser.signer)
+
+    app_client = VoteChainClient(
+        algod_client=algod_client,
+        app_id=app_id,
+        sender=creator.address,
+        signer=creator.signer,
+    )
+
+    with ProcessPoolExecutor() as signing_pool:
+        generator = LoadGenerator(app_client, funder, target, signing_pool)
+        if in_process:
+            # The stand-in keeps no App state, the votes target the first poll ID
+            poll_id = 0
+        else:
+            poll_id = generator.setup_poll(app_client.get_global_state().next_poll_id)
+
+        # Every wave logs its report (confirmed TPS, latency percentiles and failure reasons)
+        logger.info(f"Running {voter_count} voters at {rate} TPS against poll {poll_id} of App {app_id}")
+        generator.run(voter_count, rate, poll_id)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
+    # Usage: python -m smart_contracts sweep <app_id> <poll_id>
+    if len(sys.argv) > 3 and sys.argv[1] == "sweep":
+        sweep(int(sys.argv[2]), int(sys.argv[3]))
+    # Usage: python -m smart_contracts follow <app_id> [start_round]
+    elif len(sys.argv) > 2 and sys.argv[1] == "follow":
+        follow(int(sys.argv[2]), int(sys.argv[3]) if len(sys.argv) > 3 else None)
+    # Usage: python -m smart_contracts export <app_id> <output_path.csv|.parquet> [poll_id]
+    elif len(sys.argv) > 3 and sys.argv[1] == "export":
+        export(int(sys.argv[2]), Path(sys.argv[3]), int(sys.argv[4]) if len(sys.argv) > 4 else None)
+    # Usage: python -m smart_contracts load [--in-process] <app_id> <voters> [rate]
+    elif len(sys.argv) > 1 and sys.argv[1] == "load":
+        load_args = [arg for arg in sys.argv[2:] if arg != "--in-process"]
+        load(
+            int(load_args[0]),
+            int(load_args[1]),
+            float(load_args[2]) if len(load_args) > 2 else 100.0,
+            in_process="--in-process" in sys.argv[2:],
+        )
+    elif len(sys.argv) > 2:
         main(sys.argv[1], sys.argv[2])
     elif len(sys.argv) > 1:
         main(sys.argv[1])
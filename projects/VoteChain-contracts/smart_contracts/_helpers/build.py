@@ -1,10 +1,44 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import ast
+import dataclasses
+import hashlib
+import json
 import logging
+import os
 import subprocess
+import typing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from importlib import metadata
 from pathlib import Path
 from shutil import rmtree
 
 logger = logging.getLogger(__name__)
 deployment_extension = "py"
+client_extensions = (deployment_extension,)  # Typed clients generated per contract (in parallel)
+
+# Set to "1" to also generate a TypeScript client per contract (off by default, it needs Node.js for 'npx')
+typescript_client_env = "VOTECHAIN_TS_CLIENT"
+
+# Written next to the artifacts, records what they were built from (see 'verify_build')
+manifest_file_name = "build.manifest.json"
+
+# Packages whose versions change the artifacts (the compiler and the typed client generator)
+toolchain_packages = ("puyapy", "algokit-client-generator")
+
+
+@dataclasses.dataclass
+class BuildResult:
+    contract_path: Path
+    app_spec_path: Path | None  # None if the build failed
+    logs: list[str]  # Log lines of the build, kept together per contract
+    error: str | None = None
+
+
+class BuildManifest(typing.TypedDict):
+    build_hash: str  # Hash of the sources and toolchain versions below
+    sources: dict[str, str]  # Contract module and imported project modules (path -> SHA-256)
+    toolchain: dict[str, str]  # Package -> version
+    artifacts: dict[str, str]  # Artifact file name -> SHA-256
 
 
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
@@ -15,8 +49,189 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+# Returns the project directory (the one holding 'pyproject.toml'), module names are resolved from it. Packages may
+# leave out '__init__.py' (namespace packages), so the package layout can not tell where the project starts
+def _get_root_dir(module_path: Path) -> Path:
+    for root_dir in module_path.resolve().parents:
+        if (root_dir / "pyproject.toml").is_file():
+            return root_dir
+    raise Exception(f"No pyproject.toml found above {module_path}")
+
+
+# Returns the module files of the project imported by a module (absolute 'smart_contracts.*' and relative imports)
+def _get_local_imports(module_path: Path, root_dir: Path) -> list[Path]:
+    imported_paths = []
+    for node in ast.walk(ast.parse(module_path.read_bytes())):
+        if not isinstance(node, ast.ImportFrom | ast.Import):
+            continue
+
+        if isinstance(node, ast.Import):
+            module_names = [alias.name for alias in node.names]
+        elif node.level:
+            package_parts = module_path.relative_to(root_dir).parent.parts
+            package_parts = package_parts[: len(package_parts) - node.level + 1]
+            base = ".".join([*package_parts, *([node.module] if node.module else [])])
+            module_names = [base] + [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            module_names = [node.module or ""] + [f"{node.module}.{alias.name}" for alias in node.names]
+
+        for module_name in module_names:
+            module_file = root_dir.joinpath(*module_name.split("."))
+            for candidate in (module_file.with_suffix(".py"), module_file / "__init__.py"):
+                if module_name and candidate.is_file():
+                    imported_paths.append(candidate)
+
+    return imported_paths
+
+
+# Returns the contract module and every project module it (transitively) imports, the sources the compiler reads
+def _get_source_paths(contract_path: Path) -> list[Path]:
+    contract_path = contract_path.resolve()
+    root_dir = _get_root_dir(contract_path)
+    source_paths = {contract_path}
+    pending = [contract_path]
+    while pending:
+        for imported_path in _get_local_imports(pending.pop(), root_dir):
+            if imported_path not in source_paths:
+                source_paths.add(imported_path)
+                pending.append(imported_path)
+
+    return sorted(source_paths)
+
+
+def _get_toolchain_versions() -> dict[str, str]:
+    versions = {}
+    for package in toolchain_packages:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = "unknown"
+
+    # The compiler may come w/ AlgoKit instead of the project environment, ask the CLI (slower) in that case
+    if versions["puyapy"] == "unknown":
+        version_result = subprocess.run(
+            ["algokit", "--no-color", "compile", "python", "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        versions["puyapy"] = version_result.stdout.strip()
+
+    return versions
+
+
+def _hash_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+# Returns the hash of the sources and toolchain versions, the artifacts of a matching build are still fresh
+def _get_build_inputs(contract_path: Path) -> tuple[str, dict[str, str], dict[str, str]]:
+    root_dir = _get_root_dir(contract_path)
+    sources = {
+        path.relative_to(root_dir).as_posix(): _hash_file(path)
+        for path in _get_source_paths(contract_path)
+    }
+    toolchain = _get_toolchain_versions()
+    build_hash = hashlib.sha256(
+        json.dumps({"sources": sources, "toolchain": toolchain}, sort_keys=True).encode()
+    ).hexdigest()
+
+    return build_hash, sources, toolchain
+
+
+# Returns the hashes of the build artifacts (the manifest itself is not build output)
+def _hash_artifacts(output_dir: Path) -> dict[str, str]:
+    return {
+        file.name: _hash_file(file)
+        for file in sorted(output_dir.iterdir())
+        if file.is_file() and file.name != manifest_file_name
+    }
+
+
+def _read_manifest(output_dir: Path) -> BuildManifest | None:
+    manifest_path = output_dir / manifest_file_name
+    if not manifest_path.exists():
+        return None
+
+    manifest: BuildManifest = json.loads(manifest_path.read_text())
+    return manifest
+
+
+def _get_app_spec_path(output_dir: Path) -> Path:
+    app_spec_path = next(output_dir.glob("*.arc32.json"), None)
+    return app_spec_path if app_spec_path else output_dir
+
+
+# Returns None if the artifacts match the manifest and the current build inputs, the reason they are stale otherwise
+def _get_stale_reason(output_dir: Path, build_hash: str) -> str | None:
+    manifest = _read_manifest(output_dir)
+    if manifest is None:
+        return "no build manifest"
+    if manifest["build_hash"] != build_hash:
+        return "contract sources or toolchain changed"
+    if manifest["artifacts"] != _hash_artifacts(output_dir):
+        return "artifacts were modified"
+    return None
+
+
+def verify_build(output_dir: Path, contract_path: Path) -> None:
+    """Raises if the artifacts in the output directory were not built from the current contract sources"""
+
+    output_dir = output_dir.resolve()
+    build_hash, _, _ = _get_build_inputs(contract_path.resolve())
+    stale_reason = _get_stale_reason(output_dir, build_hash)
+    if stale_reason is not None:
+        raise Exception(
+            f"Artifacts in {output_dir} are stale ({stale_reason}), run 'algokit project run build' first"
+        )
+
+
+# Returns the typed client extensions to generate (read per build, so a value loaded from '.env' is used)
+def _get_client_extensions() -> tuple[str, ...]:
+    if os.environ.get(typescript_client_env) == "1":
+        return (*client_extensions, "ts")
+    return client_extensions
+
+
+def _generate_client(output_dir: Path, extension: str) -> Path:
+    output_path = _get_output_path(output_dir, extension)
+    generate_result = subprocess.run(
+        [
+            "algokit",
+            "generate",
+            "client",
+            output_dir,
+            "--output",
+            output_path,
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    if generate_result.returncode:
+        if "No such command" in generate_result.stdout:
+            raise Exception(
+                "Could not generate typed client, requires AlgoKit 2.0.0 or "
+                "later. Please update AlgoKit"
+            )
+        else:
+            raise Exception(
+                f"Could not generate typed client:\n{generate_result.stdout}"
+            )
+
+    return output_path
+
+
+def build(output_dir: Path, contract_path: Path, *, force: bool = False) -> Path:
     output_dir = output_dir.resolve()
+    contract_path = contract_path.resolve()
+
+    # Skip compilation and client generation if the artifacts were built from the same sources and toolchain
+    build_hash, sources, toolchain = _get_build_inputs(contract_path)
+    if not force and output_dir.exists() and _get_stale_reason(output_dir, build_hash) is None:
+        logger.info(f"Artifacts of {contract_path} are up to date, skipping build")
+        return _get_app_spec_path(output_dir)
+
     if output_dir.exists():
         rmtree(output_dir)
     output_dir.mkdir(exist_ok=True, parents=True)
@@ -49,28 +264,85 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             )
             continue
         print(app_spec_file_name)
-        generate_result = subprocess.run(
-            [
-                "algokit",
-                "generate",
-                "client",
-                output_dir,
-                "--output",
-                _get_output_path(output_dir, deployment_extension),
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-        if generate_result.returncode:
-            if "No such command" in generate_result.stdout:
-                raise Exception(
-                    "Could not generate typed client, requires AlgoKit 2.0.0 or "
-                    "later. Please update AlgoKit"
-                )
-            else:
-                raise Exception(
-                    f"Could not generate typed client:\n{generate_result.stdout}"
-                )
+        # Every typed client is generated by its own 'algokit generate client' process, so they run in parallel
+        extensions = _get_client_extensions()
+        with ThreadPoolExecutor(max_workers=len(extensions)) as executor:
+            for generated_client in executor.map(
+                lambda extension: _generate_client(output_dir, extension), extensions
+            ):
+                logger.info(f"Generated typed client {generated_client}")
+
+    # Record what the artifacts were built from, so unchanged contracts are not rebuilt and deploys can verify them
+    manifest = BuildManifest(
+        build_hash=build_hash,
+        sources=sources,
+        toolchain=toolchain,
+        artifacts=_hash_artifacts(output_dir),
+    )
+    (output_dir / manifest_file_name).write_text(json.dumps(manifest, indent=2) + "\n")
 
     return output_dir / app_spec_file_name if app_spec_file_name else output_dir
+
+
+# Collects formatted log lines in memory
+class _LogCollector(logging.Handler):
+    def __init__(self, logs: list[str]) -> None:
+        super().__init__()
+        self.logs = logs
+        self.setFormatter(logging.Formatter("%(levelname)-10s: %(message)s"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.logs.append(self.format(record))
+
+
+# Runs a build collecting its log lines instead of writing them, so the logs of concurrent builds do not interleave
+def _build_in_worker(output_dir: Path, contract_path: Path) -> BuildResult:
+    logs: list[str] = []
+    handler = _LogCollector(logs)
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    try:
+        app_spec_path = build(output_dir, contract_path)
+    except Exception as error:
+        return BuildResult(contract_path=contract_path, app_spec_path=None, logs=logs, error=str(error))
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+
+    return BuildResult(contract_path=contract_path, app_spec_path=app_spec_path, logs=logs)
+
+
+def build_all(builds: list[tuple[Path, Path]], max_workers: int | None = None) -> list[Path]:
+    """Builds every (output dir, contract path) pair concurrently (one process per contract, at most one per CPU),
+    returns the App spec paths in the order of 'builds' and raises once every build finished if any of them failed"""
+
+    max_workers = min(len(builds), max_workers or os.cpu_count() or 1)
+
+    results: dict[Path, BuildResult] = {}
+
+    def collect(result: BuildResult) -> None:
+        # Logs are written per contract as its build finishes
+        results[result.contract_path] = result
+        logger.info(f"Build of {result.contract_path}:\n" + "\n".join(result.logs))
+
+    if max_workers <= 1:
+        # A single build runs in this process (an unchanged contract is skipped w/o starting a pool)
+        for output_dir, contract_path in builds:
+            collect(_build_in_worker(output_dir, contract_path))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_build_in_worker, output_dir, contract_path)
+                for output_dir, contract_path in builds
+            ]
+            for future in as_completed(futures):
+                collect(future.result())
+
+    failed = [result for result in results.values() if result.error is not None]
+    for result in failed:
+        logger.error(f"Could not build {result.contract_path}: {result.error}")
+    if failed:
+        raise Exception(f"{len(failed)} of {len(builds)} contract builds failed")
+
+    return [typing.cast(Path, results[contract_path].app_spec_path) for _, contract_path in builds]
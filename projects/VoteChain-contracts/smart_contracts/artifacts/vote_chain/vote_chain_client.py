@@ -43,12 +43,135 @@ _APP_SPEC_JSON = r"""{
                 "close_out": "CALL"
             }
         },
-        "setup_poll(byte[],byte[],byte[],byte[],string,uint64,string,uint64)void": {
+        "setup_poll(pay,byte[],byte[][],bool,byte[32],string,uint64,string,uint64)uint64": {
             "call_config": {
                 "no_op": "CALL"
             }
         },
-        "submit_vote(account,uint64)void": {
+        "submit_vote(uint64,account,pay,uint64,byte[32][])void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "submit_vote_batch(uint64,pay,address[],uint64[],byte[][])void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "finalize_results(uint64)uint64": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "get_poll_snapshot(uint64)(uint64,byte[],byte[][],uint64,uint64,bool,byte[32],uint64,uint64,byte[32],bool,uint64,uint64,uint64[])": {
+            "read_only": true,
+            "structs": {
+                "output": {
+                    "name": "PollSnapshot",
+                    "elements": [
+                        [
+                            "poll_id",
+                            "uint64"
+                        ],
+                        [
+                            "title",
+                            "byte[]"
+                        ],
+                        [
+                            "choices",
+                            "byte[][]"
+                        ],
+                        [
+                            "start_date_unix",
+                            "uint64"
+                        ],
+                        [
+                            "end_date_unix",
+                            "uint64"
+                        ],
+                        [
+                            "require_opt_in",
+                            "bool"
+                        ],
+                        [
+                            "eligibility_root",
+                            "byte[32]"
+                        ],
+                        [
+                            "total_votes",
+                            "uint64"
+                        ],
+                        [
+                            "open_ballots",
+                            "uint64"
+                        ],
+                        [
+                            "ballot_hash",
+                            "byte[32]"
+                        ],
+                        [
+                            "finalized",
+                            "bool"
+                        ],
+                        [
+                            "winner",
+                            "uint64"
+                        ],
+                        [
+                            "winner_margin",
+                            "uint64"
+                        ],
+                        [
+                            "tally",
+                            "uint64[]"
+                        ]
+                    ]
+                }
+            },
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "get_voter_status(uint64,account)(bool,uint64,bool,uint64)": {
+            "read_only": true,
+            "structs": {
+                "output": {
+                    "name": "VoterStatus",
+                    "elements": [
+                        [
+                            "opted_in",
+                            "bool"
+                        ],
+                        [
+                            "votes_cast",
+                            "uint64"
+                        ],
+                        [
+                            "voted",
+                            "bool"
+                        ],
+                        [
+                            "choice",
+                            "uint64"
+                        ]
+                    ]
+                }
+            },
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "box_opt_out(uint64,account)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "sweep(uint64,address[])uint64": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "delete_poll(uint64)void": {
             "call_config": {
                 "no_op": "CALL"
             }
@@ -60,84 +183,52 @@ _APP_SPEC_JSON = r"""{
         }
     },
     "source": {
-        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uYXBwcm92YWxfcHJvZ3JhbToKICAgIGludGNibG9jayAwIDEgMiAxMDAwCiAgICBieXRlY2Jsb2NrICJ2b3RlX2Nob2ljZSIgInRvdGFsX2FjY291bnRzX29wdGVkX2luIiAicG9sbF9maW5hbGl6ZWQiICJjaG9pY2UxX3RvdGFsIiAiY2hvaWNlMl90b3RhbCIgImNob2ljZTNfdG90YWwiICJ0b3RhbF92b3RlcyIgInZvdGVfc3RhdHVzIiAicG9sbF9lbmRfZGF0ZV91bml4IiAicG9sbF9zdGFydF9kYXRlX3VuaXgiCiAgICBjYWxsc3ViIF9fcHV5YV9hcmM0X3JvdXRlcl9fCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uX19wdXlhX2FyYzRfcm91dGVyX18oKSAtPiB1aW50NjQ6Cl9fcHV5YV9hcmM0X3JvdXRlcl9fOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIFZvdGVDaGFpbihBUkM0Q29udHJhY3QpOgogICAgcHJvdG8gMCAxCiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogX19wdXlhX2FyYzRfcm91dGVyX19fYWZ0ZXJfaWZfZWxzZUAxMgogICAgcHVzaGJ5dGVzcyAweDViZTIxOWYwIDB4Zjk3NDQ3MjQgMHg2ZjhhYTg4OCAweGIzZmIyNzViIDB4MTg5ZGM2OGUgMHg0YWJmY2RmMyAweDVmZjE2ZGE0IC8vIG1ldGhvZCAiZ2VuZXJhdGUoKXZvaWQiLCBtZXRob2QgImdsb2JhbF9zdG9yYWdlX21icihwYXkpdm9pZCIsIG1ldGhvZCAibG9jYWxfc3RvcmFnZV9tYnIoYWNjb3VudCxwYXkpdm9pZCIsIG1ldGhvZCAib3B0X291dChhY2NvdW50KXZvaWQiLCBtZXRob2QgInNldHVwX3BvbGwoYnl0ZVtdLGJ5dGVbXSxieXRlW10sYnl0ZVtdLHN0cmluZyx1aW50NjQsc3RyaW5nLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJzdWJtaXRfdm90ZShhY2NvdW50LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ0ZXJtaW5hdGUoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZW5lcmF0ZV9yb3V0ZUAyIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2dsb2JhbF9zdG9yYWdlX21icl9yb3V0ZUAzIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2xvY2FsX3N0b3JhZ2VfbWJyX3JvdXRlQDQgX19wdXlhX2FyYzRfcm91dGVyX19fb3B0X291dF9yb3V0ZUA1IF9fcHV5YV9hcmM0X3JvdXRlcl9fX3NldHVwX3BvbGxfcm91dGVANiBfX3B1eWFfYXJjNF9yb3V0ZXJfX19zdWJtaXRfdm90ZV9yb3V0ZUA3IF9fcHV5YV9hcmM0X3JvdXRlcl9fX3Rlcm1pbmF0ZV9yb3V0ZUA4CiAgICBpbnRjXzAgLy8gMAogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZW5lcmF0ZV9yb3V0ZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjctNjgKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGNyZWF0ZXMgdGhlIHNtYXJ0IGNvbnRyYWN0IEFwcAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgY2FsbHN1YiBnZW5lcmF0ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fZ2xvYmFsX3N0b3JhZ2VfbWJyX3JvdXRlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5Mi05MwogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIHRoZSBjcmVhdG9yIHRvIHVzZSBnbG9iYWwgc3RvcmFnZSBieSBwYXlpbmcgYSBNQlIgY29zdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIFZvdGVDaGFpbihBUkM0Q29udHJhY3QpOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5Mi05MwogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIHRoZSBjcmVhdG9yIHRvIHVzZSBnbG9iYWwgc3RvcmFnZSBieSBwYXlpbmcgYSBNQlIgY29zdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZ2xvYmFsX3N0b3JhZ2VfbWJyCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19sb2NhbF9zdG9yYWdlX21icl9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTA5LTExMAogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIGFueSB1c2VyIHRvIG9wdCBpbiB0byB0aGUgc21hcnQgY29udHJhY3QncyBsb2NhbCBzdG9yYWdlIGJ5IHBheWluZyBhIE1CUiBjb3N0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIk9wdEluIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnRjXzEgLy8gT3B0SW4KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBPcHRJbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgVm90ZUNoYWluKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxMDktMTEwCiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgYW55IHVzZXIgdG8gb3B0IGluIHRvIHRoZSBzbWFydCBjb250cmFjdCdzIGxvY2FsIHN0b3JhZ2UgYnkgcGF5aW5nIGEgTUJSIGNvc3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIGNhbGxzdWIgbG9jYWxfc3RvcmFnZV9tYnIKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX29wdF9vdXRfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjEzNy0xMzgKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyBhbnkgdXNlciB0byBvcHQgb3V0IG9mIHRoZSBzbWFydCBjb250cmFjdCdzIGxvY2FsIHN0b3JhZ2UgdmlhIHRoZSAnY2xvc2Ugb3V0JyBtZXRob2QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiQ2xvc2VPdXQiXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludGNfMiAvLyBDbG9zZU91dAogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IENsb3NlT3V0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBWb3RlQ2hhaW4oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxMzctMTM4CiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgYW55IHVzZXIgdG8gb3B0IG91dCBvZiB0aGUgc21hcnQgY29udHJhY3QncyBsb2NhbCBzdG9yYWdlIHZpYSB0aGUgJ2Nsb3NlIG91dCcgbWV0aG9kCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIkNsb3NlT3V0Il0pCiAgICBjYWxsc3ViIG9wdF9vdXQKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX3NldHVwX3BvbGxfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE3NC0xNzUKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyB0aGUgY3JlYXRvciB0byBzZXQgdXAgdGhlIHBvbGwgdmFsdWVzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgVm90ZUNoYWluKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDcKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA4CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxNzQtMTc1CiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgdGhlIGNyZWF0b3IgdG8gc2V0IHVwIHRoZSBwb2xsIHZhbHVlcwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2V0dXBfcG9sbAogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fc3VibWl0X3ZvdGVfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIzNy0yMzgKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyBhbnkgdXNlciB0byBzdWJtaXQgdGhlaXIgdm90ZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBWb3RlQ2hhaW4oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyMzctMjM4CiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgYW55IHVzZXIgdG8gc3VibWl0IHRoZWlyIHZvdGUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBzdWJtaXRfdm90ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fdGVybWluYXRlX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyODItMjgzCiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgdGhlIGNyZWF0b3IgdG8gZGVsZXRlIEFwcCBhbmQgZ2V0IHRoZWlyIGdsb2JhbCBzY2hlbWEgTUJSIGNvc3QgcmVmdW5kZWQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiRGVsZXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgdGVybWluYXRlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19hZnRlcl9pZl9lbHNlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIFZvdGVDaGFpbihBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5nZW5lcmF0ZSgpIC0+IHZvaWQ6CmdlbmVyYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjctNjkKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGNyZWF0ZXMgdGhlIHNtYXJ0IGNvbnRyYWN0IEFwcAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICAvLyBkZWYgZ2VuZXJhdGUoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzIKICAgIC8vIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzAtNzMKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIlRyYW5zYWN0aW9uIHNlbmRlciBtdXN0IG1hdGNoIGNyZWF0b3IgYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gVHJhbnNhY3Rpb24gc2VuZGVyIG11c3QgbWF0Y2ggY3JlYXRvciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzUtNzYKICAgIC8vICMgR2xvYmFsIHN0b3JhZ2UgdmFyaWFibGUgYXNzaWdubWVudHMKICAgIC8vIHNlbGYudG90YWxfYWNjb3VudHNfb3B0ZWRfaW4gPSBVSW50NjQoMCkKICAgIGJ5dGVjXzEgLy8gInRvdGFsX2FjY291bnRzX29wdGVkX2luIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3OAogICAgLy8gc2VsZi5wb2xsX2ZpbmFsaXplZCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAicG9sbF9maW5hbGl6ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgwCiAgICAvLyBzZWxmLmNob2ljZTFfdG90YWwgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzMgLy8gImNob2ljZTFfdG90YWwiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgxCiAgICAvLyBzZWxmLmNob2ljZTJfdG90YWwgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gImNob2ljZTJfdG90YWwiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgyCiAgICAvLyBzZWxmLmNob2ljZTNfdG90YWwgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDUgLy8gImNob2ljZTNfdG90YWwiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgzCiAgICAvLyBzZWxmLnRvdGFsX3ZvdGVzID0gVUludDY0KDApCiAgICBieXRlYyA2IC8vICJ0b3RhbF92b3RlcyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODUtODYKICAgIC8vICMgTG9nIGluZm8gb24tY2hhaW4KICAgIC8vIGFyYzQuZW1pdCgiVmlldyh1aW50NjQpIiwgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIGl0b2IKICAgIHB1c2hieXRlcyAweGM2Mzc2MWNmIC8vIG1ldGhvZCAiVmlldyh1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCwKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25JRAogICAgaXRvYgogICAgcHVzaGJ5dGVzICJHZW5lcmF0aW9uIG1ldGhvZCBzdWNjZXNzZnVsIGZvciBBcHAgSUQ6ICIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODctOTAKICAgIC8vIGxvZygKICAgIC8vICAgICAiR2VuZXJhdGlvbiBtZXRob2Qgc3VjY2Vzc2Z1bCBmb3IgQXBwIElEOiAiLAogICAgLy8gICAgIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkLAogICAgLy8gKQogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uZ2xvYmFsX3N0b3JhZ2VfbWJyKG1icl9wYXk6IHVpbnQ2NCkgLT4gdm9pZDoKZ2xvYmFsX3N0b3JhZ2VfbWJyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6OTItOTQKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyB0aGUgY3JlYXRvciB0byB1c2UgZ2xvYmFsIHN0b3JhZ2UgYnkgcGF5aW5nIGEgTUJSIGNvc3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZ2xvYmFsX3N0b3JhZ2VfbWJyKHNlbGYsIG1icl9wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5NS05NgogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA9PSBzZWxmLmNhbGNfbWJyKAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBudW1fYnl0ZXM9VUludDY0KDQpLCBudW1fdWludD1VSW50NjQoOCkgICMgQ2FsYyBNQlIgZm9yIHVzaW5nIGdsb2JhbCBzY2hlbWEKICAgIHB1c2hpbnRzIDQgOCAvLyA0LCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5NS05OAogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA9PSBzZWxmLmNhbGNfbWJyKAogICAgLy8gICAgIG51bV9ieXRlcz1VSW50NjQoNCksIG51bV91aW50PVVJbnQ2NCg4KSAgIyBDYWxjIE1CUiBmb3IgdXNpbmcgZ2xvYmFsIHNjaGVtYQogICAgLy8gKSwgIk1CUiBwYXltZW50IG11c3QgbWVldCB0aGUgbWluaW11bSByZXF1aXJlbWVudCBhbW91bnQuIgogICAgY2FsbHN1YiBjYWxjX21icgogICAgPT0KICAgIGFzc2VydCAvLyBNQlIgcGF5bWVudCBtdXN0IG1lZXQgdGhlIG1pbmltdW0gcmVxdWlyZW1lbnQgYW1vdW50LgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTAwCiAgICAvLyBtYnJfcGF5LnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6OTktMTAxCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkuc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJNQlIgcGF5bWVudCBzZW5kZXIgbXVzdCBtYXRjaCB0aGUgQXBwIGNyZWF0b3IgYWNjb3VudC4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgc2VuZGVyIG11c3QgbWF0Y2ggdGhlIEFwcCBjcmVhdG9yIGFjY291bnQuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxMDMKICAgIC8vIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxMDItMTA0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgIk1CUiBwYXltZW50IHJlY2lldmVyIG11c3QgYmUgdGhlIEFwcCBhZGRyZXNzLiIKICAgIGFzc2VydCAvLyBNQlIgcGF5bWVudCByZWNpZXZlciBtdXN0IGJlIHRoZSBBcHAgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjEwNi0xMDcKICAgIC8vICMgTG9nIGluZm8gb24tY2hhaW4KICAgIC8vIGxvZygiR2xvYmFsIFN0YXRlIHN1Y2Nlc3NmdWxseSBmdW5kZWQgYnkgYWNjb3VudCBhZGRyZXNzOiAiLCBUeG4uc2VuZGVyKQogICAgcHVzaGJ5dGVzICJHbG9iYWwgU3RhdGUgc3VjY2Vzc2Z1bGx5IGZ1bmRlZCBieSBhY2NvdW50IGFkZHJlc3M6ICIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uY2FsY19tYnIobnVtX2J5dGVzOiB1aW50NjQsIG51bV91aW50OiB1aW50NjQpIC0+IHVpbnQ2NDoKY2FsY19tYnI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1My01NQogICAgLy8gIyBEZWZpbmUgc3Vicm91dGluZSB0aGF0IGNhbGN1bGF0ZXMgdGhlIG1pbmltdW0gYmFsYW5jZSByZXF1aXJlbWVudCB0b3RhbCBjb3N0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNhbGNfbWJyKHNlbGYsIG51bV9ieXRlczogVUludDY0LCBudW1fdWludDogVUludDY0KSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBieXRlX2ZlZSA9IFVJbnQ2NCg1MF8wMDApICAjIEJ5dGUgc2xpY2UgZmVlIGZvciBrZXktdmFsdWUgcGFpcgogICAgcHVzaGludCA1MDAwMCAvLyA1MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjAtNjEKICAgIC8vICMgTXVsdGlwbHkgcmVzcGVjdGl2ZSBmZWUgY29zdCB3aXRoIHRoZSBudW1iZXIgb2Yga2V5LXZhbHVlIHBhaXJzIGluIGVhY2ggc2NoZW1hIHRvIGdldCB0b3RhbCBmZWUgYW1vdW50CiAgICAvLyB0b3RhbF9ieXRlX2ZlZSA9IGJ5dGVfZmVlICogbnVtX2J5dGVzCiAgICBmcmFtZV9kaWcgLTIKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU4CiAgICAvLyB1aW50X2ZlZSA9IFVJbnQ2NCgyOF81MDApICAjIFVJbnQ2NCBmZWUgZm9yIGtleS12YWx1ZSBwYWlyCiAgICBwdXNoaW50IDI4NTAwIC8vIDI4NTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2MgogICAgLy8gdG90YWxfdWludF9mZWUgPSB1aW50X2ZlZSAqIG51bV91aW50CiAgICBmcmFtZV9kaWcgLTEKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY0LTY1CiAgICAvLyAjIFJldHVybiB0aGUgbWluaW11bSBiYWxhbmNlIHJlcXVpcmVtZW50IHRvdGFsIGNvc3QKICAgIC8vIHJldHVybiBHbG9iYWwubWluX2JhbGFuY2UgKyBiYXNlX2ZlZSArIHRvdGFsX2J5dGVfZmVlICsgdG90YWxfdWludF9mZWUKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1NgogICAgLy8gYmFzZV9mZWUgPSBVSW50NjQoMTAwXzAwMCkgICMgQmFzZSBmZWUKICAgIHB1c2hpbnQgMTAwMDAwIC8vIDEwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjQtNjUKICAgIC8vICMgUmV0dXJuIHRoZSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgdG90YWwgY29zdAogICAgLy8gcmV0dXJuIEdsb2JhbC5taW5fYmFsYW5jZSArIGJhc2VfZmVlICsgdG90YWxfYnl0ZV9mZWUgKyB0b3RhbF91aW50X2ZlZQogICAgKwogICAgdW5jb3ZlciAyCiAgICArCiAgICArCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4ubG9jYWxfc3RvcmFnZV9tYnIoYWNjb3VudDogYnl0ZXMsIG1icl9wYXk6IHVpbnQ2NCkgLT4gdm9pZDoKbG9jYWxfc3RvcmFnZV9tYnI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxMDktMTEzCiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgYW55IHVzZXIgdG8gb3B0IGluIHRvIHRoZSBzbWFydCBjb250cmFjdCdzIGxvY2FsIHN0b3JhZ2UgYnkgcGF5aW5nIGEgTUJSIGNvc3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIC8vIGRlZiBsb2NhbF9zdG9yYWdlX21icigKICAgIC8vICAgICBzZWxmLCBhY2NvdW50OiBBY2NvdW50LCBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbgogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxMTQtMTE1CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0IG1icl9wYXkuYW1vdW50ID09IHNlbGYuY2FsY19tYnIoCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTE2CiAgICAvLyBudW1fYnl0ZXM9VUludDY0KDApLCBudW1fdWludD1VSW50NjQoMikgICMgQ2FsYyBNQlIgZm9yIHVzaW5nIGxvY2FsIHNjaGVtYQogICAgaW50Y18wIC8vIDAKICAgIGludGNfMiAvLyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxMTQtMTE3CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0IG1icl9wYXkuYW1vdW50ID09IHNlbGYuY2FsY19tYnIoCiAgICAvLyAgICAgbnVtX2J5dGVzPVVJbnQ2NCgwKSwgbnVtX3VpbnQ9VUludDY0KDIpICAjIENhbGMgTUJSIGZvciB1c2luZyBsb2NhbCBzY2hlbWEKICAgIC8vICksICJNQlIgcGF5bWVudCBtdXN0IG1lZXQgdGhlIG1pbmltdW0gcmVxdWlyZW1lbnQgYW1vdW50LiIKICAgIGNhbGxzdWIgY2FsY19tYnIKICAgID09CiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgbXVzdCBtZWV0IHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50IGFtb3VudC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjExOQogICAgLy8gbWJyX3BheS5zZW5kZXIgPT0gYWNjb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjExOC0xMjAKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5zZW5kZXIgPT0gYWNjb3VudAogICAgLy8gKSwgIk1CUiBwYXltZW50IHNlbmRlciBtdXN0IG1hdGNoIHRoZSBhY2NvdW50IG9wdGluZyBpbi4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgc2VuZGVyIG11c3QgbWF0Y2ggdGhlIGFjY291bnQgb3B0aW5nIGluLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTIyCiAgICAvLyBtYnJfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTIxLTEyMwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJNQlIgcGF5bWVudCByZWNpZXZlciBtdXN0IGJlIHRoZSBBcHAgYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgcmVjaWV2ZXIgbXVzdCBiZSB0aGUgQXBwIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxMjUtMTI2CiAgICAvLyAjIENoYW5nZSBsb2NhbCBzdGF0ZSB2YXIgJ3NlbGYubG9jYWxfdm90ZV9zdGF0dXMnIChzcGVjaWZpYyB0byBhY2NvdW50KSB2YWx1ZSBmcm9tICdOb25lJyB0byAnMCcKICAgIC8vIHNlbGYubG9jYWxfdm90ZV9zdGF0dXNbYWNjb3VudF0gPSBVSW50NjQoMCkKICAgIGZyYW1lX2RpZyAtMgogICAgYnl0ZWMgNyAvLyAidm90ZV9zdGF0dXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTI4LTEyOQogICAgLy8gIyBDaGFuZ2UgbG9jYWwgc3RhdGUgdmFyICdzZWxmLmxvY2FsX3ZvdGVfY2hvaWNlJyAoc3BlY2lmaWMgdG8gYWNjb3VudCkgdmFsdWUgZnJvbSAnTm9uZScgdG8gJzAnCiAgICAvLyBzZWxmLmxvY2FsX3ZvdGVfY2hvaWNlW2FjY291bnRdID0gVUludDY0KDApCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGVjXzAgLy8gInZvdGVfY2hvaWNlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjEzMS0xMzIKICAgIC8vICMgSW5jcmVtZW50IGNvdW50IGZvciB0b3RhbCBhY2NvdW50cyBvcHRlZCBpbgogICAgLy8gc2VsZi50b3RhbF9hY2NvdW50c19vcHRlZF9pbiArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b3RhbF9hY2NvdW50c19vcHRlZF9pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9hY2NvdW50c19vcHRlZF9pbiBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18xIC8vICJ0b3RhbF9hY2NvdW50c19vcHRlZF9pbiIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxMzQtMTM1CiAgICAvLyAjIExvZyBpbmZvIG9uLWNoYWluCiAgICAvLyBsb2coIkxvY2FsIFN0YXRlIHN1Y2Nlc3NmdWxseSBmdW5kZWQgYnkgYWNjb3VudCBhZGRyZXNzOiAiLCBUeG4uc2VuZGVyKQogICAgcHVzaGJ5dGVzICJMb2NhbCBTdGF0ZSBzdWNjZXNzZnVsbHkgZnVuZGVkIGJ5IGFjY291bnQgYWRkcmVzczogIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5vcHRfb3V0KGFjY291bnQ6IGJ5dGVzKSAtPiB2b2lkOgpvcHRfb3V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTM3LTEzOQogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIGFueSB1c2VyIHRvIG9wdCBvdXQgb2YgdGhlIHNtYXJ0IGNvbnRyYWN0J3MgbG9jYWwgc3RvcmFnZSB2aWEgdGhlICdjbG9zZSBvdXQnIG1ldGhvZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJDbG9zZU91dCJdKQogICAgLy8gZGVmIG9wdF9vdXQoc2VsZiwgYWNjb3VudDogQWNjb3VudCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTQwLTE0MwogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCBhY2NvdW50LmlzX29wdGVkX2luKAogICAgLy8gICAgIEFwcGxpY2F0aW9uKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKQogICAgLy8gKSwgIkFjY291bnQgbXVzdCBmaXJzdCBiZSBvcHRlZC1pbiB0byBBcHAgY2xpZW50IGluIG9yZGVyIHRvIGNsb3NlIG91dC4iCiAgICBmcmFtZV9kaWcgLTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gQXBwbGljYXRpb24oR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE0MC0xNDMKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgYWNjb3VudC5pc19vcHRlZF9pbigKICAgIC8vICAgICBBcHBsaWNhdGlvbihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkKICAgIC8vICksICJBY2NvdW50IG11c3QgZmlyc3QgYmUgb3B0ZWQtaW4gdG8gQXBwIGNsaWVudCBpbiBvcmRlciB0byBjbG9zZSBvdXQuIgogICAgYXBwX29wdGVkX2luCiAgICBhc3NlcnQgLy8gQWNjb3VudCBtdXN0IGZpcnN0IGJlIG9wdGVkLWluIHRvIEFwcCBjbGllbnQgaW4gb3JkZXIgdG8gY2xvc2Ugb3V0LgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTQ2CiAgICAvLyBhY2NvdW50LmlzX29wdGVkX2luKEFwcGxpY2F0aW9uKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKSkKICAgIGZyYW1lX2RpZyAtMQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICBhcHBfb3B0ZWRfaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE0Ni0xNDcKICAgIC8vIGFjY291bnQuaXNfb3B0ZWRfaW4oQXBwbGljYXRpb24oR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpKQogICAgLy8gYW5kIHNlbGYubG9jYWxfdm90ZV9jaG9pY2VbYWNjb3VudF0gPT0gVUludDY0KDApCiAgICBieiBvcHRfb3V0X29yX2NvbnRkQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gYW5kIHNlbGYubG9jYWxfdm90ZV9jaG9pY2VbYWNjb3VudF0gPT0gVUludDY0KDApCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJ2b3RlX2Nob2ljZSIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxvY2FsX3ZvdGVfY2hvaWNlIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTQ2LTE0NwogICAgLy8gYWNjb3VudC5pc19vcHRlZF9pbihBcHBsaWNhdGlvbihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkpCiAgICAvLyBhbmQgc2VsZi5sb2NhbF92b3RlX2Nob2ljZVthY2NvdW50XSA9PSBVSW50NjQoMCkKICAgIGJ6IG9wdF9vdXRfYm9vbF90cnVlQDUKCm9wdF9vdXRfb3JfY29udGRAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gYWNjb3VudC5pc19vcHRlZF9pbihBcHBsaWNhdGlvbihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25JRAogICAgYXBwX29wdGVkX2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxNDktMTUxCiAgICAvLyBhY2NvdW50LmlzX29wdGVkX2luKEFwcGxpY2F0aW9uKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKSkKICAgIC8vIGFuZCBzZWxmLmxvY2FsX3ZvdGVfY2hvaWNlW2FjY291bnRdICE9IFVJbnQ2NCgwKQogICAgLy8gYW5kIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXgKICAgIGJ6IG9wdF9vdXRfYm9vbF9mYWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxNTAKICAgIC8vIGFuZCBzZWxmLmxvY2FsX3ZvdGVfY2hvaWNlW2FjY291bnRdICE9IFVJbnQ2NCgwKQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidm90ZV9jaG9pY2UiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sb2NhbF92b3RlX2Nob2ljZSBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE0OS0xNTEKICAgIC8vIGFjY291bnQuaXNfb3B0ZWRfaW4oQXBwbGljYXRpb24oR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpKQogICAgLy8gYW5kIHNlbGYubG9jYWxfdm90ZV9jaG9pY2VbYWNjb3VudF0gIT0gVUludDY0KDApCiAgICAvLyBhbmQgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peAogICAgYnogb3B0X291dF9ib29sX2ZhbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gYW5kIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXgKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJwb2xsX2VuZF9kYXRlX3VuaXgiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9lbmRfZGF0ZV91bml4IGV4aXN0cwogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTQ5LTE1MQogICAgLy8gYWNjb3VudC5pc19vcHRlZF9pbihBcHBsaWNhdGlvbihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkpCiAgICAvLyBhbmQgc2VsZi5sb2NhbF92b3RlX2Nob2ljZVthY2NvdW50XSAhPSBVSW50NjQoMCkKICAgIC8vIGFuZCBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA+IHNlbGYucG9sbF9lbmRfZGF0ZV91bml4CiAgICBieiBvcHRfb3V0X2Jvb2xfZmFsc2VANgoKb3B0X291dF9ib29sX3RydWVANToKICAgIGludGNfMSAvLyAxCiAgICBiIG9wdF9vdXRfYm9vbF9tZXJnZUA3CgpvcHRfb3V0X2Jvb2xfZmFsc2VANjoKICAgIGludGNfMCAvLyAwCgpvcHRfb3V0X2Jvb2xfbWVyZ2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE0NS0xNTIKICAgIC8vIGFzc2VydCAoICAjIEFjY291bnQgaXMgb3B0ZWQtaW4gYnV0IGhhc24ndCB2b3RlZCB5ZXQKICAgIC8vICAgICBhY2NvdW50LmlzX29wdGVkX2luKEFwcGxpY2F0aW9uKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKSkKICAgIC8vICAgICBhbmQgc2VsZi5sb2NhbF92b3RlX2Nob2ljZVthY2NvdW50XSA9PSBVSW50NjQoMCkKICAgIC8vICkgb3IgKCAgIyBBY2NvdW50IGlzIG9wdGVkLWluIGFuZCBoYXMgdm90ZWQgYW5kIHZvdGluZyBwZXJpb2QgaXMgb3ZlcgogICAgLy8gICAgIGFjY291bnQuaXNfb3B0ZWRfaW4oQXBwbGljYXRpb24oR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpKQogICAgLy8gICAgIGFuZCBzZWxmLmxvY2FsX3ZvdGVfY2hvaWNlW2FjY291bnRdICE9IFVJbnQ2NCgwKQogICAgLy8gICAgIGFuZCBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA+IHNlbGYucG9sbF9lbmRfZGF0ZV91bml4CiAgICAvLyApLCAiUmVxdWlyZW1lbnRzIGZvciBvcHRpbmctb3V0IG9mIEFwcCBjbGllbnQgYXJlIGluc3VmZmljaWVudC4iCiAgICBhc3NlcnQgLy8gUmVxdWlyZW1lbnRzIGZvciBvcHRpbmctb3V0IG9mIEFwcCBjbGllbnQgYXJlIGluc3VmZmljaWVudC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE1NC0xNTUKICAgIC8vICMgRGVsZXRlIHRoZSB1c2VyJ3MgbG9jYWwgc3RvcmFnZQogICAgLy8gZGVsIHNlbGYubG9jYWxfdm90ZV9zdGF0dXNbYWNjb3VudF0KICAgIGZyYW1lX2RpZyAtMQogICAgYnl0ZWMgNyAvLyAidm90ZV9zdGF0dXMiCiAgICBhcHBfbG9jYWxfZGVsCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxNTYKICAgIC8vIGRlbCBzZWxmLmxvY2FsX3ZvdGVfY2hvaWNlW2FjY291bnRdCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ5dGVjXzAgLy8gInZvdGVfY2hvaWNlIgogICAgYXBwX2xvY2FsX2RlbAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTU4LTE1OQogICAgLy8gIyBEZWNyZWFzZSB0aGUgdG90YWwgY291bnQgb2Ygb3B0ZWQtaW4gYWNjb3VudHMKICAgIC8vIHNlbGYudG90YWxfYWNjb3VudHNfb3B0ZWRfaW4gLT0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAidG90YWxfYWNjb3VudHNfb3B0ZWRfaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfYWNjb3VudHNfb3B0ZWRfaW4gZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgYnl0ZWNfMSAvLyAidG90YWxfYWNjb3VudHNfb3B0ZWRfaW4iCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTYzLTE2OQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPWFjY291bnQsCiAgICAvLyAgICAgYW1vdW50PXNlbGYuY2FsY19tYnIobnVtX2J5dGVzPVVJbnQ2NCgwKSwgbnVtX3VpbnQ9VUludDY0KDIpKSAtIG1pbl90eG5fZmVlLAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZlZT1taW5fdHhuX2ZlZSwKICAgIC8vICAgICBub3RlPSJNQlIgcmVmdW5kIGZvciBjbG9zaW5nIG91dC4iLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTY1CiAgICAvLyBhbW91bnQ9c2VsZi5jYWxjX21icihudW1fYnl0ZXM9VUludDY0KDApLCBudW1fdWludD1VSW50NjQoMikpIC0gbWluX3R4bl9mZWUsCiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18yIC8vIDIKICAgIGNhbGxzdWIgY2FsY19tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE2MS0xNjIKICAgIC8vICMgU3VibWl0IGlubmVyIHRyYW5zYWN0aW9uIChhY2NvdW50IGdldHMgdGhlaXIgbWJyIHBheW1lbnQgcmVmdW5kZWQpCiAgICAvLyBtaW5fdHhuX2ZlZSA9IFVJbnQ2NCgxMDAwKQogICAgaW50Y18zIC8vIDEwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE2NQogICAgLy8gYW1vdW50PXNlbGYuY2FsY19tYnIobnVtX2J5dGVzPVVJbnQ2NCgwKSwgbnVtX3VpbnQ9VUludDY0KDIpKSAtIG1pbl90eG5fZmVlLAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTY2CiAgICAvLyBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxNjgKICAgIC8vIG5vdGU9Ik1CUiByZWZ1bmQgZm9yIGNsb3Npbmcgb3V0LiIsCiAgICBwdXNoYnl0ZXMgIk1CUiByZWZ1bmQgZm9yIGNsb3Npbmcgb3V0LiIKICAgIGl0eG5fZmllbGQgTm90ZQogICAgaXR4bl9maWVsZCBTZW5kZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE2MwogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTYxLTE2MgogICAgLy8gIyBTdWJtaXQgaW5uZXIgdHJhbnNhY3Rpb24gKGFjY291bnQgZ2V0cyB0aGVpciBtYnIgcGF5bWVudCByZWZ1bmRlZCkKICAgIC8vIG1pbl90eG5fZmVlID0gVUludDY0KDEwMDApCiAgICBpbnRjXzMgLy8gMTAwMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE2My0xNjkKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1hY2NvdW50LAogICAgLy8gICAgIGFtb3VudD1zZWxmLmNhbGNfbWJyKG51bV9ieXRlcz1VSW50NjQoMCksIG51bV91aW50PVVJbnQ2NCgyKSkgLSBtaW5fdHhuX2ZlZSwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9bWluX3R4bl9mZWUsCiAgICAvLyAgICAgbm90ZT0iTUJSIHJlZnVuZCBmb3IgY2xvc2luZyBvdXQuIiwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxNzEtMTcyCiAgICAvLyAjIExvZyBpbmZvIG9uLWNoYWluCiAgICAvLyBsb2coIkNsb3NlLW91dCBtZXRob2Qgc3VjY2Vzc2Z1bCBmb3IgYWNjb3VudCBhZGRyZXNzOiAiLCBhY2NvdW50KQogICAgcHVzaGJ5dGVzICJDbG9zZS1vdXQgbWV0aG9kIHN1Y2Nlc3NmdWwgZm9yIGFjY291bnQgYWRkcmVzczogIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVfY2hhaW4uY29udHJhY3QuVm90ZUNoYWluLnNldHVwX3BvbGwodGl0bGU6IGJ5dGVzLCBjaG9pY2UxOiBieXRlcywgY2hvaWNlMjogYnl0ZXMsIGNob2ljZTM6IGJ5dGVzLCBzdGFydF9kYXRlX3N0cjogYnl0ZXMsIHN0YXJ0X2RhdGVfdW5peDogdWludDY0LCBlbmRfZGF0ZV9zdHI6IGJ5dGVzLCBlbmRfZGF0ZV91bml4OiB1aW50NjQpIC0+IHZvaWQ6CnNldHVwX3BvbGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxNzQtMTg2CiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgdGhlIGNyZWF0b3IgdG8gc2V0IHVwIHRoZSBwb2xsIHZhbHVlcwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzZXR1cF9wb2xsKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgdGl0bGU6IEJ5dGVzLAogICAgLy8gICAgIGNob2ljZTE6IEJ5dGVzLAogICAgLy8gICAgIGNob2ljZTI6IEJ5dGVzLAogICAgLy8gICAgIGNob2ljZTM6IEJ5dGVzLAogICAgLy8gICAgIHN0YXJ0X2RhdGVfc3RyOiBTdHJpbmcsCiAgICAvLyAgICAgc3RhcnRfZGF0ZV91bml4OiBVSW50NjQsCiAgICAvLyAgICAgZW5kX2RhdGVfc3RyOiBTdHJpbmcsCiAgICAvLyAgICAgZW5kX2RhdGVfdW5peDogVUludDY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gOCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxODkKICAgIC8vIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTg3LTE5MAogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiT25seSBBcHAgY3JlYXRvciBjYW4gc2V0IHZvdGUgZGF0ZXMuIgogICAgYXNzZXJ0IC8vIE9ubHkgQXBwIGNyZWF0b3IgY2FuIHNldCB2b3RlIGRhdGVzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTkyCiAgICAvLyBhc3NlcnQgKHRpdGxlLmxlbmd0aCA8PSBVSW50NjQoMTE4KSksICJQb2xsIHRpdGxlIHNpemUgY2FuIG5vdCBleGNlZWQgMTE4IGJ5dGVzIG9mIGRhdGEgcGVyIGtleS12YWx1ZS4iCiAgICBmcmFtZV9kaWcgLTgKICAgIGxlbgogICAgcHVzaGludCAxMTggLy8gMTE4CiAgICA8PQogICAgYXNzZXJ0IC8vIFBvbGwgdGl0bGUgc2l6ZSBjYW4gbm90IGV4Y2VlZCAxMTggYnl0ZXMgb2YgZGF0YSBwZXIga2V5LXZhbHVlLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTk1CiAgICAvLyBjaG9pY2UxLmxlbmd0aCA8PSBVSW50NjQoMTE2KSBhbmQKICAgIGZyYW1lX2RpZyAtNwogICAgbGVuCiAgICBwdXNoaW50IDExNiAvLyAxMTYKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxOTUtMTk3CiAgICAvLyBjaG9pY2UxLmxlbmd0aCA8PSBVSW50NjQoMTE2KSBhbmQKICAgIC8vIGNob2ljZTIubGVuZ3RoIDw9IFVJbnQ2NCgxMTYpIGFuZAogICAgLy8gY2hvaWNlMy5sZW5ndGggPD0gVUludDY0KDExNikKICAgIGJ6IHNldHVwX3BvbGxfYm9vbF9mYWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxOTYKICAgIC8vIGNob2ljZTIubGVuZ3RoIDw9IFVJbnQ2NCgxMTYpIGFuZAogICAgZnJhbWVfZGlnIC02CiAgICBsZW4KICAgIHB1c2hpbnQgMTE2IC8vIDExNgogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE5NS0xOTcKICAgIC8vIGNob2ljZTEubGVuZ3RoIDw9IFVJbnQ2NCgxMTYpIGFuZAogICAgLy8gY2hvaWNlMi5sZW5ndGggPD0gVUludDY0KDExNikgYW5kCiAgICAvLyBjaG9pY2UzLmxlbmd0aCA8PSBVSW50NjQoMTE2KQogICAgYnogc2V0dXBfcG9sbF9ib29sX2ZhbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE5NwogICAgLy8gY2hvaWNlMy5sZW5ndGggPD0gVUludDY0KDExNikKICAgIGZyYW1lX2RpZyAtNQogICAgbGVuCiAgICBwdXNoaW50IDExNiAvLyAxMTYKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxOTUtMTk3CiAgICAvLyBjaG9pY2UxLmxlbmd0aCA8PSBVSW50NjQoMTE2KSBhbmQKICAgIC8vIGNob2ljZTIubGVuZ3RoIDw9IFVJbnQ2NCgxMTYpIGFuZAogICAgLy8gY2hvaWNlMy5sZW5ndGggPD0gVUludDY0KDExNikKICAgIGJ6IHNldHVwX3BvbGxfYm9vbF9mYWxzZUA0CiAgICBpbnRjXzEgLy8gMQogICAgYiBzZXR1cF9wb2xsX2Jvb2xfbWVyZ2VANQoKc2V0dXBfcG9sbF9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAoKc2V0dXBfcG9sbF9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxOTQtMTk4CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGNob2ljZTEubGVuZ3RoIDw9IFVJbnQ2NCgxMTYpIGFuZAogICAgLy8gICAgIGNob2ljZTIubGVuZ3RoIDw9IFVJbnQ2NCgxMTYpIGFuZAogICAgLy8gICAgIGNob2ljZTMubGVuZ3RoIDw9IFVJbnQ2NCgxMTYpCiAgICAvLyApLCAiUG9sbCBjaG9pY2Ugc2l6ZSBjYW5ub3QgZXhjZWVkIDExNiBieXRlcyBvZiBkYXRhIHBlciBrZXktdmFsdWUuIgogICAgYXNzZXJ0IC8vIFBvbGwgY2hvaWNlIHNpemUgY2Fubm90IGV4Y2VlZCAxMTYgYnl0ZXMgb2YgZGF0YSBwZXIga2V5LXZhbHVlLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjEwCiAgICAvLyBzdGFydF9kYXRlX3VuaXggPCBlbmRfZGF0ZV91bml4CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMQogICAgPAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjA5LTIxMQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzdGFydF9kYXRlX3VuaXggPCBlbmRfZGF0ZV91bml4CiAgICAvLyApLCAiU3RhcnQgZGF0ZSBtdXN0IGJlIGVhcmxpZXIgdGhhbiBlbmQgZGF0ZS4iCiAgICBhc3NlcnQgLy8gU3RhcnQgZGF0ZSBtdXN0IGJlIGVhcmxpZXIgdGhhbiBlbmQgZGF0ZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIxMy0yMTUKICAgIC8vIGFzc2VydCBlbmRfZGF0ZV91bml4ID49IHN0YXJ0X2RhdGVfdW5peCArIFVJbnQ2NCgKICAgIC8vICAgICAzICogMjQgKiA2MCAqIDYwCiAgICAvLyApLCAiRW5kIGRhdGUgbXVzdCBiZSBhdCBsZWFzdCAzIGRheXMgbGF0ZXIgdGhhbiB0aGUgc3RhcnQgZGF0ZS4iCiAgICBmcmFtZV9kaWcgLTMKICAgIHB1c2hpbnQgMjU5MjAwIC8vIDI1OTIwMAogICAgKwogICAgZnJhbWVfZGlnIC0xCiAgICA8PQogICAgYXNzZXJ0IC8vIEVuZCBkYXRlIG11c3QgYmUgYXQgbGVhc3QgMyBkYXlzIGxhdGVyIHRoYW4gdGhlIHN0YXJ0IGRhdGUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyMTcKICAgIC8vIGFzc2VydCBlbmRfZGF0ZV91bml4IC0gc3RhcnRfZGF0ZV91bml4IDw9IFVJbnQ2NCgKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIC0zCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyMTctMjE5CiAgICAvLyBhc3NlcnQgZW5kX2RhdGVfdW5peCAtIHN0YXJ0X2RhdGVfdW5peCA8PSBVSW50NjQoCiAgICAvLyAgICAgMTQgKiAyNCAqIDYwICogNjAKICAgIC8vICksICJWb3RpbmcgcGVyaW9kIGNhbiBub3QgZXhjZWVkIDE0IGRheXMuIgogICAgcHVzaGludCAxMjA5NjAwIC8vIDEyMDk2MDAKICAgIDw9CiAgICBhc3NlcnQgLy8gVm90aW5nIHBlcmlvZCBjYW4gbm90IGV4Y2VlZCAxNCBkYXlzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjIxCiAgICAvLyBhc3NlcnQgc2VsZi5wb2xsX2ZpbmFsaXplZCA9PSBVSW50NjQoMCksICJQb2xsIGNhbiBvbmx5IGJlIHNldHVwIG9uY2UuIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInBvbGxfZmluYWxpemVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfZmluYWxpemVkIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFBvbGwgY2FuIG9ubHkgYmUgc2V0dXAgb25jZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIyMy0yMjQKICAgIC8vICMgVXBkYXRlIGdsb2JhbCBzY2hlbWEgdmFsdWVzCiAgICAvLyBzZWxmLnBvbGxfdGl0bGUgPSB0aXRsZQogICAgcHVzaGJ5dGVzICJwb2xsX3RpdGxlIgogICAgZnJhbWVfZGlnIC04CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjI1CiAgICAvLyBzZWxmLnBvbGxfY2hvaWNlMSA9IGNob2ljZTEKICAgIHB1c2hieXRlcyAicG9sbF9jaG9pY2UxIgogICAgZnJhbWVfZGlnIC03CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjI2CiAgICAvLyBzZWxmLnBvbGxfY2hvaWNlMiA9IGNob2ljZTIKICAgIHB1c2hieXRlcyAicG9sbF9jaG9pY2UyIgogICAgZnJhbWVfZGlnIC02CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjI3CiAgICAvLyBzZWxmLnBvbGxfY2hvaWNlMyA9IGNob2ljZTMKICAgIHB1c2hieXRlcyAicG9sbF9jaG9pY2UzIgogICAgZnJhbWVfZGlnIC01CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjI4CiAgICAvLyBzZWxmLnBvbGxfc3RhcnRfZGF0ZV91bml4ID0gc3RhcnRfZGF0ZV91bml4CiAgICBieXRlYyA5IC8vICJwb2xsX3N0YXJ0X2RhdGVfdW5peCIKICAgIGZyYW1lX2RpZyAtMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIyOQogICAgLy8gc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXggPSBlbmRfZGF0ZV91bml4CiAgICBieXRlYyA4IC8vICJwb2xsX2VuZF9kYXRlX3VuaXgiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyMzEKICAgIC8vIHNlbGYucG9sbF9maW5hbGl6ZWQgPSBVSW50NjQoMSkgICMgZmluYWxpemUgcG9sbAogICAgYnl0ZWNfMiAvLyAicG9sbF9maW5hbGl6ZWQiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIzMy0yMzQKICAgIC8vICMgTG9nIGluZm8gb24tY2hhaW4KICAgIC8vIGxvZygiUG9sbCBzdGFydCBkYXRlOiAiLCBzdGFydF9kYXRlX3N0cikKICAgIHB1c2hieXRlcyAiUG9sbCBzdGFydCBkYXRlOiAiCiAgICBmcmFtZV9kaWcgLTQKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyMzUKICAgIC8vIGxvZygiUG9sbCBlbmQgZGF0ZTogIiwgZW5kX2RhdGVfc3RyKQogICAgcHVzaGJ5dGVzICJQb2xsIGVuZCBkYXRlOiAiCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uc3VibWl0X3ZvdGUoYWNjb3VudDogYnl0ZXMsIGNob2ljZTogdWludDY0KSAtPiB2b2lkOgpzdWJtaXRfdm90ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIzNy0yMzkKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyBhbnkgdXNlciB0byBzdWJtaXQgdGhlaXIgdm90ZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc3VibWl0X3ZvdGUoc2VsZiwgYWNjb3VudDogQWNjb3VudCwgY2hvaWNlOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI0MC0yNDMKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgYWNjb3VudC5pc19vcHRlZF9pbigKICAgIC8vICAgICBBcHBsaWNhdGlvbihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkKICAgIC8vICksICJBY2NvdW50IG11c3QgYmUgb3B0ZWQtaW4gYmVmb3JlIHZvdGluZy4iCiAgICBmcmFtZV9kaWcgLTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI0MgogICAgLy8gQXBwbGljYXRpb24oR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI0MC0yNDMKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgYWNjb3VudC5pc19vcHRlZF9pbigKICAgIC8vICAgICBBcHBsaWNhdGlvbihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkKICAgIC8vICksICJBY2NvdW50IG11c3QgYmUgb3B0ZWQtaW4gYmVmb3JlIHZvdGluZy4iCiAgICBhcHBfb3B0ZWRfaW4KICAgIGFzc2VydCAvLyBBY2NvdW50IG11c3QgYmUgb3B0ZWQtaW4gYmVmb3JlIHZvdGluZy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI0NgogICAgLy8gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiBzZWxmLnBvbGxfc3RhcnRfZGF0ZV91bml4CiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAicG9sbF9zdGFydF9kYXRlX3VuaXgiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9zdGFydF9kYXRlX3VuaXggZXhpc3RzCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyNDUtMjQ3CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gc2VsZi5wb2xsX3N0YXJ0X2RhdGVfdW5peAogICAgLy8gKSwgIlZvdGluZyBwZXJpb2QgaGFzIG5vdCBzdGFydGVkIHlldC4iCiAgICBhc3NlcnQgLy8gVm90aW5nIHBlcmlvZCBoYXMgbm90IHN0YXJ0ZWQgeWV0LgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjUwCiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8IHNlbGYucG9sbF9lbmRfZGF0ZV91bml4CiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAicG9sbF9lbmRfZGF0ZV91bml4IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peCBleGlzdHMKICAgIDwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI0OS0yNTEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPCBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peAogICAgLy8gKSwgIlZvdGluZyBwZXJpb2QgaGFzIGVuZGVkLiIKICAgIGFzc2VydCAvLyBWb3RpbmcgcGVyaW9kIGhhcyBlbmRlZC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI1MwogICAgLy8gYXNzZXJ0IHNlbGYubG9jYWxfdm90ZV9jaG9pY2VbYWNjb3VudF0gPT0gVUludDY0KAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidm90ZV9jaG9pY2UiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sb2NhbF92b3RlX2Nob2ljZSBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI1My0yNTUKICAgIC8vIGFzc2VydCBzZWxmLmxvY2FsX3ZvdGVfY2hvaWNlW2FjY291bnRdID09IFVJbnQ2NCgKICAgIC8vICAgICAwCiAgICAvLyApLCAiVGhpcyBhY2NvdW50IGFscmVhZHkgc3VibWl0dGVkIGEgdm90ZS4iCiAgICAhCiAgICBhc3NlcnQgLy8gVGhpcyBhY2NvdW50IGFscmVhZHkgc3VibWl0dGVkIGEgdm90ZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI1OAogICAgLy8gY2hvaWNlID09IFVJbnQ2NCgxKSBvciBjaG9pY2UgPT0gVUludDY0KDIpIG9yIGNob2ljZSA9PSBVSW50NjQoMykKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBkdXAKICAgIGJueiBzdWJtaXRfdm90ZV9ib29sX3RydWVAMwogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIGJueiBzdWJtaXRfdm90ZV9ib29sX3RydWVAMwogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDMgLy8gMwogICAgPT0KICAgIGJ6IHN1Ym1pdF92b3RlX2Jvb2xfZmFsc2VANAoKc3VibWl0X3ZvdGVfYm9vbF90cnVlQDM6CiAgICBpbnRjXzEgLy8gMQogICAgYiBzdWJtaXRfdm90ZV9ib29sX21lcmdlQDUKCnN1Ym1pdF92b3RlX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCgpzdWJtaXRfdm90ZV9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyNTctMjU5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGNob2ljZSA9PSBVSW50NjQoMSkgb3IgY2hvaWNlID09IFVJbnQ2NCgyKSBvciBjaG9pY2UgPT0gVUludDY0KDMpCiAgICAvLyApLCAiSW52YWxpZCBjaG9pY2UuIENhbiBvbmx5IGNob29zZSBiZXR3ZWVuIGNob2ljZXMgMSwgMiwgMy4iCiAgICBhc3NlcnQgLy8gSW52YWxpZCBjaG9pY2UuIENhbiBvbmx5IGNob29zZSBiZXR3ZWVuIGNob2ljZXMgMSwgMiwgMy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI2MS0yNjIKICAgIC8vICMgTWFyayB0aGUgYWNjb3VudCBhcyBoYXZpbmcgdm90ZWQKICAgIC8vIHNlbGYubG9jYWxfdm90ZV9zdGF0dXNbYWNjb3VudF0gPSBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyAtMgogICAgYnl0ZWMgNyAvLyAidm90ZV9zdGF0dXMiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjY0LTI2NQogICAgLy8gIyBJbmNyZW1lbnQgY291bnQgZm9yIHRvdGFsIHZvdGVzCiAgICAvLyBzZWxmLnRvdGFsX3ZvdGVzICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInRvdGFsX3ZvdGVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3ZvdGVzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDYgLy8gInRvdGFsX3ZvdGVzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI2Ny0yNjgKICAgIC8vICMgVXBkYXRlIHZvdGUgdGFsbHkKICAgIC8vIGlmIGNob2ljZSA9PSBVSW50NjQoMSk6CiAgICBmcmFtZV9kaWcgMAogICAgYnogc3VibWl0X3ZvdGVfZWxzZV9ib2R5QDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI2OQogICAgLy8gc2VsZi5jaG9pY2UxX3RvdGFsICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImNob2ljZTFfdG90YWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2hvaWNlMV90b3RhbCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18zIC8vICJjaG9pY2UxX3RvdGFsIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gc2VsZi5sb2NhbF92b3RlX2Nob2ljZVthY2NvdW50XSA9IFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlY18wIC8vICJ2b3RlX2Nob2ljZSIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfbG9jYWxfcHV0CiAgICBiIHN1Ym1pdF92b3RlX2FmdGVyX2lmX2Vsc2VAMTEKCnN1Ym1pdF92b3RlX2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjcxCiAgICAvLyBlbGlmIGNob2ljZSA9PSBVSW50NjQoMik6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYnogc3VibWl0X3ZvdGVfZWxzZV9ib2R5QDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI3MgogICAgLy8gc2VsZi5jaG9pY2UyX3RvdGFsICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gImNob2ljZTJfdG90YWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2hvaWNlMl90b3RhbCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA0IC8vICJjaG9pY2UyX3RvdGFsIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI3MwogICAgLy8gc2VsZi5sb2NhbF92b3RlX2Nob2ljZVthY2NvdW50XSA9IFVJbnQ2NCgyKQogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlY18wIC8vICJ2b3RlX2Nob2ljZSIKICAgIGludGNfMiAvLyAyCiAgICBhcHBfbG9jYWxfcHV0CiAgICBiIHN1Ym1pdF92b3RlX2FmdGVyX2lmX2Vsc2VAMTEKCnN1Ym1pdF92b3RlX2Vsc2VfYm9keUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Mjc1CiAgICAvLyBzZWxmLmNob2ljZTNfdG90YWwgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiY2hvaWNlM190b3RhbCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jaG9pY2UzX3RvdGFsIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDUgLy8gImNob2ljZTNfdG90YWwiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Mjc2CiAgICAvLyBzZWxmLmxvY2FsX3ZvdGVfY2hvaWNlW2FjY291bnRdID0gVUludDY0KDMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGVjXzAgLy8gInZvdGVfY2hvaWNlIgogICAgcHVzaGludCAzIC8vIDMKICAgIGFwcF9sb2NhbF9wdXQKCnN1Ym1pdF92b3RlX2FmdGVyX2lmX2Vsc2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyNzgtMjc5CiAgICAvLyAjIExvZyBpbmZvIG9uLWNoYWluCiAgICAvLyBsb2coIlZvdGUgc3VibWl0dGVkIHN1Y2Nlc3NmdWxseSBmb3IgYWNjb3VudCBhZGRyZXNzOiAiLCBhY2NvdW50KQogICAgcHVzaGJ5dGVzICJWb3RlIHN1Ym1pdHRlZCBzdWNjZXNzZnVsbHkgZm9yIGFjY291bnQgYWRkcmVzczogIgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjgwCiAgICAvLyBsb2coIlZvdGUgc3VibWl0dGVkIGZvciBjaG9pY2UgbnVtYmVyOiAiLCBjaG9pY2UpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIHB1c2hieXRlcyAiVm90ZSBzdWJtaXR0ZWQgZm9yIGNob2ljZSBudW1iZXI6ICIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4udGVybWluYXRlKCkgLT4gdm9pZDoKdGVybWluYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjgyLTI4NAogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIHRoZSBjcmVhdG9yIHRvIGRlbGV0ZSBBcHAgYW5kIGdldCB0aGVpciBnbG9iYWwgc2NoZW1hIE1CUiBjb3N0IHJlZnVuZGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIkRlbGV0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgdGVybWluYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI4NwogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyODUtMjg4CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJPbmx5IEFwcCBjcmVhdG9yIGNhbiB0ZXJtaW5hdGUgdGhlIEFwcC4iCiAgICBhc3NlcnQgLy8gT25seSBBcHAgY3JlYXRvciBjYW4gdGVybWluYXRlIHRoZSBBcHAuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyOTItMjk4CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9c2VsZi5jYWxjX21icihudW1fYnl0ZXM9VUludDY0KDApLCBudW1fdWludD1VSW50NjQoOCkpIC0gbWluX3R4bl9mZWUsCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPW1pbl90eG5fZmVlLAogICAgLy8gICAgIG5vdGU9Ik1CUiByZWZ1bmQgZm9yIGRlbGV0aW5nIEFwcC4iLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjkzCiAgICAvLyByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyOTQKICAgIC8vIGFtb3VudD1zZWxmLmNhbGNfbWJyKG51bV9ieXRlcz1VSW50NjQoMCksIG51bV91aW50PVVJbnQ2NCg4KSkgLSBtaW5fdHhuX2ZlZSwKICAgIGludGNfMCAvLyAwCiAgICBwdXNoaW50IDggLy8gOAogICAgY2FsbHN1YiBjYWxjX21icgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjkwLTI5MQogICAgLy8gIyBTdWJtaXQgaW5uZXIgdHJhbnNhY3Rpb24gKGNyZWF0b3IgZ2V0cyB0aGVpciBtYnIgcGF5bWVudCByZWZ1bmRlZCkKICAgIC8vIG1pbl90eG5fZmVlID0gVUludDY0KDEwMDApCiAgICBpbnRjXzMgLy8gMTAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Mjk0CiAgICAvLyBhbW91bnQ9c2VsZi5jYWxjX21icihudW1fYnl0ZXM9VUludDY0KDApLCBudW1fdWludD1VSW50NjQoOCkpIC0gbWluX3R4bl9mZWUsCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyOTUKICAgIC8vIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI5NwogICAgLy8gbm90ZT0iTUJSIHJlZnVuZCBmb3IgZGVsZXRpbmcgQXBwLiIsCiAgICBwdXNoYnl0ZXMgIk1CUiByZWZ1bmQgZm9yIGRlbGV0aW5nIEFwcC4iCiAgICBpdHhuX2ZpZWxkIE5vdGUKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjkyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyOTAtMjkxCiAgICAvLyAjIFN1Ym1pdCBpbm5lciB0cmFuc2FjdGlvbiAoY3JlYXRvciBnZXRzIHRoZWlyIG1iciBwYXltZW50IHJlZnVuZGVkKQogICAgLy8gbWluX3R4bl9mZWUgPSBVSW50NjQoMTAwMCkKICAgIGludGNfMyAvLyAxMDAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjkyLTI5OAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PXNlbGYuY2FsY19tYnIobnVtX2J5dGVzPVVJbnQ2NCgwKSwgbnVtX3VpbnQ9VUludDY0KDgpKSAtIG1pbl90eG5fZmVlLAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZlZT1taW5fdHhuX2ZlZSwKICAgIC8vICAgICBub3RlPSJNQlIgcmVmdW5kIGZvciBkZWxldGluZyBBcHAuIiwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozMDMKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgIlRlcm1pbmF0aW9uIG1ldGhvZCBzdWNjZXNzZnVsIGZvciBBcHAgSUQ6ICIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzAwLTMwNAogICAgLy8gIyBMb2cgaW5mbyBvbi1jaGFpbgogICAgLy8gbG9nKAogICAgLy8gICAgICJUZXJtaW5hdGlvbiBtZXRob2Qgc3VjY2Vzc2Z1bCBmb3IgQXBwIElEOiAiLAogICAgLy8gICAgIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkLAogICAgLy8gKQogICAgbG9nCiAgICByZXRzdWIK",
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uYXBwcm92YWxfcHJvZ3JhbToKICAgIGludGNibG9jayAwIDEgMzIgMTAwMCA4NTYKICAgIGJ5dGVjYmxvY2sgInAiIDB4MDAgInRvdGFsX3BvbGxzIiAidG90YWxfYmFsbG90X2JveGVzIiAweDE1MWY3Yzc1ICJ0b3RhbF9hY2NvdW50c19vcHRlZF9pbiIgInZvdGVzX2Nhc3QiICJ2IiAibmV4dF9wb2xsX2lkIiAweDAwMDAwMDAwMDAwMDAwMDAgIm1icl9wYXllciIgImMiIDB4MDY4MTAxCiAgICBjYWxsc3ViIF9fcHV5YV9hcmM0X3JvdXRlcl9fCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uX19wdXlhX2FyYzRfcm91dGVyX18oKSAtPiB1aW50NjQ6Cl9fcHV5YV9hcmM0X3JvdXRlcl9fOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTQ2CiAgICAvLyBjbGFzcyBWb3RlQ2hhaW4oQVJDNENvbnRyYWN0KToKICAgIHByb3RvIDAgMQogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMTkKICAgIHB1c2hieXRlc3MgMHg1YmUyMTlmMCAweGY5NzQ0NzI0IDB4NmY4YWE4ODggMHhiM2ZiMjc1YiAweGI3NDQxMDAwIDB4NzJmYjVlYzIgMHhmZjk1YjlmNiAweGRkNWU4YmQ4IDB4NjczNmJiZGYgMHgwMGQxMTczYiAweGU3ZWU1OGNiIDB4Mzc5NjUyOTggMHhiNjcxZmFkYSAweDVmZjE2ZGE0IC8vIG1ldGhvZCAiZ2VuZXJhdGUoKXZvaWQiLCBtZXRob2QgImdsb2JhbF9zdG9yYWdlX21icihwYXkpdm9pZCIsIG1ldGhvZCAibG9jYWxfc3RvcmFnZV9tYnIoYWNjb3VudCxwYXkpdm9pZCIsIG1ldGhvZCAib3B0X291dChhY2NvdW50KXZvaWQiLCBtZXRob2QgInNldHVwX3BvbGwocGF5LGJ5dGVbXSxieXRlW11bXSxib29sLGJ5dGVbMzJdLHN0cmluZyx1aW50NjQsc3RyaW5nLHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgInN1Ym1pdF92b3RlKHVpbnQ2NCxhY2NvdW50LHBheSx1aW50NjQsYnl0ZVszMl1bXSl2b2lkIiwgbWV0aG9kICJzdWJtaXRfdm90ZV9iYXRjaCh1aW50NjQscGF5LGFkZHJlc3NbXSx1aW50NjRbXSxieXRlW11bXSl2b2lkIiwgbWV0aG9kICJmaW5hbGl6ZV9yZXN1bHRzKHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImdldF9wb2xsX3NuYXBzaG90KHVpbnQ2NCkodWludDY0LGJ5dGVbXSxieXRlW11bXSx1aW50NjQsdWludDY0LGJvb2wsYnl0ZVszMl0sdWludDY0LHVpbnQ2NCxieXRlWzMyXSxib29sLHVpbnQ2NCx1aW50NjQsdWludDY0W10pIiwgbWV0aG9kICJnZXRfdm90ZXJfc3RhdHVzKHVpbnQ2NCxhY2NvdW50KShib29sLHVpbnQ2NCxib29sLHVpbnQ2NCkiLCBtZXRob2QgImJveF9vcHRfb3V0KHVpbnQ2NCxhY2NvdW50KXZvaWQiLCBtZXRob2QgInN3ZWVwKHVpbnQ2NCxhZGRyZXNzW10pdWludDY0IiwgbWV0aG9kICJkZWxldGVfcG9sbCh1aW50NjQpdm9pZCIsIG1ldGhvZCAidGVybWluYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggX19wdXlhX2FyYzRfcm91dGVyX19fZ2VuZXJhdGVfcm91dGVAMiBfX3B1eWFfYXJjNF9yb3V0ZXJfX19nbG9iYWxfc3RvcmFnZV9tYnJfcm91dGVAMyBfX3B1eWFfYXJjNF9yb3V0ZXJfX19sb2NhbF9zdG9yYWdlX21icl9yb3V0ZUA0IF9fcHV5YV9hcmM0X3JvdXRlcl9fX29wdF9vdXRfcm91dGVANSBfX3B1eWFfYXJjNF9yb3V0ZXJfX19zZXR1cF9wb2xsX3JvdXRlQDYgX19wdXlhX2FyYzRfcm91dGVyX19fc3VibWl0X3ZvdGVfcm91dGVANyBfX3B1eWFfYXJjNF9yb3V0ZXJfX19zdWJtaXRfdm90ZV9iYXRjaF9yb3V0ZUA4IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2ZpbmFsaXplX3Jlc3VsdHNfcm91dGVAOSBfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZXRfcG9sbF9zbmFwc2hvdF9yb3V0ZUAxMCBfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZXRfdm90ZXJfc3RhdHVzX3JvdXRlQDExIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2JveF9vcHRfb3V0X3JvdXRlQDEyIF9fcHV5YV9hcmM0X3JvdXRlcl9fX3N3ZWVwX3JvdXRlQDEzIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2RlbGV0ZV9wb2xsX3JvdXRlQDE0IF9fcHV5YV9hcmM0X3JvdXRlcl9fX3Rlcm1pbmF0ZV9yb3V0ZUAxNQogICAgaW50Y18wIC8vIDAKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fZ2VuZXJhdGVfcm91dGVAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjM3NC0zNzUKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGNyZWF0ZXMgdGhlIHNtYXJ0IGNvbnRyYWN0IEFwcAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gaXMgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2VuZXJhdGUKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2dsb2JhbF9zdG9yYWdlX21icl9yb3V0ZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Mzk2LTM5NwogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIHRoZSBjcmVhdG9yIHRvIHVzZSBnbG9iYWwgc3RvcmFnZSBieSBwYXlpbmcgYSBNQlIgY29zdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gY2xhc3MgVm90ZUNoYWluKEFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjM5Ni0zOTcKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyB0aGUgY3JlYXRvciB0byB1c2UgZ2xvYmFsIHN0b3JhZ2UgYnkgcGF5aW5nIGEgTUJSIGNvc3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGdsb2JhbF9zdG9yYWdlX21icgogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fbG9jYWxfc3RvcmFnZV9tYnJfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQxMy00MTQKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyBhbnkgdXNlciB0byBvcHQgaW4gdG8gdGhlIHNtYXJ0IGNvbnRyYWN0J3MgbG9jYWwgc3RvcmFnZSBieSBwYXlpbmcgYSBNQlIgY29zdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJPcHRJbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50Y18xIC8vIE9wdEluCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBPcHRJbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gY2xhc3MgVm90ZUNoYWluKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0MTMtNDE0CiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgYW55IHVzZXIgdG8gb3B0IGluIHRvIHRoZSBzbWFydCBjb250cmFjdCdzIGxvY2FsIHN0b3JhZ2UgYnkgcGF5aW5nIGEgTUJSIGNvc3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIGNhbGxzdWIgbG9jYWxfc3RvcmFnZV9tYnIKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX29wdF9vdXRfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ0Mi00NDMKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyBhbnkgdXNlciB0byBvcHQgb3V0IG9mIHRoZSBzbWFydCBjb250cmFjdCdzIGxvY2FsIHN0b3JhZ2UgdmlhIHRoZSAnY2xvc2Ugb3V0JyBtZXRob2QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiQ2xvc2VPdXQiXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgMiAvLyBDbG9zZU91dAogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgQ2xvc2VPdXQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxNDYKICAgIC8vIGNsYXNzIFZvdGVDaGFpbihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ0Mi00NDMKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyBhbnkgdXNlciB0byBvcHQgb3V0IG9mIHRoZSBzbWFydCBjb250cmFjdCdzIGxvY2FsIHN0b3JhZ2UgdmlhIHRoZSAnY2xvc2Ugb3V0JyBtZXRob2QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiQ2xvc2VPdXQiXSkKICAgIGNhbGxzdWIgb3B0X291dAogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fc2V0dXBfcG9sbF9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDcyLTQ3MwogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIHRoZSBjcmVhdG9yIHRvIHNldCB1cCBhIG5ldyBwb2xsIGFuZCBwYXkgdGhlIE1CUiBjb3N0IG9mIHRoZSBwb2xsIGJveGVzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTQ2CiAgICAvLyBjbGFzcyBWb3RlQ2hhaW4oQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA3CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgOAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDcyLTQ3MwogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIHRoZSBjcmVhdG9yIHRvIHNldCB1cCBhIG5ldyBwb2xsIGFuZCBwYXkgdGhlIE1CUiBjb3N0IG9mIHRoZSBwb2xsIGJveGVzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBzZXR1cF9wb2xsCiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19zdWJtaXRfdm90ZV9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTc3LTU3OAogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIGFueSB1c2VyIHRvIHN1Ym1pdCB0aGVpciB2b3RlIHRvIGJveCBzdG9yYWdlIGFuZCBwYXkgaXRzIE1CUiBjb3N0IGluIHRoZSBzYW1lIGdyb3VwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTQ2CiAgICAvLyBjbGFzcyBWb3RlQ2hhaW4oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU3Ny01NzgKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyBhbnkgdXNlciB0byBzdWJtaXQgdGhlaXIgdm90ZSB0byBib3ggc3RvcmFnZSBhbmQgcGF5IGl0cyBNQlIgY29zdCBpbiB0aGUgc2FtZSBncm91cAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc3VibWl0X3ZvdGUKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX3N1Ym1pdF92b3RlX2JhdGNoX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2MTMtNjE0CiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgYSByZWxheWVyIHRvIHN1Ym1pdCBhIGJhdGNoIG9mIHNpZ25lZCB2b3RlcyBhbmQgcGF5IHRoZWlyIE1CUiBjb3N0IGluIG9uZSBncm91cAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gY2xhc3MgVm90ZUNoYWluKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjYxMy02MTQKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyBhIHJlbGF5ZXIgdG8gc3VibWl0IGEgYmF0Y2ggb2Ygc2lnbmVkIHZvdGVzIGFuZCBwYXkgdGhlaXIgTUJSIGNvc3QgaW4gb25lIGdyb3VwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBzdWJtaXRfdm90ZV9iYXRjaAogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fZmluYWxpemVfcmVzdWx0c19yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjgyLTY4MwogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIGFueW9uZSB0byBmcmVlemUgdGhlIHJlc3VsdHMgb2YgYSBwb2xsIGFmdGVyIHRoZSB2b3RpbmcgcGVyaW9kCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTQ2CiAgICAvLyBjbGFzcyBWb3RlQ2hhaW4oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY4Mi02ODMKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyBhbnlvbmUgdG8gZnJlZXplIHRoZSByZXN1bHRzIG9mIGEgcG9sbCBhZnRlciB0aGUgdm90aW5nIHBlcmlvZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZmluYWxpemVfcmVzdWx0cwogICAgaXRvYgogICAgYnl0ZWMgNCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fZ2V0X3BvbGxfc25hcHNob3Rfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3MzQtNzM3CiAgICAvLyAjIERlZmluZSByZWFkLW9ubHkgYWJpbWV0aG9kIHRoYXQgcmV0dXJucyB0aGUgd2hvbGUgc3RhdGUgb2YgYSBwb2xsIGluIG9uZSBjYWxsIChtZWFudCB0byBiZSBzaW11bGF0ZWQpCiAgICAvLyAjIE5PVEU6IFNuYXBzaG90cyBvZiBwb2xscyB3aXRoIGNsb3NlIHRvIDMyIG1heCBzaXplIGNob2ljZXMgZXhjZWVkIHRoZSA0LDA5NiBieXRlIEFWTSB2YWx1ZSBsaW1pdCwgdGhvc2UgcG9sbHMKICAgIC8vICMgY2FuIG9ubHkgYmUgcmVhZCB2aWEgdGhlaXIgYm94ZXMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTQ2CiAgICAvLyBjbGFzcyBWb3RlQ2hhaW4oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjczNC03MzcKICAgIC8vICMgRGVmaW5lIHJlYWQtb25seSBhYmltZXRob2QgdGhhdCByZXR1cm5zIHRoZSB3aG9sZSBzdGF0ZSBvZiBhIHBvbGwgaW4gb25lIGNhbGwgKG1lYW50IHRvIGJlIHNpbXVsYXRlZCkKICAgIC8vICMgTk9URTogU25hcHNob3RzIG9mIHBvbGxzIHdpdGggY2xvc2UgdG8gMzIgbWF4IHNpemUgY2hvaWNlcyBleGNlZWQgdGhlIDQsMDk2IGJ5dGUgQVZNIHZhbHVlIGxpbWl0LCB0aG9zZSBwb2xscwogICAgLy8gIyBjYW4gb25seSBiZSByZWFkIHZpYSB0aGVpciBib3hlcwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9wb2xsX3NuYXBzaG90CiAgICBieXRlYyA0IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZXRfdm90ZXJfc3RhdHVzX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzY4LTc2OQogICAgLy8gIyBEZWZpbmUgcmVhZC1vbmx5IGFiaW1ldGhvZCB0aGF0IHJldHVybnMgdGhlIHZvdGluZyBzdGF0dXMgb2YgYW4gYWNjb3VudCBpbiBhIHBvbGwgKG1lYW50IHRvIGJlIHNpbXVsYXRlZCBpbiBidWxrKQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxNDYKICAgIC8vIGNsYXNzIFZvdGVDaGFpbihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc2OC03NjkKICAgIC8vICMgRGVmaW5lIHJlYWQtb25seSBhYmltZXRob2QgdGhhdCByZXR1cm5zIHRoZSB2b3Rpbmcgc3RhdHVzIG9mIGFuIGFjY291bnQgaW4gYSBwb2xsIChtZWFudCB0byBiZSBzaW11bGF0ZWQgaW4gYnVsaykKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfdm90ZXJfc3RhdHVzCiAgICBieXRlYyA0IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19ib3hfb3B0X291dF9yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc4Ni03ODcKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGRlbGV0ZXMgYW4gYWNjb3VudCdzIGJhbGxvdCBib3ggYWZ0ZXIgdGhlIHZvdGluZyBwZXJpb2QgYW5kIHJlZnVuZHMgdGhlIE1CUiBwYXllcgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gY2xhc3MgVm90ZUNoYWluKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Nzg2LTc4NwogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgZGVsZXRlcyBhbiBhY2NvdW50J3MgYmFsbG90IGJveCBhZnRlciB0aGUgdm90aW5nIHBlcmlvZCBhbmQgcmVmdW5kcyB0aGUgTUJSIHBheWVyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBib3hfb3B0X291dAogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fc3dlZXBfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4MTEtODEzCiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgdGhlIGNyZWF0b3IgdG8gcmVsZWFzZSBhIGJhdGNoIG9mIGJhbGxvdCBib3hlcyBhZnRlciB0aGUgdm90aW5nIHBlcmlvZCBhbmQgcmVmdW5kCiAgICAvLyAjIGV2ZXJ5IGJhbGxvdCBib3ggTUJSIGNvc3QgdG8gdGhlIGFjY291bnQgdGhhdCBwYWlkIGl0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTQ2CiAgICAvLyBjbGFzcyBWb3RlQ2hhaW4oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgxMS04MTMKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyB0aGUgY3JlYXRvciB0byByZWxlYXNlIGEgYmF0Y2ggb2YgYmFsbG90IGJveGVzIGFmdGVyIHRoZSB2b3RpbmcgcGVyaW9kIGFuZCByZWZ1bmQKICAgIC8vICMgZXZlcnkgYmFsbG90IGJveCBNQlIgY29zdCB0byB0aGUgYWNjb3VudCB0aGF0IHBhaWQgaXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHN3ZWVwCiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19kZWxldGVfcG9sbF9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg1MC04NTEKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyB0aGUgY3JlYXRvciB0byBkZWxldGUgYSBjbG9zZWQgcG9sbCBhbmQgZ2V0IHRoZSBwb2xsIGJveGVzIE1CUiBjb3N0IHJlZnVuZGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTQ2CiAgICAvLyBjbGFzcyBWb3RlQ2hhaW4oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg1MC04NTEKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyB0aGUgY3JlYXRvciB0byBkZWxldGUgYSBjbG9zZWQgcG9sbCBhbmQgZ2V0IHRoZSBwb2xsIGJveGVzIE1CUiBjb3N0IHJlZnVuZGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBkZWxldGVfcG9sbAogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fdGVybWluYXRlX3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODk5LTkwMAogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIHRoZSBjcmVhdG9yIHRvIGRlbGV0ZSBBcHAgYW5kIGdldCB0aGVpciBnbG9iYWwgc2NoZW1hIE1CUiBjb3N0IHJlZnVuZGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIkRlbGV0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB0ZXJtaW5hdGUKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxNDYKICAgIC8vIGNsYXNzIFZvdGVDaGFpbihBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5nZW5lcmF0ZSgpIC0+IHZvaWQ6CmdlbmVyYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Mzc0LTM3NgogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgY3JlYXRlcyB0aGUgc21hcnQgY29udHJhY3QgQXBwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIC8vIGRlZiBnZW5lcmF0ZShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozNzkKICAgIC8vIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Mzc3LTM4MAogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIG11c3QgbWF0Y2ggY3JlYXRvciBhZGRyZXNzLiIKICAgIGFzc2VydCAvLyBUcmFuc2FjdGlvbiBzZW5kZXIgbXVzdCBtYXRjaCBjcmVhdG9yIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozODItMzgzCiAgICAvLyAjIEdsb2JhbCBzdG9yYWdlIHZhcmlhYmxlIGFzc2lnbm1lbnRzCiAgICAvLyBzZWxmLm5leHRfcG9sbF9pZCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgOCAvLyAibmV4dF9wb2xsX2lkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozODQKICAgIC8vIHNlbGYudG90YWxfcG9sbHMgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gInRvdGFsX3BvbGxzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozODYKICAgIC8vIHNlbGYudG90YWxfYWNjb3VudHNfb3B0ZWRfaW4gPSBVSW50NjQoMCkKICAgIGJ5dGVjIDUgLy8gInRvdGFsX2FjY291bnRzX29wdGVkX2luIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozODcKICAgIC8vIHNlbGYudG90YWxfYmFsbG90X2JveGVzID0gVUludDY0KDApCiAgICBieXRlY18zIC8vICJ0b3RhbF9iYWxsb3RfYm94ZXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjM4OS0zOTAKICAgIC8vICMgTG9nIGluZm8gb24tY2hhaW4KICAgIC8vIGFyYzQuZW1pdCgiVmlldyh1aW50NjQpIiwgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIGl0b2IKICAgIHB1c2hieXRlcyAweGM2Mzc2MWNmIC8vIG1ldGhvZCAiVmlldyh1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjM5MwogICAgLy8gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIGl0b2IKICAgIHB1c2hieXRlcyAiR2VuZXJhdGlvbiBtZXRob2Qgc3VjY2Vzc2Z1bCBmb3IgQXBwIElEOiAiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjM5MS0zOTQKICAgIC8vIGxvZygKICAgIC8vICAgICAiR2VuZXJhdGlvbiBtZXRob2Qgc3VjY2Vzc2Z1bCBmb3IgQXBwIElEOiAiLAogICAgLy8gICAgIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkLAogICAgLy8gKQogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uZ2xvYmFsX3N0b3JhZ2VfbWJyKG1icl9wYXk6IHVpbnQ2NCkgLT4gdm9pZDoKZ2xvYmFsX3N0b3JhZ2VfbWJyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Mzk2LTM5OAogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIHRoZSBjcmVhdG9yIHRvIHVzZSBnbG9iYWwgc3RvcmFnZSBieSBwYXlpbmcgYSBNQlIgY29zdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBnbG9iYWxfc3RvcmFnZV9tYnIoc2VsZiwgbWJyX3BheTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjM5OS00MDAKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgbWJyX3BheS5hbW91bnQgPT0gc2VsZi5jYWxjX21icigKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0MDEKICAgIC8vIG51bV9ieXRlcz1VSW50NjQoMCksIG51bV91aW50PVVJbnQ2NCg0KSAgIyBDYWxjIE1CUiBmb3IgdXNpbmcgZ2xvYmFsIHNjaGVtYQogICAgaW50Y18wIC8vIDAKICAgIHB1c2hpbnQgNCAvLyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozOTktNDAyCiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0IG1icl9wYXkuYW1vdW50ID09IHNlbGYuY2FsY19tYnIoCiAgICAvLyAgICAgbnVtX2J5dGVzPVVJbnQ2NCgwKSwgbnVtX3VpbnQ9VUludDY0KDQpICAjIENhbGMgTUJSIGZvciB1c2luZyBnbG9iYWwgc2NoZW1hCiAgICAvLyApLCAiTUJSIHBheW1lbnQgbXVzdCBtZWV0IHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50IGFtb3VudC4iCiAgICBjYWxsc3ViIGNhbGNfbWJyCiAgICA9PQogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IG11c3QgbWVldCB0aGUgbWluaW11bSByZXF1aXJlbWVudCBhbW91bnQuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0MDQKICAgIC8vIG1icl9wYXkuc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0MDMtNDA1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkuc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJNQlIgcGF5bWVudCBzZW5kZXIgbXVzdCBtYXRjaCB0aGUgQXBwIGNyZWF0b3IgYWNjb3VudC4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgc2VuZGVyIG11c3QgbWF0Y2ggdGhlIEFwcCBjcmVhdG9yIGFjY291bnQuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0MDcKICAgIC8vIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0MDYtNDA4CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgIk1CUiBwYXltZW50IHJlY2lldmVyIG11c3QgYmUgdGhlIEFwcCBhZGRyZXNzLiIKICAgIGFzc2VydCAvLyBNQlIgcGF5bWVudCByZWNpZXZlciBtdXN0IGJlIHRoZSBBcHAgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQxMC00MTEKICAgIC8vICMgTG9nIGluZm8gb24tY2hhaW4KICAgIC8vIGxvZygiR2xvYmFsIFN0YXRlIHN1Y2Nlc3NmdWxseSBmdW5kZWQgYnkgYWNjb3VudCBhZGRyZXNzOiAiLCBUeG4uc2VuZGVyKQogICAgcHVzaGJ5dGVzICJHbG9iYWwgU3RhdGUgc3VjY2Vzc2Z1bGx5IGZ1bmRlZCBieSBhY2NvdW50IGFkZHJlc3M6ICIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uY2FsY19tYnIobnVtX2J5dGVzOiB1aW50NjQsIG51bV91aW50OiB1aW50NjQpIC0+IHVpbnQ2NDoKY2FsY19tYnI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxNzctMTc5CiAgICAvLyAjIERlZmluZSBzdWJyb3V0aW5lIHRoYXQgY2FsY3VsYXRlcyB0aGUgbWluaW11bSBiYWxhbmNlIHJlcXVpcmVtZW50IHRvdGFsIGNvc3QKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2FsY19tYnIoc2VsZiwgbnVtX2J5dGVzOiBVSW50NjQsIG51bV91aW50OiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTgxCiAgICAvLyBieXRlX2ZlZSA9IFVJbnQ2NCg1MF8wMDApICAjIEJ5dGUgc2xpY2UgZmVlIGZvciBrZXktdmFsdWUgcGFpcgogICAgcHVzaGludCA1MDAwMCAvLyA1MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTg0LTE4NQogICAgLy8gIyBNdWx0aXBseSByZXNwZWN0aXZlIGZlZSBjb3N0IHdpdGggdGhlIG51bWJlciBvZiBrZXktdmFsdWUgcGFpcnMgaW4gZWFjaCBzY2hlbWEgdG8gZ2V0IHRvdGFsIGZlZSBhbW91bnQKICAgIC8vIHRvdGFsX2J5dGVfZmVlID0gYnl0ZV9mZWUgKiBudW1fYnl0ZXMKICAgIGZyYW1lX2RpZyAtMgogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTgyCiAgICAvLyB1aW50X2ZlZSA9IFVJbnQ2NCgyOF81MDApICAjIFVJbnQ2NCBmZWUgZm9yIGtleS12YWx1ZSBwYWlyCiAgICBwdXNoaW50IDI4NTAwIC8vIDI4NTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxODYKICAgIC8vIHRvdGFsX3VpbnRfZmVlID0gdWludF9mZWUgKiBudW1fdWludAogICAgZnJhbWVfZGlnIC0xCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxODgtMTg5CiAgICAvLyAjIFJldHVybiB0aGUgbWluaW11bSBiYWxhbmNlIHJlcXVpcmVtZW50IHRvdGFsIGNvc3QKICAgIC8vIHJldHVybiBHbG9iYWwubWluX2JhbGFuY2UgKyBiYXNlX2ZlZSArIHRvdGFsX2J5dGVfZmVlICsgdG90YWxfdWludF9mZWUKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxODAKICAgIC8vIGJhc2VfZmVlID0gVUludDY0KDEwMF8wMDApICAjIEJhc2UgZmVlCiAgICBwdXNoaW50IDEwMDAwMCAvLyAxMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE4OC0xODkKICAgIC8vICMgUmV0dXJuIHRoZSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgdG90YWwgY29zdAogICAgLy8gcmV0dXJuIEdsb2JhbC5taW5fYmFsYW5jZSArIGJhc2VfZmVlICsgdG90YWxfYnl0ZV9mZWUgKyB0b3RhbF91aW50X2ZlZQogICAgKwogICAgdW5jb3ZlciAyCiAgICArCiAgICArCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4ubG9jYWxfc3RvcmFnZV9tYnIoYWNjb3VudDogYnl0ZXMsIG1icl9wYXk6IHVpbnQ2NCkgLT4gdm9pZDoKbG9jYWxfc3RvcmFnZV9tYnI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0MTMtNDE3CiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgYW55IHVzZXIgdG8gb3B0IGluIHRvIHRoZSBzbWFydCBjb250cmFjdCdzIGxvY2FsIHN0b3JhZ2UgYnkgcGF5aW5nIGEgTUJSIGNvc3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIC8vIGRlZiBsb2NhbF9zdG9yYWdlX21icigKICAgIC8vICAgICBzZWxmLCBhY2NvdW50OiBBY2NvdW50LCBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbgogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0MTgtNDE5CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0IG1icl9wYXkuYW1vdW50ID09IHNlbGYuY2FsY19tYnIoCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDIwCiAgICAvLyBudW1fYnl0ZXM9VUludDY0KDEpLCBudW1fdWludD1VSW50NjQoMSkgICMgQ2FsYyBNQlIgZm9yIHVzaW5nIGxvY2FsIHNjaGVtYQogICAgaW50Y18xIC8vIDEKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDE4LTQyMQogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA9PSBzZWxmLmNhbGNfbWJyKAogICAgLy8gICAgIG51bV9ieXRlcz1VSW50NjQoMSksIG51bV91aW50PVVJbnQ2NCgxKSAgIyBDYWxjIE1CUiBmb3IgdXNpbmcgbG9jYWwgc2NoZW1hCiAgICAvLyApLCAiTUJSIHBheW1lbnQgbXVzdCBtZWV0IHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50IGFtb3VudC4iCiAgICBjYWxsc3ViIGNhbGNfbWJyCiAgICA9PQogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IG11c3QgbWVldCB0aGUgbWluaW11bSByZXF1aXJlbWVudCBhbW91bnQuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0MjQKICAgIC8vIFR4bi5zZW5kZXIgPT0gYWNjb3VudAogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0yCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDIyLTQyNQogICAgLy8gIyBUaGUgTUJSIHBheW1lbnQgbWF5IGNvbWUgZnJvbSBhIHNwb25zb3IgKHJlbGF5ZXIpIHRoYXQgYWxzbyBjb3ZlcnMgdGhlIHplcm8gZmVlIG9wdC1pbiBjYWxsIHZpYSBmZWUgcG9vbGluZwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IGFjY291bnQKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgbXVzdCBtYXRjaCB0aGUgYWNjb3VudCBvcHRpbmcgaW4uIgogICAgYXNzZXJ0IC8vIFRyYW5zYWN0aW9uIHNlbmRlciBtdXN0IG1hdGNoIHRoZSBhY2NvdW50IG9wdGluZyBpbi4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQyNwogICAgLy8gbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQyNi00MjgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiTUJSIHBheW1lbnQgcmVjaWV2ZXIgbXVzdCBiZSB0aGUgQXBwIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IHJlY2lldmVyIG11c3QgYmUgdGhlIEFwcCBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDMwLTQzMQogICAgLy8gIyBDaGFuZ2UgbG9jYWwgc3RhdGUgdmFyICdzZWxmLmxvY2FsX3ZvdGVzX2Nhc3QnIChzcGVjaWZpYyB0byBhY2NvdW50KSB2YWx1ZSBmcm9tICdOb25lJyB0byAnMCcKICAgIC8vIHNlbGYubG9jYWxfdm90ZXNfY2FzdFthY2NvdW50XSA9IFVJbnQ2NCgwKQogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlYyA2IC8vICJ2b3Rlc19jYXN0IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQzMy00MzQKICAgIC8vICMgUmVjb3JkIHdobyBwYWlkIHRoZSBNQlIsIHNvIGNsb3Npbmcgb3V0IHJlZnVuZHMgdGhlIHBheWVyICh0aGUgYWNjb3VudCBvciBhIHNwb25zb3IpCiAgICAvLyBzZWxmLmxvY2FsX21icl9wYXllclthY2NvdW50XSA9IG1icl9wYXkuc2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlYyAxMCAvLyAibWJyX3BheWVyIgogICAgdW5jb3ZlciAyCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0MzYtNDM3CiAgICAvLyAjIEluY3JlbWVudCBjb3VudCBmb3IgdG90YWwgYWNjb3VudHMgb3B0ZWQgaW4KICAgIC8vIHNlbGYudG90YWxfYWNjb3VudHNfb3B0ZWRfaW4gKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAidG90YWxfYWNjb3VudHNfb3B0ZWRfaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfYWNjb3VudHNfb3B0ZWRfaW4gZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgNSAvLyAidG90YWxfYWNjb3VudHNfb3B0ZWRfaW4iCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDM5LTQ0MAogICAgLy8gIyBFbWl0IGV2ZW50IG9uLWNoYWluCiAgICAvLyBhcmM0LmVtaXQoT3B0ZWRJbihhY2NvdW50PWFyYzQuQWRkcmVzcyhhY2NvdW50KSkpCiAgICBwdXNoYnl0ZXMgMHhhMGI4ZGMwMiAvLyBtZXRob2QgIk9wdGVkSW4oYWRkcmVzcykiCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4ub3B0X291dChhY2NvdW50OiBieXRlcykgLT4gdm9pZDoKb3B0X291dDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ0Mi00NDQKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyBhbnkgdXNlciB0byBvcHQgb3V0IG9mIHRoZSBzbWFydCBjb250cmFjdCdzIGxvY2FsIHN0b3JhZ2UgdmlhIHRoZSAnY2xvc2Ugb3V0JyBtZXRob2QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiQ2xvc2VPdXQiXSkKICAgIC8vIGRlZiBvcHRfb3V0KHNlbGYsIGFjY291bnQ6IEFjY291bnQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ0NS00NDkKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzIChiYWxsb3RzIGxpdmUgaW4gYm94IHN0b3JhZ2UsIHNvIGFuCiAgICAvLyAjIGFjY291bnQgY2FuIG9wdCBvdXQgYXQgYW55IHRpbWUgd2l0aG91dCBhZmZlY3RpbmcgdGhlIHBvbGxzIGl0IHZvdGVkIGluKQogICAgLy8gYXNzZXJ0IGFjY291bnQuaXNfb3B0ZWRfaW4oCiAgICAvLyAgICAgQXBwbGljYXRpb24oR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpCiAgICAvLyApLCAiQWNjb3VudCBtdXN0IGZpcnN0IGJlIG9wdGVkLWluIHRvIEFwcCBjbGllbnQgaW4gb3JkZXIgdG8gY2xvc2Ugb3V0LiIKICAgIGZyYW1lX2RpZyAtMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDQ4CiAgICAvLyBBcHBsaWNhdGlvbihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDQ1LTQ0OQogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMgKGJhbGxvdHMgbGl2ZSBpbiBib3ggc3RvcmFnZSwgc28gYW4KICAgIC8vICMgYWNjb3VudCBjYW4gb3B0IG91dCBhdCBhbnkgdGltZSB3aXRob3V0IGFmZmVjdGluZyB0aGUgcG9sbHMgaXQgdm90ZWQgaW4pCiAgICAvLyBhc3NlcnQgYWNjb3VudC5pc19vcHRlZF9pbigKICAgIC8vICAgICBBcHBsaWNhdGlvbihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkKICAgIC8vICksICJBY2NvdW50IG11c3QgZmlyc3QgYmUgb3B0ZWQtaW4gdG8gQXBwIGNsaWVudCBpbiBvcmRlciB0byBjbG9zZSBvdXQuIgogICAgYXBwX29wdGVkX2luCiAgICBhc3NlcnQgLy8gQWNjb3VudCBtdXN0IGZpcnN0IGJlIG9wdGVkLWluIHRvIEFwcCBjbGllbnQgaW4gb3JkZXIgdG8gY2xvc2Ugb3V0LgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDUxLTQ1MgogICAgLy8gIyBEZWxldGUgdGhlIHVzZXIncyBsb2NhbCBzdG9yYWdlIChrZWVwaW5nIHRoZSBNQlIgcGF5ZXIgdG8gcmVmdW5kKQogICAgLy8gbWJyX3BheWVyID0gc2VsZi5sb2NhbF9tYnJfcGF5ZXJbYWNjb3VudF0KICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJtYnJfcGF5ZXIiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sb2NhbF9tYnJfcGF5ZXIgZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0NTMKICAgIC8vIGRlbCBzZWxmLmxvY2FsX3ZvdGVzX2Nhc3RbYWNjb3VudF0KICAgIGZyYW1lX2RpZyAtMQogICAgYnl0ZWMgNiAvLyAidm90ZXNfY2FzdCIKICAgIGFwcF9sb2NhbF9kZWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ1NAogICAgLy8gZGVsIHNlbGYubG9jYWxfbWJyX3BheWVyW2FjY291bnRdCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ5dGVjIDEwIC8vICJtYnJfcGF5ZXIiCiAgICBhcHBfbG9jYWxfZGVsCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0NTYtNDU3CiAgICAvLyAjIERlY3JlYXNlIHRoZSB0b3RhbCBjb3VudCBvZiBvcHRlZC1pbiBhY2NvdW50cwogICAgLy8gc2VsZi50b3RhbF9hY2NvdW50c19vcHRlZF9pbiAtPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJ0b3RhbF9hY2NvdW50c19vcHRlZF9pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9hY2NvdW50c19vcHRlZF9pbiBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBieXRlYyA1IC8vICJ0b3RhbF9hY2NvdW50c19vcHRlZF9pbiIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0NjEtNDY3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9bWJyX3BheWVyLAogICAgLy8gICAgIGFtb3VudD1zZWxmLmNhbGNfbWJyKG51bV9ieXRlcz1VSW50NjQoMSksIG51bV91aW50PVVJbnQ2NCgxKSkgLSBtaW5fdHhuX2ZlZSwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9bWluX3R4bl9mZWUsCiAgICAvLyAgICAgbm90ZT0iTUJSIHJlZnVuZCBmb3IgY2xvc2luZyBvdXQuIiwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ2MwogICAgLy8gYW1vdW50PXNlbGYuY2FsY19tYnIobnVtX2J5dGVzPVVJbnQ2NCgxKSwgbnVtX3VpbnQ9VUludDY0KDEpKSAtIG1pbl90eG5fZmVlLAogICAgaW50Y18xIC8vIDEKICAgIGR1cAogICAgY2FsbHN1YiBjYWxjX21icgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDU5LTQ2MAogICAgLy8gIyBTdWJtaXQgaW5uZXIgdHJhbnNhY3Rpb24gKE1CUiBwYXllciBnZXRzIHRoZWlyIG1iciBwYXltZW50IHJlZnVuZGVkKQogICAgLy8gbWluX3R4bl9mZWUgPSBVSW50NjQoMTAwMCkKICAgIGludGNfMyAvLyAxMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0NjMKICAgIC8vIGFtb3VudD1zZWxmLmNhbGNfbWJyKG51bV9ieXRlcz1VSW50NjQoMSksIG51bV91aW50PVVJbnQ2NCgxKSkgLSBtaW5fdHhuX2ZlZSwKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ2NAogICAgLy8gc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDY2CiAgICAvLyBub3RlPSJNQlIgcmVmdW5kIGZvciBjbG9zaW5nIG91dC4iLAogICAgcHVzaGJ5dGVzICJNQlIgcmVmdW5kIGZvciBjbG9zaW5nIG91dC4iCiAgICBpdHhuX2ZpZWxkIE5vdGUKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDYxCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0NTktNDYwCiAgICAvLyAjIFN1Ym1pdCBpbm5lciB0cmFuc2FjdGlvbiAoTUJSIHBheWVyIGdldHMgdGhlaXIgbWJyIHBheW1lbnQgcmVmdW5kZWQpCiAgICAvLyBtaW5fdHhuX2ZlZSA9IFVJbnQ2NCgxMDAwKQogICAgaW50Y18zIC8vIDEwMDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0NjEtNDY3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9bWJyX3BheWVyLAogICAgLy8gICAgIGFtb3VudD1zZWxmLmNhbGNfbWJyKG51bV9ieXRlcz1VSW50NjQoMSksIG51bV91aW50PVVJbnQ2NCgxKSkgLSBtaW5fdHhuX2ZlZSwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9bWluX3R4bl9mZWUsCiAgICAvLyAgICAgbm90ZT0iTUJSIHJlZnVuZCBmb3IgY2xvc2luZyBvdXQuIiwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0NjktNDcwCiAgICAvLyAjIEVtaXQgZXZlbnQgb24tY2hhaW4KICAgIC8vIGFyYzQuZW1pdChPcHRlZE91dChhY2NvdW50PWFyYzQuQWRkcmVzcyhhY2NvdW50KSkpCiAgICBwdXNoYnl0ZXMgMHgxMzgwZjE3YSAvLyBtZXRob2QgIk9wdGVkT3V0KGFkZHJlc3MpIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVfY2hhaW4uY29udHJhY3QuVm90ZUNoYWluLnNldHVwX3BvbGwobWJyX3BheTogdWludDY0LCB0aXRsZTogYnl0ZXMsIGNob2ljZXM6IGJ5dGVzLCByZXF1aXJlX29wdF9pbjogYnl0ZXMsIGVsaWdpYmlsaXR5X3Jvb3Q6IGJ5dGVzLCBzdGFydF9kYXRlX3N0cjogYnl0ZXMsIHN0YXJ0X2RhdGVfdW5peDogdWludDY0LCBlbmRfZGF0ZV9zdHI6IGJ5dGVzLCBlbmRfZGF0ZV91bml4OiB1aW50NjQpIC0+IHVpbnQ2NDoKc2V0dXBfcG9sbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ3Mi00ODUKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyB0aGUgY3JlYXRvciB0byBzZXQgdXAgYSBuZXcgcG9sbCBhbmQgcGF5IHRoZSBNQlIgY29zdCBvZiB0aGUgcG9sbCBib3hlcwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzZXR1cF9wb2xsKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbWJyX3BheTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sCiAgICAvLyAgICAgdGl0bGU6IEJ5dGVzLAogICAgLy8gICAgIGNob2ljZXM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuRHluYW1pY0J5dGVzXSwKICAgIC8vICAgICByZXF1aXJlX29wdF9pbjogYXJjNC5Cb29sLAogICAgLy8gICAgIGVsaWdpYmlsaXR5X3Jvb3Q6IEhhc2gzMiwKICAgIC8vICAgICBzdGFydF9kYXRlX3N0cjogU3RyaW5nLAogICAgLy8gICAgIHN0YXJ0X2RhdGVfdW5peDogVUludDY0LAogICAgLy8gICAgIGVuZF9kYXRlX3N0cjogU3RyaW5nLAogICAgLy8gICAgIGVuZF9kYXRlX3VuaXg6IFVJbnQ2NCwKICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gOSAxCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDg4CiAgICAvLyBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ4Ni00ODkKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIk9ubHkgQXBwIGNyZWF0b3IgY2FuIHNldCB2b3RlIGRhdGVzLiIKICAgIGFzc2VydCAvLyBPbmx5IEFwcCBjcmVhdG9yIGNhbiBzZXQgdm90ZSBkYXRlcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ5MQogICAgLy8gYXNzZXJ0ICh0aXRsZS5sZW5ndGggPD0gVUludDY0KDExOCkpLCAiUG9sbCB0aXRsZSBzaXplIGNhbiBub3QgZXhjZWVkIDExOCBieXRlcyBvZiBkYXRhIHBlciBrZXktdmFsdWUuIgogICAgZnJhbWVfZGlnIC04CiAgICBsZW4KICAgIGR1cAogICAgcHVzaGludCAxMTggLy8gMTE4CiAgICA8PQogICAgYXNzZXJ0IC8vIFBvbGwgdGl0bGUgc2l6ZSBjYW4gbm90IGV4Y2VlZCAxMTggYnl0ZXMgb2YgZGF0YSBwZXIga2V5LXZhbHVlLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDkzCiAgICAvLyBhc3NlcnQgY2hvaWNlcy5sZW5ndGggPj0gVUludDY0KDIpIGFuZCBjaG9pY2VzLmxlbmd0aCA8PSBVSW50NjQoCiAgICBmcmFtZV9kaWcgLTcKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBwdXNoaW50IDIgLy8gMgogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ5My00OTUKICAgIC8vIGFzc2VydCBjaG9pY2VzLmxlbmd0aCA+PSBVSW50NjQoMikgYW5kIGNob2ljZXMubGVuZ3RoIDw9IFVJbnQ2NCgKICAgIC8vICAgICBNQVhfUE9MTF9DSE9JQ0VTCiAgICAvLyApLCAiUG9sbCBtdXN0IGhhdmUgYmV0d2VlbiAyIGFuZCAzMiBjaG9pY2VzLiIKICAgIGJ6IHNldHVwX3BvbGxfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYnogc2V0dXBfcG9sbF9ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCiAgICBiIHNldHVwX3BvbGxfYm9vbF9tZXJnZUA0CgpzZXR1cF9wb2xsX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCgpzZXR1cF9wb2xsX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ5My00OTUKICAgIC8vIGFzc2VydCBjaG9pY2VzLmxlbmd0aCA+PSBVSW50NjQoMikgYW5kIGNob2ljZXMubGVuZ3RoIDw9IFVJbnQ2NCgKICAgIC8vICAgICBNQVhfUE9MTF9DSE9JQ0VTCiAgICAvLyApLCAiUG9sbCBtdXN0IGhhdmUgYmV0d2VlbiAyIGFuZCAzMiBjaG9pY2VzLiIKICAgIGFzc2VydCAvLyBQb2xsIG11c3QgaGF2ZSBiZXR3ZWVuIDIgYW5kIDMyIGNob2ljZXMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0OTcKICAgIC8vIGZvciBpIGluIHVyYW5nZShjaG9pY2VzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAxCgpzZXR1cF9wb2xsX2Zvcl9oZWFkZXJANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ5NwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGNob2ljZXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMwogICAgPAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJ6IHNldHVwX3BvbGxfYWZ0ZXJfZm9yQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjQ5OAogICAgLy8gYXNzZXJ0IGNob2ljZXNbaV0ubGVuZ3RoIDw9IFVJbnQ2NCgKICAgIGZyYW1lX2RpZyAtNwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAwCiAgICBhc3NlcnQgLy8gSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgZXh0cmFjdDMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NDk4LTUwMAogICAgLy8gYXNzZXJ0IGNob2ljZXNbaV0ubGVuZ3RoIDw9IFVJbnQ2NCgKICAgIC8vICAgICAxMTYKICAgIC8vICksICJQb2xsIGNob2ljZSBzaXplIGNhbm5vdCBleGNlZWQgMTE2IGJ5dGVzIG9mIGRhdGEgcGVyIGNob2ljZS4iCiAgICBwdXNoaW50IDExNiAvLyAxMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gUG9sbCBjaG9pY2Ugc2l6ZSBjYW5ub3QgZXhjZWVkIDExNiBieXRlcyBvZiBkYXRhIHBlciBjaG9pY2UuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo0OTcKICAgIC8vIGZvciBpIGluIHVyYW5nZShjaG9pY2VzLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIHNldHVwX3BvbGxfZm9yX2hlYWRlckA1CgpzZXR1cF9wb2xsX2FmdGVyX2ZvckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTEyCiAgICAvLyBzdGFydF9kYXRlX3VuaXggPCBlbmRfZGF0ZV91bml4CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMQogICAgPAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTExLTUxMwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzdGFydF9kYXRlX3VuaXggPCBlbmRfZGF0ZV91bml4CiAgICAvLyApLCAiU3RhcnQgZGF0ZSBtdXN0IGJlIGVhcmxpZXIgdGhhbiBlbmQgZGF0ZS4iCiAgICBhc3NlcnQgLy8gU3RhcnQgZGF0ZSBtdXN0IGJlIGVhcmxpZXIgdGhhbiBlbmQgZGF0ZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjUxNS01MTcKICAgIC8vIGFzc2VydCBlbmRfZGF0ZV91bml4ID49IHN0YXJ0X2RhdGVfdW5peCArIFVJbnQ2NCgKICAgIC8vICAgICAzICogMjQgKiA2MCAqIDYwCiAgICAvLyApLCAiRW5kIGRhdGUgbXVzdCBiZSBhdCBsZWFzdCAzIGRheXMgbGF0ZXIgdGhhbiB0aGUgc3RhcnQgZGF0ZS4iCiAgICBmcmFtZV9kaWcgLTMKICAgIHB1c2hpbnQgMjU5MjAwIC8vIDI1OTIwMAogICAgKwogICAgZnJhbWVfZGlnIC0xCiAgICA8PQogICAgYXNzZXJ0IC8vIEVuZCBkYXRlIG11c3QgYmUgYXQgbGVhc3QgMyBkYXlzIGxhdGVyIHRoYW4gdGhlIHN0YXJ0IGRhdGUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1MTkKICAgIC8vIGFzc2VydCBlbmRfZGF0ZV91bml4IC0gc3RhcnRfZGF0ZV91bml4IDw9IFVJbnQ2NCgKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIC0zCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1MTktNTIxCiAgICAvLyBhc3NlcnQgZW5kX2RhdGVfdW5peCAtIHN0YXJ0X2RhdGVfdW5peCA8PSBVSW50NjQoCiAgICAvLyAgICAgMTQgKiAyNCAqIDYwICogNjAKICAgIC8vICksICJWb3RpbmcgcGVyaW9kIGNhbiBub3QgZXhjZWVkIDE0IGRheXMuIgogICAgcHVzaGludCAxMjA5NjAwIC8vIDEyMDk2MDAKICAgIDw9CiAgICBhc3NlcnQgLy8gVm90aW5nIHBlcmlvZCBjYW4gbm90IGV4Y2VlZCAxNCBkYXlzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTIzLTUyNAogICAgLy8gIyBBc3NpZ24gdGhlIG5leHQgcG9sbCBJRCB0byB0aGUgbmV3IHBvbGwKICAgIC8vIHBvbGxfaWQgPSBzZWxmLm5leHRfcG9sbF9pZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gIm5leHRfcG9sbF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5uZXh0X3BvbGxfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1MjcKICAgIC8vIHRpdGxlPWFyYzQuRHluYW1pY0J5dGVzKHRpdGxlKSwKICAgIGZyYW1lX2RpZyAyCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC04CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjUyOAogICAgLy8gY2hvaWNlX2NvdW50PWFyYzQuVUludDY0KGNob2ljZXMubGVuZ3RoKSwKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjUyOQogICAgLy8gc3RhcnRfZGF0ZV91bml4PWFyYzQuVUludDY0KHN0YXJ0X2RhdGVfdW5peCksCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjUzMAogICAgLy8gZW5kX2RhdGVfdW5peD1hcmM0LlVJbnQ2NChlbmRfZGF0ZV91bml4KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTM1CiAgICAvLyBiYWxsb3RfaGFzaD1IYXNoMzIuZnJvbV9ieXRlcyhvcC5iemVybygzMikpLAogICAgaW50Y18yIC8vIDMyCiAgICBiemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTI2LTUzOQogICAgLy8gcG9sbCA9IFBvbGwoCiAgICAvLyAgICAgdGl0bGU9YXJjNC5EeW5hbWljQnl0ZXModGl0bGUpLAogICAgLy8gICAgIGNob2ljZV9jb3VudD1hcmM0LlVJbnQ2NChjaG9pY2VzLmxlbmd0aCksCiAgICAvLyAgICAgc3RhcnRfZGF0ZV91bml4PWFyYzQuVUludDY0KHN0YXJ0X2RhdGVfdW5peCksCiAgICAvLyAgICAgZW5kX2RhdGVfdW5peD1hcmM0LlVJbnQ2NChlbmRfZGF0ZV91bml4KSwKICAgIC8vICAgICByZXF1aXJlX29wdF9pbj1yZXF1aXJlX29wdF9pbiwKICAgIC8vICAgICBlbGlnaWJpbGl0eV9yb290PWVsaWdpYmlsaXR5X3Jvb3QuY29weSgpLAogICAgLy8gICAgIHRvdGFsX3ZvdGVzPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG9wZW5fYmFsbG90cz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBiYWxsb3RfaGFzaD1IYXNoMzIuZnJvbV9ieXRlcyhvcC5iemVybygzMikpLAogICAgLy8gICAgIGZpbmFsaXplZD1hcmM0LkJvb2woKSwKICAgIC8vICAgICB3aW5uZXI9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgd2lubmVyX21hcmdpbj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDAwN2MKICAgIGRpZyA0CiAgICBjb25jYXQKICAgIGRpZyAzCiAgICBjb25jYXQKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTUKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTMzCiAgICAvLyB0b3RhbF92b3Rlcz1hcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjIDkgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1MjYtNTM5CiAgICAvLyBwb2xsID0gUG9sbCgKICAgIC8vICAgICB0aXRsZT1hcmM0LkR5bmFtaWNCeXRlcyh0aXRsZSksCiAgICAvLyAgICAgY2hvaWNlX2NvdW50PWFyYzQuVUludDY0KGNob2ljZXMubGVuZ3RoKSwKICAgIC8vICAgICBzdGFydF9kYXRlX3VuaXg9YXJjNC5VSW50NjQoc3RhcnRfZGF0ZV91bml4KSwKICAgIC8vICAgICBlbmRfZGF0ZV91bml4PWFyYzQuVUludDY0KGVuZF9kYXRlX3VuaXgpLAogICAgLy8gICAgIHJlcXVpcmVfb3B0X2luPXJlcXVpcmVfb3B0X2luLAogICAgLy8gICAgIGVsaWdpYmlsaXR5X3Jvb3Q9ZWxpZ2liaWxpdHlfcm9vdC5jb3B5KCksCiAgICAvLyAgICAgdG90YWxfdm90ZXM9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgb3Blbl9iYWxsb3RzPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJhbGxvdF9oYXNoPUhhc2gzMi5mcm9tX2J5dGVzKG9wLmJ6ZXJvKDMyKSksCiAgICAvLyAgICAgZmluYWxpemVkPWFyYzQuQm9vbCgpLAogICAgLy8gICAgIHdpbm5lcj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB3aW5uZXJfbWFyZ2luPWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1MzQKICAgIC8vIG9wZW5fYmFsbG90cz1hcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjIDkgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1MjYtNTM5CiAgICAvLyBwb2xsID0gUG9sbCgKICAgIC8vICAgICB0aXRsZT1hcmM0LkR5bmFtaWNCeXRlcyh0aXRsZSksCiAgICAvLyAgICAgY2hvaWNlX2NvdW50PWFyYzQuVUludDY0KGNob2ljZXMubGVuZ3RoKSwKICAgIC8vICAgICBzdGFydF9kYXRlX3VuaXg9YXJjNC5VSW50NjQoc3RhcnRfZGF0ZV91bml4KSwKICAgIC8vICAgICBlbmRfZGF0ZV91bml4PWFyYzQuVUludDY0KGVuZF9kYXRlX3VuaXgpLAogICAgLy8gICAgIHJlcXVpcmVfb3B0X2luPXJlcXVpcmVfb3B0X2luLAogICAgLy8gICAgIGVsaWdpYmlsaXR5X3Jvb3Q9ZWxpZ2liaWxpdHlfcm9vdC5jb3B5KCksCiAgICAvLyAgICAgdG90YWxfdm90ZXM9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgb3Blbl9iYWxsb3RzPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJhbGxvdF9oYXNoPUhhc2gzMi5mcm9tX2J5dGVzKG9wLmJ6ZXJvKDMyKSksCiAgICAvLyAgICAgZmluYWxpemVkPWFyYzQuQm9vbCgpLAogICAgLy8gICAgIHdpbm5lcj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB3aW5uZXJfbWFyZ2luPWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjUzNgogICAgLy8gZmluYWxpemVkPWFyYzQuQm9vbCgpLAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1MjYtNTM5CiAgICAvLyBwb2xsID0gUG9sbCgKICAgIC8vICAgICB0aXRsZT1hcmM0LkR5bmFtaWNCeXRlcyh0aXRsZSksCiAgICAvLyAgICAgY2hvaWNlX2NvdW50PWFyYzQuVUludDY0KGNob2ljZXMubGVuZ3RoKSwKICAgIC8vICAgICBzdGFydF9kYXRlX3VuaXg9YXJjNC5VSW50NjQoc3RhcnRfZGF0ZV91bml4KSwKICAgIC8vICAgICBlbmRfZGF0ZV91bml4PWFyYzQuVUludDY0KGVuZF9kYXRlX3VuaXgpLAogICAgLy8gICAgIHJlcXVpcmVfb3B0X2luPXJlcXVpcmVfb3B0X2luLAogICAgLy8gICAgIGVsaWdpYmlsaXR5X3Jvb3Q9ZWxpZ2liaWxpdHlfcm9vdC5jb3B5KCksCiAgICAvLyAgICAgdG90YWxfdm90ZXM9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgb3Blbl9iYWxsb3RzPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJhbGxvdF9oYXNoPUhhc2gzMi5mcm9tX2J5dGVzKG9wLmJ6ZXJvKDMyKSksCiAgICAvLyAgICAgZmluYWxpemVkPWFyYzQuQm9vbCgpLAogICAgLy8gICAgIHdpbm5lcj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB3aW5uZXJfbWFyZ2luPWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1MzcKICAgIC8vIHdpbm5lcj1hcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjIDkgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1MjYtNTM5CiAgICAvLyBwb2xsID0gUG9sbCgKICAgIC8vICAgICB0aXRsZT1hcmM0LkR5bmFtaWNCeXRlcyh0aXRsZSksCiAgICAvLyAgICAgY2hvaWNlX2NvdW50PWFyYzQuVUludDY0KGNob2ljZXMubGVuZ3RoKSwKICAgIC8vICAgICBzdGFydF9kYXRlX3VuaXg9YXJjNC5VSW50NjQoc3RhcnRfZGF0ZV91bml4KSwKICAgIC8vICAgICBlbmRfZGF0ZV91bml4PWFyYzQuVUludDY0KGVuZF9kYXRlX3VuaXgpLAogICAgLy8gICAgIHJlcXVpcmVfb3B0X2luPXJlcXVpcmVfb3B0X2luLAogICAgLy8gICAgIGVsaWdpYmlsaXR5X3Jvb3Q9ZWxpZ2liaWxpdHlfcm9vdC5jb3B5KCksCiAgICAvLyAgICAgdG90YWxfdm90ZXM9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgb3Blbl9iYWxsb3RzPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJhbGxvdF9oYXNoPUhhc2gzMi5mcm9tX2J5dGVzKG9wLmJ6ZXJvKDMyKSksCiAgICAvLyAgICAgZmluYWxpemVkPWFyYzQuQm9vbCgpLAogICAgLy8gICAgIHdpbm5lcj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB3aW5uZXJfbWFyZ2luPWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1MzgKICAgIC8vIHdpbm5lcl9tYXJnaW49YXJjNC5VSW50NjQoMCksCiAgICBieXRlYyA5IC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTI2LTUzOQogICAgLy8gcG9sbCA9IFBvbGwoCiAgICAvLyAgICAgdGl0bGU9YXJjNC5EeW5hbWljQnl0ZXModGl0bGUpLAogICAgLy8gICAgIGNob2ljZV9jb3VudD1hcmM0LlVJbnQ2NChjaG9pY2VzLmxlbmd0aCksCiAgICAvLyAgICAgc3RhcnRfZGF0ZV91bml4PWFyYzQuVUludDY0KHN0YXJ0X2RhdGVfdW5peCksCiAgICAvLyAgICAgZW5kX2RhdGVfdW5peD1hcmM0LlVJbnQ2NChlbmRfZGF0ZV91bml4KSwKICAgIC8vICAgICByZXF1aXJlX29wdF9pbj1yZXF1aXJlX29wdF9pbiwKICAgIC8vICAgICBlbGlnaWJpbGl0eV9yb290PWVsaWdpYmlsaXR5X3Jvb3QuY29weSgpLAogICAgLy8gICAgIHRvdGFsX3ZvdGVzPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG9wZW5fYmFsbG90cz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBiYWxsb3RfaGFzaD1IYXNoMzIuZnJvbV9ieXRlcyhvcC5iemVybygzMikpLAogICAgLy8gICAgIGZpbmFsaXplZD1hcmM0LkJvb2woKSwKICAgIC8vICAgICB3aW5uZXI9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgd2lubmVyX21hcmdpbj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU0MS01NDIKICAgIC8vICMgUG9sbCB0YWxseSBob2xkcyBvbmUgVUludDY0ICg4IGJ5dGVzKSB2b3RlIHRvdGFsIHBlciBjaG9pY2UKICAgIC8vIHRhbGx5X3NpemUgPSBjaG9pY2VzLmxlbmd0aCAqIFVJbnQ2NCg4KQogICAgdW5jb3ZlciA0CiAgICBwdXNoaW50IDggLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTQ0CiAgICAvLyBhc3NlcnQgbWJyX3BheS5hbW91bnQgPT0gc2VsZi5jYWxjX3BvbGxfYm94ZXNfbWJyKAogICAgZnJhbWVfZGlnIC05CiAgICBndHhucyBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU0NQogICAgLy8gcG9sbF9zaXplPXBvbGwuYnl0ZXMubGVuZ3RoLAogICAgZGlnIDIKICAgIGxlbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTQ2CiAgICAvLyBjaG9pY2VzX3NpemU9Y2hvaWNlcy5ieXRlcy5sZW5ndGgsCiAgICBmcmFtZV9kaWcgLTcKICAgIGxlbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTQ0LTU0OAogICAgLy8gYXNzZXJ0IG1icl9wYXkuYW1vdW50ID09IHNlbGYuY2FsY19wb2xsX2JveGVzX21icigKICAgIC8vICAgICBwb2xsX3NpemU9cG9sbC5ieXRlcy5sZW5ndGgsCiAgICAvLyAgICAgY2hvaWNlc19zaXplPWNob2ljZXMuYnl0ZXMubGVuZ3RoLAogICAgLy8gICAgIHRhbGx5X3NpemU9dGFsbHlfc2l6ZSwKICAgIC8vICksICJNQlIgcGF5bWVudCBtdXN0IG1lZXQgdGhlIG1pbmltdW0gcmVxdWlyZW1lbnQgYW1vdW50LiIKICAgIGRpZyAzCiAgICBjYWxsc3ViIGNhbGNfcG9sbF9ib3hlc19tYnIKICAgID09CiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgbXVzdCBtZWV0IHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50IGFtb3VudC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU1MAogICAgLy8gbWJyX3BheS5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZnJhbWVfZGlnIC05CiAgICBndHhucyBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU0OS01NTEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIk1CUiBwYXltZW50IHNlbmRlciBtdXN0IG1hdGNoIHRoZSBBcHAgY3JlYXRvciBhY2NvdW50LiIKICAgIGFzc2VydCAvLyBNQlIgcGF5bWVudCBzZW5kZXIgbXVzdCBtYXRjaCB0aGUgQXBwIGNyZWF0b3IgYWNjb3VudC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU1MwogICAgLy8gbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTkKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU1Mi01NTQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiTUJSIHBheW1lbnQgcmVjaWV2ZXIgbXVzdCBiZSB0aGUgQXBwIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IHJlY2lldmVyIG11c3QgYmUgdGhlIEFwcCBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTU2LTU1NwogICAgLy8gIyBTdG9yZSB0aGUgcG9sbCByZWNvcmQgYW5kIGNob2ljZXMsIGFuZCBjcmVhdGUgdGhlIHBvbGwgdGFsbHkgKGJveCBieXRlcyBhcmUgemVyb2VkIG9uIGNyZWF0aW9uKQogICAgLy8gc2VsZi5ib3hfcG9sbFtwb2xsX2lkXSA9IHBvbGwuY29weSgpCiAgICBkaWcgNQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAicCIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICB1bmNvdmVyIDMKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU1OAogICAgLy8gc2VsZi5ib3hfcG9sbF9jaG9pY2VzW3BvbGxfaWRdID0gY2hvaWNlcy5jb3B5KCkKICAgIGJ5dGVjIDExIC8vICJjIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyAtNwogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTU5CiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZShzZWxmLnBvbGxfdGFsbHlfa2V5KHBvbGxfaWQpLCB0YWxseV9zaXplKSwgIlBvbGwgdGFsbHkgYWxyZWFkeSBleGlzdHMuIgogICAgZGlnIDUKICAgIGNhbGxzdWIgcG9sbF90YWxseV9rZXkKICAgIHVuY292ZXIgMgogICAgYm94X2NyZWF0ZQogICAgYXNzZXJ0IC8vIFBvbGwgdGFsbHkgYWxyZWFkeSBleGlzdHMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1NjEtNTYyCiAgICAvLyAjIFVwZGF0ZSBnbG9iYWwgc2NoZW1hIHZhbHVlcwogICAgLy8gc2VsZi5uZXh0X3BvbGxfaWQgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAibmV4dF9wb2xsX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm5leHRfcG9sbF9pZCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA4IC8vICJuZXh0X3BvbGxfaWQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTYzCiAgICAvLyBzZWxmLnRvdGFsX3BvbGxzICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInRvdGFsX3BvbGxzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3BvbGxzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzIgLy8gInRvdGFsX3BvbGxzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU2Ny01NzIKICAgIC8vIFBvbGxTZXR1cCgKICAgIC8vICAgICBwb2xsX2lkPWFyYzQuVUludDY0KHBvbGxfaWQpLAogICAgLy8gICAgIGNob2ljZV9jb3VudD1hcmM0LlVJbnQ2NChjaG9pY2VzLmxlbmd0aCksCiAgICAvLyAgICAgc3RhcnRfZGF0ZV91bml4PWFyYzQuVUludDY0KHN0YXJ0X2RhdGVfdW5peCksCiAgICAvLyAgICAgZW5kX2RhdGVfdW5peD1hcmM0LlVJbnQ2NChlbmRfZGF0ZV91bml4KSwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1NjUtNTczCiAgICAvLyAjIEVtaXQgZXZlbnQgb24tY2hhaW4KICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBQb2xsU2V0dXAoCiAgICAvLyAgICAgICAgIHBvbGxfaWQ9YXJjNC5VSW50NjQocG9sbF9pZCksCiAgICAvLyAgICAgICAgIGNob2ljZV9jb3VudD1hcmM0LlVJbnQ2NChjaG9pY2VzLmxlbmd0aCksCiAgICAvLyAgICAgICAgIHN0YXJ0X2RhdGVfdW5peD1hcmM0LlVJbnQ2NChzdGFydF9kYXRlX3VuaXgpLAogICAgLy8gICAgICAgICBlbmRfZGF0ZV91bml4PWFyYzQuVUludDY0KGVuZF9kYXRlX3VuaXgpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDg3Njg0ZGZlIC8vIG1ldGhvZCAiUG9sbFNldHVwKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTc1CiAgICAvLyByZXR1cm4gcG9sbF9pZAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uY2FsY19wb2xsX2JveGVzX21icihwb2xsX3NpemU6IHVpbnQ2NCwgY2hvaWNlc19zaXplOiB1aW50NjQsIHRhbGx5X3NpemU6IHVpbnQ2NCkgLT4gdWludDY0OgpjYWxjX3BvbGxfYm94ZXNfbWJyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjA3LTIxMQogICAgLy8gIyBEZWZpbmUgc3Vicm91dGluZSB0aGF0IGNhbGN1bGF0ZXMgdGhlIG1pbmltdW0gYmFsYW5jZSByZXF1aXJlbWVudCBjb3N0IG9mIHRoZSBwb2xsLCBjaG9pY2VzIGFuZCB0YWxseSBib3hlcwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjYWxjX3BvbGxfYm94ZXNfbWJyKAogICAgLy8gICAgIHNlbGYsIHBvbGxfc2l6ZTogVUludDY0LCBjaG9pY2VzX3NpemU6IFVJbnQ2NCwgdGFsbHlfc2l6ZTogVUludDY0CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjE0CiAgICAvLyBzZWxmLmNhbGNfYm94X21icihrZXlfc2l6ZT1VSW50NjQoOSksIHZhbHVlX3NpemU9cG9sbF9zaXplKQogICAgcHVzaGludCA5IC8vIDkKICAgIGZyYW1lX2RpZyAtMwogICAgY2FsbHN1YiBjYWxjX2JveF9tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIxNQogICAgLy8gKyBzZWxmLmNhbGNfYm94X21icihrZXlfc2l6ZT1VSW50NjQoOSksIHZhbHVlX3NpemU9Y2hvaWNlc19zaXplKQogICAgcHVzaGludCA5IC8vIDkKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBjYWxjX2JveF9tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIxNC0yMTUKICAgIC8vIHNlbGYuY2FsY19ib3hfbWJyKGtleV9zaXplPVVJbnQ2NCg5KSwgdmFsdWVfc2l6ZT1wb2xsX3NpemUpCiAgICAvLyArIHNlbGYuY2FsY19ib3hfbWJyKGtleV9zaXplPVVJbnQ2NCg5KSwgdmFsdWVfc2l6ZT1jaG9pY2VzX3NpemUpCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyMTYKICAgIC8vICsgc2VsZi5jYWxjX2JveF9tYnIoa2V5X3NpemU9VUludDY0KDkpLCB2YWx1ZV9zaXplPXRhbGx5X3NpemUpCiAgICBwdXNoaW50IDkgLy8gOQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGNhbGNfYm94X21icgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjE0LTIxNgogICAgLy8gc2VsZi5jYWxjX2JveF9tYnIoa2V5X3NpemU9VUludDY0KDkpLCB2YWx1ZV9zaXplPXBvbGxfc2l6ZSkKICAgIC8vICsgc2VsZi5jYWxjX2JveF9tYnIoa2V5X3NpemU9VUludDY0KDkpLCB2YWx1ZV9zaXplPWNob2ljZXNfc2l6ZSkKICAgIC8vICsgc2VsZi5jYWxjX2JveF9tYnIoa2V5X3NpemU9VUludDY0KDkpLCB2YWx1ZV9zaXplPXRhbGx5X3NpemUpCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyMTItMjE3CiAgICAvLyAjIEV2ZXJ5IHBvbGwgYm94IGtleSBpcyAxIGJ5dGUgcHJlZml4ICsgOCBieXRlIHBvbGwgSUQKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgc2VsZi5jYWxjX2JveF9tYnIoa2V5X3NpemU9VUludDY0KDkpLCB2YWx1ZV9zaXplPXBvbGxfc2l6ZSkKICAgIC8vICAgICArIHNlbGYuY2FsY19ib3hfbWJyKGtleV9zaXplPVVJbnQ2NCg5KSwgdmFsdWVfc2l6ZT1jaG9pY2VzX3NpemUpCiAgICAvLyAgICAgKyBzZWxmLmNhbGNfYm94X21icihrZXlfc2l6ZT1VSW50NjQoOSksIHZhbHVlX3NpemU9dGFsbHlfc2l6ZSkKICAgIC8vICkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5jYWxjX2JveF9tYnIoa2V5X3NpemU6IHVpbnQ2NCwgdmFsdWVfc2l6ZTogdWludDY0KSAtPiB1aW50NjQ6CmNhbGNfYm94X21icjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE5MS0xOTMKICAgIC8vICMgRGVmaW5lIHN1YnJvdXRpbmUgdGhhdCBjYWxjdWxhdGVzIHRoZSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgY29zdCBvZiBhIHNpbmdsZSBib3gKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2FsY19ib3hfbWJyKHNlbGYsIGtleV9zaXplOiBVSW50NjQsIHZhbHVlX3NpemU6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxOTctMTk4CiAgICAvLyAjIFJldHVybiB0aGUgbWluaW11bSBiYWxhbmNlIHJlcXVpcmVtZW50IGNvc3Qgb2YgdGhlIGJveAogICAgLy8gcmV0dXJuIGJhc2VfZmVlICsgYnl0ZV9mZWUgKiAoa2V5X3NpemUgKyB2YWx1ZV9zaXplKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gYnl0ZV9mZWUgPSBVSW50NjQoNDAwKSAgIyBGZWUgcGVyIGJ5dGUgb2YgYm94IGtleSBhbmQgYm94IHZhbHVlCiAgICBwdXNoaW50IDQwMCAvLyA0MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjE5Ny0xOTgKICAgIC8vICMgUmV0dXJuIHRoZSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgY29zdCBvZiB0aGUgYm94CiAgICAvLyByZXR1cm4gYmFzZV9mZWUgKyBieXRlX2ZlZSAqIChrZXlfc2l6ZSArIHZhbHVlX3NpemUpCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToxOTQKICAgIC8vIGJhc2VfZmVlID0gVUludDY0KDJfNTAwKSAgIyBCYXNlIGZlZSBwZXIgYm94CiAgICBwdXNoaW50IDI1MDAgLy8gMjUwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MTk3LTE5OAogICAgLy8gIyBSZXR1cm4gdGhlIG1pbmltdW0gYmFsYW5jZSByZXF1aXJlbWVudCBjb3N0IG9mIHRoZSBib3gKICAgIC8vIHJldHVybiBiYXNlX2ZlZSArIGJ5dGVfZmVlICogKGtleV9zaXplICsgdmFsdWVfc2l6ZSkKICAgICsKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5wb2xsX3RhbGx5X2tleShwb2xsX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpwb2xsX3RhbGx5X2tleToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIxOS0yMjEKICAgIC8vICMgRGVmaW5lIHN1YnJvdXRpbmUgdGhhdCByZXR1cm5zIHRoZSBib3gga2V5IG9mIGEgcG9sbCdzIHBhY2tlZCB0YWxseSAoJ3QnIHByZWZpeCArIDggYnl0ZSBwb2xsIElEKQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBwb2xsX3RhbGx5X2tleShzZWxmLCBwb2xsX2lkOiBVSW50NjQpIC0+IEJ5dGVzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyMjIKICAgIC8vIHJldHVybiBCeXRlcyhiInQiKSArIG9wLml0b2IocG9sbF9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgcHVzaGJ5dGVzIDB4NzQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVfY2hhaW4uY29udHJhY3QuVm90ZUNoYWluLnN1Ym1pdF92b3RlKHBvbGxfaWQ6IHVpbnQ2NCwgYWNjb3VudDogYnl0ZXMsIG1icl9wYXk6IHVpbnQ2NCwgY2hvaWNlOiB1aW50NjQsIHByb29mOiBieXRlcykgLT4gdm9pZDoKc3VibWl0X3ZvdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1NzctNTg2CiAgICAvLyAjIERlZmluZSBhYmltZXRob2QgdGhhdCBhbGxvd3MgYW55IHVzZXIgdG8gc3VibWl0IHRoZWlyIHZvdGUgdG8gYm94IHN0b3JhZ2UgYW5kIHBheSBpdHMgTUJSIGNvc3QgaW4gdGhlIHNhbWUgZ3JvdXAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgc3VibWl0X3ZvdGUoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBwb2xsX2lkOiBVSW50NjQsCiAgICAvLyAgICAgYWNjb3VudDogQWNjb3VudCwKICAgIC8vICAgICBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICAgICBjaG9pY2U6IFVJbnQ2NCwKICAgIC8vICAgICBwcm9vZjogYXJjNC5EeW5hbWljQXJyYXlbSGFzaDMyXSwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDUgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NTg3LTU4OAogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCBwb2xsX2lkIGluIHNlbGYuYm94X3BvbGwsICJQb2xsIGRvZXMgbm90IGV4aXN0LiIKICAgIGZyYW1lX2RpZyAtNQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAicCIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUG9sbCBkb2VzIG5vdCBleGlzdC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU5MQogICAgLy8gbWJyX3BheS5hbW91bnQgPT0gc2VsZi5jYWxjX2JhbGxvdF9ib3hfbWJyKCkKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgQW1vdW50CiAgICBjYWxsc3ViIGNhbGNfYmFsbG90X2JveF9tYnIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1OTAtNTkyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkuYW1vdW50ID09IHNlbGYuY2FsY19iYWxsb3RfYm94X21icigpCiAgICAvLyApLCAiTUJSIHBheW1lbnQgbXVzdCBtZWV0IHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50IGFtb3VudC4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgbXVzdCBtZWV0IHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50IGFtb3VudC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU5NQogICAgLy8gVHhuLnNlbmRlciA9PSBhY2NvdW50CiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTQKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo1OTMtNTk2CiAgICAvLyAjIFRoZSBNQlIgcGF5bWVudCBtYXkgY29tZSBmcm9tIGEgc3BvbnNvciAocmVsYXllcikgdGhhdCBhbHNvIGNvdmVycyB0aGUgemVybyBmZWUgdm90ZSBjYWxsIHZpYSBmZWUgcG9vbGluZwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IGFjY291bnQKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgbXVzdCBtYXRjaCB0aGUgYWNjb3VudCB2b3RpbmcuIgogICAgYXNzZXJ0IC8vIFRyYW5zYWN0aW9uIHNlbmRlciBtdXN0IG1hdGNoIHRoZSBhY2NvdW50IHZvdGluZy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU5OAogICAgLy8gbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjU5Ny01OTkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiTUJSIHBheW1lbnQgcmVjaWV2ZXIgbXVzdCBiZSB0aGUgQXBwIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IHJlY2lldmVyIG11c3QgYmUgdGhlIEFwcCBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjAxCiAgICAvLyBzZWxmLnZlcmlmeV9lbGlnaWJpbGl0eShwb2xsX2lkLCBhY2NvdW50LCBwcm9vZikKICAgIGZyYW1lX2RpZyAtNQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgdmVyaWZ5X2VsaWdpYmlsaXR5CiAgICBmcmFtZV9idXJ5IC0xCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2MDMKICAgIC8vIHNlbGYuY2FzdF9iYWxsb3QocG9sbF9pZCwgYWNjb3VudCwgY2hvaWNlLCBtYnJfcGF5LnNlbmRlcikKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgU2VuZGVyCiAgICBmcmFtZV9kaWcgLTUKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0yCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgY2FzdF9iYWxsb3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjYwNS02MDYKICAgIC8vICMgVXBkYXRlIHZvdGUgdGFsbHkgKGNob2ljZSBudW1iZXIgJ24nIHRvdGFsIGlzIHRoZSBVSW50NjQgc3RvcmVkIGF0IGJ5dGUgb2Zmc2V0ICcobiAtIDEpICogOCcpCiAgICAvLyB0YWxseV9rZXkgPSBzZWxmLnBvbGxfdGFsbHlfa2V5KHBvbGxfaWQpCiAgICBmcmFtZV9kaWcgLTUKICAgIGNhbGxzdWIgcG9sbF90YWxseV9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjYwNwogICAgLy8gb2Zmc2V0ID0gKGNob2ljZSAtIFVJbnQ2NCgxKSkgKiBVSW50NjQoOCkKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIHB1c2hpbnQgOCAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2MDgKICAgIC8vIGNob2ljZV90b3RhbCA9IG9wLmJ0b2kob3AuQm94LmV4dHJhY3QodGFsbHlfa2V5LCBvZmZzZXQsIFVJbnQ2NCg4KSkpCiAgICBkdXAyCiAgICBwdXNoaW50IDggLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjYwOQogICAgLy8gb3AuQm94LnJlcGxhY2UodGFsbHlfa2V5LCBvZmZzZXQsIG9wLml0b2IoY2hvaWNlX3RvdGFsICsgVUludDY0KDEpKSkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjExCiAgICAvLyBzZWxmLmNvdW50X3BvbGxfdm90ZXMocG9sbF9pZCwgVUludDY0KDEpKQogICAgZnJhbWVfZGlnIC01CiAgICBpbnRjXzEgLy8gMQogICAgY2FsbHN1YiBjb3VudF9wb2xsX3ZvdGVzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uY2FsY19iYWxsb3RfYm94X21icigpIC0+IHVpbnQ2NDoKY2FsY19iYWxsb3RfYm94X21icjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIwMC0yMDIKICAgIC8vICMgRGVmaW5lIHN1YnJvdXRpbmUgdGhhdCBjYWxjdWxhdGVzIHRoZSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgY29zdCBvZiBhIGJhbGxvdCBib3gKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2FsY19iYWxsb3RfYm94X21icihzZWxmKSAtPiBVSW50NjQ6CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIwMy0yMDUKICAgIC8vICMgQmFsbG90IGJveCBrZXkgaXMgMSBieXRlIHByZWZpeCArIDggYnl0ZSBwb2xsIElEICsgMzIgYnl0ZSBhZGRyZXNzLCBiYWxsb3QgYm94IHZhbHVlIGlzIDggYnl0ZSBVSW50NjQgY2hvaWNlCiAgICAvLyAjICsgMzIgYnl0ZSBNQlIgcGF5ZXIgYWRkcmVzcwogICAgLy8gcmV0dXJuIHNlbGYuY2FsY19ib3hfbWJyKGtleV9zaXplPVVJbnQ2NCg0MSksIHZhbHVlX3NpemU9VUludDY0KDQwKSkKICAgIHB1c2hpbnRzIDQxIDQwIC8vIDQxLCA0MAogICAgY2FsbHN1YiBjYWxjX2JveF9tYnIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi52ZXJpZnlfZWxpZ2liaWxpdHkocG9sbF9pZDogdWludDY0LCBhY2NvdW50OiBieXRlcywgcHJvb2Y6IGJ5dGVzKSAtPiBieXRlczoKdmVyaWZ5X2VsaWdpYmlsaXR5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjQ1LTI0OQogICAgLy8gIyBEZWZpbmUgc3Vicm91dGluZSB0aGF0IHZlcmlmaWVzIGFuIGFjY291bnQncyBNZXJrbGUgaW5jbHVzaW9uIHByb29mIGFnYWluc3QgYSBwb2xsJ3MgZWxpZ2liaWxpdHkgcm9vdAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiB2ZXJpZnlfZWxpZ2liaWxpdHkoCiAgICAvLyAgICAgc2VsZiwgcG9sbF9pZDogVUludDY0LCBhY2NvdW50OiBBY2NvdW50LCBwcm9vZjogYXJjNC5EeW5hbWljQXJyYXlbSGFzaDMyXQogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMyAxCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI1MAogICAgLy8gcm9vdCA9IHNlbGYuYm94X3BvbGxbcG9sbF9pZF0uZWxpZ2liaWxpdHlfcm9vdC5ieXRlcwogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJwIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfcG9sbCBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMjcgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI1Mi0yNTMKICAgIC8vICMgUG9sbHMgd2l0aG91dCBhbiBlbGlnaWJpbGl0eSByb290IGFyZSBvcGVuIHRvIGV2ZXJ5IGFjY291bnQKICAgIC8vIGlmIHJvb3QgPT0gb3AuYnplcm8oMzIpOgogICAgaW50Y18yIC8vIDMyCiAgICBiemVybwogICAgPT0KICAgIGJ6IHZlcmlmeV9lbGlnaWJpbGl0eV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI1NAogICAgLy8gcmV0dXJuCiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgp2ZXJpZnlfZWxpZ2liaWxpdHlfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjU2CiAgICAvLyBhc3NlcnQgcHJvb2YubGVuZ3RoIDw9IFVJbnQ2NCgKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjU2LTI1OAogICAgLy8gYXNzZXJ0IHByb29mLmxlbmd0aCA8PSBVSW50NjQoCiAgICAvLyAgICAgTUFYX1BST09GX0xFTkdUSAogICAgLy8gKSwgIkVsaWdpYmlsaXR5IHByb29mIGNhbiBub3QgZXhjZWVkIDMyIGxldmVscy4iCiAgICBkdXAKICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBFbGlnaWJpbGl0eSBwcm9vZiBjYW4gbm90IGV4Y2VlZCAzMiBsZXZlbHMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyNjIKICAgIC8vIFVJbnQ2NChNRVJLTEVfTEVWRUxfT1BDT0RFX0JVREdFVCkgKiBwcm9vZi5sZW5ndGgsIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQKICAgIHB1c2hpbnQgNzUgLy8gNzUKICAgICoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyNjAtMjYzCiAgICAvLyAjIFBvb2wgZW5vdWdoIG9wY29kZSBidWRnZXQgZm9yIGhhc2hpbmcgZXZlcnkgcHJvb2YgbGV2ZWwgKG9wLXVwIGZlZXMgYXJlIHBhaWQgYnkgdGhlIHZvdGVyKQogICAgLy8gZW5zdXJlX2J1ZGdldCgKICAgIC8vICAgICBVSW50NjQoTUVSS0xFX0xFVkVMX09QQ09ERV9CVURHRVQpICogcHJvb2YubGVuZ3RoLCBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0CiAgICAvLyApCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI2NS0yNjYKICAgIC8vICMgRm9sZCB0aGUgcHJvb2YgZnJvbSB0aGUgYWNjb3VudCdzIGxlYWYgdXAgdG8gdGhlIHJvb3QgKHNpYmxpbmcgaGFzaGVzIGFyZSBjb25jYXRlbmF0ZWQgaW4gc29ydGVkIG9yZGVyKQogICAgLy8gbm9kZSA9IG9wLnNoYTI1NihCeXRlcyhNRVJLTEVfTEVBRl9QUkVGSVgpICsgYWNjb3VudC5ieXRlcykKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyNjcKICAgIC8vIGZvciBpIGluIHVyYW5nZShwcm9vZi5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMQoKdmVyaWZ5X2VsaWdpYmlsaXR5X2Zvcl9oZWFkZXJAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI2NwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHByb29mLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IHZlcmlmeV9lbGlnaWJpbGl0eV9hZnRlcl9mb3JAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjY4CiAgICAvLyBzaWJsaW5nID0gcHJvb2ZbaV0uY29weSgpCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyNjkKICAgIC8vIGlmIEJpZ1VJbnQuZnJvbV9ieXRlcyhub2RlKSA8IEJpZ1VJbnQuZnJvbV9ieXRlcyhzaWJsaW5nLmJ5dGVzKToKICAgIGZyYW1lX2RpZyAwCiAgICBiPgogICAgYnogdmVyaWZ5X2VsaWdpYmlsaXR5X2Vsc2VfYm9keUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyNzAKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYoQnl0ZXMoTUVSS0xFX05PREVfUFJFRklYKSArIG5vZGUgKyBzaWJsaW5nLmJ5dGVzKQogICAgcHVzaGJ5dGVzIDB4MDEKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICBmcmFtZV9idXJ5IDAKICAgIGIgdmVyaWZ5X2VsaWdpYmlsaXR5X2FmdGVyX2lmX2Vsc2VANwoKdmVyaWZ5X2VsaWdpYmlsaXR5X2Vsc2VfYm9keUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjcyCiAgICAvLyBub2RlID0gb3Auc2hhMjU2KEJ5dGVzKE1FUktMRV9OT0RFX1BSRUZJWCkgKyBzaWJsaW5nLmJ5dGVzICsgbm9kZSkKICAgIHB1c2hieXRlcyAweDAxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgZnJhbWVfYnVyeSAwCgp2ZXJpZnlfZWxpZ2liaWxpdHlfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjY3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIHZlcmlmeV9lbGlnaWJpbGl0eV9mb3JfaGVhZGVyQDMKCnZlcmlmeV9lbGlnaWJpbGl0eV9hZnRlcl9mb3JAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gYXNzZXJ0IG5vZGUgPT0gcm9vdCwgIkFjY291bnQgaXMgbm90IGVsaWdpYmxlIHRvIHZvdGUgaW4gdGhpcyBwb2xsLiIKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMwogICAgPT0KICAgIGFzc2VydCAvLyBBY2NvdW50IGlzIG5vdCBlbGlnaWJsZSB0byB2b3RlIGluIHRoaXMgcG9sbC4KICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uY2FzdF9iYWxsb3QocG9sbF9pZDogdWludDY0LCBhY2NvdW50OiBieXRlcywgY2hvaWNlOiB1aW50NjQsIG1icl9wYXllcjogYnl0ZXMpIC0+IHZvaWQ6CmNhc3RfYmFsbG90OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Mjg2LTI5MQogICAgLy8gIyBEZWZpbmUgc3Vicm91dGluZSB0aGF0IHN0b3JlcyBhbiBhY2NvdW50J3MgYmFsbG90IGJveCAody8gdGhlIGFjY291bnQgdGhhdCBwYWlkIGl0cyBNQlIpIGFuZCBjb3VudHMgaXQgdG93YXJkcwogICAgLy8gIyB0aGUgYWNjb3VudCdzIHZvdGVzCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNhc3RfYmFsbG90KAogICAgLy8gICAgIHNlbGYsIHBvbGxfaWQ6IFVJbnQ2NCwgYWNjb3VudDogQWNjb3VudCwgY2hvaWNlOiBVSW50NjQsIG1icl9wYXllcjogQWNjb3VudAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNCAwCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjkyCiAgICAvLyBiYWxsb3Rfa2V5ID0gc2VsZi5iYWxsb3Rfa2V5KHBvbGxfaWQsIGFjY291bnQpCiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgY2FsbHN1YiBiYWxsb3Rfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyOTUKICAgIC8vIGJhbGxvdF9rZXkgbm90IGluIHNlbGYuYm94X3ZvdGVfY2hvaWNlCiAgICBieXRlYyA3IC8vICJ2IgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Mjk0LTI5NgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBiYWxsb3Rfa2V5IG5vdCBpbiBzZWxmLmJveF92b3RlX2Nob2ljZQogICAgLy8gKSwgIlRoaXMgYWNjb3VudCBhbHJlYWR5IHN1Ym1pdHRlZCBhIHZvdGUuIgogICAgYXNzZXJ0IC8vIFRoaXMgYWNjb3VudCBhbHJlYWR5IHN1Ym1pdHRlZCBhIHZvdGUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyOTgKICAgIC8vIGlmIHNlbGYuYm94X3BvbGxbcG9sbF9pZF0ucmVxdWlyZV9vcHRfaW4ubmF0aXZlOgogICAgZnJhbWVfZGlnIC00CiAgICBpdG9iCiAgICBkdXAKICAgIGJ5dGVjXzAgLy8gInAiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X3BvbGwgZW50cnkgZXhpc3RzCiAgICBwdXNoaW50IDIwOCAvLyAyMDgKICAgIGdldGJpdAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIGJ6IGNhc3RfYmFsbG90X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Mjk5LTMwMQogICAgLy8gYXNzZXJ0IGFjY291bnQuaXNfb3B0ZWRfaW4oCiAgICAvLyAgICAgQXBwbGljYXRpb24oR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpCiAgICAvLyApLCAiQWNjb3VudCBtdXN0IGJlIG9wdGVkLWluIGJlZm9yZSB2b3RpbmcuIgogICAgZnJhbWVfZGlnIC0zCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozMDAKICAgIC8vIEFwcGxpY2F0aW9uKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyOTktMzAxCiAgICAvLyBhc3NlcnQgYWNjb3VudC5pc19vcHRlZF9pbigKICAgIC8vICAgICBBcHBsaWNhdGlvbihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkKICAgIC8vICksICJBY2NvdW50IG11c3QgYmUgb3B0ZWQtaW4gYmVmb3JlIHZvdGluZy4iCiAgICBhcHBfb3B0ZWRfaW4KICAgIGFzc2VydCAvLyBBY2NvdW50IG11c3QgYmUgb3B0ZWQtaW4gYmVmb3JlIHZvdGluZy4KCmNhc3RfYmFsbG90X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjMwMwogICAgLy8gc2VsZi52YWxpZGF0ZV92b3RlKHBvbGxfaWQsIGNob2ljZSkKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIHZhbGlkYXRlX3ZvdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjMwNwogICAgLy8gY2hvaWNlPWFyYzQuVUludDY0KGNob2ljZSksIG1icl9wYXllcj1hcmM0LkFkZHJlc3MobWJyX3BheWVyKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzA1LTMwOAogICAgLy8gIyBDcmVhdGUgdGhlIGFjY291bnQncyBiYWxsb3QgYm94IGhvbGRpbmcgdGhlaXIgdm90ZSBjaG9pY2UgYW5kIHRoZSBNQlIgcGF5ZXIgdG8gcmVmdW5kIG9uIHJlbGVhc2UKICAgIC8vIHNlbGYuYm94X3ZvdGVfY2hvaWNlW2JhbGxvdF9rZXldID0gQmFsbG90KAogICAgLy8gICAgIGNob2ljZT1hcmM0LlVJbnQ2NChjaG9pY2UpLCBtYnJfcGF5ZXI9YXJjNC5BZGRyZXNzKG1icl9wYXllcikKICAgIC8vICkKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozMTAtMzExCiAgICAvLyAjIEZvbGQgdGhlIGJhbGxvdCBpbnRvIHRoZSBwb2xsJ3MgcnVubmluZyBiYWxsb3QgaGFzaCBjaGFpbgogICAgLy8gcG9sbCA9IHNlbGYuYm94X3BvbGxbcG9sbF9pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfcG9sbCBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjMxMwogICAgLy8gb3Auc2hhMjU2KHBvbGwuYmFsbG90X2hhc2guYnl0ZXMgKyBhY2NvdW50LmJ5dGVzICsgb3AuaXRvYihjaG9pY2UpKQogICAgZHVwCiAgICBleHRyYWN0IDc1IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjMxMi0zMTQKICAgIC8vIHBvbGwuYmFsbG90X2hhc2ggPSBIYXNoMzIuZnJvbV9ieXRlcygKICAgIC8vICAgICBvcC5zaGEyNTYocG9sbC5iYWxsb3RfaGFzaC5ieXRlcyArIGFjY291bnQuYnl0ZXMgKyBvcC5pdG9iKGNob2ljZSkpCiAgICAvLyApCiAgICByZXBsYWNlMiA3NQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzE1CiAgICAvLyBzZWxmLmJveF9wb2xsW3BvbGxfaWRdID0gcG9sbC5jb3B5KCkKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjMxNy0zMTgKICAgIC8vICMgSW5jcmVtZW50IGNvdW50IGZvciB0b3RhbCBiYWxsb3QgYm94ZXMKICAgIC8vIHNlbGYudG90YWxfYmFsbG90X2JveGVzICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX2JhbGxvdF9ib3hlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9iYWxsb3RfYm94ZXMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWNfMyAvLyAidG90YWxfYmFsbG90X2JveGVzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjMyMC0zMjEKICAgIC8vICMgSW5jcmVtZW50IHRoZSBhY2NvdW50J3Mgdm90ZSBjb3VudCBpZiB0aGUgYWNjb3VudCBpcyBvcHRlZCBpbgogICAgLy8gaWYgYWNjb3VudC5pc19vcHRlZF9pbihBcHBsaWNhdGlvbihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkpOgogICAgZnJhbWVfZGlnIC0zCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIGFwcF9vcHRlZF9pbgogICAgYnogY2FzdF9iYWxsb3RfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozMjIKICAgIC8vIHNlbGYubG9jYWxfdm90ZXNfY2FzdFthY2NvdW50XSArPSBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInZvdGVzX2Nhc3QiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sb2NhbF92b3Rlc19jYXN0IGV4aXN0cyBmb3IgYWNjb3VudAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2RpZyAtMwogICAgYnl0ZWMgNiAvLyAidm90ZXNfY2FzdCIKICAgIHVuY292ZXIgMgogICAgYXBwX2xvY2FsX3B1dAoKY2FzdF9iYWxsb3RfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzI2LTMzMAogICAgLy8gVm90ZUNhc3QoCiAgICAvLyAgICAgcG9sbF9pZD1hcmM0LlVJbnQ2NChwb2xsX2lkKSwKICAgIC8vICAgICB2b3Rlcj1hcmM0LkFkZHJlc3MoYWNjb3VudCksCiAgICAvLyAgICAgY2hvaWNlPWFyYzQuVUludDY0KGNob2ljZSksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjMyNC0zMzEKICAgIC8vICMgRW1pdCBldmVudCBvbi1jaGFpbgogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIFZvdGVDYXN0KAogICAgLy8gICAgICAgICBwb2xsX2lkPWFyYzQuVUludDY0KHBvbGxfaWQpLAogICAgLy8gICAgICAgICB2b3Rlcj1hcmM0LkFkZHJlc3MoYWNjb3VudCksCiAgICAvLyAgICAgICAgIGNob2ljZT1hcmM0LlVJbnQ2NChjaG9pY2UpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDg5ZTQ0NjY3IC8vIG1ldGhvZCAiVm90ZUNhc3QodWludDY0LGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uYmFsbG90X2tleShwb2xsX2lkOiB1aW50NjQsIGFjY291bnQ6IGJ5dGVzKSAtPiBieXRlczoKYmFsbG90X2tleToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIyNC0yMjYKICAgIC8vICMgRGVmaW5lIHN1YnJvdXRpbmUgdGhhdCByZXR1cm5zIHRoZSBiYWxsb3QgYm94IGtleSBvZiBhbiBhY2NvdW50IGZvciBhIHBvbGwgKHdpdGhvdXQgdGhlICd2JyBwcmVmaXgpCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGJhbGxvdF9rZXkoc2VsZiwgcG9sbF9pZDogVUludDY0LCBhY2NvdW50OiBBY2NvdW50KSAtPiBCeXRlczoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjI3CiAgICAvLyByZXR1cm4gb3AuaXRvYihwb2xsX2lkKSArIGFjY291bnQuYnl0ZXMKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi52YWxpZGF0ZV92b3RlKHBvbGxfaWQ6IHVpbnQ2NCwgY2hvaWNlOiB1aW50NjQpIC0+IHZvaWQ6CnZhbGlkYXRlX3ZvdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyMjktMjMxCiAgICAvLyAjIERlZmluZSBzdWJyb3V0aW5lIHRoYXQgY2hlY2tzIHRoZSB2b3RpbmcgcGVyaW9kIGFuZCBjaG9pY2Ugb2YgYSB2b3RlIGJlZm9yZSBpdCBpcyBjb3VudGVkCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHZhbGlkYXRlX3ZvdGUoc2VsZiwgcG9sbF9pZDogVUludDY0LCBjaG9pY2U6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjMzCiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA+IHNlbGYuYm94X3BvbGxbcG9sbF9pZF0uc3RhcnRfZGF0ZV91bml4Lm5hdGl2ZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJwIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X3BvbGwgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDEwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICB1bmNvdmVyIDIKICAgIDwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIzMi0yMzQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLnN0YXJ0X2RhdGVfdW5peC5uYXRpdmUKICAgIC8vICksICJWb3RpbmcgcGVyaW9kIGhhcyBub3Qgc3RhcnRlZCB5ZXQuIgogICAgYXNzZXJ0IC8vIFZvdGluZyBwZXJpb2QgaGFzIG5vdCBzdGFydGVkIHlldC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIzNwogICAgLy8gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPCBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmVuZF9kYXRlX3VuaXgubmF0aXZlCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBzd2FwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfcG9sbCBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMTggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIDwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjIzNi0yMzgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPCBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmVuZF9kYXRlX3VuaXgubmF0aXZlCiAgICAvLyApLCAiVm90aW5nIHBlcmlvZCBoYXMgZW5kZWQuIgogICAgYXNzZXJ0IC8vIFZvdGluZyBwZXJpb2QgaGFzIGVuZGVkLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjQxCiAgICAvLyBjaG9pY2UgPj0gVUludDY0KDEpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAxCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjQxLTI0MgogICAgLy8gY2hvaWNlID49IFVJbnQ2NCgxKQogICAgLy8gYW5kIGNob2ljZSA8PSBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmNob2ljZV9jb3VudC5uYXRpdmUKICAgIGJ6IHZhbGlkYXRlX3ZvdGVfYm9vbF9mYWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyNDIKICAgIC8vIGFuZCBjaG9pY2UgPD0gc2VsZi5ib3hfcG9sbFtwb2xsX2lkXS5jaG9pY2VfY291bnQubmF0aXZlCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X3BvbGwgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMQogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI0MS0yNDIKICAgIC8vIGNob2ljZSA+PSBVSW50NjQoMSkKICAgIC8vIGFuZCBjaG9pY2UgPD0gc2VsZi5ib3hfcG9sbFtwb2xsX2lkXS5jaG9pY2VfY291bnQubmF0aXZlCiAgICBieiB2YWxpZGF0ZV92b3RlX2Jvb2xfZmFsc2VAMwogICAgaW50Y18xIC8vIDEKICAgIGIgdmFsaWRhdGVfdm90ZV9ib29sX21lcmdlQDQKCnZhbGlkYXRlX3ZvdGVfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKCnZhbGlkYXRlX3ZvdGVfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjQwLTI0MwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBjaG9pY2UgPj0gVUludDY0KDEpCiAgICAvLyAgICAgYW5kIGNob2ljZSA8PSBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmNob2ljZV9jb3VudC5uYXRpdmUKICAgIC8vICksICJJbnZhbGlkIGNob2ljZS4gQ2FuIG9ubHkgY2hvb3NlIGJldHdlZW4gY2hvaWNlIDEgYW5kIHRoZSBwb2xsIGNob2ljZSBjb3VudC4iCiAgICBhc3NlcnQgLy8gSW52YWxpZCBjaG9pY2UuIENhbiBvbmx5IGNob29zZSBiZXR3ZWVuIGNob2ljZSAxIGFuZCB0aGUgcG9sbCBjaG9pY2UgY291bnQuCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uY291bnRfcG9sbF92b3Rlcyhwb2xsX2lkOiB1aW50NjQsIHZvdGVfY291bnQ6IHVpbnQ2NCkgLT4gdm9pZDoKY291bnRfcG9sbF92b3RlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjM2NS0zNjcKICAgIC8vICMgRGVmaW5lIHN1YnJvdXRpbmUgdGhhdCBhZGRzIHZhbGlkIHZvdGVzIHRvIGEgcG9sbCdzIHJlY29yZCB0b3RhbHMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY291bnRfcG9sbF92b3RlcyhzZWxmLCBwb2xsX2lkOiBVSW50NjQsIHZvdGVfY291bnQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzY4LTM2OQogICAgLy8gIyBJbmNyZW1lbnQgY291bnQgZm9yIHRvdGFsIHZvdGVzIGFuZCBvcGVuIGJhbGxvdHMgb2YgdGhlIHBvbGwKICAgIC8vIHBvbGwgPSBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJwIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveF9wb2xsIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzcwCiAgICAvLyBwb2xsLnRvdGFsX3ZvdGVzID0gYXJjNC5VSW50NjQocG9sbC50b3RhbF92b3Rlcy5uYXRpdmUgKyB2b3RlX2NvdW50KQogICAgZHVwCiAgICBleHRyYWN0IDU5IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDU5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozNzEKICAgIC8vIHBvbGwub3Blbl9iYWxsb3RzID0gYXJjNC5VSW50NjQocG9sbC5vcGVuX2JhbGxvdHMubmF0aXZlICsgdm90ZV9jb3VudCkKICAgIGR1cAogICAgZXh0cmFjdCA2NyA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiA2NwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzcyCiAgICAvLyBzZWxmLmJveF9wb2xsW3BvbGxfaWRdID0gcG9sbC5jb3B5KCkKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5zdWJtaXRfdm90ZV9iYXRjaChwb2xsX2lkOiB1aW50NjQsIG1icl9wYXk6IHVpbnQ2NCwgdm90ZXJzOiBieXRlcywgY2hvaWNlczogYnl0ZXMsIHNpZ25hdHVyZXM6IGJ5dGVzKSAtPiB2b2lkOgpzdWJtaXRfdm90ZV9iYXRjaDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjYxMy02MjIKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyBhIHJlbGF5ZXIgdG8gc3VibWl0IGEgYmF0Y2ggb2Ygc2lnbmVkIHZvdGVzIGFuZCBwYXkgdGhlaXIgTUJSIGNvc3QgaW4gb25lIGdyb3VwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIHN1Ym1pdF92b3RlX2JhdGNoKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcG9sbF9pZDogVUludDY0LAogICAgLy8gICAgIG1icl9wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gICAgIHZvdGVyczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5BZGRyZXNzXSwKICAgIC8vICAgICBjaG9pY2VzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0sCiAgICAvLyAgICAgc2lnbmF0dXJlczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5EeW5hbWljQnl0ZXNdLAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNSAwCiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjYyMwogICAgLy8gYmF0Y2hfc2l6ZSA9IHZvdGVycy5sZW5ndGgKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjYyNS02MjYKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgcG9sbF9pZCBpbiBzZWxmLmJveF9wb2xsLCAiUG9sbCBkb2VzIG5vdCBleGlzdC4iCiAgICBmcmFtZV9kaWcgLTUKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gInAiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgY292ZXIgMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUG9sbCBkb2VzIG5vdCBleGlzdC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjYyOAogICAgLy8gYXNzZXJ0IGJhdGNoX3NpemUgPiBVSW50NjQoMCksICJWb3RlIGJhdGNoIG11c3QgY29udGFpbiBhdCBsZWFzdCBvbmUgYmFsbG90LiIKICAgIGR1cAogICAgYXNzZXJ0IC8vIFZvdGUgYmF0Y2ggbXVzdCBjb250YWluIGF0IGxlYXN0IG9uZSBiYWxsb3QuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2MjktNjMxCiAgICAvLyBhc3NlcnQgYmF0Y2hfc2l6ZSA8PSBVSW50NjQoCiAgICAvLyAgICAgTUFYX0JBVENIX1NJWkUKICAgIC8vICksICJWb3RlIGJhdGNoIHNpemUgY2FuIG5vdCBleGNlZWQgMyBiYWxsb3RzLiIKICAgIGR1cAogICAgcHVzaGludCAzIC8vIDMKICAgIDw9CiAgICBhc3NlcnQgLy8gVm90ZSBiYXRjaCBzaXplIGNhbiBub3QgZXhjZWVkIDMgYmFsbG90cy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjYzMwogICAgLy8gY2hvaWNlcy5sZW5ndGggPT0gYmF0Y2hfc2l6ZSBhbmQgc2lnbmF0dXJlcy5sZW5ndGggPT0gYmF0Y2hfc2l6ZQogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgID09CiAgICBieiBzdWJtaXRfdm90ZV9iYXRjaF9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgMwogICAgPT0KICAgIGJ6IHN1Ym1pdF92b3RlX2JhdGNoX2Jvb2xfZmFsc2VAMwogICAgaW50Y18xIC8vIDEKICAgIGIgc3VibWl0X3ZvdGVfYmF0Y2hfYm9vbF9tZXJnZUA0CgpzdWJtaXRfdm90ZV9iYXRjaF9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAoKc3VibWl0X3ZvdGVfYmF0Y2hfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjMyLTYzNAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBjaG9pY2VzLmxlbmd0aCA9PSBiYXRjaF9zaXplIGFuZCBzaWduYXR1cmVzLmxlbmd0aCA9PSBiYXRjaF9zaXplCiAgICAvLyApLCAiVm90ZSBiYXRjaCB2b3RlcnMsIGNob2ljZXMgYW5kIHNpZ25hdHVyZXMgbXVzdCBoYXZlIG1hdGNoaW5nIGxlbmd0aHMuIgogICAgYXNzZXJ0IC8vIFZvdGUgYmF0Y2ggdm90ZXJzLCBjaG9pY2VzIGFuZCBzaWduYXR1cmVzIG11c3QgaGF2ZSBtYXRjaGluZyBsZW5ndGhzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjM4CiAgICAvLyBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmVsaWdpYmlsaXR5X3Jvb3QuYnl0ZXMgPT0gb3AuYnplcm8oMzIpCiAgICBmcmFtZV9kaWcgNAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X3BvbGwgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDI3IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgaW50Y18yIC8vIDMyCiAgICBiemVybwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjYzNi02MzkKICAgIC8vICMgQSBiYXRjaCBoYXMgbm8gcm9vbSBsZWZ0IGluIGl0cyBhcHAgYXJncyBmb3IgcGVyIHZvdGVyIGVsaWdpYmlsaXR5IHByb29mcwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmVsaWdpYmlsaXR5X3Jvb3QuYnl0ZXMgPT0gb3AuYnplcm8oMzIpCiAgICAvLyApLCAiUG9sbHMgd2l0aCBhbiBlbGlnaWJpbGl0eSByb290IG9ubHkgYWNjZXB0IHZvdGVzIHZpYSAnc3VibWl0X3ZvdGUnLiIKICAgIGFzc2VydCAvLyBQb2xscyB3aXRoIGFuIGVsaWdpYmlsaXR5IHJvb3Qgb25seSBhY2NlcHQgdm90ZXMgdmlhICdzdWJtaXRfdm90ZScuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2NDIKICAgIC8vIG1icl9wYXkuYW1vdW50ID09IHNlbGYuY2FsY19iYWxsb3RfYm94X21icigpICogYmF0Y2hfc2l6ZQogICAgZnJhbWVfZGlnIC00CiAgICBndHhucyBBbW91bnQKICAgIGNhbGxzdWIgY2FsY19iYWxsb3RfYm94X21icgogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgY292ZXIgMwogICAgKgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY0MS02NDMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5hbW91bnQgPT0gc2VsZi5jYWxjX2JhbGxvdF9ib3hfbWJyKCkgKiBiYXRjaF9zaXplCiAgICAvLyApLCAiTUJSIHBheW1lbnQgbXVzdCBtZWV0IHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50IGFtb3VudC4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgbXVzdCBtZWV0IHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50IGFtb3VudC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY0NQogICAgLy8gbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTQKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY0NC02NDYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiTUJSIHBheW1lbnQgcmVjaWV2ZXIgbXVzdCBiZSB0aGUgQXBwIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IHJlY2lldmVyIG11c3QgYmUgdGhlIEFwcCBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjUwCiAgICAvLyBVSW50NjQoQkFMTE9UX09QQ09ERV9CVURHRVQpICogYmF0Y2hfc2l6ZSwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdAogICAgcHVzaGludCAyMDAwIC8vIDIwMDAKICAgICoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2NDgtNjUxCiAgICAvLyAjIFBvb2wgZW5vdWdoIG9wY29kZSBidWRnZXQgZm9yIHZlcmlmeWluZyBldmVyeSBiYWxsb3Qgc2lnbmF0dXJlIChvcC11cCBmZWVzIGFyZSBwYWlkIGJ5IHRoZSByZWxheWVyKQogICAgLy8gZW5zdXJlX2J1ZGdldCgKICAgIC8vICAgICBVSW50NjQoQkFMTE9UX09QQ09ERV9CVURHRVQpICogYmF0Y2hfc2l6ZSwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdAogICAgLy8gKQogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2NTMtNjU0CiAgICAvLyAjIFJlYWQgdGhlIHBhY2tlZCB0YWxseSBvbmNlIHNvIGJveCBzdG9yYWdlIGlzIG9ubHkgdXBkYXRlZCBvbmNlIHBlciBiYXRjaAogICAgLy8gdGFsbHlfa2V5ID0gc2VsZi5wb2xsX3RhbGx5X2tleShwb2xsX2lkKQogICAgZnJhbWVfZGlnIC01CiAgICBjYWxsc3ViIHBvbGxfdGFsbHlfa2V5CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjU1CiAgICAvLyB0YWxseSwgdGFsbHlfZXhpc3RzID0gb3AuQm94LmdldCh0YWxseV9rZXkpCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY1NgogICAgLy8gYXNzZXJ0IHRhbGx5X2V4aXN0cywgIlBvbGwgdGFsbHkgZG9lcyBub3QgZXhpc3QuIgogICAgYXNzZXJ0IC8vIFBvbGwgdGFsbHkgZG9lcyBub3QgZXhpc3QuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2NTgKICAgIC8vIGZvciBpIGluIHVyYW5nZShiYXRjaF9zaXplKToKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDIKCnN1Ym1pdF92b3RlX2JhdGNoX2Zvcl9oZWFkZXJANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY1OAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGJhdGNoX3NpemUpOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAzCiAgICA8CiAgICBieiBzdWJtaXRfdm90ZV9iYXRjaF9hZnRlcl9mb3JAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjU5CiAgICAvLyB2b3RlciA9IHZvdGVyc1tpXS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY2MAogICAgLy8gY2hvaWNlID0gY2hvaWNlc1tpXS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAyCiAgICBwdXNoaW50IDggLy8gOAogICAgKgogICAgcHVzaGludCA4IC8vIDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjYxCiAgICAvLyBzaWduYXR1cmUgPSBzaWduYXR1cmVzW2ldLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyA0CiAgICA+CiAgICBhc3NlcnQgLy8gSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGRpZyAzCiAgICBwdXNoaW50IDIgLy8gMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIGV4dHJhY3QzCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjY0CiAgICAvLyBzZWxmLmJhbGxvdF9tZXNzYWdlKHBvbGxfaWQsIGNob2ljZSksIHNpZ25hdHVyZSwgdm90ZXIuYnl0ZXMKICAgIGZyYW1lX2RpZyAtNQogICAgZGlnIDIKICAgIGNhbGxzdWIgYmFsbG90X21lc3NhZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY2My02NjUKICAgIC8vIGFzc2VydCBvcC5lZDI1NTE5dmVyaWZ5X2JhcmUoCiAgICAvLyAgICAgc2VsZi5iYWxsb3RfbWVzc2FnZShwb2xsX2lkLCBjaG9pY2UpLCBzaWduYXR1cmUsIHZvdGVyLmJ5dGVzCiAgICAvLyApLCAiQmFsbG90IHNpZ25hdHVyZSBtdXN0IGJlIHNpZ25lZCBieSB0aGUgdm90aW5nIGFjY291bnQuIgogICAgc3dhcAogICAgZGlnIDMKICAgIGVkMjU1MTl2ZXJpZnlfYmFyZQogICAgYXNzZXJ0IC8vIEJhbGxvdCBzaWduYXR1cmUgbXVzdCBiZSBzaWduZWQgYnkgdGhlIHZvdGluZyBhY2NvdW50LgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjY3CiAgICAvLyBzZWxmLmNhc3RfYmFsbG90KHBvbGxfaWQsIHZvdGVyLCBjaG9pY2UsIG1icl9wYXkuc2VuZGVyKQogICAgZnJhbWVfZGlnIC00CiAgICBndHhucyBTZW5kZXIKICAgIGZyYW1lX2RpZyAtNQogICAgdW5jb3ZlciAzCiAgICBkaWcgMwogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGNhc3RfYmFsbG90CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2NjkKICAgIC8vIG9mZnNldCA9IChjaG9pY2UgLSBVSW50NjQoMSkpICogVUludDY0KDgpCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgcHVzaGludCA4IC8vIDgKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY3MQogICAgLy8gdGFsbHksIG9mZnNldCwgb3AuaXRvYihvcC5leHRyYWN0X3VpbnQ2NCh0YWxseSwgb2Zmc2V0KSArIFVJbnQ2NCgxKSkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGRpZyAxCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY3MC02NzIKICAgIC8vIHRhbGx5ID0gb3AucmVwbGFjZSgKICAgIC8vICAgICB0YWxseSwgb2Zmc2V0LCBvcC5pdG9iKG9wLmV4dHJhY3RfdWludDY0KHRhbGx5LCBvZmZzZXQpICsgVUludDY0KDEpKQogICAgLy8gKQogICAgcmVwbGFjZTMKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjU4CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYmF0Y2hfc2l6ZSk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIHN1Ym1pdF92b3RlX2JhdGNoX2Zvcl9oZWFkZXJANQoKc3VibWl0X3ZvdGVfYmF0Y2hfYWZ0ZXJfZm9yQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2NzQtNjc1CiAgICAvLyAjIFVwZGF0ZSB2b3RlIHRhbGx5CiAgICAvLyBvcC5Cb3gucHV0KHRhbGx5X2tleSwgdGFsbHkpCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY3NwogICAgLy8gc2VsZi5jb3VudF9wb2xsX3ZvdGVzKHBvbGxfaWQsIGJhdGNoX3NpemUpCiAgICBmcmFtZV9kaWcgLTUKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgY291bnRfcG9sbF92b3RlcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Njc5LTY4MAogICAgLy8gIyBMb2cgaW5mbyBvbi1jaGFpbgogICAgLy8gbG9nKCJWb3RlIGJhdGNoIHN1Ym1pdHRlZCBzdWNjZXNzZnVsbHkgd2l0aCBiYWxsb3QgY291bnQ6ICIsIGJhdGNoX3NpemUpCiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgIlZvdGUgYmF0Y2ggc3VibWl0dGVkIHN1Y2Nlc3NmdWxseSB3aXRoIGJhbGxvdCBjb3VudDogIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5iYWxsb3RfbWVzc2FnZShwb2xsX2lkOiB1aW50NjQsIGNob2ljZTogdWludDY0KSAtPiBieXRlczoKYmFsbG90X21lc3NhZ2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyNzYtMjc4CiAgICAvLyAjIERlZmluZSBzdWJyb3V0aW5lIHRoYXQgYnVpbGRzIHRoZSBtZXNzYWdlIGEgdm90ZXIgc2lnbnMgdG8gYXV0aG9yaXplIGEgYmFsbG90IHN1Ym1pdHRlZCBvbiB0aGVpciBiZWhhbGYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYmFsbG90X21lc3NhZ2Uoc2VsZiwgcG9sbF9pZDogVUludDY0LCBjaG9pY2U6IFVJbnQ2NCkgLT4gQnl0ZXM6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI4MQogICAgLy8gKyBvcC5pdG9iKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyODAKICAgIC8vIEJ5dGVzKEJBTExPVF9QUkVGSVgpCiAgICBwdXNoYnl0ZXMgMHg1NjZmNzQ2NTQzNjg2MTY5NmUyMDYyNjE2YzZjNmY3NAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjgwLTI4MQogICAgLy8gQnl0ZXMoQkFMTE9UX1BSRUZJWCkKICAgIC8vICsgb3AuaXRvYihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjgyCiAgICAvLyArIG9wLml0b2IocG9sbF9pZCkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MjgwLTI4MgogICAgLy8gQnl0ZXMoQkFMTE9UX1BSRUZJWCkKICAgIC8vICsgb3AuaXRvYihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkKICAgIC8vICsgb3AuaXRvYihwb2xsX2lkKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weToyODMKICAgIC8vICsgb3AuaXRvYihjaG9pY2UpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI4MC0yODMKICAgIC8vIEJ5dGVzKEJBTExPVF9QUkVGSVgpCiAgICAvLyArIG9wLml0b2IoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpCiAgICAvLyArIG9wLml0b2IocG9sbF9pZCkKICAgIC8vICsgb3AuaXRvYihjaG9pY2UpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjI3OS0yODQKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgQnl0ZXMoQkFMTE9UX1BSRUZJWCkKICAgIC8vICAgICArIG9wLml0b2IoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpCiAgICAvLyAgICAgKyBvcC5pdG9iKHBvbGxfaWQpCiAgICAvLyAgICAgKyBvcC5pdG9iKGNob2ljZSkKICAgIC8vICkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5maW5hbGl6ZV9yZXN1bHRzKHBvbGxfaWQ6IHVpbnQ2NCkgLT4gdWludDY0OgpmaW5hbGl6ZV9yZXN1bHRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjgyLTY4NAogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIGFueW9uZSB0byBmcmVlemUgdGhlIHJlc3VsdHMgb2YgYSBwb2xsIGFmdGVyIHRoZSB2b3RpbmcgcGVyaW9kCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGZpbmFsaXplX3Jlc3VsdHMoc2VsZiwgcG9sbF9pZDogVUludDY0KSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Njg1LTY4NgogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCBwb2xsX2lkIGluIHNlbGYuYm94X3BvbGwsICJQb2xsIGRvZXMgbm90IGV4aXN0LiIKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBieXRlY18wIC8vICJwIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXBuIDIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFBvbGwgZG9lcyBub3QgZXhpc3QuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2ODgKICAgIC8vIHBvbGwgPSBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveF9wb2xsIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjkwCiAgICAvLyBhc3NlcnQgbm90IHBvbGwuZmluYWxpemVkLm5hdGl2ZSwgIlBvbGwgcmVzdWx0cyBhcmUgYWxyZWFkeSBmaW5hbGl6ZWQuIgogICAgZHVwCiAgICBpbnRjIDQgLy8gODU2CiAgICBnZXRiaXQKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAhCiAgICBhc3NlcnQgLy8gUG9sbCByZXN1bHRzIGFyZSBhbHJlYWR5IGZpbmFsaXplZC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY5MwogICAgLy8gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiBwb2xsLmVuZF9kYXRlX3VuaXgubmF0aXZlCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBkaWcgMQogICAgZXh0cmFjdCAxOCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NjkyLTY5NAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA+IHBvbGwuZW5kX2RhdGVfdW5peC5uYXRpdmUKICAgIC8vICksICJQb2xsIHJlc3VsdHMgY2FuIG9ubHkgYmUgZmluYWxpemVkIGFmdGVyIHRoZSB2b3RpbmcgcGVyaW9kIGlzIG92ZXIuIgogICAgYXNzZXJ0IC8vIFBvbGwgcmVzdWx0cyBjYW4gb25seSBiZSBmaW5hbGl6ZWQgYWZ0ZXIgdGhlIHZvdGluZyBwZXJpb2QgaXMgb3Zlci4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjY5Ni02OTcKICAgIC8vICMgUG9vbCBlbm91Z2ggb3Bjb2RlIGJ1ZGdldCBmb3Igc2Nhbm5pbmcgdGhlIHdob2xlIHRhbGx5IChvcC11cCBmZWVzIGFyZSBwYWlkIGJ5IHRoZSBjYWxsZXIpCiAgICAvLyBlbnN1cmVfYnVkZ2V0KFVJbnQ2NChGSU5BTElaRV9PUENPREVfQlVER0VUKSwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCkKICAgIHB1c2hpbnQgMTQwMCAvLyAxNDAwCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo2OTkKICAgIC8vIHRhbGx5LCB0YWxseV9leGlzdHMgPSBvcC5Cb3guZ2V0KHNlbGYucG9sbF90YWxseV9rZXkocG9sbF9pZCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgcG9sbF90YWxseV9rZXkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjcwMAogICAgLy8gYXNzZXJ0IHRhbGx5X2V4aXN0cywgIlBvbGwgdGFsbHkgZG9lcyBub3QgZXhpc3QuIgogICAgYXNzZXJ0IC8vIFBvbGwgdGFsbHkgZG9lcyBub3QgZXhpc3QuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3MDItNzAzCiAgICAvLyAjIEZpbmQgdGhlIHdpbm5lciBhbmQgcnVubmVyIHVwIHRvdGFscyBpbiBvbmUgcGFzcyAodGllcyBnbyB0byB0aGUgbG93ZXN0IGNob2ljZSBudW1iZXIgdy8gYSB6ZXJvIG1hcmdpbikKICAgIC8vIHdpbm5lciA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjcwNAogICAgLy8gd2lubmVyX3RvdGFsID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzA1CiAgICAvLyBydW5uZXJfdXBfdG90YWwgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3MDYKICAgIC8vIGZvciBpIGluIHVyYW5nZShwb2xsLmNob2ljZV9jb3VudC5uYXRpdmUpOgogICAgZXh0cmFjdCAyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBpbnRjXzAgLy8gMAoKZmluYWxpemVfcmVzdWx0c19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3MDYKICAgIC8vIGZvciBpIGluIHVyYW5nZShwb2xsLmNob2ljZV9jb3VudC5uYXRpdmUpOgogICAgZnJhbWVfZGlnIDkKICAgIGZyYW1lX2RpZyA4CiAgICA8CiAgICBieiBmaW5hbGl6ZV9yZXN1bHRzX2FmdGVyX2ZvckAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzA3CiAgICAvLyBjaG9pY2VfdG90YWwgPSBvcC5leHRyYWN0X3VpbnQ2NCh0YWxseSwgaSAqIFVJbnQ2NCg4KSkKICAgIGZyYW1lX2RpZyA5CiAgICBwdXNoaW50IDggLy8gOAogICAgKgogICAgZnJhbWVfZGlnIDQKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjcwOAogICAgLy8gaWYgd2lubmVyID09IFVJbnQ2NCgwKSBvciBjaG9pY2VfdG90YWwgPiB3aW5uZXJfdG90YWw6CiAgICBmcmFtZV9kaWcgNQogICAgYnogZmluYWxpemVfcmVzdWx0c19pZl9ib2R5QDQKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgNgogICAgPgogICAgYnogZmluYWxpemVfcmVzdWx0c19lbHNlX2JvZHlANQoKZmluYWxpemVfcmVzdWx0c19pZl9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3MTAKICAgIC8vIHdpbm5lciA9IGkgKyBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA1CiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfYnVyeSA3CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfYnVyeSA2CiAgICBiIGZpbmFsaXplX3Jlc3VsdHNfYWZ0ZXJfaWZfZWxzZUA4CgpmaW5hbGl6ZV9yZXN1bHRzX2Vsc2VfYm9keUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzEyCiAgICAvLyBlbGlmIGNob2ljZV90b3RhbCA+IHJ1bm5lcl91cF90b3RhbDoKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgNwogICAgPgogICAgYnogZmluYWxpemVfcmVzdWx0c19hZnRlcl9pZl9lbHNlQDgKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9idXJ5IDcKCmZpbmFsaXplX3Jlc3VsdHNfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzA2CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UocG9sbC5jaG9pY2VfY291bnQubmF0aXZlKToKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA5CiAgICBiIGZpbmFsaXplX3Jlc3VsdHNfZm9yX2hlYWRlckAxCgpmaW5hbGl6ZV9yZXN1bHRzX2FmdGVyX2ZvckAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjcxNS03MTYKICAgIC8vICMgRnJlZXplIHRoZSByZXN1bHRzIGluIHRoZSBwb2xsIHJlY29yZAogICAgLy8gcG9sbC5maW5hbGl6ZWQgPSBhcmM0LkJvb2woVHJ1ZSkgICMgbm9xYTogRkJUMDAzICgnYXJjNC5Cb29sJyBvbmx5IHRha2VzIGl0cyB2YWx1ZSBwb3NpdGlvbmFsbHkpCiAgICBmcmFtZV9kaWcgMwogICAgaW50YyA0IC8vIDg1NgogICAgaW50Y18xIC8vIDEKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzE3CiAgICAvLyBwb2xsLndpbm5lciA9IGFyYzQuVUludDY0KHdpbm5lcikKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGl0b2IKICAgIHJlcGxhY2UyIDEwOAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzE4CiAgICAvLyBwb2xsLndpbm5lcl9tYXJnaW4gPSBhcmM0LlVJbnQ2NCh3aW5uZXJfdG90YWwgLSBydW5uZXJfdXBfdG90YWwpCiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfZGlnIDcKICAgIC0KICAgIGl0b2IKICAgIHJlcGxhY2UyIDExNgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzE5CiAgICAvLyBzZWxmLmJveF9wb2xsW3BvbGxfaWRdID0gcG9sbC5jb3B5KCkKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjcyNQogICAgLy8gd2lubmVyPXBvbGwud2lubmVyLAogICAgZHVwCiAgICBleHRyYWN0IDEwOCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzI2CiAgICAvLyB3aW5uZXJfbWFyZ2luPXBvbGwud2lubmVyX21hcmdpbiwKICAgIGRpZyAxCiAgICBleHRyYWN0IDExNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzI3CiAgICAvLyB0b3RhbF92b3Rlcz1wb2xsLnRvdGFsX3ZvdGVzLAogICAgZGlnIDIKICAgIGV4dHJhY3QgNTkgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjcyOAogICAgLy8gYmFsbG90X2hhc2g9cG9sbC5iYWxsb3RfaGFzaC5jb3B5KCksCiAgICB1bmNvdmVyIDMKICAgIGV4dHJhY3QgNzUgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3MjMtNzI5CiAgICAvLyBQb2xsRmluYWxpemVkKAogICAgLy8gICAgIHBvbGxfaWQ9YXJjNC5VSW50NjQocG9sbF9pZCksCiAgICAvLyAgICAgd2lubmVyPXBvbGwud2lubmVyLAogICAgLy8gICAgIHdpbm5lcl9tYXJnaW49cG9sbC53aW5uZXJfbWFyZ2luLAogICAgLy8gICAgIHRvdGFsX3ZvdGVzPXBvbGwudG90YWxfdm90ZXMsCiAgICAvLyAgICAgYmFsbG90X2hhc2g9cG9sbC5iYWxsb3RfaGFzaC5jb3B5KCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMQogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3MjEtNzMwCiAgICAvLyAjIEVtaXQgZXZlbnQgb24tY2hhaW4KICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBQb2xsRmluYWxpemVkKAogICAgLy8gICAgICAgICBwb2xsX2lkPWFyYzQuVUludDY0KHBvbGxfaWQpLAogICAgLy8gICAgICAgICB3aW5uZXI9cG9sbC53aW5uZXIsCiAgICAvLyAgICAgICAgIHdpbm5lcl9tYXJnaW49cG9sbC53aW5uZXJfbWFyZ2luLAogICAgLy8gICAgICAgICB0b3RhbF92b3Rlcz1wb2xsLnRvdGFsX3ZvdGVzLAogICAgLy8gICAgICAgICBiYWxsb3RfaGFzaD1wb2xsLmJhbGxvdF9oYXNoLmNvcHkoKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgxNWViN2RkNSAvLyBtZXRob2QgIlBvbGxGaW5hbGl6ZWQodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGJ5dGVbMzJdKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3MzIKICAgIC8vIHJldHVybiB3aW5uZXIKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVfY2hhaW4uY29udHJhY3QuVm90ZUNoYWluLmdldF9wb2xsX3NuYXBzaG90KHBvbGxfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9wb2xsX3NuYXBzaG90OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzM0LTczOAogICAgLy8gIyBEZWZpbmUgcmVhZC1vbmx5IGFiaW1ldGhvZCB0aGF0IHJldHVybnMgdGhlIHdob2xlIHN0YXRlIG9mIGEgcG9sbCBpbiBvbmUgY2FsbCAobWVhbnQgdG8gYmUgc2ltdWxhdGVkKQogICAgLy8gIyBOT1RFOiBTbmFwc2hvdHMgb2YgcG9sbHMgd2l0aCBjbG9zZSB0byAzMiBtYXggc2l6ZSBjaG9pY2VzIGV4Y2VlZCB0aGUgNCwwOTYgYnl0ZSBBVk0gdmFsdWUgbGltaXQsIHRob3NlIHBvbGxzCiAgICAvLyAjIGNhbiBvbmx5IGJlIHJlYWQgdmlhIHRoZWlyIGJveGVzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcG9sbF9zbmFwc2hvdChzZWxmLCBwb2xsX2lkOiBVSW50NjQpIC0+IFBvbGxTbmFwc2hvdDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzM5CiAgICAvLyBhc3NlcnQgcG9sbF9pZCBpbiBzZWxmLmJveF9wb2xsLCAiUG9sbCBkb2VzIG5vdCBleGlzdC4iCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gInAiCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFBvbGwgZG9lcyBub3QgZXhpc3QuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NDEKICAgIC8vIHBvbGwgPSBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X3BvbGwgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NDMKICAgIC8vIHRhbGx5LCB0YWxseV9leGlzdHMgPSBvcC5Cb3guZ2V0KHNlbGYucG9sbF90YWxseV9rZXkocG9sbF9pZCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgcG9sbF90YWxseV9rZXkKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc0NAogICAgLy8gYXNzZXJ0IHRhbGx5X2V4aXN0cywgIlBvbGwgdGFsbHkgZG9lcyBub3QgZXhpc3QuIgogICAgYXNzZXJ0IC8vIFBvbGwgdGFsbHkgZG9lcyBub3QgZXhpc3QuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NDgKICAgIC8vIG9wLmV4dHJhY3Qob3AuaXRvYihwb2xsLmNob2ljZV9jb3VudC5uYXRpdmUpLCA2LCAyKSArIHRhbGx5CiAgICBkaWcgMQogICAgZXh0cmFjdCAyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzQ2LTc0OQogICAgLy8gIyBUaGUgcGFja2VkIHRhbGx5IGFscmVhZHkgaXMgdGhlIEFSQy00IGVuY29kaW5nIG9mIHRoZSB0YWxseSBpdGVtcywgcHJlZml4IGl0IHdpdGggdGhlIDIgYnl0ZSBpdGVtIGNvdW50CiAgICAvLyB0YWxseV9hcnJheSA9IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XS5mcm9tX2J5dGVzKAogICAgLy8gICAgIG9wLmV4dHJhY3Qob3AuaXRvYihwb2xsLmNob2ljZV9jb3VudC5uYXRpdmUpLCA2LCAyKSArIHRhbGx5CiAgICAvLyApCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NDgKICAgIC8vIG9wLmV4dHJhY3Qob3AuaXRvYihwb2xsLmNob2ljZV9jb3VudC5uYXRpdmUpLCA2LCAyKSArIHRhbGx5CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc1MwogICAgLy8gdGl0bGU9cG9sbC50aXRsZS5jb3B5KCksCiAgICBkaWcgMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMgogICAgbGVuCiAgICBkaWcgMwogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzU0CiAgICAvLyBjaG9pY2VzPXNlbGYuYm94X3BvbGxfY2hvaWNlc1twb2xsX2lkXS5jb3B5KCksCiAgICBieXRlYyAxMSAvLyAiYyIKICAgIGRpZyA0CiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveF9wb2xsX2Nob2ljZXMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NTUKICAgIC8vIHN0YXJ0X2RhdGVfdW5peD1wb2xsLnN0YXJ0X2RhdGVfdW5peCwKICAgIGRpZyAzCiAgICBleHRyYWN0IDEwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NTYKICAgIC8vIGVuZF9kYXRlX3VuaXg9cG9sbC5lbmRfZGF0ZV91bml4LAogICAgZGlnIDQKICAgIGV4dHJhY3QgMTggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc1NwogICAgLy8gcmVxdWlyZV9vcHRfaW49cG9sbC5yZXF1aXJlX29wdF9pbiwKICAgIGRpZyA1CiAgICBwdXNoaW50IDIwOCAvLyAyMDgKICAgIGdldGJpdAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc1OAogICAgLy8gZWxpZ2liaWxpdHlfcm9vdD1wb2xsLmVsaWdpYmlsaXR5X3Jvb3QuY29weSgpLAogICAgZGlnIDYKICAgIGV4dHJhY3QgMjcgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NTkKICAgIC8vIHRvdGFsX3ZvdGVzPXBvbGwudG90YWxfdm90ZXMsCiAgICBkaWcgNwogICAgZXh0cmFjdCA1OSA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzYwCiAgICAvLyBvcGVuX2JhbGxvdHM9cG9sbC5vcGVuX2JhbGxvdHMsCiAgICBkaWcgOAogICAgZXh0cmFjdCA2NyA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzYxCiAgICAvLyBiYWxsb3RfaGFzaD1wb2xsLmJhbGxvdF9oYXNoLmNvcHkoKSwKICAgIGRpZyA5CiAgICBleHRyYWN0IDc1IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzYyCiAgICAvLyBmaW5hbGl6ZWQ9cG9sbC5maW5hbGl6ZWQsCiAgICBkaWcgMTAKICAgIGludGMgNCAvLyA4NTYKICAgIGdldGJpdAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc2MwogICAgLy8gd2lubmVyPXBvbGwud2lubmVyLAogICAgZGlnIDExCiAgICBleHRyYWN0IDEwOCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzY0CiAgICAvLyB3aW5uZXJfbWFyZ2luPXBvbGwud2lubmVyX21hcmdpbiwKICAgIHVuY292ZXIgMTIKICAgIGV4dHJhY3QgMTE2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NTEtNzY2CiAgICAvLyByZXR1cm4gUG9sbFNuYXBzaG90KAogICAgLy8gICAgIHBvbGxfaWQ9YXJjNC5VSW50NjQocG9sbF9pZCksCiAgICAvLyAgICAgdGl0bGU9cG9sbC50aXRsZS5jb3B5KCksCiAgICAvLyAgICAgY2hvaWNlcz1zZWxmLmJveF9wb2xsX2Nob2ljZXNbcG9sbF9pZF0uY29weSgpLAogICAgLy8gICAgIHN0YXJ0X2RhdGVfdW5peD1wb2xsLnN0YXJ0X2RhdGVfdW5peCwKICAgIC8vICAgICBlbmRfZGF0ZV91bml4PXBvbGwuZW5kX2RhdGVfdW5peCwKICAgIC8vICAgICByZXF1aXJlX29wdF9pbj1wb2xsLnJlcXVpcmVfb3B0X2luLAogICAgLy8gICAgIGVsaWdpYmlsaXR5X3Jvb3Q9cG9sbC5lbGlnaWJpbGl0eV9yb290LmNvcHkoKSwKICAgIC8vICAgICB0b3RhbF92b3Rlcz1wb2xsLnRvdGFsX3ZvdGVzLAogICAgLy8gICAgIG9wZW5fYmFsbG90cz1wb2xsLm9wZW5fYmFsbG90cywKICAgIC8vICAgICBiYWxsb3RfaGFzaD1wb2xsLmJhbGxvdF9oYXNoLmNvcHkoKSwKICAgIC8vICAgICBmaW5hbGl6ZWQ9cG9sbC5maW5hbGl6ZWQsCiAgICAvLyAgICAgd2lubmVyPXBvbGwud2lubmVyLAogICAgLy8gICAgIHdpbm5lcl9tYXJnaW49cG9sbC53aW5uZXJfbWFyZ2luLAogICAgLy8gICAgIHRhbGx5PXRhbGx5X2FycmF5LmNvcHkoKSwKICAgIC8vICkKICAgIHVuY292ZXIgMTMKICAgIHB1c2hieXRlcyAweDAwODAKICAgIGNvbmNhdAogICAgZGlnIDEyCiAgICBsZW4KICAgIHB1c2hpbnQgMTI4IC8vIDEyOAogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxMgogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIHN3YXAKICAgIHVuY292ZXIgMTEKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMAogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGNvbmNhdAogICAgdW5jb3ZlciA4CiAgICBjb25jYXQKICAgIHVuY292ZXIgNwogICAgY29uY2F0CiAgICB1bmNvdmVyIDYKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVfY2hhaW4uY29udHJhY3QuVm90ZUNoYWluLmdldF92b3Rlcl9zdGF0dXMocG9sbF9pZDogdWludDY0LCBhY2NvdW50OiBieXRlcykgLT4gYnl0ZXM6CmdldF92b3Rlcl9zdGF0dXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NjgtNzcwCiAgICAvLyAjIERlZmluZSByZWFkLW9ubHkgYWJpbWV0aG9kIHRoYXQgcmV0dXJucyB0aGUgdm90aW5nIHN0YXR1cyBvZiBhbiBhY2NvdW50IGluIGEgcG9sbCAobWVhbnQgdG8gYmUgc2ltdWxhdGVkIGluIGJ1bGspCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfdm90ZXJfc3RhdHVzKHNlbGYsIHBvbGxfaWQ6IFVJbnQ2NCwgYWNjb3VudDogQWNjb3VudCkgLT4gVm90ZXJTdGF0dXM6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc3MQogICAgLy8gdm90ZXNfY2FzdCwgb3B0ZWRfaW4gPSBzZWxmLmxvY2FsX3ZvdGVzX2Nhc3QubWF5YmUoYWNjb3VudCkKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInZvdGVzX2Nhc3QiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NzMKICAgIC8vIGJhbGxvdF9rZXkgPSBzZWxmLmJhbGxvdF9rZXkocG9sbF9pZCwgYWNjb3VudCkKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGJhbGxvdF9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc3NAogICAgLy8gdm90ZWQgPSBiYWxsb3Rfa2V5IGluIHNlbGYuYm94X3ZvdGVfY2hvaWNlCiAgICBieXRlYyA3IC8vICJ2IgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc3NQogICAgLy8gY2hvaWNlID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Nzc2CiAgICAvLyBpZiB2b3RlZDoKICAgIGJ6IGdldF92b3Rlcl9zdGF0dXNfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NzcKICAgIC8vIGNob2ljZSA9IHNlbGYuYm94X3ZvdGVfY2hvaWNlW2JhbGxvdF9rZXldLmNob2ljZS5uYXRpdmUKICAgIGZyYW1lX2RpZyAyCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfdm90ZV9jaG9pY2UgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgNAoKZ2V0X3ZvdGVyX3N0YXR1c19hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3ODAKICAgIC8vIG9wdGVkX2luPWFyYzQuQm9vbChvcHRlZF9pbiksCiAgICBieXRlY18xIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9kaWcgMAogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3ODEKICAgIC8vIHZvdGVzX2Nhc3Q9YXJjNC5VSW50NjQodm90ZXNfY2FzdCksCiAgICBmcmFtZV9kaWcgMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzgyCiAgICAvLyB2b3RlZD1hcmM0LkJvb2wodm90ZWQpLAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfZGlnIDMKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzgzCiAgICAvLyBjaG9pY2U9YXJjNC5VSW50NjQoY2hvaWNlKSwKICAgIGZyYW1lX2RpZyA0CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3NzktNzg0CiAgICAvLyByZXR1cm4gVm90ZXJTdGF0dXMoCiAgICAvLyAgICAgb3B0ZWRfaW49YXJjNC5Cb29sKG9wdGVkX2luKSwKICAgIC8vICAgICB2b3Rlc19jYXN0PWFyYzQuVUludDY0KHZvdGVzX2Nhc3QpLAogICAgLy8gICAgIHZvdGVkPWFyYzQuQm9vbCh2b3RlZCksCiAgICAvLyAgICAgY2hvaWNlPWFyYzQuVUludDY0KGNob2ljZSksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5ib3hfb3B0X291dChwb2xsX2lkOiB1aW50NjQsIGFjY291bnQ6IGJ5dGVzKSAtPiB2b2lkOgpib3hfb3B0X291dDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc4Ni03ODgKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGRlbGV0ZXMgYW4gYWNjb3VudCdzIGJhbGxvdCBib3ggYWZ0ZXIgdGhlIHZvdGluZyBwZXJpb2QgYW5kIHJlZnVuZHMgdGhlIE1CUiBwYXllcgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBib3hfb3B0X291dChzZWxmLCBwb2xsX2lkOiBVSW50NjQsIGFjY291bnQ6IEFjY291bnQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc4OQogICAgLy8gYmFsbG90X2tleSA9IHNlbGYuYmFsbG90X2tleShwb2xsX2lkLCBhY2NvdW50KQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgYmFsbG90X2tleQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo3OTMKICAgIC8vIGJhbGxvdF9rZXkgaW4gc2VsZi5ib3hfdm90ZV9jaG9pY2UKICAgIGJ5dGVjIDcgLy8gInYiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6NzkxLTc5NAogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYmFsbG90X2tleSBpbiBzZWxmLmJveF92b3RlX2Nob2ljZQogICAgLy8gKSwgIkFjY291bnQgbXVzdCBoYXZlIGEgYmFsbG90IGJveCBpbiBvcmRlciB0byByZWNsYWltIGl0LiIKICAgIGFzc2VydCAvLyBBY2NvdW50IG11c3QgaGF2ZSBhIGJhbGxvdCBib3ggaW4gb3JkZXIgdG8gcmVjbGFpbSBpdC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojc5NwogICAgLy8gVHhuLnNlbmRlciA9PSBhY2NvdW50IG9yIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYm56IGJveF9vcHRfb3V0X2Jvb2xfdHJ1ZUAyCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBieiBib3hfb3B0X291dF9ib29sX2ZhbHNlQDMKCmJveF9vcHRfb3V0X2Jvb2xfdHJ1ZUAyOgogICAgaW50Y18xIC8vIDEKICAgIGIgYm94X29wdF9vdXRfYm9vbF9tZXJnZUA0Cgpib3hfb3B0X291dF9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAoKYm94X29wdF9vdXRfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6Nzk2LTc5OAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IGFjY291bnQgb3IgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiT25seSB0aGUgdm90aW5nIGFjY291bnQgb3IgQXBwIGNyZWF0b3IgY2FuIHJlY2xhaW0gYSBiYWxsb3QgYm94LiIKICAgIGFzc2VydCAvLyBPbmx5IHRoZSB2b3RpbmcgYWNjb3VudCBvciBBcHAgY3JlYXRvciBjYW4gcmVjbGFpbSBhIGJhbGxvdCBib3guCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4MDEKICAgIC8vIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gc2VsZi5ib3hfcG9sbFtwb2xsX2lkXS5lbmRfZGF0ZV91bml4Lm5hdGl2ZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJwIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfcG9sbCBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMTggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgID4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgwMC04MDIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmVuZF9kYXRlX3VuaXgubmF0aXZlCiAgICAvLyApLCAiQmFsbG90IGJveGVzIGNhbiBvbmx5IGJlIHJlY2xhaW1lZCBhZnRlciB0aGUgdm90aW5nIHBlcmlvZCBpcyBvdmVyLiIKICAgIGFzc2VydCAvLyBCYWxsb3QgYm94ZXMgY2FuIG9ubHkgYmUgcmVjbGFpbWVkIGFmdGVyIHRoZSB2b3RpbmcgcGVyaW9kIGlzIG92ZXIuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4MDQtODA1CiAgICAvLyAjIERlbGV0ZSB0aGUgYWNjb3VudCdzIGJhbGxvdCBib3ggYW5kIHJlZnVuZCBpdHMgTUJSIGNvc3QgdG8gdGhlIE1CUiBwYXllcgogICAgLy8gc2VsZi5yZWxlYXNlX2JhbGxvdF9ib3goYmFsbG90X2tleSkKICAgIGZyYW1lX2RpZyAwCiAgICBjYWxsc3ViIHJlbGVhc2VfYmFsbG90X2JveAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODA2CiAgICAvLyBzZWxmLmNvdW50X3JlbGVhc2VkX2JhbGxvdHMocG9sbF9pZCwgVUludDY0KDEpKQogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzEgLy8gMQogICAgY2FsbHN1YiBjb3VudF9yZWxlYXNlZF9iYWxsb3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4MDgtODA5CiAgICAvLyAjIExvZyBpbmZvIG9uLWNoYWluCiAgICAvLyBsb2coIkJhbGxvdCBib3ggcmVjbGFpbWVkIGZvciBhY2NvdW50IGFkZHJlc3M6ICIsIGFjY291bnQpCiAgICBwdXNoYnl0ZXMgIkJhbGxvdCBib3ggcmVjbGFpbWVkIGZvciBhY2NvdW50IGFkZHJlc3M6ICIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5yZWxlYXNlX2JhbGxvdF9ib3goYmFsbG90X2tleTogYnl0ZXMpIC0+IHZvaWQ6CnJlbGVhc2VfYmFsbG90X2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjMzMy0zMzUKICAgIC8vICMgRGVmaW5lIHN1YnJvdXRpbmUgdGhhdCBkZWxldGVzIGEgYmFsbG90IGJveCBhbmQgcmVmdW5kcyBpdHMgTUJSIGNvc3QgdG8gdGhlIGFjY291bnQgdGhhdCBwYWlkIGl0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlbGVhc2VfYmFsbG90X2JveChzZWxmLCBiYWxsb3Rfa2V5OiBCeXRlcykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzM2CiAgICAvLyBtYnJfcGF5ZXIgPSBzZWxmLmJveF92b3RlX2Nob2ljZVtiYWxsb3Rfa2V5XS5tYnJfcGF5ZXIubmF0aXZlCiAgICBieXRlYyA3IC8vICJ2IgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X3ZvdGVfY2hvaWNlIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCA4IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzM3CiAgICAvLyBkZWwgc2VsZi5ib3hfdm90ZV9jaG9pY2VbYmFsbG90X2tleV0KICAgIHN3YXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzQxLTM0NwogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPW1icl9wYXllciwKICAgIC8vICAgICBhbW91bnQ9c2VsZi5jYWxjX2JhbGxvdF9ib3hfbWJyKCkgLSBtaW5fdHhuX2ZlZSwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9bWluX3R4bl9mZWUsCiAgICAvLyAgICAgbm90ZT0iTUJSIHJlZnVuZCBmb3IgcmVjbGFpbWluZyBiYWxsb3QgYm94LiIsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozNDMKICAgIC8vIGFtb3VudD1zZWxmLmNhbGNfYmFsbG90X2JveF9tYnIoKSAtIG1pbl90eG5fZmVlLAogICAgY2FsbHN1YiBjYWxjX2JhbGxvdF9ib3hfbWJyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozMzktMzQwCiAgICAvLyAjIFN1Ym1pdCBpbm5lciB0cmFuc2FjdGlvbiAoTUJSIHBheWVyIGdldHMgdGhlaXIgYmFsbG90IGJveCBtYnIgcGF5bWVudCByZWZ1bmRlZCwgZS5nLiBhIHJlbGF5ZXIncyBzcG9uc29yKQogICAgLy8gbWluX3R4bl9mZWUgPSBVSW50NjQoMTAwMCkKICAgIGludGNfMyAvLyAxMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozNDMKICAgIC8vIGFtb3VudD1zZWxmLmNhbGNfYmFsbG90X2JveF9tYnIoKSAtIG1pbl90eG5fZmVlLAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzQ0CiAgICAvLyBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozNDYKICAgIC8vIG5vdGU9Ik1CUiByZWZ1bmQgZm9yIHJlY2xhaW1pbmcgYmFsbG90IGJveC4iLAogICAgcHVzaGJ5dGVzICJNQlIgcmVmdW5kIGZvciByZWNsYWltaW5nIGJhbGxvdCBib3guIgogICAgaXR4bl9maWVsZCBOb3RlCiAgICBpdHhuX2ZpZWxkIFNlbmRlcgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjM0MQogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzM5LTM0MAogICAgLy8gIyBTdWJtaXQgaW5uZXIgdHJhbnNhY3Rpb24gKE1CUiBwYXllciBnZXRzIHRoZWlyIGJhbGxvdCBib3ggbWJyIHBheW1lbnQgcmVmdW5kZWQsIGUuZy4gYSByZWxheWVyJ3Mgc3BvbnNvcikKICAgIC8vIG1pbl90eG5fZmVlID0gVUludDY0KDEwMDApCiAgICBpbnRjXzMgLy8gMTAwMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjM0MS0zNDcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1tYnJfcGF5ZXIsCiAgICAvLyAgICAgYW1vdW50PXNlbGYuY2FsY19iYWxsb3RfYm94X21icigpIC0gbWluX3R4bl9mZWUsCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPW1pbl90eG5fZmVlLAogICAgLy8gICAgIG5vdGU9Ik1CUiByZWZ1bmQgZm9yIHJlY2xhaW1pbmcgYmFsbG90IGJveC4iLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5jb3VudF9yZWxlYXNlZF9iYWxsb3RzKHBvbGxfaWQ6IHVpbnQ2NCwgYmFsbG90X2NvdW50OiB1aW50NjQpIC0+IHZvaWQ6CmNvdW50X3JlbGVhc2VkX2JhbGxvdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozNDktMzUxCiAgICAvLyAjIERlZmluZSBzdWJyb3V0aW5lIHRoYXQgcmVtb3ZlcyByZWxlYXNlZCBiYWxsb3QgYm94ZXMgZnJvbSB0aGUgcG9sbCBhbmQgQXBwIHRvdGFscwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjb3VudF9yZWxlYXNlZF9iYWxsb3RzKHNlbGYsIHBvbGxfaWQ6IFVJbnQ2NCwgYmFsbG90X2NvdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjM1Mi0zNTMKICAgIC8vICMgRGVjcmVhc2UgdGhlIHRvdGFsIGNvdW50IG9mIGJhbGxvdCBib3hlcyAocG9sbCB3aWRlIGFuZCBBcHAgd2lkZSkKICAgIC8vIHBvbGwgPSBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJwIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveF9wb2xsIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzU0CiAgICAvLyBwb2xsLm9wZW5fYmFsbG90cyA9IGFyYzQuVUludDY0KHBvbGwub3Blbl9iYWxsb3RzLm5hdGl2ZSAtIGJhbGxvdF9jb3VudCkKICAgIGR1cAogICAgZXh0cmFjdCA2NyA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBpdG9iCiAgICByZXBsYWNlMiA2NwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6MzU1CiAgICAvLyBzZWxmLmJveF9wb2xsW3BvbGxfaWRdID0gcG9sbC5jb3B5KCkKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGRpZyAxCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozNTcKICAgIC8vIHNlbGYudG90YWxfYmFsbG90X2JveGVzIC09IGJhbGxvdF9jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX2JhbGxvdF9ib3hlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9iYWxsb3RfYm94ZXMgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIGJ5dGVjXzMgLy8gInRvdGFsX2JhbGxvdF9ib3hlcyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozNTktMzYwCiAgICAvLyAjIE9uY2UgdGhlIGxhc3QgYmFsbG90IGJveCBpcyByZWxlYXNlZCB0aGUgcGFja2VkIHRhbGx5IGlzIGxvZ2dlZCBhcyB0aGUgcG9sbCdzIGNvbXBhY3QgZmluYWwgcmVjb3JkCiAgICAvLyBpZiBwb2xsLm9wZW5fYmFsbG90cy5uYXRpdmUgPT0gVUludDY0KDApOgogICAgZXh0cmFjdCA2NyA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgYm56IGNvdW50X3JlbGVhc2VkX2JhbGxvdHNfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozNjEKICAgIC8vIHRhbGx5LCB0YWxseV9leGlzdHMgPSBvcC5Cb3guZ2V0KHNlbGYucG9sbF90YWxseV9rZXkocG9sbF9pZCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgcG9sbF90YWxseV9rZXkKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjM2MgogICAgLy8gYXNzZXJ0IHRhbGx5X2V4aXN0cywgIlBvbGwgdGFsbHkgZG9lcyBub3QgZXhpc3QuIgogICAgYXNzZXJ0IC8vIFBvbGwgdGFsbHkgZG9lcyBub3QgZXhpc3QuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTozNjMKICAgIC8vIGxvZygiRmluYWwgcG9sbCB0YWxseTogIiwgdGFsbHkpCiAgICBwdXNoYnl0ZXMgIkZpbmFsIHBvbGwgdGFsbHk6ICIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCgpjb3VudF9yZWxlYXNlZF9iYWxsb3RzX2FmdGVyX2lmX2Vsc2VAMjoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3RlX2NoYWluLmNvbnRyYWN0LlZvdGVDaGFpbi5zd2VlcChwb2xsX2lkOiB1aW50NjQsIGFjY291bnRzOiBieXRlcykgLT4gdWludDY0Ogpzd2VlcDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgxMS04MTYKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyB0aGUgY3JlYXRvciB0byByZWxlYXNlIGEgYmF0Y2ggb2YgYmFsbG90IGJveGVzIGFmdGVyIHRoZSB2b3RpbmcgcGVyaW9kIGFuZCByZWZ1bmQKICAgIC8vICMgZXZlcnkgYmFsbG90IGJveCBNQlIgY29zdCB0byB0aGUgYWNjb3VudCB0aGF0IHBhaWQgaXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgc3dlZXAoCiAgICAvLyAgICAgc2VsZiwgcG9sbF9pZDogVUludDY0LCBhY2NvdW50czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5BZGRyZXNzXQogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgxOQogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4MTctODIwCiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJPbmx5IEFwcCBjcmVhdG9yIGNhbiBzd2VlcCBiYWxsb3QgYm94ZXMuIgogICAgYXNzZXJ0IC8vIE9ubHkgQXBwIGNyZWF0b3IgY2FuIHN3ZWVwIGJhbGxvdCBib3hlcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgyMgogICAgLy8gYXNzZXJ0IHBvbGxfaWQgaW4gc2VsZi5ib3hfcG9sbCwgIlBvbGwgZG9lcyBub3QgZXhpc3QuIgogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJwIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFBvbGwgZG9lcyBub3QgZXhpc3QuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4MjUKICAgIC8vIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gc2VsZi5ib3hfcG9sbFtwb2xsX2lkXS5lbmRfZGF0ZV91bml4Lm5hdGl2ZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgc3dhcAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X3BvbGwgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDE4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4MjQtODI2CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gc2VsZi5ib3hfcG9sbFtwb2xsX2lkXS5lbmRfZGF0ZV91bml4Lm5hdGl2ZQogICAgLy8gKSwgIkJhbGxvdCBib3hlcyBjYW4gb25seSBiZSBzd2VwdCBhZnRlciB0aGUgdm90aW5nIHBlcmlvZCBpcyBvdmVyLiIKICAgIGFzc2VydCAvLyBCYWxsb3QgYm94ZXMgY2FuIG9ubHkgYmUgc3dlcHQgYWZ0ZXIgdGhlIHZvdGluZyBwZXJpb2QgaXMgb3Zlci4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgyOAogICAgLy8gYXNzZXJ0IGFjY291bnRzLmxlbmd0aCA8PSBVSW50NjQoCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4MjgtODMwCiAgICAvLyBhc3NlcnQgYWNjb3VudHMubGVuZ3RoIDw9IFVJbnQ2NCgKICAgIC8vICAgICBNQVhfU1dFRVBfU0laRQogICAgLy8gKSwgIlN3ZWVwIGJhdGNoIHNpemUgY2FuIG5vdCBleGNlZWQgMyBiYWxsb3QgYm94ZXMuIgogICAgcHVzaGludCAzIC8vIDMKICAgIDw9CiAgICBhc3NlcnQgLy8gU3dlZXAgYmF0Y2ggc2l6ZSBjYW4gbm90IGV4Y2VlZCAzIGJhbGxvdCBib3hlcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgzMi04MzMKICAgIC8vICMgQWNjb3VudHMgd2l0aG91dCBhIGJhbGxvdCBib3ggKGUuZy4gYWxyZWFkeSByZWNsYWltZWQgYnkgdGhlIHZvdGVyKSBhcmUgc2tpcHBlZCBzbyBzd2VlcHMgY2FuIGJlIHJldHJpZWQKICAgIC8vIHN3ZXB0X2NvdW50ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODM0CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYWNjb3VudHMubGVuZ3RoKToKICAgIGR1cAoKc3dlZXBfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODM0CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYWNjb3VudHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgMgogICAgPAogICAgYnogc3dlZXBfYWZ0ZXJfZm9yQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgzNQogICAgLy8gYWNjb3VudCA9IGFjY291bnRzW2ldLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgzNgogICAgLy8gYmFsbG90X2tleSA9IHNlbGYuYmFsbG90X2tleShwb2xsX2lkLCBhY2NvdW50KQogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjYWxsc3ViIGJhbGxvdF9rZXkKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4MzgKICAgIC8vIGlmIGJhbGxvdF9rZXkgaW4gc2VsZi5ib3hfdm90ZV9jaG9pY2U6CiAgICBieXRlYyA3IC8vICJ2IgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDEKICAgIGJ6IHN3ZWVwX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODM5CiAgICAvLyBzZWxmLnJlbGVhc2VfYmFsbG90X2JveChiYWxsb3Rfa2V5KQogICAgZnJhbWVfZGlnIDAKICAgIGNhbGxzdWIgcmVsZWFzZV9iYWxsb3RfYm94CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4NDAKICAgIC8vIHN3ZXB0X2NvdW50ICs9IFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKCnN3ZWVwX2FmdGVyX2lmX2Vsc2VANDoKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjgzNAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFjY291bnRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgNAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgYiBzd2VlcF9mb3JfaGVhZGVyQDEKCnN3ZWVwX2FmdGVyX2ZvckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODQyCiAgICAvLyBpZiBzd2VwdF9jb3VudCA+IFVJbnQ2NCgwKToKICAgIGZyYW1lX2RpZyAzCiAgICBieiBzd2VlcF9hZnRlcl9pZl9lbHNlQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg0MwogICAgLy8gc2VsZi5jb3VudF9yZWxlYXNlZF9iYWxsb3RzKHBvbGxfaWQsIHN3ZXB0X2NvdW50KQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgMwogICAgY2FsbHN1YiBjb3VudF9yZWxlYXNlZF9iYWxsb3RzCgpzd2VlcF9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4NDUtODQ2CiAgICAvLyAjIExvZyBpbmZvIG9uLWNoYWluCiAgICAvLyBsb2coIlN3ZWVwIHN1Y2Nlc3NmdWwgd2l0aCBiYWxsb3QgYm94IGNvdW50OiAiLCBzd2VwdF9jb3VudCkKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGl0b2IKICAgIHB1c2hieXRlcyAiU3dlZXAgc3VjY2Vzc2Z1bCB3aXRoIGJhbGxvdCBib3ggY291bnQ6ICIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4NDgKICAgIC8vIHJldHVybiBzd2VwdF9jb3VudAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uZGVsZXRlX3BvbGwocG9sbF9pZDogdWludDY0KSAtPiB2b2lkOgpkZWxldGVfcG9sbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg1MC04NTIKICAgIC8vICMgRGVmaW5lIGFiaW1ldGhvZCB0aGF0IGFsbG93cyB0aGUgY3JlYXRvciB0byBkZWxldGUgYSBjbG9zZWQgcG9sbCBhbmQgZ2V0IHRoZSBwb2xsIGJveGVzIE1CUiBjb3N0IHJlZnVuZGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGRlbGV0ZV9wb2xsKHNlbGYsIHBvbGxfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODU1CiAgICAvLyBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg1My04NTYKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIk9ubHkgQXBwIGNyZWF0b3IgY2FuIGRlbGV0ZSBhIHBvbGwuIgogICAgYXNzZXJ0IC8vIE9ubHkgQXBwIGNyZWF0b3IgY2FuIGRlbGV0ZSBhIHBvbGwuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4NTgKICAgIC8vIGFzc2VydCBwb2xsX2lkIGluIHNlbGYuYm94X3BvbGwsICJQb2xsIGRvZXMgbm90IGV4aXN0LiIKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAicCIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUG9sbCBkb2VzIG5vdCBleGlzdC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg2MQogICAgLy8gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiBzZWxmLmJveF9wb2xsW3BvbGxfaWRdLmVuZF9kYXRlX3VuaXgubmF0aXZlCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBkaWcgMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X3BvbGwgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDE4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4NjAtODYyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gc2VsZi5ib3hfcG9sbFtwb2xsX2lkXS5lbmRfZGF0ZV91bml4Lm5hdGl2ZQogICAgLy8gKSwgIlBvbGwgY2FuIG9ubHkgYmUgZGVsZXRlZCBhZnRlciB0aGUgdm90aW5nIHBlcmlvZCBpcyBvdmVyLiIKICAgIGFzc2VydCAvLyBQb2xsIGNhbiBvbmx5IGJlIGRlbGV0ZWQgYWZ0ZXIgdGhlIHZvdGluZyBwZXJpb2QgaXMgb3Zlci4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg2NQogICAgLy8gc2VsZi5ib3hfcG9sbFtwb2xsX2lkXS5vcGVuX2JhbGxvdHMubmF0aXZlID09IFVJbnQ2NCgwKQogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfcG9sbCBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgNjcgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgICEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg2NC04NjYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi5ib3hfcG9sbFtwb2xsX2lkXS5vcGVuX2JhbGxvdHMubmF0aXZlID09IFVJbnQ2NCgwKQogICAgLy8gKSwgIkFsbCBiYWxsb3QgYm94ZXMgb2YgdGhlIHBvbGwgbXVzdCBiZSByZWNsYWltZWQgYmVmb3JlIGRlbGV0aW5nIGl0LiIKICAgIGFzc2VydCAvLyBBbGwgYmFsbG90IGJveGVzIG9mIHRoZSBwb2xsIG11c3QgYmUgcmVjbGFpbWVkIGJlZm9yZSBkZWxldGluZyBpdC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg2OAogICAgLy8gdGFsbHlfa2V5ID0gc2VsZi5wb2xsX3RhbGx5X2tleShwb2xsX2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIHBvbGxfdGFsbHlfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4NjkKICAgIC8vIHRhbGx5X3NpemUsIHRhbGx5X2V4aXN0cyA9IG9wLkJveC5sZW5ndGgodGFsbHlfa2V5KQogICAgZHVwCiAgICBib3hfbGVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4NzAKICAgIC8vIGFzc2VydCB0YWxseV9leGlzdHMsICJQb2xsIHRhbGx5IGRvZXMgbm90IGV4aXN0LiIKICAgIGFzc2VydCAvLyBQb2xsIHRhbGx5IGRvZXMgbm90IGV4aXN0LgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODczCiAgICAvLyBwb2xsX3NpemU9c2VsZi5ib3hfcG9sbC5sZW5ndGgocG9sbF9pZCksCiAgICBkaWcgMgogICAgYm94X2xlbgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X3BvbGwgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4NzQKICAgIC8vIGNob2ljZXNfc2l6ZT1zZWxmLmJveF9wb2xsX2Nob2ljZXMubGVuZ3RoKHBvbGxfaWQpLAogICAgYnl0ZWMgMTEgLy8gImMiCiAgICBkaWcgNQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveF9wb2xsX2Nob2ljZXMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4NzItODc2CiAgICAvLyBwb2xsX2JveGVzX21iciA9IHNlbGYuY2FsY19wb2xsX2JveGVzX21icigKICAgIC8vICAgICBwb2xsX3NpemU9c2VsZi5ib3hfcG9sbC5sZW5ndGgocG9sbF9pZCksCiAgICAvLyAgICAgY2hvaWNlc19zaXplPXNlbGYuYm94X3BvbGxfY2hvaWNlcy5sZW5ndGgocG9sbF9pZCksCiAgICAvLyAgICAgdGFsbHlfc2l6ZT10YWxseV9zaXplLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgY2FsY19wb2xsX2JveGVzX21icgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODc4LTg3OQogICAgLy8gIyBEZWxldGUgdGhlIHBvbGwgYm94ZXMKICAgIC8vIGRlbCBzZWxmLmJveF9wb2xsW3BvbGxfaWRdCiAgICB1bmNvdmVyIDMKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODgwCiAgICAvLyBkZWwgc2VsZi5ib3hfcG9sbF9jaG9pY2VzW3BvbGxfaWRdCiAgICBzd2FwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg4MQogICAgLy8gYXNzZXJ0IG9wLkJveC5kZWxldGUodGFsbHlfa2V5KSwgIlBvbGwgdGFsbHkgZG9lcyBub3QgZXhpc3QuIgogICAgc3dhcAogICAgYm94X2RlbAogICAgYXNzZXJ0IC8vIFBvbGwgdGFsbHkgZG9lcyBub3QgZXhpc3QuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4ODMtODg0CiAgICAvLyAjIERlY3JlYXNlIHRoZSB0b3RhbCBjb3VudCBvZiBwb2xscwogICAgLy8gc2VsZi50b3RhbF9wb2xscyAtPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJ0b3RhbF9wb2xscyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9wb2xscyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBieXRlY18yIC8vICJ0b3RhbF9wb2xscyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4ODgtODk0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9cG9sbF9ib3hlc19tYnIgLSBtaW5fdHhuX2ZlZSwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9bWluX3R4bl9mZWUsCiAgICAvLyAgICAgbm90ZT0iTUJSIHJlZnVuZCBmb3IgZGVsZXRpbmcgcG9sbC4iLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODg5CiAgICAvLyByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4OTAKICAgIC8vIGFtb3VudD1wb2xsX2JveGVzX21iciAtIG1pbl90eG5fZmVlLAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODg2LTg4NwogICAgLy8gIyBTdWJtaXQgaW5uZXIgdHJhbnNhY3Rpb24gKGNyZWF0b3IgZ2V0cyB0aGVpciBwb2xsIGJveGVzIG1iciBwYXltZW50IHJlZnVuZGVkKQogICAgLy8gbWluX3R4bl9mZWUgPSBVSW50NjQoMTAwMCkKICAgIGludGNfMyAvLyAxMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4OTAKICAgIC8vIGFtb3VudD1wb2xsX2JveGVzX21iciAtIG1pbl90eG5fZmVlLAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODkxCiAgICAvLyBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4OTMKICAgIC8vIG5vdGU9Ik1CUiByZWZ1bmQgZm9yIGRlbGV0aW5nIHBvbGwuIiwKICAgIHB1c2hieXRlcyAiTUJSIHJlZnVuZCBmb3IgZGVsZXRpbmcgcG9sbC4iCiAgICBpdHhuX2ZpZWxkIE5vdGUKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODg4CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4ODYtODg3CiAgICAvLyAjIFN1Ym1pdCBpbm5lciB0cmFuc2FjdGlvbiAoY3JlYXRvciBnZXRzIHRoZWlyIHBvbGwgYm94ZXMgbWJyIHBheW1lbnQgcmVmdW5kZWQpCiAgICAvLyBtaW5fdHhuX2ZlZSA9IFVJbnQ2NCgxMDAwKQogICAgaW50Y18zIC8vIDEwMDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo4ODgtODk0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9cG9sbF9ib3hlc19tYnIgLSBtaW5fdHhuX2ZlZSwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9bWluX3R4bl9mZWUsCiAgICAvLyAgICAgbm90ZT0iTUJSIHJlZnVuZCBmb3IgZGVsZXRpbmcgcG9sbC4iLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5Ojg5Ni04OTcKICAgIC8vICMgTG9nIGluZm8gb24tY2hhaW4KICAgIC8vIGxvZygiUG9sbCBkZWxldGlvbiBzdWNjZXNzZnVsIGZvciBwb2xsIElEOiAiLCBwb2xsX2lkKQogICAgcHVzaGJ5dGVzICJQb2xsIGRlbGV0aW9uIHN1Y2Nlc3NmdWwgZm9yIHBvbGwgSUQ6ICIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4udGVybWluYXRlKCkgLT4gdm9pZDoKdGVybWluYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6ODk5LTkwMQogICAgLy8gIyBEZWZpbmUgYWJpbWV0aG9kIHRoYXQgYWxsb3dzIHRoZSBjcmVhdG9yIHRvIGRlbGV0ZSBBcHAgYW5kIGdldCB0aGVpciBnbG9iYWwgc2NoZW1hIE1CUiBjb3N0IHJlZnVuZGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIkRlbGV0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgdGVybWluYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjkwNAogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5MDItOTA1CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJPbmx5IEFwcCBjcmVhdG9yIGNhbiB0ZXJtaW5hdGUgdGhlIEFwcC4iCiAgICBhc3NlcnQgLy8gT25seSBBcHAgY3JlYXRvciBjYW4gdGVybWluYXRlIHRoZSBBcHAuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5MDgKICAgIC8vIHNlbGYudG90YWxfYmFsbG90X2JveGVzID09IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX2JhbGxvdF9ib3hlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9iYWxsb3RfYm94ZXMgZXhpc3RzCiAgICAhCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5MDctOTA5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYudG90YWxfYmFsbG90X2JveGVzID09IFVJbnQ2NCgwKQogICAgLy8gKSwgIkFsbCBiYWxsb3QgYm94ZXMgbXVzdCBiZSByZWNsYWltZWQgYmVmb3JlIHRlcm1pbmF0aW5nIHRoZSBBcHAuIgogICAgYXNzZXJ0IC8vIEFsbCBiYWxsb3QgYm94ZXMgbXVzdCBiZSByZWNsYWltZWQgYmVmb3JlIHRlcm1pbmF0aW5nIHRoZSBBcHAuCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5MTIKICAgIC8vIHNlbGYudG90YWxfcG9sbHMgPT0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAidG90YWxfcG9sbHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfcG9sbHMgZXhpc3RzCiAgICAhCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5MTEtOTEzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYudG90YWxfcG9sbHMgPT0gVUludDY0KDApCiAgICAvLyApLCAiQWxsIHBvbGxzIG11c3QgYmUgZGVsZXRlZCBiZWZvcmUgdGVybWluYXRpbmcgdGhlIEFwcC4iCiAgICBhc3NlcnQgLy8gQWxsIHBvbGxzIG11c3QgYmUgZGVsZXRlZCBiZWZvcmUgdGVybWluYXRpbmcgdGhlIEFwcC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjkxNy05MjMKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1zZWxmLmNhbGNfbWJyKG51bV9ieXRlcz1VSW50NjQoMCksIG51bV91aW50PVVJbnQ2NCg0KSkgLSBtaW5fdHhuX2ZlZSwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9bWluX3R4bl9mZWUsCiAgICAvLyAgICAgbm90ZT0iTUJSIHJlZnVuZCBmb3IgZGVsZXRpbmcgQXBwLiIsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5MTgKICAgIC8vIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjkxOQogICAgLy8gYW1vdW50PXNlbGYuY2FsY19tYnIobnVtX2J5dGVzPVVJbnQ2NCgwKSwgbnVtX3VpbnQ9VUludDY0KDQpKSAtIG1pbl90eG5fZmVlLAogICAgaW50Y18wIC8vIDAKICAgIHB1c2hpbnQgNCAvLyA0CiAgICBjYWxsc3ViIGNhbGNfbWJyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5MTUtOTE2CiAgICAvLyAjIFN1Ym1pdCBpbm5lciB0cmFuc2FjdGlvbiAoY3JlYXRvciBnZXRzIHRoZWlyIG1iciBwYXltZW50IHJlZnVuZGVkKQogICAgLy8gbWluX3R4bl9mZWUgPSBVSW50NjQoMTAwMCkKICAgIGludGNfMyAvLyAxMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5MTkKICAgIC8vIGFtb3VudD1zZWxmLmNhbGNfbWJyKG51bV9ieXRlcz1VSW50NjQoMCksIG51bV91aW50PVVJbnQ2NCg0KSkgLSBtaW5fdHhuX2ZlZSwKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjkyMAogICAgLy8gc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVfY2hhaW4vY29udHJhY3QucHk6OTIyCiAgICAvLyBub3RlPSJNQlIgcmVmdW5kIGZvciBkZWxldGluZyBBcHAuIiwKICAgIHB1c2hieXRlcyAiTUJSIHJlZnVuZCBmb3IgZGVsZXRpbmcgQXBwLiIKICAgIGl0eG5fZmllbGQgTm90ZQogICAgaXR4bl9maWVsZCBTZW5kZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5MTcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjkxNS05MTYKICAgIC8vICMgU3VibWl0IGlubmVyIHRyYW5zYWN0aW9uIChjcmVhdG9yIGdldHMgdGhlaXIgbWJyIHBheW1lbnQgcmVmdW5kZWQpCiAgICAvLyBtaW5fdHhuX2ZlZSA9IFVJbnQ2NCgxMDAwKQogICAgaW50Y18zIC8vIDEwMDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5MTctOTIzCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9c2VsZi5jYWxjX21icihudW1fYnl0ZXM9VUludDY0KDApLCBudW1fdWludD1VSW50NjQoNCkpIC0gbWluX3R4bl9mZWUsCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPW1pbl90eG5fZmVlLAogICAgLy8gICAgIG5vdGU9Ik1CUiByZWZ1bmQgZm9yIGRlbGV0aW5nIEFwcC4iLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3RlX2NoYWluL2NvbnRyYWN0LnB5OjkyOAogICAgLy8gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIGl0b2IKICAgIHB1c2hieXRlcyAiVGVybWluYXRpb24gbWV0aG9kIHN1Y2Nlc3NmdWwgZm9yIEFwcCBJRDogIgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZV9jaGFpbi9jb250cmFjdC5weTo5MjUtOTI5CiAgICAvLyAjIExvZyBpbmZvIG9uLWNoYWluCiAgICAvLyBsb2coCiAgICAvLyAgICAgIlRlcm1pbmF0aW9uIG1ldGhvZCBzdWNjZXNzZnVsIGZvciBBcHAgSUQ6ICIsCiAgICAvLyAgICAgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQsCiAgICAvLyApCiAgICBsb2cKICAgIHJldHN1YgoKCi8vIF9wdXlhX2xpYi51dGlsLmVuc3VyZV9idWRnZXQocmVxdWlyZWRfYnVkZ2V0OiB1aW50NjQsIGZlZV9zb3VyY2U6IHVpbnQ2NCkgLT4gdm9pZDoKZW5zdXJlX2J1ZGdldDoKICAgIHByb3RvIDIgMAogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICArCgplbnN1cmVfYnVkZ2V0X3doaWxlX3RvcEAxOgogICAgZnJhbWVfZGlnIDAKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgID4KICAgIGJ6IGVuc3VyZV9idWRnZXRfYWZ0ZXJfd2hpbGVANwogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIGJ5dGVjIDEyIC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbQogICAgYnl0ZWMgMTIgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW0KICAgIGZyYW1lX2RpZyAtMQogICAgc3dpdGNoIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMEAzIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0CiAgICBiIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfbmV4dEA2CgplbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlXzBAMzoKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgYiBlbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANgoKZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8xQDQ6CiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICBpdHhuX2ZpZWxkIEZlZQoKZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV9uZXh0QDY6CiAgICBpdHhuX3N1Ym1pdAogICAgYiBlbnN1cmVfYnVkZ2V0X3doaWxlX3RvcEAxCgplbnN1cmVfYnVkZ2V0X2FmdGVyX3doaWxlQDc6CiAgICByZXRzdWIK",
         "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMudm90ZV9jaGFpbi5jb250cmFjdC5Wb3RlQ2hhaW4uY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"
     },
     "state": {
         "global": {
-            "num_byte_slices": 4,
-            "num_uints": 8
+            "num_byte_slices": 0,
+            "num_uints": 4
         },
         "local": {
-            "num_byte_slices": 0,
-            "num_uints": 2
+            "num_byte_slices": 1,
+            "num_uints": 1
         }
     },
     "schema": {
         "global": {
             "declared": {
-                "choice1_total": {
-                    "type": "uint64",
-                    "key": "choice1_total"
-                },
-                "choice2_total": {
-                    "type": "uint64",
-                    "key": "choice2_total"
-                },
-                "choice3_total": {
+                "next_poll_id": {
                     "type": "uint64",
-                    "key": "choice3_total"
-                },
-                "poll_choice1": {
-                    "type": "bytes",
-                    "key": "poll_choice1"
-                },
-                "poll_choice2": {
-                    "type": "bytes",
-                    "key": "poll_choice2"
-                },
-                "poll_choice3": {
-                    "type": "bytes",
-                    "key": "poll_choice3"
-                },
-                "poll_end_date_unix": {
-                    "type": "uint64",
-                    "key": "poll_end_date_unix"
-                },
-                "poll_finalized": {
-                    "type": "uint64",
-                    "key": "poll_finalized"
-                },
-                "poll_start_date_unix": {
-                    "type": "uint64",
-                    "key": "poll_start_date_unix"
-                },
-                "poll_title": {
-                    "type": "bytes",
-                    "key": "poll_title"
+                    "key": "next_poll_id"
                 },
                 "total_accounts_opted_in": {
                     "type": "uint64",
                     "key": "total_accounts_opted_in"
                 },
-                "total_votes": {
+                "total_ballot_boxes": {
                     "type": "uint64",
-                    "key": "total_votes"
+                    "key": "total_ballot_boxes"
+                },
+                "total_polls": {
+                    "type": "uint64",
+                    "key": "total_polls"
                 }
             },
             "reserved": {}
         },
         "local": {
             "declared": {
-                "local_vote_choice": {
-                    "type": "uint64",
-                    "key": "vote_choice",
-                    "descr": "Account vote choice (based on UInt64 corresponding w/ choice)"
+                "local_mbr_payer": {
+                    "type": "bytes",
+                    "key": "mbr_payer",
+                    "descr": "Account that paid the local storage MBR (the account or a sponsor), refunded on close out"
                 },
-                "local_vote_status": {
+                "local_votes_cast": {
                     "type": "uint64",
-                    "key": "vote_status",
-                    "descr": "Account vote status ('0' = not voted, '1' = voted)"
+                    "key": "votes_cast",
+                    "descr": "Account vote count (number of poll ballots cast while opted in)"
                 }
             },
             "reserved": {}
@@ -196,21 +287,25 @@ _APP_SPEC_JSON = r"""{
             {
                 "name": "setup_poll",
                 "args": [
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    },
                     {
                         "type": "byte[]",
                         "name": "title"
                     },
                     {
-                        "type": "byte[]",
-                        "name": "choice1"
+                        "type": "byte[][]",
+                        "name": "choices"
                     },
                     {
-                        "type": "byte[]",
-                        "name": "choice2"
+                        "type": "bool",
+                        "name": "require_opt_in"
                     },
                     {
-                        "type": "byte[]",
-                        "name": "choice3"
+                        "type": "byte[32]",
+                        "name": "eligibility_root"
                     },
                     {
                         "type": "string",
@@ -230,19 +325,143 @@ _APP_SPEC_JSON = r"""{
                     }
                 ],
                 "returns": {
-                    "type": "void"
+                    "type": "uint64"
                 }
             },
             {
                 "name": "submit_vote",
                 "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    },
                     {
                         "type": "account",
                         "name": "account"
                     },
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    },
                     {
                         "type": "uint64",
                         "name": "choice"
+                    },
+                    {
+                        "type": "byte[32][]",
+                        "name": "proof"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "submit_vote_batch",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    },
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    },
+                    {
+                        "type": "address[]",
+                        "name": "voters"
+                    },
+                    {
+                        "type": "uint64[]",
+                        "name": "choices"
+                    },
+                    {
+                        "type": "byte[][]",
+                        "name": "signatures"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "finalize_results",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    }
+                ],
+                "returns": {
+                    "type": "uint64"
+                }
+            },
+            {
+                "name": "get_poll_snapshot",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    }
+                ],
+                "returns": {
+                    "type": "(uint64,byte[],byte[][],uint64,uint64,bool,byte[32],uint64,uint64,byte[32],bool,uint64,uint64,uint64[])"
+                }
+            },
+            {
+                "name": "get_voter_status",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    },
+                    {
+                        "type": "account",
+                        "name": "account"
+                    }
+                ],
+                "returns": {
+                    "type": "(bool,uint64,bool,uint64)"
+                }
+            },
+            {
+                "name": "box_opt_out",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    },
+                    {
+                        "type": "account",
+                        "name": "account"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "sweep",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    },
+                    {
+                        "type": "address[]",
+                        "name": "accounts"
+                    }
+                ],
+                "returns": {
+                    "type": "uint64"
+                }
+            },
+            {
+                "name": "delete_poll",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
                     }
                 ],
                 "returns": {
@@ -354,11 +573,12 @@ class GlobalStorageMbrArgs(_ArgsBase[None]):
 
 
 @dataclasses.dataclass(kw_only=True)
-class SetupPollArgs(_ArgsBase[None]):
+class SetupPollArgs(_ArgsBase[int]):
+    mbr_pay: TransactionWithSigner
     title: bytes | bytearray
-    choice1: bytes | bytearray
-    choice2: bytes | bytearray
-    choice3: bytes | bytearray
+    choices: list[bytes | bytearray]
+    require_opt_in: bool
+    eligibility_root: bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
     start_date_str: str
     start_date_unix: int
     end_date_str: str
@@ -366,17 +586,116 @@ class SetupPollArgs(_ArgsBase[None]):
 
     @staticmethod
     def method() -> str:
-        return "setup_poll(byte[],byte[],byte[],byte[],string,uint64,string,uint64)void"
+        return "setup_poll(pay,byte[],byte[][],bool,byte[32],string,uint64,string,uint64)uint64"
 
 
 @dataclasses.dataclass(kw_only=True)
 class SubmitVoteArgs(_ArgsBase[None]):
+    poll_id: int
     account: str | bytes
+    mbr_pay: TransactionWithSigner
+    choice: int
+    proof: list[bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+
+    @staticmethod
+    def method() -> str:
+        return "submit_vote(uint64,account,pay,uint64,byte[32][])void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class SubmitVoteBatchArgs(_ArgsBase[None]):
+    poll_id: int
+    mbr_pay: TransactionWithSigner
+    voters: list[str]
+    choices: list[int]
+    signatures: list[bytes | bytearray]
+
+    @staticmethod
+    def method() -> str:
+        return "submit_vote_batch(uint64,pay,address[],uint64[],byte[][])void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class FinalizeResultsArgs(_ArgsBase[int]):
+    poll_id: int
+
+    @staticmethod
+    def method() -> str:
+        return "finalize_results(uint64)uint64"
+
+
+@dataclasses.dataclass(kw_only=True)
+class PollSnapshot:
+    poll_id: int
+    title: bytes | bytearray
+    choices: list[bytes | bytearray]
+    start_date_unix: int
+    end_date_unix: int
+    require_opt_in: bool
+    eligibility_root: bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    total_votes: int
+    open_ballots: int
+    ballot_hash: bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    finalized: bool
+    winner: int
+    winner_margin: int
+    tally: list[int]
+
+
+@dataclasses.dataclass(kw_only=True)
+class GetPollSnapshotArgs(_ArgsBase[PollSnapshot]):
+    poll_id: int
+
+    @staticmethod
+    def method() -> str:
+        return "get_poll_snapshot(uint64)(uint64,byte[],byte[][],uint64,uint64,bool,byte[32],uint64,uint64,byte[32],bool,uint64,uint64,uint64[])"
+
+
+@dataclasses.dataclass(kw_only=True)
+class VoterStatus:
+    opted_in: bool
+    votes_cast: int
+    voted: bool
     choice: int
 
+
+@dataclasses.dataclass(kw_only=True)
+class GetVoterStatusArgs(_ArgsBase[VoterStatus]):
+    poll_id: int
+    account: str | bytes
+
     @staticmethod
     def method() -> str:
-        return "submit_vote(account,uint64)void"
+        return "get_voter_status(uint64,account)(bool,uint64,bool,uint64)"
+
+
+@dataclasses.dataclass(kw_only=True)
+class BoxOptOutArgs(_ArgsBase[None]):
+    poll_id: int
+    account: str | bytes
+
+    @staticmethod
+    def method() -> str:
+        return "box_opt_out(uint64,account)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class SweepArgs(_ArgsBase[int]):
+    poll_id: int
+    accounts: list[str]
+
+    @staticmethod
+    def method() -> str:
+        return "sweep(uint64,address[])uint64"
+
+
+@dataclasses.dataclass(kw_only=True)
+class DeletePollArgs(_ArgsBase[None]):
+    poll_id: int
+
+    @staticmethod
+    def method() -> str:
+        return "delete_poll(uint64)void"
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -435,26 +754,18 @@ class ByteReader:
 
 class GlobalState:
     def __init__(self, data: dict[bytes, bytes | int]):
-        self.choice1_total = typing.cast(int, data.get(b"choice1_total"))
-        self.choice2_total = typing.cast(int, data.get(b"choice2_total"))
-        self.choice3_total = typing.cast(int, data.get(b"choice3_total"))
-        self.poll_choice1 = ByteReader(typing.cast(bytes, data.get(b"poll_choice1")))
-        self.poll_choice2 = ByteReader(typing.cast(bytes, data.get(b"poll_choice2")))
-        self.poll_choice3 = ByteReader(typing.cast(bytes, data.get(b"poll_choice3")))
-        self.poll_end_date_unix = typing.cast(int, data.get(b"poll_end_date_unix"))
-        self.poll_finalized = typing.cast(int, data.get(b"poll_finalized"))
-        self.poll_start_date_unix = typing.cast(int, data.get(b"poll_start_date_unix"))
-        self.poll_title = ByteReader(typing.cast(bytes, data.get(b"poll_title")))
+        self.next_poll_id = typing.cast(int, data.get(b"next_poll_id"))
         self.total_accounts_opted_in = typing.cast(int, data.get(b"total_accounts_opted_in"))
-        self.total_votes = typing.cast(int, data.get(b"total_votes"))
+        self.total_ballot_boxes = typing.cast(int, data.get(b"total_ballot_boxes"))
+        self.total_polls = typing.cast(int, data.get(b"total_polls"))
 
 
 class LocalState:
     def __init__(self, data: dict[bytes, bytes | int]):
-        self.local_vote_choice = typing.cast(int, data.get(b"vote_choice"))
-        """Account vote choice (based on UInt64 corresponding w/ choice)"""
-        self.local_vote_status = typing.cast(int, data.get(b"vote_status"))
-        """Account vote status ('0' = not voted, '1' = voted)"""
+        self.local_mbr_payer = ByteReader(typing.cast(bytes, data.get(b"mbr_payer")))
+        """Account that paid the local storage MBR (the account or a sponsor), refunded on close out"""
+        self.local_votes_cast = typing.cast(int, data.get(b"votes_cast"))
+        """Account vote count (number of poll ballots cast while opted in)"""
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -514,22 +825,24 @@ class Composer:
     def setup_poll(
         self,
         *,
+        mbr_pay: TransactionWithSigner,
         title: bytes | bytearray,
-        choice1: bytes | bytearray,
-        choice2: bytes | bytearray,
-        choice3: bytes | bytearray,
+        choices: list[bytes | bytearray],
+        require_opt_in: bool,
+        eligibility_root: bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int],
         start_date_str: str,
         start_date_unix: int,
         end_date_str: str,
         end_date_unix: int,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> "Composer":
-        """Adds a call to `setup_poll(byte[],byte[],byte[],byte[],string,uint64,string,uint64)void` ABI method
+        """Adds a call to `setup_poll(pay,byte[],byte[][],bool,byte[32],string,uint64,string,uint64)uint64` ABI method
         
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
         :param bytes | bytearray title: The `title` ABI parameter
-        :param bytes | bytearray choice1: The `choice1` ABI parameter
-        :param bytes | bytearray choice2: The `choice2` ABI parameter
-        :param bytes | bytearray choice3: The `choice3` ABI parameter
+        :param list[bytes | bytearray] choices: The `choices` ABI parameter
+        :param bool require_opt_in: The `require_opt_in` ABI parameter
+        :param bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int] eligibility_root: The `eligibility_root` ABI parameter
         :param str start_date_str: The `start_date_str` ABI parameter
         :param int start_date_unix: The `start_date_unix` ABI parameter
         :param str end_date_str: The `end_date_str` ABI parameter
@@ -538,10 +851,11 @@ class Composer:
         :returns Composer: This Composer instance"""
 
         args = SetupPollArgs(
+            mbr_pay=mbr_pay,
             title=title,
-            choice1=choice1,
-            choice2=choice2,
-            choice3=choice3,
+            choices=choices,
+            require_opt_in=require_opt_in,
+            eligibility_root=eligibility_root,
             start_date_str=start_date_str,
             start_date_unix=start_date_unix,
             end_date_str=end_date_str,
@@ -558,20 +872,211 @@ class Composer:
     def submit_vote(
         self,
         *,
+        poll_id: int,
         account: str | bytes,
+        mbr_pay: TransactionWithSigner,
         choice: int,
+        proof: list[bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]],
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> "Composer":
-        """Adds a call to `submit_vote(account,uint64)void` ABI method
+        """Adds a call to `submit_vote(uint64,account,pay,uint64,byte[32][])void` ABI method
         
+        :param int poll_id: The `poll_id` ABI parameter
         :param str | bytes account: The `account` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
         :param int choice: The `choice` ABI parameter
+        :param list[bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] proof: The `proof` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
         :returns Composer: This Composer instance"""
 
         args = SubmitVoteArgs(
+            poll_id=poll_id,
             account=account,
+            mbr_pay=mbr_pay,
             choice=choice,
+            proof=proof,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def submit_vote_batch(
+        self,
+        *,
+        poll_id: int,
+        mbr_pay: TransactionWithSigner,
+        voters: list[str],
+        choices: list[int],
+        signatures: list[bytes | bytearray],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `submit_vote_batch(uint64,pay,address[],uint64[],byte[][])void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param list[str] voters: The `voters` ABI parameter
+        :param list[int] choices: The `choices` ABI parameter
+        :param list[bytes | bytearray] signatures: The `signatures` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = SubmitVoteBatchArgs(
+            poll_id=poll_id,
+            mbr_pay=mbr_pay,
+            voters=voters,
+            choices=choices,
+            signatures=signatures,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def finalize_results(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `finalize_results(uint64)uint64` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = FinalizeResultsArgs(
+            poll_id=poll_id,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def get_poll_snapshot(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `get_poll_snapshot(uint64)(uint64,byte[],byte[][],uint64,uint64,bool,byte[32],uint64,uint64,byte[32],bool,uint64,uint64,uint64[])` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = GetPollSnapshotArgs(
+            poll_id=poll_id,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def get_voter_status(
+        self,
+        *,
+        poll_id: int,
+        account: str | bytes,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `get_voter_status(uint64,account)(bool,uint64,bool,uint64)` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param str | bytes account: The `account` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = GetVoterStatusArgs(
+            poll_id=poll_id,
+            account=account,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def box_opt_out(
+        self,
+        *,
+        poll_id: int,
+        account: str | bytes,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `box_opt_out(uint64,account)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param str | bytes account: The `account` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = BoxOptOutArgs(
+            poll_id=poll_id,
+            account=account,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def sweep(
+        self,
+        *,
+        poll_id: int,
+        accounts: list[str],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `sweep(uint64,address[])uint64` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param list[str] accounts: The `accounts` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = SweepArgs(
+            poll_id=poll_id,
+            accounts=accounts,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def delete_poll(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `delete_poll(uint64)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = DeletePollArgs(
+            poll_id=poll_id,
         )
         self.app_client.compose_call(
             self.atc,
@@ -847,34 +1352,37 @@ class VoteChainClient:
     def setup_poll(
         self,
         *,
+        mbr_pay: TransactionWithSigner,
         title: bytes | bytearray,
-        choice1: bytes | bytearray,
-        choice2: bytes | bytearray,
-        choice3: bytes | bytearray,
+        choices: list[bytes | bytearray],
+        require_opt_in: bool,
+        eligibility_root: bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int],
         start_date_str: str,
         start_date_unix: int,
         end_date_str: str,
         end_date_unix: int,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
-    ) -> algokit_utils.ABITransactionResponse[None]:
-        """Calls `setup_poll(byte[],byte[],byte[],byte[],string,uint64,string,uint64)void` ABI method
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `setup_poll(pay,byte[],byte[][],bool,byte[32],string,uint64,string,uint64)uint64` ABI method
         
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
         :param bytes | bytearray title: The `title` ABI parameter
-        :param bytes | bytearray choice1: The `choice1` ABI parameter
-        :param bytes | bytearray choice2: The `choice2` ABI parameter
-        :param bytes | bytearray choice3: The `choice3` ABI parameter
+        :param list[bytes | bytearray] choices: The `choices` ABI parameter
+        :param bool require_opt_in: The `require_opt_in` ABI parameter
+        :param bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int] eligibility_root: The `eligibility_root` ABI parameter
         :param str start_date_str: The `start_date_str` ABI parameter
         :param int start_date_unix: The `start_date_unix` ABI parameter
         :param str end_date_str: The `end_date_str` ABI parameter
         :param int end_date_unix: The `end_date_unix` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
-        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
 
         args = SetupPollArgs(
+            mbr_pay=mbr_pay,
             title=title,
-            choice1=choice1,
-            choice2=choice2,
-            choice3=choice3,
+            choices=choices,
+            require_opt_in=require_opt_in,
+            eligibility_root=eligibility_root,
             start_date_str=start_date_str,
             start_date_unix=start_date_unix,
             end_date_str=end_date_str,
@@ -890,20 +1398,210 @@ class VoteChainClient:
     def submit_vote(
         self,
         *,
+        poll_id: int,
         account: str | bytes,
+        mbr_pay: TransactionWithSigner,
         choice: int,
+        proof: list[bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]],
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> algokit_utils.ABITransactionResponse[None]:
-        """Calls `submit_vote(account,uint64)void` ABI method
+        """Calls `submit_vote(uint64,account,pay,uint64,byte[32][])void` ABI method
         
+        :param int poll_id: The `poll_id` ABI parameter
         :param str | bytes account: The `account` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
         :param int choice: The `choice` ABI parameter
+        :param list[bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] proof: The `proof` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
         :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
 
         args = SubmitVoteArgs(
+            poll_id=poll_id,
             account=account,
+            mbr_pay=mbr_pay,
             choice=choice,
+            proof=proof,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def submit_vote_batch(
+        self,
+        *,
+        poll_id: int,
+        mbr_pay: TransactionWithSigner,
+        voters: list[str],
+        choices: list[int],
+        signatures: list[bytes | bytearray],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `submit_vote_batch(uint64,pay,address[],uint64[],byte[][])void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param list[str] voters: The `voters` ABI parameter
+        :param list[int] choices: The `choices` ABI parameter
+        :param list[bytes | bytearray] signatures: The `signatures` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = SubmitVoteBatchArgs(
+            poll_id=poll_id,
+            mbr_pay=mbr_pay,
+            voters=voters,
+            choices=choices,
+            signatures=signatures,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def finalize_results(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `finalize_results(uint64)uint64` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        args = FinalizeResultsArgs(
+            poll_id=poll_id,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def get_poll_snapshot(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[PollSnapshot]:
+        """Calls `get_poll_snapshot(uint64)(uint64,byte[],byte[][],uint64,uint64,bool,byte[32],uint64,uint64,byte[32],bool,uint64,uint64,uint64[])` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[PollSnapshot]: The result of the transaction"""
+
+        args = GetPollSnapshotArgs(
+            poll_id=poll_id,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        elements = self.app_spec.hints[args.method()].structs["output"]["elements"]
+        result_dict = {element[0]: value for element, value in zip(elements, result.return_value)}
+        result.return_value = PollSnapshot(**result_dict)
+        return result
+
+    def get_voter_status(
+        self,
+        *,
+        poll_id: int,
+        account: str | bytes,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[VoterStatus]:
+        """Calls `get_voter_status(uint64,account)(bool,uint64,bool,uint64)` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param str | bytes account: The `account` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[VoterStatus]: The result of the transaction"""
+
+        args = GetVoterStatusArgs(
+            poll_id=poll_id,
+            account=account,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        elements = self.app_spec.hints[args.method()].structs["output"]["elements"]
+        result_dict = {element[0]: value for element, value in zip(elements, result.return_value)}
+        result.return_value = VoterStatus(**result_dict)
+        return result
+
+    def box_opt_out(
+        self,
+        *,
+        poll_id: int,
+        account: str | bytes,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `box_opt_out(uint64,account)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param str | bytes account: The `account` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = BoxOptOutArgs(
+            poll_id=poll_id,
+            account=account,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def sweep(
+        self,
+        *,
+        poll_id: int,
+        accounts: list[str],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `sweep(uint64,address[])uint64` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param list[str] accounts: The `accounts` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        args = SweepArgs(
+            poll_id=poll_id,
+            accounts=accounts,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def delete_poll(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `delete_poll(uint64)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = DeletePollArgs(
+            poll_id=poll_id,
         )
         result = self.app_client.call(
             call_abi_method=args.method(),
@@ -0,0 +1,794 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import asyncio
+import base64
+import dataclasses
+import typing
+from collections.abc import Iterable
+
+import httpx
+from algokit_utils import TransactionParameters
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.encoding import msgpack_encode
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import GenericSignedTransaction, SignedTransaction, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from smart_contracts.artifacts.vote_chain.vote_chain_client import (
+    Composer,
+    GlobalState,
+    LocalState,
+    VoteChainClient,
+)
+from smart_contracts.vote_chain.state import (
+    MAX_GROUP_SIZE,
+    Poll,
+    PollSnapshot,
+    PollState,
+    VoterStatus,
+    decode_abi_return,
+    decode_choices,
+    decode_poll,
+    decode_poll_snapshot,
+    decode_tally,
+    get_ballot_box_name,
+    get_poll_box_name,
+    get_poll_box_references,
+    get_poll_choices_box_name,
+    get_poll_tally_box_name,
+)
+
+# Keep-alive connection pool shared by every client created from the same 'AsyncAlgod'
+DEFAULT_POOL_LIMITS = httpx.Limits(max_connections=512, max_keepalive_connections=128)
+
+
+@dataclasses.dataclass(kw_only=True)
+class AsyncABIResult:
+    tx_id: str
+    method: Method
+    return_value: object
+
+
+@dataclasses.dataclass(kw_only=True)
+class AsyncTransactionResponse:
+    confirmed_round: int
+    tx_ids: list[str]
+    abi_results: list[AsyncABIResult]
+
+    @property
+    def tx_id(self) -> str:
+        """Returns the transaction ID of the last transaction (the app call of a single method group)"""
+
+        return self.tx_ids[-1]
+
+    @property
+    def return_value(self) -> object:
+        """Returns the ABI return value of the last method call"""
+
+        return self.abi_results[-1].return_value
+
+
+@dataclasses.dataclass(kw_only=True)
+class AsyncSimulateResponse:
+    failure_message: str | None
+    simulate_response: dict[str, typing.Any]
+    abi_results: list[AsyncABIResult]
+
+
+# Async algod API client, every request goes through one pooled 'httpx.AsyncClient' (share one instance per process)
+class AsyncAlgod:
+    def __init__(
+        self,
+        algod_address: str,
+        algod_token: str = "",
+        headers: dict[str, str] | None = None,
+        limits: httpx.Limits = DEFAULT_POOL_LIMITS,
+        timeout: float = 30.0,
+    ) -> None:
+        self.algod_address = algod_address
+        self.algod_token = algod_token
+        self.headers = headers
+        # Extra headers (e.g. the API key of a hosted node) are sent w/ every request, as by the synchronous client
+        self.http = httpx.AsyncClient(
+            base_url=algod_address,
+            headers={"X-Algo-API-Token": algod_token, **(headers or {})},
+            limits=limits,
+            timeout=timeout,
+        )
+
+    @classmethod
+    def from_algod_client(cls, algod_client: AlgodClient) -> "AsyncAlgod":
+        return cls(algod_client.algod_address, algod_client.algod_token, algod_client.headers)
+
+    async def close(self) -> None:
+        await self.http.aclose()
+
+    async def __aenter__(self) -> "AsyncAlgod":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    # Sends a request and raises the same error type as the synchronous algod client on failure
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, str] | None = None,
+        content: bytes | None = None,
+        content_type: str = "application/x-binary",
+    ) -> dict[str, typing.Any]:
+        response = await self.http.request(
+            method,
+            path,
+            params=params,
+            content=content,
+            headers={"Content-Type": content_type} if content is not None else None,
+        )
+        if response.status_code >= 400:
+            try:
+                message = response.json().get("message", response.text)
+            except ValueError:
+                message = response.text
+            raise AlgodHTTPError(message, response.status_code)
+        return typing.cast(dict[str, typing.Any], response.json())
+
+    async def status(self) -> dict[str, typing.Any]:
+        return await self._request("GET", "/v2/status")
+
+    async def status_after_block(self, round_num: int) -> dict[str, typing.Any]:
+        return await self._request("GET", f"/v2/status/wait-for-block-after/{round_num}")
+
+    async def suggested_params(self) -> SuggestedParams:
+        params = await self._request("GET", "/v2/transactions/params")
+        return SuggestedParams(
+            fee=params["fee"],
+            first=params["last-round"],
+            last=params["last-round"] + 1000,
+            gh=params["genesis-hash"],
+            gen=params["genesis-id"],
+            flat_fee=False,
+            consensus_version=params["consensus-version"],
+            min_fee=params["min-fee"],
+        )
+
+    async def send_raw_transaction(self, signed_txns: bytes) -> str:
+        return typing.cast(str, (await self._request("POST", "/v2/transactions", content=signed_txns))["txId"])
+
+    async def pending_transaction_info(self, tx_id: str) -> dict[str, typing.Any]:
+        return await self._request("GET", f"/v2/transactions/pending/{tx_id}")
+
+    # Encodes the request as the synchronous client does (canonical msgpack w/ empty fields left out)
+    async def simulate(self, request: SimulateRequest) -> dict[str, typing.Any]:
+        return await self._request(
+            "POST",
+            "/v2/transactions/simulate",
+            params={"format": "json"},
+            content=base64.b64decode(msgpack_encode(request)),
+            content_type="application/msgpack",
+        )
+
+    async def application_info(self, app_id: int) -> dict[str, typing.Any]:
+        return await self._request("GET", f"/v2/applications/{app_id}")
+
+    async def account_application_info(self, address: str, app_id: int) -> dict[str, typing.Any]:
+        return await self._request("GET", f"/v2/accounts/{address}/applications/{app_id}")
+
+    async def application_box_by_name(self, app_id: int, box_name: bytes) -> bytes:
+        box = await self._request(
+            "GET",
+            f"/v2/applications/{app_id}/box",
+            params={"name": "b64:" + base64.b64encode(box_name).decode()},
+        )
+        return base64.b64decode(box["value"])
+
+    async def application_boxes(self, app_id: int) -> list[bytes]:
+        boxes = await self._request("GET", f"/v2/applications/{app_id}/boxes")
+        return [base64.b64decode(box["name"]) for box in boxes["boxes"]]
+
+    # Waits until a transaction is confirmed (or rejected from the pool) and returns its pending transaction info
+    async def wait_for_confirmation(self, tx_id: str, wait_rounds: int = 10) -> dict[str, typing.Any]:
+        last_round = (await self.status())["last-round"]
+        for _ in range(wait_rounds):
+            txn_info = await self.pending_transaction_info(tx_id)
+            if txn_info.get("confirmed-round", 0) > 0:
+                return txn_info
+            if txn_info.get("pool-error"):
+                raise AlgodHTTPError(f"Transaction rejected: {txn_info['pool-error']}", 400)
+            last_round = (await self.status_after_block(last_round))["last-round"]
+        raise TimeoutError(f"Transaction {tx_id} not confirmed after {wait_rounds} rounds")
+
+
+# Decodes the ABI return value of a method call from its transaction logs
+def _parse_abi_result(method: Method, tx_id: str, logs: list[str]) -> AsyncABIResult:
+    return AsyncABIResult(
+        tx_id=tx_id, method=method, return_value=decode_abi_return(method, logs)
+    )
+
+
+# Composes a group w/ the typed methods of the synchronous 'Composer' (building and signing needs no algod I/O once the
+# suggested params are known) and sends or simulates it over the async algod client
+class AsyncComposer:
+    def __init__(
+        self,
+        async_algod: AsyncAlgod,
+        composer: Composer,
+        suggested_params: SuggestedParams,
+    ) -> None:
+        self.async_algod = async_algod
+        self.composer = composer
+        self.suggested_params = suggested_params
+
+    # Fills in the cached suggested params so the synchronous App client never fetches them itself
+    def _params(
+        self, transaction_parameters: TransactionParameters | None
+    ) -> TransactionParameters:
+        params = transaction_parameters or TransactionParameters()
+        if params.suggested_params is None:
+            params = dataclasses.replace(params, suggested_params=self.suggested_params)
+        return params
+
+    def build(self) -> AtomicTransactionComposer:
+        return self.composer.build()
+
+    def global_storage_mbr(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.global_storage_mbr(
+            mbr_pay=mbr_pay, transaction_parameters=self._params(transaction_parameters)
+        )
+        return self
+
+    def opt_in_local_storage_mbr(
+        self,
+        *,
+        account: str,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.opt_in_local_storage_mbr(
+            account=account,
+            mbr_pay=mbr_pay,
+            transaction_parameters=self._params(transaction_parameters),
+        )
+        return self
+
+    def close_out_opt_out(
+        self,
+        *,
+        account: str,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.close_out_opt_out(
+            account=account, transaction_parameters=self._params(transaction_parameters)
+        )
+        return self
+
+    def setup_poll(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        title: bytes,
+        choices: list[bytes],
+        require_opt_in: bool,
+        eligibility_root: bytes,
+        start_date_str: str,
+        start_date_unix: int,
+        end_date_str: str,
+        end_date_unix: int,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.setup_poll(
+            mbr_pay=mbr_pay,
+            title=title,
+            choices=choices,
+            require_opt_in=require_opt_in,
+            eligibility_root=eligibility_root,
+            start_date_str=start_date_str,
+            start_date_unix=start_date_unix,
+            end_date_str=end_date_str,
+            end_date_unix=end_date_unix,
+            transaction_parameters=self._params(transaction_parameters),
+        )
+        return self
+
+    def submit_vote(
+        self,
+        *,
+        poll_id: int,
+        account: str,
+        mbr_pay: TransactionWithSigner,
+        choice: int,
+        proof: list[bytes],
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.submit_vote(
+            poll_id=poll_id,
+            account=account,
+            mbr_pay=mbr_pay,
+            choice=choice,
+            proof=list(proof),  # Copied into the element type of the generated client's 'proof' parameter
+            transaction_parameters=self._params(transaction_parameters),
+        )
+        return self
+
+    def submit_vote_batch(
+        self,
+        *,
+        poll_id: int,
+        mbr_pay: TransactionWithSigner,
+        voters: list[str],
+        choices: list[int],
+        signatures: list[bytes],
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.submit_vote_batch(
+            poll_id=poll_id,
+            mbr_pay=mbr_pay,
+            voters=voters,
+            choices=choices,
+            signatures=signatures,
+            transaction_parameters=self._params(transaction_parameters),
+        )
+        return self
+
+    def finalize_results(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.finalize_results(
+            poll_id=poll_id, transaction_parameters=self._params(transaction_parameters)
+        )
+        return self
+
+    def get_poll_snapshot(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.get_poll_snapshot(
+            poll_id=poll_id, transaction_parameters=self._params(transaction_parameters)
+        )
+        return self
+
+    def get_voter_status(
+        self,
+        *,
+        poll_id: int,
+        account: str,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.get_voter_status(
+            poll_id=poll_id,
+            account=account,
+            transaction_parameters=self._params(transaction_parameters),
+        )
+        return self
+
+    def box_opt_out(
+        self,
+        *,
+        poll_id: int,
+        account: str,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.box_opt_out(
+            poll_id=poll_id,
+            account=account,
+            transaction_parameters=self._params(transaction_parameters),
+        )
+        return self
+
+    def sweep(
+        self,
+        *,
+        poll_id: int,
+        accounts: list[str],
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.sweep(
+            poll_id=poll_id,
+            accounts=accounts,
+            transaction_parameters=self._params(transaction_parameters),
+        )
+        return self
+
+    def delete_poll(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self.composer.delete_poll(
+            poll_id=poll_id, transaction_parameters=self._params(transaction_parameters)
+        )
+        return self
+
+    # Signs and sends the group, waits for confirmation and decodes the ABI return values
+    async def execute(self, wait_rounds: int = 10) -> AsyncTransactionResponse:
+        atc = self.composer.build()
+        signed_txns = atc.gather_signatures()
+        tx_ids = [signed_txn.get_txid() for signed_txn in signed_txns]
+
+        await self.async_algod.send_raw_transaction(_encode_signed_txns(signed_txns))
+        confirmed = await self.async_algod.wait_for_confirmation(tx_ids[0], wait_rounds)
+
+        # Method call results are read concurrently from the pending transaction endpoint
+        method_indexes = sorted(atc.method_dict)
+        txn_infos = await asyncio.gather(
+            *(self.async_algod.pending_transaction_info(tx_ids[i]) for i in method_indexes)
+        )
+
+        return AsyncTransactionResponse(
+            confirmed_round=confirmed["confirmed-round"],
+            tx_ids=tx_ids,
+            abi_results=[
+                _parse_abi_result(atc.method_dict[i], tx_ids[i], txn_info.get("logs", []))
+                for i, txn_info in zip(method_indexes, txn_infos, strict=True)
+            ],
+        )
+
+    # Simulates the group (read-only calls need no signatures) and decodes the ABI return values
+    async def simulate(
+        self, *, allow_more_logs: bool = False, allow_empty_signatures: bool = True
+    ) -> AsyncSimulateResponse:
+        atc = self.composer.build()
+        txns = atc.build_group()
+        signed_txns: list[GenericSignedTransaction] = (
+            [SignedTransaction(txn.txn, None) for txn in txns]
+            if allow_empty_signatures
+            else atc.gather_signatures()
+        )
+
+        response = await self.async_algod.simulate(
+            SimulateRequest(
+                txn_groups=[SimulateRequestTransactionGroup(txns=signed_txns)],
+                allow_more_logs=allow_more_logs,
+                allow_empty_signatures=allow_empty_signatures,
+            )
+        )
+
+        group = response["txn-groups"][0]
+        txn_results = group["txn-results"]
+        tx_ids = [txn.txn.get_txid() for txn in txns]
+
+        return AsyncSimulateResponse(
+            failure_message=group.get("failure-message"),
+            simulate_response=response,
+            abi_results=[
+                _parse_abi_result(
+                    atc.method_dict[i],
+                    tx_ids[i],
+                    txn_results[i]["txn-result"].get("logs", []),
+                )
+                for i in sorted(atc.method_dict)
+                if i < len(txn_results)
+            ],
+        )
+
+
+# Async variant of 'VoteChainClient' (typed methods send the same ABI calls, I/O goes through a shared 'AsyncAlgod')
+class AsyncVoteChainClient:
+    def __init__(
+        self,
+        async_algod: AsyncAlgod,
+        *,
+        app_id: int,
+        sender: str | None = None,
+        signer: TransactionSigner | None = None,
+    ) -> None:
+        self.async_algod = async_algod
+
+        # Without a signer only simulated reads are possible, those are sent from the zero address w/ empty signatures
+        if signer is None:
+            sender = sender or ZERO_ADDRESS
+            signer = EmptySigner()
+
+        # The synchronous client is only used to build transactions, it never talks to algod
+        self.sync_client = VoteChainClient(
+            algod_client=AlgodClient(async_algod.algod_token, async_algod.algod_address, async_algod.headers),
+            app_id=app_id,
+            sender=sender,
+            signer=signer,
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.sync_client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.sync_client.app_address
+
+    async def compose(self, suggested_params: SuggestedParams | None = None) -> AsyncComposer:
+        return AsyncComposer(
+            self.async_algod,
+            self.sync_client.compose(),
+            suggested_params or await self.async_algod.suggested_params(),
+        )
+
+    async def get_global_state(self) -> GlobalState:
+        app_info = await self.async_algod.application_info(self.app_id)
+        return GlobalState(_decode_state(app_info["params"].get("global-state", [])))
+
+    async def get_local_state(self, account: str) -> LocalState:
+        acc_info = await self.async_algod.account_application_info(account, self.app_id)
+        return LocalState(_decode_state(acc_info["app-local-state"].get("key-value", [])))
+
+    async def global_storage_mbr(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> AsyncTransactionResponse:
+        composer = await self.compose()
+        composer.global_storage_mbr(mbr_pay=mbr_pay, transaction_parameters=transaction_parameters)
+        return await composer.execute()
+
+    async def opt_in_local_storage_mbr(
+        self,
+        *,
+        account: str,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> AsyncTransactionResponse:
+        composer = await self.compose()
+        composer.opt_in_local_storage_mbr(
+            account=account, mbr_pay=mbr_pay, transaction_parameters=transaction_parameters
+        )
+        return await composer.execute()
+
+    async def close_out_opt_out(
+        self,
+        *,
+        account: str,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> AsyncTransactionResponse:
+        composer = await self.compose()
+        composer.close_out_opt_out(account=account, transaction_parameters=transaction_parameters)
+        return await composer.execute()
+
+    async def setup_poll(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        title: bytes,
+        choices: list[bytes],
+        require_opt_in: bool,
+        eligibility_root: bytes,
+        start_date_str: str,
+        start_date_unix: int,
+        end_date_str: str,
+        end_date_unix: int,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> AsyncTransactionResponse:
+        composer = await self.compose()
+        composer.setup_poll(
+            mbr_pay=mbr_pay,
+            title=title,
+            choices=choices,
+            require_opt_in=require_opt_in,
+            eligibility_root=eligibility_root,
+            start_date_str=start_date_str,
+            start_date_unix=start_date_unix,
+            end_date_str=end_date_str,
+            end_date_unix=end_date_unix,
+            transaction_parameters=transaction_parameters,
+        )
+        return await composer.execute()
+
+    async def submit_vote(
+        self,
+        *,
+        poll_id: int,
+        account: str,
+        mbr_pay: TransactionWithSigner,
+        choice: int,
+        proof: list[bytes],
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> AsyncTransactionResponse:
+        composer = await self.compose()
+        composer.submit_vote(
+            poll_id=poll_id,
+            account=account,
+            mbr_pay=mbr_pay,
+            choice=choice,
+            proof=proof,
+            transaction_parameters=transaction_parameters,
+        )
+        return await composer.execute()
+
+    async def submit_vote_batch(
+        self,
+        *,
+        poll_id: int,
+        mbr_pay: TransactionWithSigner,
+        voters: list[str],
+        choices: list[int],
+        signatures: list[bytes],
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> AsyncTransactionResponse:
+        composer = await self.compose()
+        composer.submit_vote_batch(
+            poll_id=poll_id,
+            mbr_pay=mbr_pay,
+            voters=voters,
+            choices=choices,
+            signatures=signatures,
+            transaction_parameters=transaction_parameters,
+        )
+        return await composer.execute()
+
+    async def finalize_results(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> AsyncTransactionResponse:
+        composer = await self.compose()
+        composer.finalize_results(poll_id=poll_id, transaction_parameters=transaction_parameters)
+        return await composer.execute()
+
+    async def box_opt_out(
+        self,
+        *,
+        poll_id: int,
+        account: str,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> AsyncTransactionResponse:
+        composer = await self.compose()
+        composer.box_opt_out(
+            poll_id=poll_id, account=account, transaction_parameters=transaction_parameters
+        )
+        return await composer.execute()
+
+    async def sweep(
+        self,
+        *,
+        poll_id: int,
+        accounts: list[str],
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> AsyncTransactionResponse:
+        composer = await self.compose()
+        composer.sweep(
+            poll_id=poll_id, accounts=accounts, transaction_parameters=transaction_parameters
+        )
+        return await composer.execute()
+
+    async def delete_poll(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: TransactionParameters | None = None,
+    ) -> AsyncTransactionResponse:
+        composer = await self.compose()
+        composer.delete_poll(poll_id=poll_id, transaction_parameters=transaction_parameters)
+        return await composer.execute()
+
+
+# Converts raw algod state entries into the key-value dict the generated state classes are built from
+def _decode_state(entries: list[dict[str, typing.Any]]) -> dict[bytes, bytes | int]:
+    state: dict[bytes, bytes | int] = {}
+    for entry in entries:
+        value = entry["value"]
+        state[base64.b64decode(entry["key"])] = (
+            base64.b64decode(value["bytes"]) if value["type"] == 1 else value["uint"]
+        )
+    return state
+
+
+# Encodes signed transactions as concatenated msgpack (the raw transaction body algod expects for a group)
+def _encode_signed_txns(signed_txns: list[GenericSignedTransaction]) -> bytes:
+    return b"".join(base64.b64decode(msgpack_encode(signed_txn)) for signed_txn in signed_txns)
+
+
+# Raises when a simulated read-only call failed, as the synchronous App client does for read-only methods (a failed
+# call has no ABI return value to decode)
+def _check_simulate(result: AsyncSimulateResponse) -> AsyncSimulateResponse:
+    if result.failure_message:
+        methods = ", ".join(dict.fromkeys(abi_result.method.get_signature() for abi_result in result.abi_results))
+        raise Exception(f"Simulate failed for readonly method {methods}: {result.failure_message}")
+    return result
+
+
+# Async state readers (same results as the readers in 'state.py', independent box reads run concurrently)
+async def get_poll(client: AsyncVoteChainClient, poll_id: int) -> Poll:
+    value = await client.async_algod.application_box_by_name(
+        client.app_id, get_poll_box_name(poll_id)
+    )
+    return decode_poll(poll_id, value)
+
+
+async def get_poll_tally(client: AsyncVoteChainClient, poll_id: int) -> list[int]:
+    value = await client.async_algod.application_box_by_name(
+        client.app_id, get_poll_tally_box_name(poll_id)
+    )
+    return decode_tally(value)
+
+
+async def get_poll_choices(client: AsyncVoteChainClient, poll_id: int) -> list[bytes]:
+    value = await client.async_algod.application_box_by_name(
+        client.app_id, get_poll_choices_box_name(poll_id)
+    )
+    return decode_choices(value)
+
+
+async def get_poll_state(client: AsyncVoteChainClient, poll_id: int) -> PollState:
+    poll, choices, tally = await asyncio.gather(
+        get_poll(client, poll_id),
+        get_poll_choices(client, poll_id),
+        get_poll_tally(client, poll_id),
+    )
+    return PollState(poll=poll, choices=choices, tally=tally)
+
+
+async def get_poll_snapshot(client: AsyncVoteChainClient, poll_id: int) -> PollSnapshot:
+    composer = await client.compose()
+    composer.get_poll_snapshot(
+        poll_id=poll_id,
+        transaction_parameters=TransactionParameters(
+            boxes=get_poll_box_references(poll_id, client.app_id)
+        ),
+    )
+    result = _check_simulate(await composer.simulate(allow_more_logs=True))
+    snapshot = result.abi_results[0].return_value
+    assert isinstance(snapshot, list)
+    return decode_poll_snapshot(snapshot)
+
+
+async def get_voter_statuses(
+    client: AsyncVoteChainClient, poll_id: int, addresses: Iterable[str]
+) -> dict[str, VoterStatus]:
+    unique_addresses = list(dict.fromkeys(addresses))
+    suggested_params = await client.async_algod.suggested_params()
+
+    # Every chunk of 16 accounts is one simulate request, all chunks are in flight at the same time
+    async def simulate_chunk(chunk: list[str]) -> list[VoterStatus]:
+        composer = await client.compose(suggested_params)
+        for address in chunk:
+            composer.get_voter_status(
+                poll_id=poll_id,
+                account=address,
+                transaction_parameters=TransactionParameters(
+                    accounts=[address],
+                    boxes=[(client.app_id, get_ballot_box_name(poll_id, address))],
+                ),
+            )
+        result = _check_simulate(await composer.simulate())
+        statuses = []
+        for address, abi_result in zip(chunk, result.abi_results, strict=True):
+            status = abi_result.return_value
+            assert isinstance(status, list)
+            opted_in, votes_cast, voted, choice = status
+            statuses.append(
+                VoterStatus(
+                    address=address,
+                    opted_in=opted_in,
+                    votes_cast=votes_cast,
+                    voted=voted,
+                    choice=choice,
+                )
+            )
+        return statuses
+
+    chunks = await asyncio.gather(
+        *(
+            simulate_chunk(unique_addresses[start : start + MAX_GROUP_SIZE])
+            for start in range(0, len(unique_addresses), MAX_GROUP_SIZE)
+        )
+    )
+    return {status.address: status for chunk in chunks for status in chunk}
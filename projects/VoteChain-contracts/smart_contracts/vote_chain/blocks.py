@@ -0,0 +1,122 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import base64
+import functools
+import mmap
+import os
+import typing
+from collections.abc import Iterator
+from pathlib import Path
+
+import msgpack
+from algosdk import constants
+from algosdk.encoding import checksum
+from algosdk.v2client.algod import AlgodClient
+
+# go-codec encodes '[]byte' fields of some block types (e.g. 'lg' logs and state delta keys) as msgpack str, so strs are
+# decoded w/ 'surrogateescape' (binary data round-trips) and logs are encoded back to the bytes they hold
+UNICODE_ERRORS = "surrogateescape"
+
+
+# Returns the bytes of a str-typed msgpack value decoded w/ 'UNICODE_ERRORS' (bin-typed values are bytes already)
+def _raw_bytes(value: str | bytes) -> bytes:
+    return value.encode(errors=UNICODE_ERRORS) if isinstance(value, str) else value
+
+
+# Returns the canonical msgpack form of a map (keys sorted at every level, as algod encodes transactions)
+def _canonical(value: object) -> object:
+    if isinstance(value, dict):
+        return {key: _canonical(value[key]) for key in sorted(value)}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    return value
+
+
+# Yields every (transaction, apply data) pair of a list of signed transactions in a block, inner transactions included
+def _iter_txn_tree(
+    signed_txns: list[dict[str, typing.Any]]
+) -> Iterator[tuple[dict[str, typing.Any], dict[str, typing.Any]]]:
+    for signed_txn in signed_txns:
+        apply_data: dict[str, typing.Any] = signed_txn.get("dt", {})
+        yield signed_txn.get("txn", {}), apply_data
+        yield from _iter_txn_tree(apply_data.get("itx", []))
+
+
+# A block stored as the raw msgpack bytes returned by algod, decoded only when (and as far as) it is read
+class CachedBlock:
+    def __init__(self, round_num: int, path: Path) -> None:
+        self.round = round_num
+        self.path = path
+
+    @functools.cached_property
+    def block(self) -> dict[str, typing.Any]:
+        # The blob is memory-mapped, so only the decoded block is held in memory
+        with self.path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as blob:
+            decoded = msgpack.unpackb(blob, raw=False, strict_map_key=False, unicode_errors=UNICODE_ERRORS)
+            return typing.cast(dict[str, typing.Any], decoded["block"])
+
+    @property
+    def txns(self) -> list[dict[str, typing.Any]]:
+        """Returns the top level signed transactions of the block (w/ their apply data under 'dt')"""
+
+        return typing.cast(list[dict[str, typing.Any]], self.block.get("txns", []))
+
+    @functools.cached_property
+    def tx_ids(self) -> list[str]:
+        """Returns the top level transaction IDs (computed locally instead of asking algod for the block txids)"""
+
+        tx_ids = []
+        for signed_txn in self.txns:
+            # Blocks leave out the genesis hash (and the genesis ID if 'hgi' is set), both are part of the signed txn
+            txn = dict(signed_txn["txn"], gh=self.block["gh"])
+            if signed_txn.get("hgi"):
+                txn["gen"] = self.block["gen"]
+
+            encoded_txn = msgpack.packb(_canonical(txn), use_bin_type=True, unicode_errors=UNICODE_ERRORS)
+            digest = checksum(constants.txid_prefix + encoded_txn)
+            tx_ids.append(base64.b32encode(digest).decode().rstrip("="))
+
+        return tx_ids
+
+    @property
+    def fees(self) -> list[int]:
+        return [signed_txn["txn"].get("fee", 0) for signed_txn in self.txns]
+
+    def app_logs(self, app_id: int) -> list[bytes]:
+        """Returns the logs of every call to an App in the block, including inner calls made by other Apps"""
+
+        return [
+            _raw_bytes(entry)
+            for txn, apply_data in _iter_txn_tree(self.txns)
+            if txn.get("type") == "appl" and txn.get("apid") == app_id
+            for entry in apply_data.get("lg", [])
+        ]
+
+
+# Fetches every block once from algod (as msgpack) and keeps the raw bytes on disk, keyed by the genesis hash of the
+# network and the round (confirmed blocks never change, and a reset localnet gets a new genesis hash)
+class BlockCache:
+    def __init__(self, algod_client: AlgodClient, cache_dir: Path) -> None:
+        self.algod_client = algod_client
+        versions = algod_client.versions()
+        assert isinstance(versions, dict)
+        genesis_hash = base64.b64decode(versions["genesis_hash_b64"])
+        self.cache_dir = cache_dir / base64.b32encode(genesis_hash).decode().rstrip("=")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.fetches = 0  # Number of blocks fetched from algod (cache misses)
+
+    def _path(self, round_num: int) -> Path:
+        return self.cache_dir / f"{round_num:012d}.msgpack"
+
+    def get_block(self, round_num: int) -> CachedBlock:
+        path = self._path(round_num)
+        if not path.exists():
+            blob = self.algod_client.block_info(round_num=round_num, response_format="msgpack")
+            assert isinstance(blob, bytes)
+            self.fetches += 1
+
+            # Written to a temporary file first, so a concurrent reader never sees a partial block
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(blob)
+            tmp_path.replace(path)
+
+        return CachedBlock(round_num, path)
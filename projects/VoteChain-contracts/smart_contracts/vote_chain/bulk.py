@@ -0,0 +1,203 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import dataclasses
+import logging
+from collections.abc import Callable
+
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import GenericSignedTransaction
+
+from smart_contracts.artifacts.vote_chain.vote_chain_client import (
+    Composer,
+    VoteChainClient,
+)
+from smart_contracts.vote_chain.signing import gather_signatures
+from smart_contracts.vote_chain.state import MAX_GROUP_SIZE, decode_abi_return
+
+logger = logging.getLogger(__name__)
+
+# Adds one VoteChain call (and the transactions passed as its arguments, e.g. an MBR payment) to a composer,
+# e.g. 'lambda composer: composer.opt_in_local_storage_mbr(account=..., mbr_pay=..., transaction_parameters=...)'
+BulkCall = Callable[[Composer], object]
+
+# Max number of submitted groups waiting for confirmation before new groups are held back
+DEFAULT_MAX_IN_FLIGHT = 64
+
+
+@dataclasses.dataclass(kw_only=True)
+class BulkResult:
+    index: int  # Position of the call in the input list
+    tx_id: str | None = None  # Transaction ID of the app call
+    confirmed_round: int | None = None
+    return_value: object = None
+    error: str | None = None  # Submission or confirmation error of the call's group
+
+    @property
+    def confirmed(self) -> bool:
+        return self.confirmed_round is not None
+
+
+@dataclasses.dataclass(kw_only=True)
+class _Group:
+    atc: AtomicTransactionComposer
+    call_indexes: list[int] = dataclasses.field(default_factory=list)
+    app_call_positions: list[int] = dataclasses.field(default_factory=list)  # App call txn index within the group
+    tx_ids: list[str] = dataclasses.field(default_factory=list)
+
+
+# Moves the transactions (and ABI methods) composed on their own into a group, the group assigns their group ID later
+def _move_transactions(source: AtomicTransactionComposer, target: AtomicTransactionComposer) -> None:
+    offset = target.get_tx_count()
+    for txn_with_signer in source.txn_list:
+        target.add_transaction(txn_with_signer)
+    for position, method in source.method_dict.items():
+        target.method_dict[offset + position] = method
+
+
+# Packs any number of VoteChain calls into atomic groups of at most 16 transactions, signs and submits the groups
+# without waiting for each other and waits for all confirmations in one shared status loop
+class BulkComposer:
+    def __init__(
+        self, app_client: VoteChainClient, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> None:
+        self.app_client = app_client
+        self.max_in_flight = max_in_flight
+        self.calls: list[BulkCall] = []
+
+    def add(self, call: BulkCall) -> int:
+        """Adds a call and returns its index in the results"""
+
+        self.calls.append(call)
+        return len(self.calls) - 1
+
+    # Packs the calls greedily into groups (calls are never split across groups, so their payments stay atomic)
+    def _build_groups(self) -> list[_Group]:
+        groups = [_Group(atc=AtomicTransactionComposer())]
+
+        for index, call in enumerate(self.calls):
+            # Compose the call once on its own to learn how many transactions it adds (calls are only run once, e.g. an
+            # MBR payment is built and its params fetched once), then move its transactions into the group
+            scratch = AtomicTransactionComposer()
+            call(self.app_client.compose(scratch))
+
+            group = groups[-1]
+            if group.atc.get_tx_count() + scratch.get_tx_count() > MAX_GROUP_SIZE:
+                group = _Group(atc=AtomicTransactionComposer())
+                groups.append(group)
+
+            _move_transactions(scratch, group.atc)
+            group.call_indexes.append(index)
+            group.app_call_positions.append(group.atc.get_tx_count() - 1)
+
+        return [group for group in groups if group.call_indexes]
+
+    # Submits a signed group, errors are recorded for every call of the group instead of stopping the pipeline
+    def _submit(
+        self, group: _Group, signed_txns: list[GenericSignedTransaction], results: list[BulkResult]
+    ) -> bool:
+        algod_client = self.app_client.algod_client
+        group.tx_ids = [signed_txn.get_txid() for signed_txn in signed_txns]
+        try:
+            algod_client.send_transactions(signed_txns)
+        except AlgodHTTPError as error:
+            for index in group.call_indexes:
+                results[index].error = str(error)
+            return False
+
+        for index, position in zip(group.call_indexes, group.app_call_positions, strict=True):
+            results[index].tx_id = group.tx_ids[position]
+        return True
+
+    # Checks every in-flight group once per round until the number of in-flight groups drops to 'max_pending'
+    def _wait(
+        self, in_flight: list[_Group], results: list[BulkResult], max_pending: int, wait_rounds: int
+    ) -> list[_Group]:
+        algod_client = self.app_client.algod_client
+        status = algod_client.status()
+        assert isinstance(status, dict)
+        last_round = status["last-round"]
+        rounds_waited = 0
+
+        while len(in_flight) > max_pending:
+            pending = []
+            for group in in_flight:
+                if not self._check(group, results):
+                    pending.append(group)
+            in_flight = pending
+
+            if len(in_flight) <= max_pending:
+                break
+
+            rounds_waited += 1
+            if rounds_waited > wait_rounds:
+                for group in in_flight:
+                    for index in group.call_indexes:
+                        results[index].error = f"Not confirmed after {wait_rounds} rounds"
+                return []
+
+            status = algod_client.status_after_block(last_round)
+            assert isinstance(status, dict)
+            last_round = status["last-round"]
+
+        return in_flight
+
+    # Returns True once the group is settled (confirmed or rejected from the transaction pool)
+    def _check(self, group: _Group, results: list[BulkResult]) -> bool:
+        algod_client = self.app_client.algod_client
+        try:
+            txn_info = algod_client.pending_transaction_info(group.tx_ids[0])
+        except AlgodHTTPError as error:
+            # Transactions dropped from the pool are no longer known to algod
+            for index in group.call_indexes:
+                results[index].error = str(error)
+            return True
+
+        assert isinstance(txn_info, dict)
+        if txn_info.get("pool-error"):
+            for index in group.call_indexes:
+                results[index].error = txn_info["pool-error"]
+            return True
+
+        confirmed_round = txn_info.get("confirmed-round", 0)
+        if confirmed_round == 0:
+            return False
+
+        for index, position in zip(group.call_indexes, group.app_call_positions, strict=True):
+            app_call_info = (
+                txn_info if position == 0 else algod_client.pending_transaction_info(group.tx_ids[position])
+            )
+            assert isinstance(app_call_info, dict)
+            results[index].confirmed_round = confirmed_round
+            results[index].return_value = decode_abi_return(
+                group.atc.method_dict[position], app_call_info.get("logs", [])
+            )
+        return True
+
+    def execute(self, wait_rounds: int = 10) -> list[BulkResult]:
+        """Submits every call and returns one result per call in input order"""
+
+        results = [BulkResult(index=index) for index in range(len(self.calls))]
+
+        # Fetch the suggested params once for every call that does not bring its own
+        previous_suggested_params = self.app_client.suggested_params
+        self.app_client.suggested_params = self.app_client.algod_client.suggested_params()
+        try:
+            groups = self._build_groups()
+        finally:
+            self.app_client.suggested_params = previous_suggested_params
+        logger.info(f"Submitting {len(self.calls)} calls in {len(groups)} groups")
+
+        in_flight: list[_Group] = []
+        for start in range(0, len(groups), self.max_in_flight):
+            # Sign the next window of groups in one pass ('ParallelTransactionSigner' signers use their process pool)
+            window = groups[start : start + self.max_in_flight]
+            signed_groups = gather_signatures([group.atc for group in window])
+
+            for group, signed_txns in zip(window, signed_groups, strict=True):
+                if self._submit(group, signed_txns, results):
+                    in_flight.append(group)
+                if len(in_flight) >= self.max_in_flight:
+                    in_flight = self._wait(in_flight, results, self.max_in_flight - 1, wait_rounds)
+
+        self._wait(in_flight, results, 0, wait_rounds)
+        return results
@@ -0,0 +1,200 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import collections
+import copy
+import functools
+import time
+import typing
+from collections.abc import Callable, Hashable
+
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient, AlgodResponseType
+
+T = typing.TypeVar("T")
+
+# Suggested params stay valid for 1,000 rounds, so they are only refreshed every few rounds to pick up fee changes
+PARAMS_MAX_AGE_ROUNDS = 10
+
+# Rounds are ~3 seconds apart, so the current round is asked from algod at most once a second when no response has
+# reported it since (otherwise state reads would be served from the cache while other accounts keep writing)
+ROUND_REFRESH_SECONDS = 1.0
+
+
+# Returns the round an algod response was read at ('first' of suggested params is the 'last-round' of the response),
+# or None for responses w/o a round (App info)
+def _response_round(response: object) -> int | None:
+    if isinstance(response, SuggestedParams):
+        return typing.cast(int, response.first)
+    if isinstance(response, dict):
+        return typing.cast(int | None, response.get("round", response.get("last-round")))
+    return None
+
+
+# Bounded LRU cache of values tagged with the round they were read at
+class RoundCache:
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self._entries: collections.OrderedDict[Hashable, tuple[int, object]] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # Returns the cached value if it was read within 'max_age_rounds' of the current round (0 = same round only)
+    def get(self, key: Hashable, current_round: int, max_age_rounds: int = 0) -> object | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        read_round, value = entry
+        if current_round - read_round > max_age_rounds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, read_round: int, value: object) -> None:
+        self._entries[key] = (read_round, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    # Drops every entry that is not kept (e.g. App state after a write, suggested params are kept)
+    def invalidate(self, keep: tuple[str, ...] = ()) -> None:
+        for key in list(self._entries):
+            if not (isinstance(key, tuple) and key[0] in keep):
+                del self._entries[key]
+
+
+# Algod client that serves App state, box and suggested params reads from a round-aware cache (pass it as the
+# 'algod_client' of 'VoteChainClient' to cache 'get_global_state', 'get_local_state' and transaction builds).
+# Entries are tagged w/ the round algod reports in the response ('last-round' of suggested params, 'round' of local
+# state and boxes) and dropped as soon as a newer round is seen in any response (share the client w/ a
+# 'BlockFollower' to see every new round) or a transaction is sent through this client. The current round is asked
+# from algod once no response has reported it for 'round_refresh_seconds'.
+# NOTE: Cached state responses are shared, callers must not mutate them
+class CachingAlgodClient(AlgodClient):
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        max_size: int = 1024,
+        round_refresh_seconds: float = ROUND_REFRESH_SECONDS,
+    ) -> None:
+        super().__init__(algod_token, algod_address, headers)
+        self.cache = RoundCache(max_size)
+        self.round_refresh_seconds = round_refresh_seconds
+        self._round = 0
+        self._round_seen_at = 0.0
+
+    @classmethod
+    def from_algod_client(
+        cls,
+        algod_client: AlgodClient,
+        *,
+        max_size: int = 1024,
+        round_refresh_seconds: float = ROUND_REFRESH_SECONDS,
+    ) -> "CachingAlgodClient":
+        return cls(
+            algod_client.algod_token,
+            algod_client.algod_address,
+            algod_client.headers,
+            max_size=max_size,
+            round_refresh_seconds=round_refresh_seconds,
+        )
+
+    # Records a round seen in any algod response (a new round invalidates every round tagged state entry)
+    def _observe_round(self, round_num: int) -> None:
+        if round_num >= self._round:
+            self._round_seen_at = time.monotonic()
+        if round_num > self._round:
+            self._round = round_num
+            self.cache.invalidate(keep=("params",))
+
+    # Returns the last round seen in an algod response, asking algod before the first read and whenever no response
+    # has reported the current round for 'round_refresh_seconds'
+    def current_round(self) -> int:
+        if self._round == 0 or time.monotonic() - self._round_seen_at >= self.round_refresh_seconds:
+            self.status()
+        return self._round
+
+    # Returns the cached value of a read, or performs the read and caches it tagged w/ the round of its response
+    def _cached(self, key: tuple[Hashable, ...], max_age_rounds: int, read: Callable[[], T]) -> T:
+        value = self.cache.get(key, self.current_round(), max_age_rounds)
+        if value is None:
+            value = read()
+            read_round = _response_round(value)
+            if read_round is None:
+                read_round = self._round
+            else:
+                self._observe_round(read_round)
+            self.cache.put(key, read_round, value)
+        return typing.cast(T, value)
+
+    def status(self, **kwargs: object) -> AlgodResponseType:
+        response = super().status(**kwargs)
+        assert isinstance(response, dict)
+        self._observe_round(response["last-round"])
+        return response
+
+    def status_after_block(
+        self, block_num: int | None = None, round_num: int | None = None, **kwargs: typing.Any
+    ) -> AlgodResponseType:
+        response = super().status_after_block(block_num, round_num, **kwargs)
+        assert isinstance(response, dict)
+        self._observe_round(response["last-round"])
+        return response
+
+    def suggested_params(self, **kwargs: object) -> SuggestedParams:
+        if kwargs:
+            return super().suggested_params(**kwargs)
+
+        # Callers may adjust the fee of the params they get, so every caller gets its own copy
+        suggested_params = self._cached(
+            ("params",), PARAMS_MAX_AGE_ROUNDS, functools.partial(AlgodClient.suggested_params, self)
+        )
+        return copy.copy(suggested_params)
+
+    def application_info(self, application_id: int, **kwargs: object) -> AlgodResponseType:
+        if kwargs:
+            return super().application_info(application_id, **kwargs)
+        return self._cached(
+            ("app", application_id), 0, functools.partial(AlgodClient.application_info, self, application_id)
+        )
+
+    def account_application_info(self, address: str, application_id: int, **kwargs: object) -> AlgodResponseType:
+        if kwargs:
+            return super().account_application_info(address, application_id, **kwargs)
+        return self._cached(
+            ("local", address, application_id),
+            0,
+            functools.partial(AlgodClient.account_application_info, self, address, application_id),
+        )
+
+    def application_box_by_name(self, application_id: int, box_name: bytes, **kwargs: object) -> AlgodResponseType:
+        if kwargs:
+            return super().application_box_by_name(application_id, box_name, **kwargs)
+        return self._cached(
+            ("box", application_id, box_name),
+            0,
+            functools.partial(AlgodClient.application_box_by_name, self, application_id, box_name),
+        )
+
+    # The client's own writes ('send_transaction(s)' send through here) invalidate the cached state once they are sent
+    # and again once they are confirmed
+    def send_raw_transaction(self, txn: bytes | str, **kwargs: object) -> str:
+        tx_id = super().send_raw_transaction(txn, **kwargs)
+        self.cache.invalidate(keep=("params",))
+        return tx_id
+
+    def pending_transaction_info(
+        self, transaction_id: str, response_format: str = "json", **kwargs: typing.Any
+    ) -> AlgodResponseType:
+        response = super().pending_transaction_info(transaction_id, response_format, **kwargs)
+        if isinstance(response, dict) and response.get("confirmed-round", 0) > 0:
+            self.cache.invalidate(keep=("params",))
+            self._observe_round(response["confirmed-round"])
+        return response
@@ -1,55 +1,179 @@
 # smart_contracts/vote_chain/contract.py
+import typing
+
 from algopy import (
     Account,
     Application,
     ARC4Contract,
+    BigUInt,
+    BoxMap,
     Bytes,
     Global,
     LocalState,
+    OpUpFeeSource,
     String,
     Txn,
     UInt64,
     arc4,
+    ensure_budget,
     gtxn,
     itxn,
     log,
+    op,
     subroutine,
+    urange,
 )
 
+# Batch voting opcode budget analysis ('submit_vote_batch'):
+# - Every ballot is authorized by an 'ed25519verify_bare' check (1,900 opcodes) plus ~100 opcodes of bookkeeping
+#   (box lookup/creation, opt-in check, vote validation), so a ballot is budgeted at 2,000 opcodes.
+# - An app call only provides 700 opcodes, the missing budget is pooled via op-up inner transactions
+#   ('ensure_budget' w/ group credit) which the relayer covers by paying extra fee on the app call.
+# - Every ballot needs 2 resource references (voter account + ballot box) and the batch needs the poll and tally
+#   boxes, an app call can hold 8 references, which caps one batch at 3 ballots (~6,000 opcodes, ~8 op-up txns).
+# - A 16 transaction group fits 8 (MBR payment + batch call) pairs, so 24 ballots per group (~48,000 opcodes,
+#   ~64 op-up inner transactions), well within the 256 inner transaction limit of a group.
+BALLOT_PREFIX = b"VoteChain ballot"
+BALLOT_OPCODE_BUDGET = 2_000
+MAX_BATCH_SIZE = 3
+
+# Result finalization ('finalize_results') scans the packed tally once (~20 opcodes per choice, ~640 opcodes for 32
+# choices plus the poll record update), so it pools the budget of one extra app call via an op-up inner transaction
+FINALIZE_OPCODE_BUDGET = 1_400
+
+# Post-poll sweeping ('sweep'): every swept ballot needs 2 resource references (MBR payer account for the refund +
+# ballot box) and the sweep needs the poll and tally boxes, so one sweep call can release 3 ballot boxes (a 16
+# transaction group releases 48, every refund is an inner payment within the 256 inner transaction limit of a group)
+MAX_SWEEP_SIZE = 3
+
+# Poll choices are stored in box storage, so a poll is not limited to the size of the global schema
+MAX_POLL_CHOICES = 32
+
+# Merkle eligibility opcode budget analysis ('submit_vote' on a poll with an eligibility root):
+# - Leaves are 'sha256(0x00 + address)' and inner nodes are 'sha256(0x01 + lower hash + higher hash)', so proofs are
+#   order independent and carry no left/right direction bits.
+# - Every proof level costs a 'sha256' (35 opcodes) plus ~40 opcodes of comparison/concatenation/loop overhead, so a
+#   level is budgeted at 75 opcodes.
+# - A proof of 32 levels covers over 4 billion eligible addresses (~2,400 opcodes, ~3 op-up inner transactions) and
+#   1,026 bytes of app args, leaving room for the remaining 'submit_vote' args within the 2,048 byte limit.
+MERKLE_LEAF_PREFIX = b"\x00"
+MERKLE_NODE_PREFIX = b"\x01"
+MERKLE_LEVEL_OPCODE_BUDGET = 75
+MAX_PROOF_LENGTH = 32
+
+# 32 byte SHA-256 hash (Merkle roots and proof nodes)
+Hash32: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+
+
+# Poll record stored in box storage (box key is 'p' prefix + 8 byte poll ID)
+class Poll(arc4.Struct):
+    title: arc4.DynamicBytes
+    choice_count: arc4.UInt64
+    start_date_unix: arc4.UInt64
+    end_date_unix: arc4.UInt64
+    require_opt_in: arc4.Bool  # Only accounts opted in to the App can vote
+    eligibility_root: Hash32  # Merkle root of eligible addresses (all zero bytes for an open poll)
+    total_votes: arc4.UInt64
+    open_ballots: arc4.UInt64  # Ballot boxes not yet reclaimed
+    ballot_hash: Hash32  # Running hash chain of every ballot cast ('sha256(previous hash + voter + choice)')
+    finalized: arc4.Bool  # Results were frozen by 'finalize_results'
+    winner: arc4.UInt64  # Winning choice number (0 until finalized)
+    winner_margin: arc4.UInt64  # Vote lead of the winner over the runner up (0 on a tie)
+
+
+# Ballot box value (box key is 'v' prefix + 8 byte poll ID + 32 byte account address)
+class Ballot(arc4.Struct):
+    choice: arc4.UInt64
+    mbr_payer: arc4.Address  # Account that paid the ballot box MBR (the voter or a sponsor), refunded on release
+
+
+# ARC-28 events (fixed size layouts, so off-chain decoders can parse logs in bulk, see 'events.py')
+class VoteCast(arc4.Struct):
+    poll_id: arc4.UInt64
+    voter: arc4.Address
+    choice: arc4.UInt64
+
+
+class OptedIn(arc4.Struct):
+    account: arc4.Address
+
+
+class OptedOut(arc4.Struct):
+    account: arc4.Address
+
+
+class PollSetup(arc4.Struct):
+    poll_id: arc4.UInt64
+    choice_count: arc4.UInt64
+    start_date_unix: arc4.UInt64
+    end_date_unix: arc4.UInt64
+
+
+class PollFinalized(arc4.Struct):
+    poll_id: arc4.UInt64
+    winner: arc4.UInt64
+    winner_margin: arc4.UInt64
+    total_votes: arc4.UInt64
+    ballot_hash: Hash32
+
+
+# Whole poll state returned by the read-only 'get_poll_snapshot' method
+class PollSnapshot(arc4.Struct):
+    poll_id: arc4.UInt64
+    title: arc4.DynamicBytes
+    choices: arc4.DynamicArray[arc4.DynamicBytes]
+    start_date_unix: arc4.UInt64
+    end_date_unix: arc4.UInt64
+    require_opt_in: arc4.Bool
+    eligibility_root: Hash32
+    total_votes: arc4.UInt64
+    open_ballots: arc4.UInt64
+    ballot_hash: Hash32
+    finalized: arc4.Bool
+    winner: arc4.UInt64
+    winner_margin: arc4.UInt64
+    tally: arc4.DynamicArray[arc4.UInt64]  # Vote total of every choice (index 0 holds choice number 1)
+
+
+# Voting status of an account in a poll returned by the read-only 'get_voter_status' method
+class VoterStatus(arc4.Struct):
+    opted_in: arc4.Bool
+    votes_cast: arc4.UInt64  # Account vote count across polls (0 when not opted in)
+    voted: arc4.Bool  # Account has a ballot box in the poll
+    choice: arc4.UInt64  # Ballot choice (0 when the account has not voted)
+
 
 class VoteChain(ARC4Contract):
     # Global State type declarations
-    poll_title: Bytes
-    poll_choice1: Bytes
-    poll_choice2: Bytes
-    poll_choice3: Bytes
-
-    poll_start_date_unix: UInt64
-    poll_end_date_unix: UInt64
-    poll_finalized: UInt64
+    next_poll_id: UInt64
+    total_polls: UInt64
 
     total_accounts_opted_in: UInt64
-
-    choice1_total: UInt64
-    choice2_total: UInt64
-    choice3_total: UInt64
-    total_votes: UInt64
+    total_ballot_boxes: UInt64
 
     def __init__(self) -> None:
         super().__init__()
         # Local State type declarations
-        self.local_vote_status = LocalState(
+        self.local_votes_cast = LocalState(
             UInt64,
-            key="vote_status",
-            description="Account vote status ('0' = not voted, '1' = voted)",
+            key="votes_cast",
+            description="Account vote count (number of poll ballots cast while opted in)",
+        )
+        self.local_mbr_payer = LocalState(
+            Account,
+            key="mbr_payer",
+            description="Account that paid the local storage MBR (the account or a sponsor), refunded on close out",
         )
 
-        self.local_vote_choice = LocalState(
-            UInt64,
-            key="vote_choice",
-            description="Account vote choice (based on UInt64 corresponding w/ choice)",
+        # Box Storage type declarations (poll record, poll choices as ARC-4 'byte[][]' keyed by poll ID)
+        self.box_poll = BoxMap(UInt64, Poll, key_prefix="p")
+        self.box_poll_choices = BoxMap(
+            UInt64, arc4.DynamicArray[arc4.DynamicBytes], key_prefix="c"
         )
 
+        # Box Storage type declarations (ballot box key is 'v' prefix + 8 byte poll ID + 32 byte account address)
+        self.box_vote_choice = BoxMap(Bytes, Ballot, key_prefix="v")
+
     # Define subroutine that calculates the minimum balance requirement total cost
     @subroutine
     def calc_mbr(self, num_bytes: UInt64, num_uint: UInt64) -> UInt64:
@@ -64,6 +188,189 @@ class VoteChain(ARC4Contract):
         # Return the minimum balance requirement total cost
         return Global.min_balance + base_fee + total_byte_fee + total_uint_fee
 
+    # Define subroutine that calculates the minimum balance requirement cost of a single box
+    @subroutine
+    def calc_box_mbr(self, key_size: UInt64, value_size: UInt64) -> UInt64:
+        base_fee = UInt64(2_500)  # Base fee per box
+        byte_fee = UInt64(400)  # Fee per byte of box key and box value
+
+        # Return the minimum balance requirement cost of the box
+        return base_fee + byte_fee * (key_size + value_size)
+
+    # Define subroutine that calculates the minimum balance requirement cost of a ballot box
+    @subroutine
+    def calc_ballot_box_mbr(self) -> UInt64:
+        # Ballot box key is 1 byte prefix + 8 byte poll ID + 32 byte address, ballot box value is 8 byte UInt64 choice
+        # + 32 byte MBR payer address
+        return self.calc_box_mbr(key_size=UInt64(41), value_size=UInt64(40))
+
+    # Define subroutine that calculates the minimum balance requirement cost of the poll, choices and tally boxes
+    @subroutine
+    def calc_poll_boxes_mbr(
+        self, poll_size: UInt64, choices_size: UInt64, tally_size: UInt64
+    ) -> UInt64:
+        # Every poll box key is 1 byte prefix + 8 byte poll ID
+        return (
+            self.calc_box_mbr(key_size=UInt64(9), value_size=poll_size)
+            + self.calc_box_mbr(key_size=UInt64(9), value_size=choices_size)
+            + self.calc_box_mbr(key_size=UInt64(9), value_size=tally_size)
+        )
+
+    # Define subroutine that returns the box key of a poll's packed tally ('t' prefix + 8 byte poll ID)
+    @subroutine
+    def poll_tally_key(self, poll_id: UInt64) -> Bytes:
+        return Bytes(b"t") + op.itob(poll_id)
+
+    # Define subroutine that returns the ballot box key of an account for a poll (without the 'v' prefix)
+    @subroutine
+    def ballot_key(self, poll_id: UInt64, account: Account) -> Bytes:
+        return op.itob(poll_id) + account.bytes
+
+    # Define subroutine that checks the voting period and choice of a vote before it is counted
+    @subroutine
+    def validate_vote(self, poll_id: UInt64, choice: UInt64) -> None:
+        assert (
+            Global.latest_timestamp > self.box_poll[poll_id].start_date_unix.native
+        ), "Voting period has not started yet."
+
+        assert (
+            Global.latest_timestamp < self.box_poll[poll_id].end_date_unix.native
+        ), "Voting period has ended."
+
+        assert (
+            choice >= UInt64(1)
+            and choice <= self.box_poll[poll_id].choice_count.native
+        ), "Invalid choice. Can only choose between choice 1 and the poll choice count."
+
+    # Define subroutine that verifies an account's Merkle inclusion proof against a poll's eligibility root
+    @subroutine
+    def verify_eligibility(
+        self, poll_id: UInt64, account: Account, proof: arc4.DynamicArray[Hash32]
+    ) -> None:
+        root = self.box_poll[poll_id].eligibility_root.bytes
+
+        # Polls without an eligibility root are open to every account
+        if root == op.bzero(32):
+            return
+
+        assert proof.length <= UInt64(
+            MAX_PROOF_LENGTH
+        ), "Eligibility proof can not exceed 32 levels."
+
+        # Pool enough opcode budget for hashing every proof level (op-up fees are paid by the voter)
+        ensure_budget(
+            UInt64(MERKLE_LEVEL_OPCODE_BUDGET) * proof.length, OpUpFeeSource.GroupCredit
+        )
+
+        # Fold the proof from the account's leaf up to the root (sibling hashes are concatenated in sorted order)
+        node = op.sha256(Bytes(MERKLE_LEAF_PREFIX) + account.bytes)
+        for i in urange(proof.length):
+            sibling = proof[i].copy()
+            if BigUInt.from_bytes(node) < BigUInt.from_bytes(sibling.bytes):
+                node = op.sha256(Bytes(MERKLE_NODE_PREFIX) + node + sibling.bytes)
+            else:
+                node = op.sha256(Bytes(MERKLE_NODE_PREFIX) + sibling.bytes + node)
+
+        assert node == root, "Account is not eligible to vote in this poll."
+
+    # Define subroutine that builds the message a voter signs to authorize a ballot submitted on their behalf
+    @subroutine
+    def ballot_message(self, poll_id: UInt64, choice: UInt64) -> Bytes:
+        return (
+            Bytes(BALLOT_PREFIX)
+            + op.itob(Global.current_application_id.id)
+            + op.itob(poll_id)
+            + op.itob(choice)
+        )
+
+    # Define subroutine that stores an account's ballot box (w/ the account that paid its MBR) and counts it towards
+    # the account's votes
+    @subroutine
+    def cast_ballot(
+        self, poll_id: UInt64, account: Account, choice: UInt64, mbr_payer: Account
+    ) -> None:
+        ballot_key = self.ballot_key(poll_id, account)
+
+        assert (
+            ballot_key not in self.box_vote_choice
+        ), "This account already submitted a vote."
+
+        if self.box_poll[poll_id].require_opt_in.native:
+            assert account.is_opted_in(
+                Application(Global.current_application_id.id)
+            ), "Account must be opted-in before voting."
+
+        self.validate_vote(poll_id, choice)
+
+        # Create the account's ballot box holding their vote choice and the MBR payer to refund on release
+        self.box_vote_choice[ballot_key] = Ballot(
+            choice=arc4.UInt64(choice), mbr_payer=arc4.Address(mbr_payer)
+        )
+
+        # Fold the ballot into the poll's running ballot hash chain
+        poll = self.box_poll[poll_id].copy()
+        poll.ballot_hash = Hash32.from_bytes(
+            op.sha256(poll.ballot_hash.bytes + account.bytes + op.itob(choice))
+        )
+        self.box_poll[poll_id] = poll.copy()
+
+        # Increment count for total ballot boxes
+        self.total_ballot_boxes += UInt64(1)
+
+        # Increment the account's vote count if the account is opted in
+        if account.is_opted_in(Application(Global.current_application_id.id)):
+            self.local_votes_cast[account] += UInt64(1)
+
+        # Emit event on-chain
+        arc4.emit(
+            VoteCast(
+                poll_id=arc4.UInt64(poll_id),
+                voter=arc4.Address(account),
+                choice=arc4.UInt64(choice),
+            )
+        )
+
+    # Define subroutine that deletes a ballot box and refunds its MBR cost to the account that paid it
+    @subroutine
+    def release_ballot_box(self, ballot_key: Bytes) -> None:
+        mbr_payer = self.box_vote_choice[ballot_key].mbr_payer.native
+        del self.box_vote_choice[ballot_key]
+
+        # Submit inner transaction (MBR payer gets their ballot box mbr payment refunded, e.g. a relayer's sponsor)
+        min_txn_fee = UInt64(1000)
+        itxn.Payment(
+            receiver=mbr_payer,
+            amount=self.calc_ballot_box_mbr() - min_txn_fee,
+            sender=Global.current_application_address,
+            fee=min_txn_fee,
+            note="MBR refund for reclaiming ballot box.",
+        ).submit()
+
+    # Define subroutine that removes released ballot boxes from the poll and App totals
+    @subroutine
+    def count_released_ballots(self, poll_id: UInt64, ballot_count: UInt64) -> None:
+        # Decrease the total count of ballot boxes (poll wide and App wide)
+        poll = self.box_poll[poll_id].copy()
+        poll.open_ballots = arc4.UInt64(poll.open_ballots.native - ballot_count)
+        self.box_poll[poll_id] = poll.copy()
+
+        self.total_ballot_boxes -= ballot_count
+
+        # Once the last ballot box is released the packed tally is logged as the poll's compact final record
+        if poll.open_ballots.native == UInt64(0):
+            tally, tally_exists = op.Box.get(self.poll_tally_key(poll_id))
+            assert tally_exists, "Poll tally does not exist."
+            log("Final poll tally: ", tally)
+
+    # Define subroutine that adds valid votes to a poll's record totals
+    @subroutine
+    def count_poll_votes(self, poll_id: UInt64, vote_count: UInt64) -> None:
+        # Increment count for total votes and open ballots of the poll
+        poll = self.box_poll[poll_id].copy()
+        poll.total_votes = arc4.UInt64(poll.total_votes.native + vote_count)
+        poll.open_ballots = arc4.UInt64(poll.open_ballots.native + vote_count)
+        self.box_poll[poll_id] = poll.copy()
+
     # Define abimethod that creates the smart contract App
     @arc4.abimethod(create="require")
     def generate(self) -> None:
@@ -73,14 +380,11 @@ class VoteChain(ARC4Contract):
         ), "Transaction sender must match creator address."
 
         # Global storage variable assignments
-        self.total_accounts_opted_in = UInt64(0)
+        self.next_poll_id = UInt64(0)
+        self.total_polls = UInt64(0)
 
-        self.poll_finalized = UInt64(0)
-
-        self.choice1_total = UInt64(0)
-        self.choice2_total = UInt64(0)
-        self.choice3_total = UInt64(0)
-        self.total_votes = UInt64(0)
+        self.total_accounts_opted_in = UInt64(0)
+        self.total_ballot_boxes = UInt64(0)
 
         # Log info on-chain
         arc4.emit("View(uint64)", Global.current_application_id.id)
@@ -94,7 +398,7 @@ class VoteChain(ARC4Contract):
     def global_storage_mbr(self, mbr_pay: gtxn.PaymentTransaction) -> None:
         # Make necessary assertions to verify transaction requirements
         assert mbr_pay.amount == self.calc_mbr(
-            num_bytes=UInt64(4), num_uint=UInt64(8)  # Calc MBR for using global schema
+            num_bytes=UInt64(0), num_uint=UInt64(4)  # Calc MBR for using global schema
         ), "MBR payment must meet the minimum requirement amount."
         assert (
             mbr_pay.sender == Global.creator_address
@@ -113,77 +417,72 @@ class VoteChain(ARC4Contract):
     ) -> None:
         # Make necessary assertions to verify transaction requirements
         assert mbr_pay.amount == self.calc_mbr(
-            num_bytes=UInt64(0), num_uint=UInt64(2)  # Calc MBR for using local schema
+            num_bytes=UInt64(1), num_uint=UInt64(1)  # Calc MBR for using local schema
         ), "MBR payment must meet the minimum requirement amount."
+        # The MBR payment may come from a sponsor (relayer) that also covers the zero fee opt-in call via fee pooling
         assert (
-            mbr_pay.sender == account
-        ), "MBR payment sender must match the account opting in."
+            Txn.sender == account
+        ), "Transaction sender must match the account opting in."
         assert (
             mbr_pay.receiver == Global.current_application_address
         ), "MBR payment reciever must be the App address."
 
-        # Change local state var 'self.local_vote_status' (specific to account) value from 'None' to '0'
-        self.local_vote_status[account] = UInt64(0)
+        # Change local state var 'self.local_votes_cast' (specific to account) value from 'None' to '0'
+        self.local_votes_cast[account] = UInt64(0)
 
-        # Change local state var 'self.local_vote_choice' (specific to account) value from 'None' to '0'
-        self.local_vote_choice[account] = UInt64(0)
+        # Record who paid the MBR, so closing out refunds the payer (the account or a sponsor)
+        self.local_mbr_payer[account] = mbr_pay.sender
 
         # Increment count for total accounts opted in
         self.total_accounts_opted_in += UInt64(1)
 
-        # Log info on-chain
-        log("Local State successfully funded by account address: ", Txn.sender)
+        # Emit event on-chain
+        arc4.emit(OptedIn(account=arc4.Address(account)))
 
     # Define abimethod that allows any user to opt out of the smart contract's local storage via the 'close out' method
     @arc4.abimethod(allow_actions=["CloseOut"])
     def opt_out(self, account: Account) -> None:
-        # Make necessary assertions to verify transaction requirements
+        # Make necessary assertions to verify transaction requirements (ballots live in box storage, so an
+        # account can opt out at any time without affecting the polls it voted in)
         assert account.is_opted_in(
             Application(Global.current_application_id.id)
         ), "Account must first be opted-in to App client in order to close out."
 
-        assert (  # Account is opted-in and hasn't voted yet
-            account.is_opted_in(Application(Global.current_application_id.id))
-            and self.local_vote_choice[account] == UInt64(0)
-        ) or (  # Account is opted-in and has voted and voting period is over
-            account.is_opted_in(Application(Global.current_application_id.id))
-            and self.local_vote_choice[account] != UInt64(0)
-            and Global.latest_timestamp > self.poll_end_date_unix
-        ), "Requirements for opting-out of App client are insufficient."
-
-        # Delete the user's local storage
-        del self.local_vote_status[account]
-        del self.local_vote_choice[account]
+        # Delete the user's local storage (keeping the MBR payer to refund)
+        mbr_payer = self.local_mbr_payer[account]
+        del self.local_votes_cast[account]
+        del self.local_mbr_payer[account]
 
         # Decrease the total count of opted-in accounts
         self.total_accounts_opted_in -= UInt64(1)
 
-        # Submit inner transaction (account gets their mbr payment refunded)
+        # Submit inner transaction (MBR payer gets their mbr payment refunded)
         min_txn_fee = UInt64(1000)
         itxn.Payment(
-            receiver=account,
-            amount=self.calc_mbr(num_bytes=UInt64(0), num_uint=UInt64(2)) - min_txn_fee,
+            receiver=mbr_payer,
+            amount=self.calc_mbr(num_bytes=UInt64(1), num_uint=UInt64(1)) - min_txn_fee,
             sender=Global.current_application_address,
             fee=min_txn_fee,
             note="MBR refund for closing out.",
         ).submit()
 
-        # Log info on-chain
-        log("Close-out method successful for account address: ", account)
+        # Emit event on-chain
+        arc4.emit(OptedOut(account=arc4.Address(account)))
 
-    # Define abimethod that allows the creator to set up the poll values
+    # Define abimethod that allows the creator to set up a new poll and pay the MBR cost of the poll boxes
     @arc4.abimethod()
     def setup_poll(
         self,
+        mbr_pay: gtxn.PaymentTransaction,
         title: Bytes,
-        choice1: Bytes,
-        choice2: Bytes,
-        choice3: Bytes,
+        choices: arc4.DynamicArray[arc4.DynamicBytes],
+        require_opt_in: arc4.Bool,
+        eligibility_root: Hash32,
         start_date_str: String,
         start_date_unix: UInt64,
         end_date_str: String,
         end_date_unix: UInt64,
-    ) -> None:
+    ) -> UInt64:
         # Make necessary assertions to verify transaction requirements
         assert (
             Txn.sender == Global.creator_address
@@ -191,11 +490,14 @@ class VoteChain(ARC4Contract):
 
         assert (title.length <= UInt64(118)), "Poll title size can not exceed 118 bytes of data per key-value."
 
-        assert (
-            choice1.length <= UInt64(116) and
-            choice2.length <= UInt64(116) and
-            choice3.length <= UInt64(116)
-        ), "Poll choice size cannot exceed 116 bytes of data per key-value."
+        assert choices.length >= UInt64(2) and choices.length <= UInt64(
+            MAX_POLL_CHOICES
+        ), "Poll must have between 2 and 32 choices."
+
+        for i in urange(choices.length):
+            assert choices[i].length <= UInt64(
+                116
+            ), "Poll choice size cannot exceed 116 bytes of data per choice."
 
         # UNCOMMENT WHEN DONE TESTING!
         # assert (
@@ -218,66 +520,381 @@ class VoteChain(ARC4Contract):
             14 * 24 * 60 * 60
         ), "Voting period can not exceed 14 days."
 
-        assert self.poll_finalized == UInt64(0), "Poll can only be setup once."
+        # Assign the next poll ID to the new poll
+        poll_id = self.next_poll_id
+
+        poll = Poll(
+            title=arc4.DynamicBytes(title),
+            choice_count=arc4.UInt64(choices.length),
+            start_date_unix=arc4.UInt64(start_date_unix),
+            end_date_unix=arc4.UInt64(end_date_unix),
+            require_opt_in=require_opt_in,
+            eligibility_root=eligibility_root.copy(),
+            total_votes=arc4.UInt64(0),
+            open_ballots=arc4.UInt64(0),
+            ballot_hash=Hash32.from_bytes(op.bzero(32)),
+            finalized=arc4.Bool(),
+            winner=arc4.UInt64(0),
+            winner_margin=arc4.UInt64(0),
+        )
+
+        # Poll tally holds one UInt64 (8 bytes) vote total per choice
+        tally_size = choices.length * UInt64(8)
+
+        assert mbr_pay.amount == self.calc_poll_boxes_mbr(
+            poll_size=poll.bytes.length,
+            choices_size=choices.bytes.length,
+            tally_size=tally_size,
+        ), "MBR payment must meet the minimum requirement amount."
+        assert (
+            mbr_pay.sender == Global.creator_address
+        ), "MBR payment sender must match the App creator account."
+        assert (
+            mbr_pay.receiver == Global.current_application_address
+        ), "MBR payment reciever must be the App address."
+
+        # Store the poll record and choices, and create the poll tally (box bytes are zeroed on creation)
+        self.box_poll[poll_id] = poll.copy()
+        self.box_poll_choices[poll_id] = choices.copy()
+        assert op.Box.create(self.poll_tally_key(poll_id), tally_size), "Poll tally already exists."
 
         # Update global schema values
-        self.poll_title = title
-        self.poll_choice1 = choice1
-        self.poll_choice2 = choice2
-        self.poll_choice3 = choice3
-        self.poll_start_date_unix = start_date_unix
-        self.poll_end_date_unix = end_date_unix
+        self.next_poll_id += UInt64(1)
+        self.total_polls += UInt64(1)
+
+        # Emit event on-chain
+        arc4.emit(
+            PollSetup(
+                poll_id=arc4.UInt64(poll_id),
+                choice_count=arc4.UInt64(choices.length),
+                start_date_unix=arc4.UInt64(start_date_unix),
+                end_date_unix=arc4.UInt64(end_date_unix),
+            )
+        )
+
+        return poll_id
+
+    # Define abimethod that allows any user to submit their vote to box storage and pay its MBR cost in the same group
+    @arc4.abimethod()
+    def submit_vote(
+        self,
+        poll_id: UInt64,
+        account: Account,
+        mbr_pay: gtxn.PaymentTransaction,
+        choice: UInt64,
+        proof: arc4.DynamicArray[Hash32],
+    ) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert poll_id in self.box_poll, "Poll does not exist."
+
+        assert (
+            mbr_pay.amount == self.calc_ballot_box_mbr()
+        ), "MBR payment must meet the minimum requirement amount."
+        # The MBR payment may come from a sponsor (relayer) that also covers the zero fee vote call via fee pooling
+        assert (
+            Txn.sender == account
+        ), "Transaction sender must match the account voting."
+        assert (
+            mbr_pay.receiver == Global.current_application_address
+        ), "MBR payment reciever must be the App address."
+
+        self.verify_eligibility(poll_id, account, proof)
+
+        self.cast_ballot(poll_id, account, choice, mbr_pay.sender)
+
+        # Update vote tally (choice number 'n' total is the UInt64 stored at byte offset '(n - 1) * 8')
+        tally_key = self.poll_tally_key(poll_id)
+        offset = (choice - UInt64(1)) * UInt64(8)
+        choice_total = op.btoi(op.Box.extract(tally_key, offset, UInt64(8)))
+        op.Box.replace(tally_key, offset, op.itob(choice_total + UInt64(1)))
 
-        self.poll_finalized = UInt64(1)  # finalize poll
+        self.count_poll_votes(poll_id, UInt64(1))
+
+    # Define abimethod that allows a relayer to submit a batch of signed votes and pay their MBR cost in one group
+    @arc4.abimethod()
+    def submit_vote_batch(
+        self,
+        poll_id: UInt64,
+        mbr_pay: gtxn.PaymentTransaction,
+        voters: arc4.DynamicArray[arc4.Address],
+        choices: arc4.DynamicArray[arc4.UInt64],
+        signatures: arc4.DynamicArray[arc4.DynamicBytes],
+    ) -> None:
+        batch_size = voters.length
+
+        # Make necessary assertions to verify transaction requirements
+        assert poll_id in self.box_poll, "Poll does not exist."
+
+        assert batch_size > UInt64(0), "Vote batch must contain at least one ballot."
+        assert batch_size <= UInt64(
+            MAX_BATCH_SIZE
+        ), "Vote batch size can not exceed 3 ballots."
+        assert (
+            choices.length == batch_size and signatures.length == batch_size
+        ), "Vote batch voters, choices and signatures must have matching lengths."
+
+        # A batch has no room left in its app args for per voter eligibility proofs
+        assert (
+            self.box_poll[poll_id].eligibility_root.bytes == op.bzero(32)
+        ), "Polls with an eligibility root only accept votes via 'submit_vote'."
+
+        assert (
+            mbr_pay.amount == self.calc_ballot_box_mbr() * batch_size
+        ), "MBR payment must meet the minimum requirement amount."
+        assert (
+            mbr_pay.receiver == Global.current_application_address
+        ), "MBR payment reciever must be the App address."
+
+        # Pool enough opcode budget for verifying every ballot signature (op-up fees are paid by the relayer)
+        ensure_budget(
+            UInt64(BALLOT_OPCODE_BUDGET) * batch_size, OpUpFeeSource.GroupCredit
+        )
+
+        # Read the packed tally once so box storage is only updated once per batch
+        tally_key = self.poll_tally_key(poll_id)
+        tally, tally_exists = op.Box.get(tally_key)
+        assert tally_exists, "Poll tally does not exist."
+
+        for i in urange(batch_size):
+            voter = voters[i].native
+            choice = choices[i].native
+            signature = signatures[i].native
+
+            assert op.ed25519verify_bare(
+                self.ballot_message(poll_id, choice), signature, voter.bytes
+            ), "Ballot signature must be signed by the voting account."
+
+            self.cast_ballot(poll_id, voter, choice, mbr_pay.sender)
+
+            offset = (choice - UInt64(1)) * UInt64(8)
+            tally = op.replace(
+                tally, offset, op.itob(op.extract_uint64(tally, offset) + UInt64(1))
+            )
+
+        # Update vote tally
+        op.Box.put(tally_key, tally)
+
+        self.count_poll_votes(poll_id, batch_size)
 
         # Log info on-chain
-        log("Poll start date: ", start_date_str)
-        log("Poll end date: ", end_date_str)
+        log("Vote batch submitted successfully with ballot count: ", batch_size)
 
-    # Define abimethod that allows any user to submit their vote
-    @arc4.abimethod
-    def submit_vote(self, account: Account, choice: UInt64) -> None:
+    # Define abimethod that allows anyone to freeze the results of a poll after the voting period
+    @arc4.abimethod()
+    def finalize_results(self, poll_id: UInt64) -> UInt64:
         # Make necessary assertions to verify transaction requirements
-        assert account.is_opted_in(
-            Application(Global.current_application_id.id)
-        ), "Account must be opted-in before voting."
+        assert poll_id in self.box_poll, "Poll does not exist."
+
+        poll = self.box_poll[poll_id].copy()
+
+        assert not poll.finalized.native, "Poll results are already finalized."
 
         assert (
-            Global.latest_timestamp > self.poll_start_date_unix
-        ), "Voting period has not started yet."
+            Global.latest_timestamp > poll.end_date_unix.native
+        ), "Poll results can only be finalized after the voting period is over."
+
+        # Pool enough opcode budget for scanning the whole tally (op-up fees are paid by the caller)
+        ensure_budget(UInt64(FINALIZE_OPCODE_BUDGET), OpUpFeeSource.GroupCredit)
+
+        tally, tally_exists = op.Box.get(self.poll_tally_key(poll_id))
+        assert tally_exists, "Poll tally does not exist."
+
+        # Find the winner and runner up totals in one pass (ties go to the lowest choice number w/ a zero margin)
+        winner = UInt64(0)
+        winner_total = UInt64(0)
+        runner_up_total = UInt64(0)
+        for i in urange(poll.choice_count.native):
+            choice_total = op.extract_uint64(tally, i * UInt64(8))
+            if winner == UInt64(0) or choice_total > winner_total:
+                runner_up_total = winner_total
+                winner = i + UInt64(1)
+                winner_total = choice_total
+            elif choice_total > runner_up_total:
+                runner_up_total = choice_total
+
+        # Freeze the results in the poll record
+        poll.finalized = arc4.Bool(True)  # noqa: FBT003 ('arc4.Bool' only takes its value positionally)
+        poll.winner = arc4.UInt64(winner)
+        poll.winner_margin = arc4.UInt64(winner_total - runner_up_total)
+        self.box_poll[poll_id] = poll.copy()
+
+        # Emit event on-chain
+        arc4.emit(
+            PollFinalized(
+                poll_id=arc4.UInt64(poll_id),
+                winner=poll.winner,
+                winner_margin=poll.winner_margin,
+                total_votes=poll.total_votes,
+                ballot_hash=poll.ballot_hash.copy(),
+            )
+        )
+
+        return winner
+
+    # Define read-only abimethod that returns the whole state of a poll in one call (meant to be simulated)
+    # NOTE: Snapshots of polls with close to 32 max size choices exceed the 4,096 byte AVM value limit, those polls
+    # can only be read via their boxes
+    @arc4.abimethod(readonly=True)
+    def get_poll_snapshot(self, poll_id: UInt64) -> PollSnapshot:
+        assert poll_id in self.box_poll, "Poll does not exist."
+
+        poll = self.box_poll[poll_id].copy()
+
+        tally, tally_exists = op.Box.get(self.poll_tally_key(poll_id))
+        assert tally_exists, "Poll tally does not exist."
+
+        # The packed tally already is the ARC-4 encoding of the tally items, prefix it with the 2 byte item count
+        tally_array = arc4.DynamicArray[arc4.UInt64].from_bytes(
+            op.extract(op.itob(poll.choice_count.native), 6, 2) + tally
+        )
+
+        return PollSnapshot(
+            poll_id=arc4.UInt64(poll_id),
+            title=poll.title.copy(),
+            choices=self.box_poll_choices[poll_id].copy(),
+            start_date_unix=poll.start_date_unix,
+            end_date_unix=poll.end_date_unix,
+            require_opt_in=poll.require_opt_in,
+            eligibility_root=poll.eligibility_root.copy(),
+            total_votes=poll.total_votes,
+            open_ballots=poll.open_ballots,
+            ballot_hash=poll.ballot_hash.copy(),
+            finalized=poll.finalized,
+            winner=poll.winner,
+            winner_margin=poll.winner_margin,
+            tally=tally_array.copy(),
+        )
+
+    # Define read-only abimethod that returns the voting status of an account in a poll (meant to be simulated in bulk)
+    @arc4.abimethod(readonly=True)
+    def get_voter_status(self, poll_id: UInt64, account: Account) -> VoterStatus:
+        votes_cast, opted_in = self.local_votes_cast.maybe(account)
+
+        ballot_key = self.ballot_key(poll_id, account)
+        voted = ballot_key in self.box_vote_choice
+        choice = UInt64(0)
+        if voted:
+            choice = self.box_vote_choice[ballot_key].choice.native
+
+        return VoterStatus(
+            opted_in=arc4.Bool(opted_in),
+            votes_cast=arc4.UInt64(votes_cast),
+            voted=arc4.Bool(voted),
+            choice=arc4.UInt64(choice),
+        )
+
+    # Define abimethod that deletes an account's ballot box after the voting period and refunds the MBR payer
+    @arc4.abimethod()
+    def box_opt_out(self, poll_id: UInt64, account: Account) -> None:
+        ballot_key = self.ballot_key(poll_id, account)
 
+        # Make necessary assertions to verify transaction requirements
         assert (
-            Global.latest_timestamp < self.poll_end_date_unix
-        ), "Voting period has ended."
+            ballot_key in self.box_vote_choice
+        ), "Account must have a ballot box in order to reclaim it."
 
-        assert self.local_vote_choice[account] == UInt64(
-            0
-        ), "This account already submitted a vote."
+        assert (
+            Txn.sender == account or Txn.sender == Global.creator_address
+        ), "Only the voting account or App creator can reclaim a ballot box."
 
         assert (
-            choice == UInt64(1) or choice == UInt64(2) or choice == UInt64(3)
-        ), "Invalid choice. Can only choose between choices 1, 2, 3."
+            Global.latest_timestamp > self.box_poll[poll_id].end_date_unix.native
+        ), "Ballot boxes can only be reclaimed after the voting period is over."
 
-        # Mark the account as having voted
-        self.local_vote_status[account] = UInt64(1)
+        # Delete the account's ballot box and refund its MBR cost to the MBR payer
+        self.release_ballot_box(ballot_key)
+        self.count_released_ballots(poll_id, UInt64(1))
 
-        # Increment count for total votes
-        self.total_votes += UInt64(1)
+        # Log info on-chain
+        log("Ballot box reclaimed for account address: ", account)
 
-        # Update vote tally
-        if choice == UInt64(1):
-            self.choice1_total += UInt64(1)
-            self.local_vote_choice[account] = UInt64(1)
-        elif choice == UInt64(2):
-            self.choice2_total += UInt64(1)
-            self.local_vote_choice[account] = UInt64(2)
-        else:
-            self.choice3_total += UInt64(1)
-            self.local_vote_choice[account] = UInt64(3)
+    # Define abimethod that allows the creator to release a batch of ballot boxes after the voting period and refund
+    # every ballot box MBR cost to the account that paid it
+    @arc4.abimethod()
+    def sweep(
+        self, poll_id: UInt64, accounts: arc4.DynamicArray[arc4.Address]
+    ) -> UInt64:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            Txn.sender == Global.creator_address
+        ), "Only App creator can sweep ballot boxes."
+
+        assert poll_id in self.box_poll, "Poll does not exist."
+
+        assert (
+            Global.latest_timestamp > self.box_poll[poll_id].end_date_unix.native
+        ), "Ballot boxes can only be swept after the voting period is over."
+
+        assert accounts.length <= UInt64(
+            MAX_SWEEP_SIZE
+        ), "Sweep batch size can not exceed 3 ballot boxes."
+
+        # Accounts without a ballot box (e.g. already reclaimed by the voter) are skipped so sweeps can be retried
+        swept_count = UInt64(0)
+        for i in urange(accounts.length):
+            account = accounts[i].native
+            ballot_key = self.ballot_key(poll_id, account)
+
+            if ballot_key in self.box_vote_choice:
+                self.release_ballot_box(ballot_key)
+                swept_count += UInt64(1)
+
+        if swept_count > UInt64(0):
+            self.count_released_ballots(poll_id, swept_count)
 
         # Log info on-chain
-        log("Vote submitted successfully for account address: ", account)
-        log("Vote submitted for choice number: ", choice)
+        log("Sweep successful with ballot box count: ", swept_count)
+
+        return swept_count
+
+    # Define abimethod that allows the creator to delete a closed poll and get the poll boxes MBR cost refunded
+    @arc4.abimethod()
+    def delete_poll(self, poll_id: UInt64) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            Txn.sender == Global.creator_address
+        ), "Only App creator can delete a poll."
+
+        assert poll_id in self.box_poll, "Poll does not exist."
+
+        assert (
+            Global.latest_timestamp > self.box_poll[poll_id].end_date_unix.native
+        ), "Poll can only be deleted after the voting period is over."
+
+        assert (
+            self.box_poll[poll_id].open_ballots.native == UInt64(0)
+        ), "All ballot boxes of the poll must be reclaimed before deleting it."
+
+        tally_key = self.poll_tally_key(poll_id)
+        tally_size, tally_exists = op.Box.length(tally_key)
+        assert tally_exists, "Poll tally does not exist."
+
+        poll_boxes_mbr = self.calc_poll_boxes_mbr(
+            poll_size=self.box_poll.length(poll_id),
+            choices_size=self.box_poll_choices.length(poll_id),
+            tally_size=tally_size,
+        )
+
+        # Delete the poll boxes
+        del self.box_poll[poll_id]
+        del self.box_poll_choices[poll_id]
+        assert op.Box.delete(tally_key), "Poll tally does not exist."
+
+        # Decrease the total count of polls
+        self.total_polls -= UInt64(1)
+
+        # Submit inner transaction (creator gets their poll boxes mbr payment refunded)
+        min_txn_fee = UInt64(1000)
+        itxn.Payment(
+            receiver=Global.creator_address,
+            amount=poll_boxes_mbr - min_txn_fee,
+            sender=Global.current_application_address,
+            fee=min_txn_fee,
+            note="MBR refund for deleting poll.",
+        ).submit()
+
+        # Log info on-chain
+        log("Poll deletion successful for poll ID: ", poll_id)
 
     # Define abimethod that allows the creator to delete App and get their global schema MBR cost refunded
     @arc4.abimethod(allow_actions=["DeleteApplication"])
@@ -287,11 +904,19 @@ class VoteChain(ARC4Contract):
             Txn.sender == Global.creator_address
         ), "Only App creator can terminate the App."
 
+        assert (
+            self.total_ballot_boxes == UInt64(0)
+        ), "All ballot boxes must be reclaimed before terminating the App."
+
+        assert (
+            self.total_polls == UInt64(0)
+        ), "All polls must be deleted before terminating the App."
+
         # Submit inner transaction (creator gets their mbr payment refunded)
         min_txn_fee = UInt64(1000)
         itxn.Payment(
             receiver=Global.creator_address,
-            amount=self.calc_mbr(num_bytes=UInt64(0), num_uint=UInt64(8)) - min_txn_fee,
+            amount=self.calc_mbr(num_bytes=UInt64(0), num_uint=UInt64(4)) - min_txn_fee,
             sender=Global.current_application_address,
             fee=min_txn_fee,
             note="MBR refund for deleting App.",
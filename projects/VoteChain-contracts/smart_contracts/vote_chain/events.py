@@ -0,0 +1,93 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import array
+import dataclasses
+import struct
+from collections.abc import Iterable
+
+from algosdk.encoding import checksum
+
+
+@dataclasses.dataclass(frozen=True)
+class EventLayout:
+    name: str
+    fields: tuple[str, ...]
+    arc4_types: tuple[str, ...]  # 'uint64', 'address' or 'byte[32]' per field
+
+    @property
+    def signature(self) -> str:
+        return f"{self.name}({','.join(self.arc4_types)})"
+
+    @property
+    def selector(self) -> bytes:
+        """Returns the ARC-28 event selector (first 4 bytes of the SHA-512/256 hash of the event signature)"""
+
+        return bytes(checksum(self.signature.encode())[:4])
+
+    @property
+    def body(self) -> struct.Struct:
+        """Returns the fixed size binary layout of the event body (logged after the selector)"""
+
+        return struct.Struct(
+            ">" + "".join("Q" if arc4_type == "uint64" else "32s" for arc4_type in self.arc4_types)
+        )
+
+
+# ARC-28 events emitted by the VoteChain contract (must match the event structs in contract.py)
+EVENT_LAYOUTS = (
+    EventLayout(
+        name="VoteCast",
+        fields=("poll_id", "voter", "choice"),
+        arc4_types=("uint64", "address", "uint64"),
+    ),
+    EventLayout(name="OptedIn", fields=("account",), arc4_types=("address",)),
+    EventLayout(name="OptedOut", fields=("account",), arc4_types=("address",)),
+    EventLayout(
+        name="PollSetup",
+        fields=("poll_id", "choice_count", "start_date_unix", "end_date_unix"),
+        arc4_types=("uint64", "uint64", "uint64", "uint64"),
+    ),
+    EventLayout(
+        name="PollFinalized",
+        fields=("poll_id", "winner", "winner_margin", "total_votes", "ballot_hash"),
+        arc4_types=("uint64", "uint64", "uint64", "uint64", "byte[32]"),
+    ),
+)
+
+_LAYOUTS_BY_SELECTOR = {layout.selector: layout for layout in EVENT_LAYOUTS}
+
+# Decoded events as columns: event name -> field name -> column ('uint64' fields are 'array.array("Q")' columns,
+# 'address' and 'byte[32]' fields are lists of 32 byte values, encode addresses w/ 'algosdk.encoding.encode_address')
+EventColumns = dict[str, dict[str, "array.array[int] | list[bytes]"]]
+
+
+# Decodes raw log entries (e.g. every log of thousands of transactions) into columns per event in a single pass,
+# log entries that are not VoteChain events (plain logs, ABI return values) are skipped
+def decode_events(logs: Iterable[bytes]) -> EventColumns:
+    bodies: dict[bytes, list[bytes]] = {selector: [] for selector in _LAYOUTS_BY_SELECTOR}
+
+    # Bucket the event bodies by selector so every event type is unpacked with one 'iter_unpack' call
+    for entry in logs:
+        selector_bodies = bodies.get(entry[:4])
+        if selector_bodies is not None:
+            selector_bodies.append(entry[4:])
+
+    columns: EventColumns = {}
+    for selector, layout in _LAYOUTS_BY_SELECTOR.items():
+        body = layout.body
+        rows = [
+            event_body for event_body in bodies[selector] if len(event_body) == body.size
+        ]
+        values = (
+            list(zip(*body.iter_unpack(b"".join(rows)), strict=True))
+            if rows
+            else [() for _ in layout.fields]
+        )
+
+        columns[layout.name] = {
+            field: array.array("Q", column) if arc4_type == "uint64" else list(column)
+            for field, arc4_type, column in zip(
+                layout.fields, layout.arc4_types, values, strict=True
+            )
+        }
+
+    return columns
@@ -0,0 +1,191 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import base64
+import csv
+import logging
+import typing
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from algosdk.encoding import encode_address
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts.vote_chain.events import EVENT_LAYOUTS, EventLayout
+
+logger = logging.getLogger(__name__)
+
+# Transactions per indexer page (the indexer's max page size)
+INDEXER_PAGE_SIZE = 1000
+
+# Rows buffered per written batch (bounds memory, however many ballots a poll has)
+DEFAULT_BATCH_SIZE = 50_000
+
+# Events exported as rows: one 'VoteCast' per ballot ('submit_vote', batched and sponsored votes), one 'OptedOut'
+# per 'opt_out' (logged events are decoded instead of app args so every way of voting is covered)
+_EXPORTED_LAYOUTS = {
+    layout.selector: layout for layout in EVENT_LAYOUTS if layout.name in ("VoteCast", "OptedOut")
+}
+
+EXPORT_COLUMNS = ("round", "round_time", "tx_id", "event", "poll_id", "account", "choice", "fee")
+
+
+class ExportRow(typing.NamedTuple):
+    confirmed_round: int  # Written as the 'round' column
+    round_time: int  # Unix timestamp of the round
+    tx_id: str  # ID of the top level transaction (inner transactions have no ID of their own)
+    event: str  # 'VoteCast' or 'OptedOut'
+    poll_id: int | None  # None for 'OptedOut'
+    account: str
+    choice: int | None  # None for 'OptedOut'
+    fee: int  # Fee of the App call that logged the event (sponsored calls log a zero fee)
+
+
+# Pages through every transaction of the App in the indexer, one page held in memory at a time
+def iter_app_transactions(
+    indexer_client: IndexerClient,
+    app_id: int,
+    min_round: int | None = None,
+    page_size: int = INDEXER_PAGE_SIZE,
+) -> Iterator[dict[str, typing.Any]]:
+    next_token = ""
+    while True:
+        response = indexer_client.search_transactions(
+            application_id=app_id, min_round=min_round, limit=page_size, next_page=next_token
+        )
+        yield from response["transactions"]
+
+        next_token = response.get("next-token", "")
+        if not next_token or not response["transactions"]:
+            break
+
+
+# Returns the (App call, log entry) pairs of every call to the App within a transaction tree (the indexer returns the
+# top level transaction when an inner transaction of another App calls the App)
+def _iter_app_logs(txn: dict[str, typing.Any], app_id: int) -> Iterator[tuple[dict[str, typing.Any], bytes]]:
+    app_call_fields: dict[str, typing.Any] = txn.get("application-transaction", {})
+    if app_call_fields.get("application-id") == app_id:
+        yield from ((txn, base64.b64decode(entry)) for entry in txn.get("logs", []))
+
+    for inner_txn in txn.get("inner-txns", []):
+        yield from _iter_app_logs(inner_txn, app_id)
+
+
+def _decode_row(
+    txn: dict[str, typing.Any], app_call: dict[str, typing.Any], layout: EventLayout, values: tuple[int | bytes, ...]
+) -> ExportRow:
+    fields = dict(zip(layout.fields, values, strict=True))
+    account = fields["voter"] if layout.name == "VoteCast" else fields["account"]
+
+    return ExportRow(
+        confirmed_round=txn["confirmed-round"],
+        round_time=txn["round-time"],
+        tx_id=txn["id"],
+        event=layout.name,
+        poll_id=typing.cast(int | None, fields.get("poll_id")),
+        account=encode_address(account),
+        choice=typing.cast(int | None, fields.get("choice")),
+        fee=app_call.get("fee", 0),
+    )
+
+
+# Decodes the ballots and opt-outs of a transaction stream into rows (optionally of a single poll)
+def iter_export_rows(
+    txns: Iterable[dict[str, typing.Any]], app_id: int, poll_id: int | None = None
+) -> Iterator[ExportRow]:
+    for txn in txns:
+        for app_call, entry in _iter_app_logs(txn, app_id):
+            layout = _EXPORTED_LAYOUTS.get(entry[:4])
+            if layout is None or len(entry) - 4 != layout.body.size:
+                continue
+
+            row = _decode_row(txn, app_call, layout, layout.body.unpack(entry[4:]))
+            # Opt-outs are not tied to a poll, so they are exported for every poll
+            if poll_id is None or row.poll_id is None or row.poll_id == poll_id:
+                yield row
+
+
+# Groups rows into batches of columns (column name -> values), the unit written to the output file
+def iter_column_batches(
+    rows: Iterable[ExportRow], batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[dict[str, list[int | str | None]]]:
+    columns: dict[str, list[int | str | None]] = {column: [] for column in EXPORT_COLUMNS}
+    batch_rows = 0
+
+    for row in rows:
+        for column, value in zip(EXPORT_COLUMNS, typing.cast(tuple[int | str | None, ...], row), strict=True):
+            columns[column].append(value)
+        batch_rows += 1
+
+        if batch_rows == batch_size:
+            yield columns
+            columns = {column: [] for column in EXPORT_COLUMNS}
+            batch_rows = 0
+
+    if batch_rows:
+        yield columns
+
+
+def write_csv(batches: Iterable[dict[str, list[int | str | None]]], path: Path) -> int:
+    rows_written = 0
+    with path.open("w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(EXPORT_COLUMNS)
+        for columns in batches:
+            writer.writerows(zip(*(columns[column] for column in EXPORT_COLUMNS), strict=True))
+            rows_written += len(columns["round"])
+
+    return rows_written
+
+
+# Writes every batch as a Parquet row group (needs the optional 'pyarrow' dependency, 'poetry install -E export')
+def write_parquet(batches: Iterable[dict[str, list[int | str | None]]], path: Path) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise RuntimeError("Parquet export needs pyarrow, install it w/ 'poetry install -E export'") from error
+
+    schema = pa.schema(
+        [
+            ("round", pa.uint64()),
+            ("round_time", pa.uint64()),
+            ("tx_id", pa.string()),
+            ("event", pa.string()),
+            ("poll_id", pa.uint64()),
+            ("account", pa.string()),
+            ("choice", pa.uint64()),
+            ("fee", pa.uint64()),
+        ]
+    )
+
+    rows_written = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for columns in batches:
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            rows_written += len(columns["round"])
+
+    return rows_written
+
+
+# Exports every ballot and opt-out of the App (or of a single poll) to a '.csv' or '.parquet' file, streaming
+# indexer pages through the decoder into batched writes, returns the number of rows written
+def export_vote_history(
+    indexer_client: IndexerClient,
+    app_id: int,
+    path: Path,
+    poll_id: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    match path.suffix:
+        case ".csv":
+            write = write_csv
+        case ".parquet":
+            write = write_parquet
+        case _:
+            raise ValueError(f"Unsupported export format '{path.suffix}', use '.csv' or '.parquet'")
+
+    txns = iter_app_transactions(indexer_client, app_id)
+    rows = iter_export_rows(txns, app_id, poll_id)
+    rows_written = write(iter_column_batches(rows, batch_size), path)
+
+    logger.info(f"Exported {rows_written} rows of App {app_id} to {path}")
+    return rows_written
@@ -0,0 +1,245 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import array
+import base64
+import dataclasses
+import json
+import logging
+import typing
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from algosdk.encoding import encode_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.vote_chain.blocks import BlockCache
+from smart_contracts.vote_chain.events import EventColumns, decode_events
+
+logger = logging.getLogger(__name__)
+
+# Rounds followed without VoteChain activity before the checkpoint is written anyway
+DEFAULT_CHECKPOINT_INTERVAL = 100
+
+
+@dataclasses.dataclass(kw_only=True)
+class PollTally:
+    choice_count: int
+    tally: list[int]  # Votes per choice (choice numbers start at 1, so choice 1 is at index 0)
+    voters: set[str] = dataclasses.field(default_factory=set)
+    winner: int | None = None  # Set once the poll is finalized
+    winner_margin: int | None = None
+
+
+@dataclasses.dataclass(kw_only=True)
+class FollowerState:
+    last_round: int  # Last fully processed round
+    polls: dict[int, PollTally] = dataclasses.field(default_factory=dict)
+    opted_in: set[str] = dataclasses.field(default_factory=set)
+
+
+@dataclasses.dataclass(kw_only=True)
+class RoundUpdate:
+    round_num: int
+    events: EventColumns  # VoteChain events of the round, decoded as columns (see 'decode_events')
+    state: FollowerState  # Live state after the round (shared, do not mutate)
+
+    @property
+    def votes(self) -> int:
+        return len(self.events["VoteCast"]["poll_id"])
+
+    @property
+    def has_events(self) -> bool:
+        return any(len(next(iter(columns.values()))) > 0 for columns in self.events.values())
+
+
+# Saves the follower state as JSON, written to a temporary file first so a crash never leaves a partial checkpoint
+def save_checkpoint(path: Path, state: FollowerState) -> None:
+    checkpoint = {
+        "round": state.last_round,
+        "polls": {
+            str(poll_id): {
+                "choice_count": poll.choice_count,
+                "tally": poll.tally,
+                "voters": sorted(poll.voters),
+                "winner": poll.winner,
+                "winner_margin": poll.winner_margin,
+            }
+            for poll_id, poll in state.polls.items()
+        },
+        "opted_in": sorted(state.opted_in),
+    }
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(checkpoint))
+    tmp_path.replace(path)
+
+
+def load_checkpoint(path: Path) -> FollowerState:
+    checkpoint = json.loads(path.read_text())
+    return FollowerState(
+        last_round=checkpoint["round"],
+        polls={
+            int(poll_id): PollTally(
+                choice_count=poll["choice_count"],
+                tally=poll["tally"],
+                voters=set(poll["voters"]),
+                winner=poll["winner"],
+                winner_margin=poll["winner_margin"],
+            )
+            for poll_id, poll in checkpoint["polls"].items()
+        },
+        opted_in=set(checkpoint["opted_in"]),
+    )
+
+
+# Collects the logs of every call to the App in a block, including inner calls made by other Apps
+def _collect_app_logs(signed_txns: list[dict[str, typing.Any]], app_id: int, logs: list[bytes]) -> None:
+    for signed_txn in signed_txns:
+        txn: dict[str, typing.Any] = signed_txn.get("txn", {})
+        apply_data: dict[str, typing.Any] = signed_txn.get("dt", {})
+
+        if txn.get("type") == "appl" and txn.get("apid") == app_id:
+            logs.extend(base64.b64decode(entry) for entry in apply_data.get("lg", []))
+
+        _collect_app_logs(apply_data.get("itx", []), app_id, logs)
+
+
+# Returns a 'uint64' event column (see 'EventColumns')
+def _uint64_column(columns: dict[str, "array.array[int] | list[bytes]"], field: str) -> "array.array[int]":
+    column = columns[field]
+    assert isinstance(column, array.array)
+    return column
+
+
+# Returns an 'address' or 'byte[32]' event column (see 'EventColumns')
+def _bytes_column(columns: dict[str, "array.array[int] | list[bytes]"], field: str) -> list[bytes]:
+    column = columns[field]
+    assert isinstance(column, list)
+    return column
+
+
+# Returns the last round of an algod status response
+def _last_round(status: object) -> int:
+    assert isinstance(status, dict)
+    return typing.cast(int, status["last-round"])
+
+
+# Follows the chain round by round (one block fetch per round, however many subscribers watch the results) and
+# applies the VoteChain events of every round to an in-memory tally, voter set and opted in set.
+# NOTE: Pass the App creation round as 'start_round' to rebuild the full history, a checkpoint takes precedence
+class BlockFollower:
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        app_id: int,
+        *,
+        start_round: int | None = None,
+        checkpoint_path: Path | None = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        block_cache: BlockCache | None = None,
+    ) -> None:
+        self.algod_client = algod_client
+        self.app_id = app_id
+        self.block_cache = block_cache  # Rounds read again (e.g. replays from an older checkpoint) are not refetched
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.subscribers: list[Callable[[RoundUpdate], None]] = []
+
+        if checkpoint_path is not None and checkpoint_path.exists():
+            self.state = load_checkpoint(checkpoint_path)
+            logger.info(f"Resuming App {app_id} from round {self.state.last_round + 1}")
+        else:
+            # Without a start round only new rounds are followed
+            if start_round is None:
+                start_round = _last_round(algod_client.status()) + 1
+            self.state = FollowerState(last_round=start_round - 1)
+
+    def subscribe(self, callback: Callable[[RoundUpdate], None]) -> None:
+        self.subscribers.append(callback)
+
+    # Applies the events of a round to the state
+    def _apply(self, events: EventColumns) -> None:
+        polls = self.state.polls
+
+        poll_setup = events["PollSetup"]
+        for poll_id, choice_count in zip(
+            _uint64_column(poll_setup, "poll_id"), _uint64_column(poll_setup, "choice_count"), strict=True
+        ):
+            polls[poll_id] = PollTally(choice_count=choice_count, tally=[0] * choice_count)
+
+        vote_cast = events["VoteCast"]
+        for poll_id, voter, choice in zip(
+            _uint64_column(vote_cast, "poll_id"),
+            _bytes_column(vote_cast, "voter"),
+            _uint64_column(vote_cast, "choice"),
+            strict=True,
+        ):
+            # Polls set up before the followed rounds are sized as their votes come in
+            poll = polls.setdefault(poll_id, PollTally(choice_count=0, tally=[]))
+            if choice > len(poll.tally):
+                poll.tally.extend([0] * (choice - len(poll.tally)))
+                poll.choice_count = len(poll.tally)
+            poll.tally[choice - 1] += 1
+            poll.voters.add(encode_address(voter))
+
+        poll_finalized = events["PollFinalized"]
+        for poll_id, winner, winner_margin in zip(
+            _uint64_column(poll_finalized, "poll_id"),
+            _uint64_column(poll_finalized, "winner"),
+            _uint64_column(poll_finalized, "winner_margin"),
+            strict=True,
+        ):
+            if poll_id in polls:
+                polls[poll_id].winner = winner
+                polls[poll_id].winner_margin = winner_margin
+
+        # Events are decoded per type, so an account opting out and back in within the same round counts as opted out
+        self.state.opted_in.update(
+            encode_address(account) for account in _bytes_column(events["OptedIn"], "account")
+        )
+        self.state.opted_in.difference_update(
+            encode_address(account) for account in _bytes_column(events["OptedOut"], "account")
+        )
+
+    # Fetches and applies a single round (the round must already exist)
+    def process_round(self, round_num: int) -> RoundUpdate:
+        logs: list[bytes] = []
+        if self.block_cache is not None:
+            logs = self.block_cache.get_block(round_num).app_logs(self.app_id)
+        else:
+            block_info = self.algod_client.block_info(round_num=round_num)
+            assert isinstance(block_info, dict)
+            _collect_app_logs(block_info["block"].get("txns", []), self.app_id, logs)
+
+        events = decode_events(logs)
+        self._apply(events)
+        self.state.last_round = round_num
+
+        return RoundUpdate(round_num=round_num, events=events, state=self.state)
+
+    def follow(self, max_rounds: int | None = None) -> Iterator[RoundUpdate]:
+        """Yields an update per round (waiting for new rounds w/ 'status_after_block') and keeps the checkpoint"""
+
+        last_round = _last_round(self.algod_client.status())
+        rounds_followed = 0
+        rounds_since_checkpoint = 0
+
+        while max_rounds is None or rounds_followed < max_rounds:
+            next_round = self.state.last_round + 1
+            if next_round > last_round:
+                last_round = _last_round(self.algod_client.status_after_block(last_round))
+                continue
+
+            update = self.process_round(next_round)
+            rounds_followed += 1
+            rounds_since_checkpoint += 1
+
+            # Checkpoint every round that changed the state, and every few rounds otherwise
+            if self.checkpoint_path is not None and (
+                update.has_events or rounds_since_checkpoint >= self.checkpoint_interval
+            ):
+                save_checkpoint(self.checkpoint_path, self.state)
+                rounds_since_checkpoint = 0
+
+            for subscriber in self.subscribers:
+                subscriber(update)
+            yield update
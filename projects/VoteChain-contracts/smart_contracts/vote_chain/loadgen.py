@@ -0,0 +1,390 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import collections
+import dataclasses
+import logging
+import random
+import re
+import threading
+import time
+import typing
+from collections.abc import Sequence
+from concurrent.futures import Executor
+
+from algokit_utils import TransactionParameters
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algosdk import account
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import GenericSignedTransaction, PaymentTxn, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.vote_chain.vote_chain_client import VoteChainClient
+from smart_contracts.vote_chain.signing import ParallelTransactionSigner, gather_signatures
+from smart_contracts.vote_chain.state import (
+    BALLOT_BOX_MBR,
+    LOCAL_STORAGE_MBR,
+    MAX_GROUP_SIZE,
+    get_ballot_box_name,
+    get_poll_box_name,
+    get_poll_box_references,
+    get_poll_tally_box_name,
+)
+
+logger = logging.getLogger(__name__)
+
+# Waves run by the load generator, in order
+WAVES = ("fund", "opt_in", "vote", "opt_out")
+
+# ALGO (in microALGO) funded to every voter, covers the local storage and ballot box MBR plus fees
+VOTER_FUNDING = 1_000_000
+
+# Poll set up for a load run (the poll opens right away and stays open for the minimum voting period of 3 days)
+LOAD_POLL_TITLE = b"Load test"
+LOAD_POLL_CHOICES = [b"Yes", b"No", b"Abstain"]
+LOAD_POLL_DURATION = 3 * 24 * 60 * 60
+
+# Seconds between checks for a new round while tracking confirmations
+ROUND_POLL_INTERVAL = 0.05
+
+# Seconds per round used to expire pending groups (a dev mode localnet only cuts blocks for new transactions, so a
+# dropped group is expired by time rather than by rounds)
+ROUND_TIME = 2.8
+
+# Transaction IDs are 52 character base32 strings (replaced in failure reasons so equal failures group together)
+_TX_ID_PATTERN = re.compile(r"\b[A-Z2-7]{52}\b")
+
+
+# Node a load run submits to: a local node ('AlgodTarget') or the in-process stand-in ('InProcessTarget')
+class LoadTarget(typing.Protocol):
+    def suggested_params(self) -> SuggestedParams: ...
+
+    def send(self, signed_txns: list[GenericSignedTransaction]) -> None: ...
+
+    def last_round(self) -> int: ...
+
+    def block_tx_ids(self, round_num: int) -> list[str]: ...
+
+
+class AlgodTarget:
+    def __init__(self, algod_client: AlgodClient) -> None:
+        self.algod_client = algod_client
+
+    def suggested_params(self) -> SuggestedParams:
+        return self.algod_client.suggested_params()
+
+    def send(self, signed_txns: list[GenericSignedTransaction]) -> None:
+        self.algod_client.send_transactions(signed_txns)
+
+    def last_round(self) -> int:
+        status = self.algod_client.status()
+        assert isinstance(status, dict)
+        return typing.cast(int, status["last-round"])
+
+    def block_tx_ids(self, round_num: int) -> list[str]:
+        block_txids = self.algod_client.get_block_txids(round_num)
+        assert isinstance(block_txids, dict)
+        return typing.cast(list[str], block_txids["blockTxids"])
+
+
+# Stand-in node that accepts every group into the next block without evaluating the contract, for sizing the load
+# generator itself (signing, pacing, tracking) and for dry runs w/o a local node. A block is cut from the pending
+# transactions every 'block_time' seconds (0 cuts a block per round check, like a dev mode localnet) and a share of
+# 'reject_rate' groups is rejected on submission like a failing logic evaluation would be.
+class InProcessTarget:
+    def __init__(self, block_time: float = 0.0, reject_rate: float = 0.0, seed: int | None = None) -> None:
+        self.block_time = block_time
+        self.reject_rate = reject_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._round = 1
+        self._cut_at = time.monotonic()
+        self._pool: list[str] = []
+        self._blocks: dict[int, list[str]] = {}
+
+    def suggested_params(self) -> SuggestedParams:
+        return SuggestedParams(
+            fee=1_000,
+            first=self._round,
+            last=self._round + 1_000,
+            gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+            gen="in-process-v1",
+            flat_fee=True,
+            min_fee=1_000,
+        )
+
+    def send(self, signed_txns: list[GenericSignedTransaction]) -> None:
+        if self._random.random() < self.reject_rate:
+            raise AlgodHTTPError(
+                f"TransactionPool.Remember: transaction {signed_txns[0].get_txid()}: simulated rejection", 400
+            )
+        with self._lock:
+            self._pool.extend(signed_txn.get_txid() for signed_txn in signed_txns)
+
+    # Cuts the next block from the pending transactions once the block time has passed
+    def last_round(self) -> int:
+        with self._lock:
+            if self._pool and time.monotonic() - self._cut_at >= self.block_time:
+                self._round += 1
+                self._cut_at = time.monotonic()
+                self._blocks[self._round], self._pool = self._pool, []
+            return self._round
+
+    def block_tx_ids(self, round_num: int) -> list[str]:
+        with self._lock:
+            return self._blocks.get(round_num, [])
+
+
+@dataclasses.dataclass(kw_only=True)
+class WaveReport:
+    wave: str
+    submitted_txns: int = 0
+    confirmed_txns: int = 0
+    failed_txns: int = 0
+    duration: float = 0.0  # Seconds from the first submission to the last confirmation
+    latencies: list[float] = dataclasses.field(default_factory=list)  # Submit to confirm seconds per confirmed group
+    failures: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)  # Reason -> txns
+
+    @property
+    def tps(self) -> float:
+        return self.confirmed_txns / self.duration if self.duration else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """Returns the nearest-rank percentile of the submit to confirm latencies in seconds"""
+
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(1, -(-len(ordered) * percentile // 100))
+        return ordered[int(rank) - 1]
+
+    def summary(self) -> str:
+        lines = [
+            f"{self.wave}: {self.confirmed_txns}/{self.submitted_txns} txns confirmed in {self.duration:.2f}s "
+            f"({self.tps:.1f} TPS), latency p50 {self.latency_percentile(50):.3f}s "
+            f"p95 {self.latency_percentile(95):.3f}s p99 {self.latency_percentile(99):.3f}s"
+        ]
+        lines += [f"  {txns} txns failed: {reason}" for reason, txns in self.failures.most_common()]
+        return "\n".join(lines)
+
+
+# Returns a failure reason that groups equal failures of different transactions together
+def _failure_reason(error: Exception) -> str:
+    return _TX_ID_PATTERN.sub("<txid>", str(error))[:200]
+
+
+@dataclasses.dataclass(kw_only=True)
+class _PendingGroup:
+    size: int
+    submitted_at: float
+
+
+# Submits signed groups at a target rate while a tracker thread matches every new block's transaction IDs against
+# the pending groups (one block lookup per round, however many groups are pending)
+def run_wave(
+    target: LoadTarget,
+    wave: str,
+    signed_groups: Sequence[list[GenericSignedTransaction]],
+    rate: float,
+    wait_rounds: int = 10,
+) -> WaveReport:
+    report = WaveReport(wave=wave)
+    pending: dict[str, _PendingGroup] = {}
+    lock = threading.Lock()
+    submitting = threading.Event()
+    submitting.set()
+
+    started_at = time.monotonic()
+    last_confirmed_at = started_at
+
+    # Groups still pending after 'wait_rounds' were dropped (e.g. expired or evicted from the transaction pool)
+    def expire() -> None:
+        expired_before = time.monotonic() - wait_rounds * ROUND_TIME
+        with lock:
+            for tx_id, group in list(pending.items()):
+                if group.submitted_at < expired_before:
+                    del pending[tx_id]
+                    report.failed_txns += group.size
+                    report.failures[f"Not confirmed within {wait_rounds} rounds"] += group.size
+
+    def track() -> None:
+        nonlocal last_confirmed_at
+        last_round = target.last_round()
+        while submitting.is_set() or pending:
+            new_round = target.last_round()
+            if new_round == last_round:
+                expire()
+                time.sleep(ROUND_POLL_INTERVAL)
+                continue
+
+            for round_num in range(last_round + 1, new_round + 1):
+                tx_ids = target.block_tx_ids(round_num)
+                confirmed_at = time.monotonic()
+                with lock:
+                    for tx_id in tx_ids:
+                        group = pending.pop(tx_id, None)
+                        if group is not None:
+                            report.confirmed_txns += group.size
+                            report.latencies.append(confirmed_at - group.submitted_at)
+                            last_confirmed_at = confirmed_at
+            last_round = new_round
+
+    tracker = threading.Thread(target=track, name=f"loadgen-{wave}", daemon=True)
+    tracker.start()
+
+    next_send = started_at
+    for signed_txns in signed_groups:
+        # Pace the submissions to the target rate of transactions per second
+        delay = next_send - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        next_send += len(signed_txns) / rate
+
+        tx_id = signed_txns[0].get_txid()
+        report.submitted_txns += len(signed_txns)
+
+        # Registered before sending, so a block cut right after the submission still finds the group
+        with lock:
+            pending[tx_id] = _PendingGroup(size=len(signed_txns), submitted_at=time.monotonic())
+        try:
+            target.send(signed_txns)
+        except AlgodHTTPError as error:
+            with lock:
+                del pending[tx_id]
+                report.failed_txns += len(signed_txns)
+                report.failures[_failure_reason(error)] += len(signed_txns)
+
+    submitting.clear()
+    tracker.join()
+
+    report.duration = last_confirmed_at - started_at
+    logger.info(report.summary())
+    return report
+
+
+# Creates voters, sets up a poll and runs the opt-in, vote and opt-out waves against a target, every voter transaction
+# is signed ahead of its wave (across 'signing_pool' if given) so signing never throttles the submission rate
+class LoadGenerator:
+    def __init__(
+        self,
+        app_client: VoteChainClient,
+        funder: AddressAndSigner,
+        target: LoadTarget,
+        signing_pool: Executor | None = None,
+    ) -> None:
+        self.app_client = app_client
+        self.funder = funder  # Funds the voters, e.g. the localnet dispenser
+        self.target = target
+        self.signing_pool = signing_pool
+
+    def create_voters(self, count: int) -> list[AddressAndSigner]:
+        voters = []
+        for _ in range(count):
+            private_key, address = account.generate_account()
+            voters.append(
+                AddressAndSigner(address=address, signer=ParallelTransactionSigner(private_key, self.signing_pool))
+            )
+        return voters
+
+    def _payment(self, sender: AddressAndSigner, amount: int, receiver: str | None = None) -> TransactionWithSigner:
+        return TransactionWithSigner(
+            txn=PaymentTxn(
+                sender=sender.address,
+                sp=self.target.suggested_params(),
+                receiver=receiver or self.app_client.app_address,
+                amt=amount,
+            ),
+            signer=sender.signer,
+        )
+
+    # Sets up the poll voted on by the vote wave (the App client sender must be the App creator), returns its ID
+    def setup_poll(self, poll_id: int) -> int:
+        start_date_unix = int(time.time()) - 60
+        end_date_unix = start_date_unix + LOAD_POLL_DURATION
+
+        # Poll record (4 + title + 7 UInt64 + 2 Bool + 2 Hash32), choices and tally box MBR (see 'calc_poll_boxes_mbr')
+        poll_size = 4 + len(LOAD_POLL_TITLE) + 7 * 8 + 2 + 2 * 32
+        choices_size = 2 + sum(4 + len(choice) for choice in LOAD_POLL_CHOICES)
+        tally_size = 8 * len(LOAD_POLL_CHOICES)
+        mbr = sum(2_500 + 400 * (9 + size) for size in (poll_size, choices_size, tally_size))
+
+        assert self.app_client.sender is not None and self.app_client.signer is not None
+        creator = AddressAndSigner(address=self.app_client.sender, signer=self.app_client.signer)
+
+        response = self.app_client.setup_poll(
+            mbr_pay=self._payment(creator, mbr),
+            title=LOAD_POLL_TITLE,
+            choices=LOAD_POLL_CHOICES,
+            require_opt_in=True,
+            eligibility_root=bytes(32),
+            start_date_str=time.strftime("%m/%d/%Y", time.localtime(start_date_unix)),
+            start_date_unix=start_date_unix,
+            end_date_str=time.strftime("%m/%d/%Y", time.localtime(end_date_unix)),
+            end_date_unix=end_date_unix,
+            transaction_parameters=TransactionParameters(
+                boxes=get_poll_box_references(poll_id, self.app_client.app_id)
+            ),
+        )
+        return response.return_value
+
+    # Builds the groups of a wave, every call and its payment are packed into groups of up to 16 transactions
+    def build_wave(
+        self, wave: str, voters: Sequence[AddressAndSigner], poll_id: int
+    ) -> list[AtomicTransactionComposer]:
+        calls_per_group = MAX_GROUP_SIZE if wave in ("fund", "opt_out") else MAX_GROUP_SIZE // 2
+        self.app_client.suggested_params = self.target.suggested_params()
+
+        atcs = []
+        for start in range(0, len(voters), calls_per_group):
+            atc = AtomicTransactionComposer()
+            composer = self.app_client.compose(atc)
+
+            for voter in voters[start : start + calls_per_group]:
+                voter_parameters = TransactionParameters(sender=voter.address, signer=voter.signer)
+                match wave:
+                    case "fund":
+                        atc.add_transaction(self._payment(self.funder, VOTER_FUNDING, voter.address))
+                    case "opt_in":
+                        composer.opt_in_local_storage_mbr(
+                            account=voter.address,
+                            mbr_pay=self._payment(voter, LOCAL_STORAGE_MBR),
+                            transaction_parameters=voter_parameters,
+                        )
+                    case "vote":
+                        composer.submit_vote(
+                            poll_id=poll_id,
+                            account=voter.address,
+                            mbr_pay=self._payment(voter, BALLOT_BOX_MBR),
+                            choice=random.randint(1, len(LOAD_POLL_CHOICES)),
+                            proof=[],
+                            transaction_parameters=TransactionParameters(
+                                sender=voter.address,
+                                signer=voter.signer,
+                                boxes=[
+                                    (self.app_client.app_id, get_poll_box_name(poll_id)),
+                                    (self.app_client.app_id, get_poll_tally_box_name(poll_id)),
+                                    (self.app_client.app_id, get_ballot_box_name(poll_id, voter.address)),
+                                ],
+                            ),
+                        )
+                    case "opt_out":
+                        composer.close_out_opt_out(account=voter.address, transaction_parameters=voter_parameters)
+            atcs.append(atc)
+
+        return atcs
+
+    def run(
+        self, voter_count: int, rate: float, poll_id: int, wait_rounds: int = 10
+    ) -> list[WaveReport]:
+        """Runs every wave for 'voter_count' new voters at 'rate' transactions per second, returns a report per wave"""
+
+        voters = self.create_voters(voter_count)
+
+        reports = []
+        for wave in WAVES:
+            signed_groups = gather_signatures(self.build_wave(wave, voters, poll_id))
+            reports.append(run_wave(self.target, wave, signed_groups, rate, wait_rounds))
+
+        return reports
@@ -0,0 +1,176 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import array
+import csv
+import dataclasses
+import typing
+from pathlib import Path
+
+import numpy as np
+
+# Offline tally reconstruction from exported ballots (see 'export.py'), needs the optional 'numpy' dependency
+# ('poetry install -E analysis', Parquet exports also need 'pyarrow' from the 'export' extra)
+
+# Array types spelled out on 'np.ndarray' (the numpy stubs declare 'npt.NDArray' and the return types of 'np.bincount',
+# 'np.lexsort' and 'np.unique' w/ 'type' statements the pinned mypy can't resolve, so those results are cast)
+Int64Array: typing.TypeAlias = np.ndarray[tuple[int, ...], np.dtype[np.int64]]
+UInt64Array: typing.TypeAlias = np.ndarray[tuple[int, ...], np.dtype[np.uint64]]
+IntpArray: typing.TypeAlias = np.ndarray[tuple[int, ...], np.dtype[np.intp]]
+StrArray: typing.TypeAlias = np.ndarray[tuple[int, ...], np.dtype[np.str_]]
+
+
+@dataclasses.dataclass(frozen=True)
+class BallotArrays:
+    voter: Int64Array  # Index of the voter address in 'voters'
+    choice: UInt64Array  # Choice numbers start at 1
+    confirmed_round: UInt64Array  # Read from the 'round' column
+    fee: UInt64Array
+    voters: StrArray  # Voter addresses
+
+    def __len__(self) -> int:
+        return len(self.voter)
+
+    def take(self, indexes: IntpArray) -> "BallotArrays":
+        return BallotArrays(
+            voter=self.voter[indexes],
+            choice=self.choice[indexes],
+            confirmed_round=self.confirmed_round[indexes],
+            fee=self.fee[indexes],
+            voters=self.voters,
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class Reconstruction:
+    tally: Int64Array  # Votes per choice (choice 1 at index 0)
+    rounds: UInt64Array  # Rounds w/ at least one counted ballot
+    cumulative_tally: Int64Array  # Tally after each round in 'rounds' (one row per round)
+    fees_by_round: UInt64Array  # Fees paid by the counted ballots per round in 'rounds'
+    total_fees: int
+    voter_count: int
+    duplicate_ballots: int  # Ballots dropped because their voter had already voted
+
+    def matches(self, tally: list[int]) -> bool:
+        """Returns True if the reconstructed tally matches a tally read on-chain (e.g. from 'get_poll_tally')"""
+
+        return bool(self.tally.tolist() == list(tally))
+
+
+# Loads the ballots of a poll from a '.csv' export, voter addresses are interned to indexes while reading so the
+# addresses of voters w/ several rows are only held once
+def _load_csv_ballots(path: Path, poll_id: int) -> BallotArrays:
+    voter_indexes: dict[str, int] = {}
+    voter, choice, round_num, fee = array.array("q"), array.array("Q"), array.array("Q"), array.array("Q")
+
+    with path.open(newline="") as file:
+        for row in csv.DictReader(file):
+            if row["event"] != "VoteCast" or int(row["poll_id"]) != poll_id:
+                continue
+            voter.append(voter_indexes.setdefault(row["account"], len(voter_indexes)))
+            choice.append(int(row["choice"]))
+            round_num.append(int(row["round"]))
+            fee.append(int(row["fee"]))
+
+    return BallotArrays(
+        voter=np.frombuffer(voter, dtype=np.int64),
+        choice=np.frombuffer(choice, dtype=np.uint64),
+        confirmed_round=np.frombuffer(round_num, dtype=np.uint64),
+        fee=np.frombuffer(fee, dtype=np.uint64),
+        voters=np.array(list(voter_indexes), dtype=np.str_),
+    )
+
+
+# Loads the ballots of a poll from a '.parquet' export, voter addresses are dictionary encoded by pyarrow
+def _load_parquet_ballots(path: Path, poll_id: int) -> BallotArrays:
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(
+        path,
+        columns=["round", "poll_id", "account", "choice", "fee"],
+        filters=[("event", "=", "VoteCast"), ("poll_id", "=", poll_id)],
+    )
+    accounts = pc.dictionary_encode(table["account"]).combine_chunks()
+
+    return BallotArrays(
+        voter=accounts.indices.to_numpy().astype(np.int64),
+        choice=table["choice"].to_numpy().astype(np.uint64),
+        confirmed_round=table["round"].to_numpy().astype(np.uint64),
+        fee=table["fee"].to_numpy().astype(np.uint64),
+        voters=np.array(accounts.dictionary.to_pylist(), dtype=np.str_),
+    )
+
+
+def load_ballots(path: Path, poll_id: int) -> BallotArrays:
+    match path.suffix:
+        case ".csv":
+            return _load_csv_ballots(path, poll_id)
+        case ".parquet":
+            return _load_parquet_ballots(path, poll_id)
+        case _:
+            raise ValueError(f"Unsupported export format '{path.suffix}', use '.csv' or '.parquet'")
+
+
+# Keeps the first ballot of every voter (the contract rejects a second vote while the voter's ballot box exists),
+# ballots stay in chain order
+def dedupe_ballots(ballots: BallotArrays) -> BallotArrays:
+    if len(ballots) == 0:
+        return ballots
+
+    # Sort by voter, then round, then export position so the first ballot of every voter leads its run
+    order = typing.cast(IntpArray, np.lexsort((np.arange(len(ballots)), ballots.confirmed_round, ballots.voter)))
+    sorted_voter = ballots.voter[order]
+    first = np.ones(len(ballots), dtype=bool)
+    first[1:] = sorted_voter[1:] != sorted_voter[:-1]
+
+    return ballots.take(np.sort(order[first]))
+
+
+def compute_tally(ballots: BallotArrays, choice_count: int) -> Int64Array:
+    choice_index = ballots.choice.astype(np.int64) - 1
+    if len(ballots) and (choice_index.min() < 0 or choice_index.max() >= choice_count):
+        raise ValueError(f"Ballot choices must be between 1 and {choice_count}")
+
+    return typing.cast(IntpArray, np.bincount(choice_index, minlength=choice_count)).astype(np.int64)
+
+
+# Returns the sorted rounds w/ ballots and the index of every ballot's round in them
+def _unique_rounds(ballots: BallotArrays) -> tuple[UInt64Array, IntpArray]:
+    return typing.cast(
+        tuple[UInt64Array, IntpArray], np.unique(ballots.confirmed_round, return_inverse=True)
+    )
+
+
+# Returns the rounds w/ ballots and the tally after each of them (one row per round, one column per choice)
+def compute_cumulative_tally(
+    ballots: BallotArrays, choice_count: int
+) -> tuple[UInt64Array, Int64Array]:
+    rounds, round_index = _unique_rounds(ballots)
+    cells = round_index.astype(np.int64) * choice_count + ballots.choice.astype(np.int64) - 1
+    per_round = typing.cast(IntpArray, np.bincount(cells, minlength=len(rounds) * choice_count))
+    per_round = per_round.reshape(len(rounds), choice_count)
+
+    return rounds, per_round.cumsum(axis=0).astype(np.int64)
+
+
+# Returns the fee totals per round w/ ballots (in the order of 'np.unique' rounds)
+def compute_fees_by_round(ballots: BallotArrays) -> UInt64Array:
+    rounds, round_index = _unique_rounds(ballots)
+    fees_by_round = np.zeros(len(rounds), dtype=np.uint64)
+    np.add.at(fees_by_round, round_index, ballots.fee)
+    return fees_by_round
+
+
+# Reconstructs the tally of a poll from its exported ballots w/ vectorized reductions
+def reconstruct_poll(ballots: BallotArrays, choice_count: int) -> Reconstruction:
+    counted = dedupe_ballots(ballots)
+    rounds, cumulative_tally = compute_cumulative_tally(counted, choice_count)
+
+    return Reconstruction(
+        tally=compute_tally(counted, choice_count),
+        rounds=rounds,
+        cumulative_tally=cumulative_tally,
+        fees_by_round=compute_fees_by_round(counted),
+        total_fees=int(counted.fee.sum()),
+        voter_count=len(counted),
+        duplicate_ballots=len(ballots) - len(counted),
+    )
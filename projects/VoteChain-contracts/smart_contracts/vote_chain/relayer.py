@@ -0,0 +1,149 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import copy
+import dataclasses
+from collections.abc import Iterable
+
+from algokit_utils import TransactionParameters
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.transaction import PaymentTxn, SuggestedParams
+
+from smart_contracts.artifacts.vote_chain.vote_chain_client import VoteChainClient
+from smart_contracts.vote_chain.state import (
+    BALLOT_BOX_MBR,
+    LOCAL_STORAGE_MBR,
+    MAX_GROUP_SIZE,
+    get_ballot_box_name,
+    get_poll_box_name,
+    get_poll_tally_box_name,
+)
+
+# Opcode budget of an app call and per Merkle proof level (see 'MERKLE_LEVEL_OPCODE_BUDGET' in contract.py)
+APP_CALL_OPCODE_BUDGET = 700
+MERKLE_LEVEL_OPCODE_BUDGET = 75
+
+# Every sponsored vote is a (sponsor MBR payment, voter app call) pair, so a group fits 8 sponsored votes
+MAX_SPONSORED_VOTES_PER_GROUP = MAX_GROUP_SIZE // 2
+
+
+@dataclasses.dataclass(kw_only=True)
+class SponsoredBallot:
+    voter: str
+    signer: TransactionSigner  # Signs the voter's zero fee app call (e.g. forwarded by the voter's wallet)
+    poll_id: int
+    choice: int
+    proof: list[bytes] = dataclasses.field(default_factory=list)  # Merkle proof for polls w/ an eligibility root
+
+
+# Returns suggested params with a flat fee (fee pooling lets one transaction of a group pay for the others)
+def _flat_fee_params(suggested_params: SuggestedParams, fee: int) -> SuggestedParams:
+    params = copy.copy(suggested_params)
+    params.flat_fee = True
+    params.fee = fee
+    return params
+
+
+# Returns the fee a sponsor pays to cover its MBR payment, the voter's app call and any Merkle proof op-up calls
+def calc_sponsored_vote_fee(ballot: SponsoredBallot, min_fee: int) -> int:
+    op_up_calls = -(
+        -MERKLE_LEVEL_OPCODE_BUDGET * len(ballot.proof) // APP_CALL_OPCODE_BUDGET
+    )
+    return min_fee * (2 + op_up_calls)
+
+
+# Adds a sponsored opt-in (sponsor pays the local storage MBR and all fees, the account sends a zero fee call)
+def compose_sponsored_opt_in(
+    app_client: VoteChainClient,
+    atc: AtomicTransactionComposer,
+    suggested_params: SuggestedParams,
+    sponsor: str,
+    sponsor_signer: TransactionSigner,
+    account: str,
+    account_signer: TransactionSigner,
+) -> None:
+    mbr_pay = TransactionWithSigner(
+        txn=PaymentTxn(
+            sender=sponsor,
+            sp=_flat_fee_params(suggested_params, 2 * suggested_params.min_fee),
+            receiver=app_client.app_address,
+            amt=LOCAL_STORAGE_MBR,
+        ),
+        signer=sponsor_signer,
+    )
+
+    app_client.compose(atc).opt_in_local_storage_mbr(
+        account=account,
+        mbr_pay=mbr_pay,
+        transaction_parameters=TransactionParameters(
+            sender=account,
+            signer=account_signer,
+            suggested_params=_flat_fee_params(suggested_params, 0),
+        ),
+    )
+
+
+# Adds a sponsored vote (sponsor pays the ballot box MBR and all fees, the voter sends a zero fee call)
+def compose_sponsored_vote(
+    app_client: VoteChainClient,
+    atc: AtomicTransactionComposer,
+    suggested_params: SuggestedParams,
+    sponsor: str,
+    sponsor_signer: TransactionSigner,
+    ballot: SponsoredBallot,
+) -> None:
+    mbr_pay = TransactionWithSigner(
+        txn=PaymentTxn(
+            sender=sponsor,
+            sp=_flat_fee_params(
+                suggested_params,
+                calc_sponsored_vote_fee(ballot, suggested_params.min_fee),
+            ),
+            receiver=app_client.app_address,
+            amt=BALLOT_BOX_MBR,
+        ),
+        signer=sponsor_signer,
+    )
+
+    app_client.compose(atc).submit_vote(
+        poll_id=ballot.poll_id,
+        account=ballot.voter,
+        mbr_pay=mbr_pay,
+        choice=ballot.choice,
+        proof=list(ballot.proof),  # Copied into the element type of the generated client's 'proof' parameter
+        transaction_parameters=TransactionParameters(
+            sender=ballot.voter,
+            signer=ballot.signer,
+            suggested_params=_flat_fee_params(suggested_params, 0),
+            boxes=[
+                (app_client.app_id, get_poll_box_name(ballot.poll_id)),
+                (app_client.app_id, get_poll_tally_box_name(ballot.poll_id)),
+                (app_client.app_id, get_ballot_box_name(ballot.poll_id, ballot.voter)),
+            ],
+        ),
+    )
+
+
+# Assembles sponsored votes into groups of up to 8 (payment, app call) pairs and submits every group
+def submit_sponsored_votes(
+    app_client: VoteChainClient,
+    sponsor: str,
+    sponsor_signer: TransactionSigner,
+    ballots: Iterable[SponsoredBallot],
+) -> list[AtomicTransactionResponse]:
+    suggested_params = app_client.algod_client.suggested_params()
+    pending = list(ballots)
+
+    responses = []
+    for start in range(0, len(pending), MAX_SPONSORED_VOTES_PER_GROUP):
+        atc = AtomicTransactionComposer()
+        for ballot in pending[start : start + MAX_SPONSORED_VOTES_PER_GROUP]:
+            compose_sponsored_vote(
+                app_client, atc, suggested_params, sponsor, sponsor_signer, ballot
+            )
+        responses.append(app_client.app_client.execute_atc(atc))
+
+    return responses
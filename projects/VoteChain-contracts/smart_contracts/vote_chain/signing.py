@@ -0,0 +1,147 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import base64
+import itertools
+from collections.abc import Sequence
+from concurrent.futures import Executor
+
+from algosdk import account, constants, encoding
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionSigner,
+)
+from algosdk.transaction import GenericSignedTransaction, SignedTransaction, Transaction
+from nacl.signing import SigningKey
+
+# Number of transactions sent to a worker process at once (large enough to amortize the inter-process round trip)
+DEFAULT_CHUNK_SIZE = 256
+
+# Batches smaller than this are signed in the caller's process (e.g. a single 16 transaction group)
+DEFAULT_MIN_PARALLEL = 64
+
+
+# Signs the (32 byte seed, msgpack encoded transaction) pairs of a chunk in a worker process and returns the raw
+# ed25519 signatures (only seeds and encoded transactions cross the process boundary, never 'Transaction' objects)
+def _sign_chunk(items: list[tuple[bytes, bytes]]) -> list[bytes]:
+    signing_keys: dict[bytes, SigningKey] = {}
+    signatures = []
+    for seed, encoded_txn in items:
+        if seed not in signing_keys:
+            signing_keys[seed] = SigningKey(seed)
+        signatures.append(signing_keys[seed].sign(constants.txid_prefix + encoded_txn).signature)
+    return signatures
+
+
+def _encode_txn(txn: Transaction) -> bytes:
+    return base64.b64decode(encoding.msgpack_encode(txn))
+
+
+# Signs (seed, encoded transaction) pairs in order, chunked across the executor unless there are too few of them
+def _sign_items(
+    items: list[tuple[bytes, bytes]],
+    executor: Executor | None,
+    *,
+    chunk_size: int,
+    min_parallel: int,
+) -> list[bytes]:
+    if executor is None or len(items) < min_parallel:
+        return _sign_chunk(items)
+
+    chunks = [items[start : start + chunk_size] for start in range(0, len(items), chunk_size)]
+    return list(itertools.chain.from_iterable(executor.map(_sign_chunk, chunks)))
+
+
+# Transaction signer that spreads the ed25519 signing of large batches across a process pool, a drop-in replacement
+# for 'AccountTransactionSigner' (e.g. as the 'signer' of 'TransactionParameters' or an 'AddressAndSigner')
+class ParallelTransactionSigner(TransactionSigner):
+    def __init__(
+        self,
+        private_key: str,
+        executor: Executor | None = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        min_parallel: int = DEFAULT_MIN_PARALLEL,
+    ) -> None:
+        self.private_key = private_key
+        self.address = account.address_from_private_key(private_key)
+        self.executor = executor  # e.g. a 'ProcessPoolExecutor' shared by every signer, None signs in-process
+        self.chunk_size = chunk_size
+        self.min_parallel = min_parallel
+        self._seed = base64.b64decode(private_key)[:32]
+
+    # The signer is never mutated and its process pool can't be copied, so copies (e.g. the 'dataclasses.asdict' of
+    # 'TransactionParameters' in the generated client) share the signer itself
+    def __deepcopy__(self, memo: dict[int, object]) -> "ParallelTransactionSigner":
+        return self
+
+    def sign_transactions(
+        self, txn_group: list[Transaction], indexes: list[int]
+    ) -> list[GenericSignedTransaction]:
+        return list(self.sign_batch([txn_group[index] for index in indexes]))
+
+    def sign_batch(self, txns: Sequence[Transaction]) -> list[SignedTransaction]:
+        """Signs any number of transactions (e.g. the transactions of many groups) and returns them in order"""
+
+        signatures = _sign_items(
+            [(self._seed, _encode_txn(txn)) for txn in txns],
+            self.executor,
+            chunk_size=self.chunk_size,
+            min_parallel=self.min_parallel,
+        )
+        return [self._signed_txn(txn, signature) for txn, signature in zip(txns, signatures, strict=True)]
+
+    def _signed_txn(self, txn: Transaction, signature: bytes) -> SignedTransaction:
+        # Transactions sent by a rekeyed account are signed by this signer's address as the authorizing address
+        return SignedTransaction(
+            txn,
+            base64.b64encode(signature).decode(),
+            None if txn.sender == self.address else self.address,
+        )
+
+
+# Signs the groups of many composers at once: the transactions of every parallel signer (e.g. one signer per voter)
+# go into one work list per process pool that is chunked across the pool, every other signer signs group by group as
+# in 'AtomicTransactionComposer.gather_signatures'
+def gather_signatures(
+    atcs: Sequence[AtomicTransactionComposer],
+) -> list[list[GenericSignedTransaction]]:
+    txn_groups = [atc.build_group() for atc in atcs]
+    signed_txns: dict[tuple[int, int], GenericSignedTransaction] = {}
+
+    # Collect the (group, transaction) positions and signers of every parallel signer transaction, per executor
+    batches: dict[int, list[tuple[tuple[int, int], ParallelTransactionSigner]]] = {}
+    for group_index, txn_group in enumerate(txn_groups):
+        for txn_index, txn_with_signer in enumerate(txn_group):
+            signer = txn_with_signer.signer
+            if isinstance(signer, ParallelTransactionSigner):
+                batches.setdefault(id(signer.executor), []).append(((group_index, txn_index), signer))
+
+    for batch in batches.values():
+        # Signers sharing an executor are expected to share its chunking settings, the first signer's are used
+        first_signer = batch[0][1]
+        txns = [txn_groups[group_index][txn_index].txn for (group_index, txn_index), _ in batch]
+        signatures = _sign_items(
+            [(signer._seed, _encode_txn(txn)) for txn, (_, signer) in zip(txns, batch, strict=True)],
+            first_signer.executor,
+            chunk_size=first_signer.chunk_size,
+            min_parallel=first_signer.min_parallel,
+        )
+        for txn, signature, (position, signer) in zip(txns, signatures, batch, strict=True):
+            signed_txns[position] = signer._signed_txn(txn, signature)
+
+    # Sign the remaining transactions per group and signer
+    for group_index, txn_group in enumerate(txn_groups):
+        txns = [txn_with_signer.txn for txn_with_signer in txn_group]
+        indexes_by_signer: dict[int, tuple[TransactionSigner, list[int]]] = {}
+        for txn_index, txn_with_signer in enumerate(txn_group):
+            if (group_index, txn_index) not in signed_txns:
+                signer = txn_with_signer.signer
+                indexes_by_signer.setdefault(id(signer), (signer, []))[1].append(txn_index)
+
+        for signer, indexes in indexes_by_signer.values():
+            for txn_index, signed_txn in zip(indexes, signer.sign_transactions(txns, indexes), strict=True):
+                signed_txns[(group_index, txn_index)] = signed_txn
+
+    return [
+        [signed_txns[(group_index, txn_index)] for txn_index in range(len(txn_group))]
+        for group_index, txn_group in enumerate(txn_groups)
+    ]
@@ -0,0 +1,354 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import base64
+import dataclasses
+import struct
+import typing
+from collections.abc import Iterable
+
+from algokit_utils import TransactionParameters
+from algosdk.abi import ABIType, Method
+from algosdk.encoding import decode_address, encode_address
+
+from smart_contracts.artifacts.vote_chain.vote_chain_client import (
+    APP_SPEC,
+    SimulateOptions,
+    VoteChainClient,
+)
+
+# ABI return values are logged with this prefix (ARC-4)
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+# ARC-4 types of the poll record ('Poll' struct in contract.py) and poll choices box values
+_POLL_TYPE = ABIType.from_string(
+    "(byte[],uint64,uint64,uint64,bool,byte[32],uint64,uint64,byte[32],bool,uint64,uint64)"
+)
+_POLL_CHOICES_TYPE = ABIType.from_string("byte[][]")
+
+
+@dataclasses.dataclass(kw_only=True)
+class Poll:
+    poll_id: int
+    title: bytes
+    choice_count: int
+    start_date_unix: int
+    end_date_unix: int
+    require_opt_in: bool
+    eligibility_root: bytes
+    total_votes: int
+    open_ballots: int
+    ballot_hash: bytes
+    finalized: bool
+    winner: int
+    winner_margin: int
+
+
+@dataclasses.dataclass(kw_only=True)
+class PollState:
+    poll: Poll
+    choices: list[bytes]
+    tally: list[int]
+
+    @property
+    def results(self) -> dict[bytes, int]:
+        """Returns the vote total of every poll choice keyed by the choice"""
+
+        return dict(zip(self.choices, self.tally, strict=True))
+
+
+@dataclasses.dataclass(kw_only=True)
+class PollSnapshot:
+    poll_id: int
+    title: bytes
+    choices: list[bytes]
+    start_date_unix: int
+    end_date_unix: int
+    require_opt_in: bool
+    eligibility_root: bytes
+    total_votes: int
+    open_ballots: int
+    ballot_hash: bytes
+    finalized: bool
+    winner: int
+    winner_margin: int
+    tally: list[int]
+
+    @property
+    def results(self) -> dict[bytes, int]:
+        """Returns the vote total of every poll choice keyed by the choice"""
+
+        return dict(zip(self.choices, self.tally, strict=True))
+
+
+# Ballot box value ('Ballot' struct in contract.py)
+@dataclasses.dataclass(kw_only=True)
+class Ballot:
+    choice: int
+    mbr_payer: str  # Account refunded the ballot box MBR on release (the voter or a sponsor)
+
+
+@dataclasses.dataclass(kw_only=True)
+class VoterStatus:
+    address: str
+    opted_in: bool
+    votes_cast: int
+    voted: bool
+    choice: int
+
+
+# Max number of transactions in an atomic group (one 'get_voter_status' call per transaction)
+MAX_GROUP_SIZE = 16
+
+# MBR pricing of the local schema and boxes (mirrors 'calc_mbr' and 'calc_box_mbr' in contract.py, 'Global.min_balance'
+# is the consensus minimum balance of an account)
+MIN_BALANCE = 100_000
+SCHEMA_BASE_MBR = 100_000
+SCHEMA_BYTES_MBR = 50_000
+SCHEMA_UINT_MBR = 28_500
+BOX_BASE_MBR = 2_500
+BOX_BYTE_MBR = 400
+
+# Ballot box name ('v' prefix + 8 byte poll ID + 32 byte address) and value ('Ballot' struct in contract.py, 8 byte
+# choice + 32 byte MBR payer address) sizes
+BALLOT_BOX_NAME_SIZE = 1 + 8 + 32
+BALLOT_SIZE = 8 + 32
+
+
+# Returns the MBR cost of a box
+def calc_box_mbr(name_size: int, value_size: int) -> int:
+    return BOX_BASE_MBR + BOX_BYTE_MBR * (name_size + value_size)
+
+
+# MBR costs of an opt-in (sized by the local schema of the App spec) and a ballot box
+LOCAL_STORAGE_MBR = (
+    MIN_BALANCE
+    + SCHEMA_BASE_MBR
+    + SCHEMA_BYTES_MBR * APP_SPEC.local_state_schema.num_byte_slices
+    + SCHEMA_UINT_MBR * APP_SPEC.local_state_schema.num_uints
+)
+BALLOT_BOX_MBR = calc_box_mbr(BALLOT_BOX_NAME_SIZE, BALLOT_SIZE)
+
+
+# Box names used by the VoteChain contract (1 byte prefix + 8 byte poll ID)
+def get_poll_box_name(poll_id: int) -> bytes:
+    return b"p" + poll_id.to_bytes(8, "big")
+
+
+def get_poll_choices_box_name(poll_id: int) -> bytes:
+    return b"c" + poll_id.to_bytes(8, "big")
+
+
+def get_poll_tally_box_name(poll_id: int) -> bytes:
+    return b"t" + poll_id.to_bytes(8, "big")
+
+
+# Box name of an account's ballot box for a poll ('v' prefix + 8 byte poll ID + 32 byte account address)
+def get_ballot_box_name(poll_id: int, address: str) -> bytes:
+    return b"v" + poll_id.to_bytes(8, "big") + typing.cast(bytes, decode_address(address))
+
+
+# Box references needed by the poll scoped methods ('setup_poll' and 'delete_poll' need all three)
+def get_poll_box_references(poll_id: int, app_id: int) -> list[tuple[int, bytes]]:
+    return [
+        (app_id, get_poll_box_name(poll_id)),
+        (app_id, get_poll_choices_box_name(poll_id)),
+        (app_id, get_poll_tally_box_name(poll_id)),
+    ]
+
+
+# Decodes the ABI return value of a method call from its base64 encoded transaction logs (None for void methods)
+def decode_abi_return(method: Method, logs: list[str]) -> object:
+    if method.returns.type == "void" or not logs:
+        return None
+
+    last_log = base64.b64decode(logs[-1])
+    if not last_log.startswith(ABI_RETURN_PREFIX):
+        return None
+
+    return_type = method.returns.type
+    assert isinstance(return_type, ABIType)
+    return return_type.decode(last_log[len(ABI_RETURN_PREFIX) :])
+
+
+# Decodes the ARC-4 poll record box value
+def decode_poll(poll_id: int, value: bytes) -> Poll:
+    (
+        title,
+        choice_count,
+        start,
+        end,
+        require_opt_in,
+        eligibility_root,
+        total_votes,
+        open_ballots,
+        ballot_hash,
+        finalized,
+        winner,
+        winner_margin,
+    ) = _POLL_TYPE.decode(value)
+    return Poll(
+        poll_id=poll_id,
+        title=bytes(title),
+        choice_count=choice_count,
+        start_date_unix=start,
+        end_date_unix=end,
+        require_opt_in=require_opt_in,
+        eligibility_root=bytes(eligibility_root),
+        total_votes=total_votes,
+        open_ballots=open_ballots,
+        ballot_hash=bytes(ballot_hash),
+        finalized=finalized,
+        winner=winner,
+        winner_margin=winner_margin,
+    )
+
+
+# Decodes the packed poll tally box value (one big-endian UInt64 per choice) in a single unpack
+def decode_tally(value: bytes) -> list[int]:
+    return list(struct.unpack(f">{len(value) // 8}Q", value))
+
+
+# Decodes the ballot box value (8 byte choice + 32 byte MBR payer address)
+def decode_ballot(value: bytes) -> Ballot:
+    return Ballot(choice=int.from_bytes(value[:8], "big"), mbr_payer=encode_address(value[8:BALLOT_SIZE]))
+
+
+# Decodes the ARC-4 'byte[][]' poll choices box value
+def decode_choices(value: bytes) -> list[bytes]:
+    return [bytes(choice) for choice in _POLL_CHOICES_TYPE.decode(value)]
+
+
+# Reads a box value of the App by its name
+def _get_box_value(app_client: VoteChainClient, box_name: bytes) -> bytes:
+    box = app_client.algod_client.application_box_by_name(app_client.app_id, box_name)
+    assert isinstance(box, dict)
+    return base64.b64decode(box["value"])
+
+
+# Returns the addresses of every account holding a ballot box in a poll (ballot box names end with the address)
+def get_poll_ballot_accounts(app_client: VoteChainClient, poll_id: int) -> list[str]:
+    prefix = b"v" + poll_id.to_bytes(8, "big")
+    response = app_client.algod_client.application_boxes(app_client.app_id)
+    assert isinstance(response, dict)
+    names = (base64.b64decode(box["name"]) for box in response["boxes"])
+    return [encode_address(name[len(prefix) :]) for name in names if name.startswith(prefix)]
+
+
+# Returns the ballot of an account in a poll
+def get_ballot(app_client: VoteChainClient, poll_id: int, address: str) -> Ballot:
+    return decode_ballot(_get_box_value(app_client, get_ballot_box_name(poll_id, address)))
+
+
+# Returns the poll record of a poll
+def get_poll(app_client: VoteChainClient, poll_id: int) -> Poll:
+    return decode_poll(poll_id, _get_box_value(app_client, get_poll_box_name(poll_id)))
+
+
+# Returns the vote total of every poll choice (index 0 holds the total of choice number 1)
+def get_poll_tally(app_client: VoteChainClient, poll_id: int) -> list[int]:
+    return decode_tally(_get_box_value(app_client, get_poll_tally_box_name(poll_id)))
+
+
+# Returns the poll choices (index 0 holds choice number 1)
+def get_poll_choices(app_client: VoteChainClient, poll_id: int) -> list[bytes]:
+    return decode_choices(
+        _get_box_value(app_client, get_poll_choices_box_name(poll_id))
+    )
+
+
+# Returns the poll record together with the poll choices and the whole poll tally
+def get_poll_state(app_client: VoteChainClient, poll_id: int) -> PollState:
+    return PollState(
+        poll=get_poll(app_client, poll_id),
+        choices=get_poll_choices(app_client, poll_id),
+        tally=get_poll_tally(app_client, poll_id),
+    )
+
+
+# Decodes the ARC-4 'PollSnapshot' struct returned by the 'get_poll_snapshot' method
+def decode_poll_snapshot(value: list[typing.Any]) -> PollSnapshot:
+    (
+        poll_id,
+        title,
+        choices,
+        start,
+        end,
+        require_opt_in,
+        eligibility_root,
+        total_votes,
+        open_ballots,
+        ballot_hash,
+        finalized,
+        winner,
+        winner_margin,
+        tally,
+    ) = value
+    return PollSnapshot(
+        poll_id=poll_id,
+        title=bytes(title),
+        choices=[bytes(choice) for choice in choices],
+        start_date_unix=start,
+        end_date_unix=end,
+        require_opt_in=require_opt_in,
+        eligibility_root=bytes(eligibility_root),
+        total_votes=total_votes,
+        open_ballots=open_ballots,
+        ballot_hash=bytes(ballot_hash),
+        finalized=finalized,
+        winner=winner,
+        winner_margin=winner_margin,
+        tally=list(tally),
+    )
+
+
+# Returns a consistent snapshot of the whole poll state in one round trip by simulating 'get_poll_snapshot'
+# (more logs are allowed so polls with many long choices can exceed the 1,024 byte log limit of the ABI return,
+# polls that exceed the 4,096 byte AVM value limit have to be read via 'get_poll_state' instead)
+def get_poll_snapshot(app_client: VoteChainClient, poll_id: int) -> PollSnapshot:
+    result = (
+        app_client.compose()
+        .get_poll_snapshot(
+            poll_id=poll_id,
+            transaction_parameters=TransactionParameters(
+                boxes=get_poll_box_references(poll_id, app_client.app_id)
+            ),
+        )
+        .simulate(SimulateOptions(allow_more_logs=True, allow_empty_signatures=True))
+    )
+    return decode_poll_snapshot(result.abi_results[0].return_value)
+
+
+# Returns the voting status of many accounts in a poll by packing 'get_voter_status' calls into simulated groups
+# (one simulate request per 16 accounts instead of one local state and one box request per account)
+def get_voter_statuses(
+    app_client: VoteChainClient, poll_id: int, addresses: Iterable[str]
+) -> dict[str, VoterStatus]:
+    # Identical calls in a group would share a transaction ID, so every account is only looked up once
+    unique_addresses = list(dict.fromkeys(addresses))
+
+    statuses: dict[str, VoterStatus] = {}
+    for start in range(0, len(unique_addresses), MAX_GROUP_SIZE):
+        chunk = unique_addresses[start : start + MAX_GROUP_SIZE]
+
+        composer = app_client.compose()
+        for address in chunk:
+            composer.get_voter_status(
+                poll_id=poll_id,
+                account=address,
+                transaction_parameters=TransactionParameters(
+                    accounts=[address],
+                    boxes=[(app_client.app_id, get_ballot_box_name(poll_id, address))],
+                ),
+            )
+
+        result = composer.simulate(SimulateOptions(allow_empty_signatures=True))
+        for address, abi_result in zip(chunk, result.abi_results, strict=True):
+            opted_in, votes_cast, voted, choice = abi_result.return_value
+            statuses[address] = VoterStatus(
+                address=address,
+                opted_in=opted_in,
+                votes_cast=votes_cast,
+                voted=voted,
+                choice=choice,
+            )
+
+    return statuses
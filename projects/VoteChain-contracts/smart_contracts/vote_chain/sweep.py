@@ -0,0 +1,73 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import logging
+
+from algokit_utils import TransactionParameters
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.artifacts.vote_chain.vote_chain_client import VoteChainClient
+from smart_contracts.vote_chain.contract import MAX_SWEEP_SIZE
+from smart_contracts.vote_chain.state import (
+    MAX_GROUP_SIZE,
+    get_ballot,
+    get_ballot_box_name,
+    get_poll_ballot_accounts,
+    get_poll_box_name,
+    get_poll_tally_box_name,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Releases every ballot box of a closed poll by sending groups of 16 'sweep' calls (the ballot boxes are listed once,
+# then released 48 per group), returns the number of ballot boxes swept (the App client sender must be the App creator)
+def sweep_poll(app_client: VoteChainClient, poll_id: int) -> int:
+    accounts = get_poll_ballot_accounts(app_client, poll_id)
+    group_size = MAX_GROUP_SIZE * MAX_SWEEP_SIZE
+
+    swept_total = 0
+    for group_start in range(0, len(accounts), group_size):
+        # Look up the MBR payer of every ballot box, the refunds go to those accounts (the voter or a sponsor). The
+        # contract reads the payer from the box, but its refund is an inner payment whose receiver must be an account
+        # referenced by the group, and only the box knows which account that is (a voter's MBR may have been paid by
+        # a sponsor), so every box is read once before the sweep calls are composed
+        mbr_payers: dict[str, str] = {}
+        for account in accounts[group_start : group_start + group_size]:
+            try:
+                mbr_payers[account] = get_ballot(app_client, poll_id, account).mbr_payer
+            except AlgodHTTPError as error:
+                # Ballot boxes reclaimed by their voters since the listing are skipped
+                if error.code != 404:
+                    raise
+
+        group_accounts = list(mbr_payers)
+        if not group_accounts:
+            continue
+
+        composer = app_client.compose()
+        for start in range(0, len(group_accounts), MAX_SWEEP_SIZE):
+            batch = group_accounts[start : start + MAX_SWEEP_SIZE]
+            composer.sweep(
+                poll_id=poll_id,
+                accounts=batch,
+                transaction_parameters=TransactionParameters(
+                    accounts=list(dict.fromkeys(mbr_payers[account] for account in batch)),
+                    boxes=[
+                        (app_client.app_id, get_poll_box_name(poll_id)),
+                        (app_client.app_id, get_poll_tally_box_name(poll_id)),
+                    ]
+                    + [
+                        (app_client.app_id, get_ballot_box_name(poll_id, account))
+                        for account in batch
+                    ],
+                ),
+            )
+
+        response = composer.execute()
+        swept = sum(result.return_value for result in response.abi_results)
+        swept_total += swept
+
+        logger.info(
+            f"Swept {swept} ballot boxes of poll {poll_id} in round {response.confirmed_round}"
+        )
+
+    return swept_total
@@ -0,0 +1,73 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import dataclasses
+import hashlib
+from collections.abc import Iterable
+
+from smart_contracts.artifacts.vote_chain.vote_chain_client import VoteChainClient
+from smart_contracts.vote_chain.state import Poll, get_poll
+
+
+@dataclasses.dataclass(kw_only=True)
+class ResultVerification:
+    ballot_hash: bytes
+    tally: list[int]
+    winner: int
+    winner_margin: int
+    hash_matches: bool
+    results_match: bool  # Recomputed tally totals, winner and margin match the finalized poll record
+
+    @property
+    def verified(self) -> bool:
+        return self.hash_matches and self.results_match
+
+
+# Returns the next link of a poll's ballot hash chain (see 'cast_ballot' in contract.py)
+def chain_ballot(ballot_hash: bytes, voter: bytes, choice: int) -> bytes:
+    return hashlib.sha256(ballot_hash + voter + choice.to_bytes(8, "big")).digest()
+
+
+# Recomputes a poll's ballot hash chain, tally, winner and margin in one streaming pass over its ballots
+# (ballots are '(voter public key, choice)' pairs in the order they were cast, e.g. the 'voter' and 'choice' columns of
+# the poll's 'VoteCast' events decoded by 'events.decode_events')
+def recompute_results(
+    ballots: Iterable[tuple[bytes, int]], choice_count: int
+) -> tuple[bytes, list[int], int, int]:
+    ballot_hash = bytes(32)
+    tally = [0] * choice_count
+
+    for voter, choice in ballots:
+        ballot_hash = chain_ballot(ballot_hash, voter, choice)
+        tally[choice - 1] += 1
+
+    # Ties go to the lowest choice number with a zero margin (same rule as 'finalize_results')
+    winner_total = max(tally)
+    winner = tally.index(winner_total) + 1
+    runner_up_total = max(
+        (total for i, total in enumerate(tally) if i != winner - 1), default=0
+    )
+
+    return ballot_hash, tally, winner, winner_total - runner_up_total
+
+
+# Verifies exported ballots against a poll record (the hash chain alone is checked until the poll is finalized)
+def verify_poll_record(poll: Poll, ballots: Iterable[tuple[bytes, int]]) -> ResultVerification:
+    ballot_hash, tally, winner, winner_margin = recompute_results(ballots, poll.choice_count)
+
+    return ResultVerification(
+        ballot_hash=ballot_hash,
+        tally=tally,
+        winner=winner,
+        winner_margin=winner_margin,
+        hash_matches=ballot_hash == poll.ballot_hash,
+        results_match=poll.finalized
+        and sum(tally) == poll.total_votes
+        and winner == poll.winner
+        and winner_margin == poll.winner_margin,
+    )
+
+
+# Verifies exported ballots against the on-chain poll record of a poll
+def verify_poll_results(
+    app_client: VoteChainClient, poll_id: int, ballots: Iterable[tuple[bytes, int]]
+) -> ResultVerification:
+    return verify_poll_record(get_poll(app_client, poll_id), ballots)
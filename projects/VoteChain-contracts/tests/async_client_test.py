@@ -0,0 +1,138 @@
+import asyncio
+import base64
+
+import httpx
+import msgpack
+import pytest
+from algosdk import abi, account, encoding
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.transaction import PaymentTxn, SignedTransaction, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from smart_contracts.vote_chain.async_client import AsyncAlgod, AsyncVoteChainClient, get_voter_statuses
+from smart_contracts.vote_chain.state import ABI_RETURN_PREFIX, VoterStatus
+
+ALGOD_ADDRESS = "http://localhost:4001"
+GENESIS_HASH = "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI="
+
+
+# Helper function: Returns the suggested params response of algod
+def suggested_params_response() -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "fee": 0,
+            "last-round": 1,
+            "genesis-hash": GENESIS_HASH,
+            "genesis-id": "dockernet-v1",
+            "consensus-version": "future",
+            "min-fee": 1_000,
+        },
+    )
+
+
+# Test case for sending simulate requests w/ the encoding and content type of the synchronous algod client
+def test_async_algod_simulate() -> None:
+    _, address = account.generate_account()
+    sp = SuggestedParams(fee=1_000, first=1, last=1_001, gh=GENESIS_HASH, flat_fee=True)
+    payment = PaymentTxn(sender=address, sp=sp, receiver=address, amt=0)
+    request = SimulateRequest(
+        txn_groups=[SimulateRequestTransactionGroup(txns=[SignedTransaction(payment, None)])],
+        allow_empty_signatures=True,
+    )
+    requests: list[httpx.Request] = []
+
+    def handle(http_request: httpx.Request) -> httpx.Response:
+        requests.append(http_request)
+        return httpx.Response(200, json={"txn-groups": []})
+
+    async def simulate() -> dict:
+        async with AsyncAlgod(ALGOD_ADDRESS) as async_algod:
+            # Algod is answered in process, the pooled client is swapped for one w/ a mock transport
+            await async_algod.http.aclose()
+            async_algod.http = httpx.AsyncClient(base_url=ALGOD_ADDRESS, transport=httpx.MockTransport(handle))
+            return await async_algod.simulate(request)
+
+    assert asyncio.run(simulate()) == {"txn-groups": []}, "Simulate response returned."
+
+    # Verify the body is the canonical msgpack encoding algod expects for 'application/msgpack'
+    (http_request,) = requests
+    assert http_request.headers["Content-Type"] == "application/msgpack", "Msgpack content type."
+    assert http_request.content == base64.b64decode(encoding.msgpack_encode(request)), "Canonical msgpack body."
+    assert http_request.url.params["format"] == "json", "JSON response requested."
+
+
+# Test case for raising the simulate failure of read-only calls instead of decoding their missing return values
+def test_get_voter_statuses_simulate_failure() -> None:
+    private_key, address = account.generate_account()
+    failure_message = "transaction rejected by ApprovalProgram"
+
+    def handle(http_request: httpx.Request) -> httpx.Response:
+        if http_request.url.path == "/v2/transactions/params":
+            return suggested_params_response()
+        return httpx.Response(
+            200,
+            json={
+                "txn-groups": [
+                    {"failure-message": failure_message, "txn-results": [{"txn-result": {"logs": []}}]}
+                ]
+            },
+        )
+
+    async def get_statuses() -> None:
+        async with AsyncAlgod(ALGOD_ADDRESS) as async_algod:
+            await async_algod.http.aclose()
+            async_algod.http = httpx.AsyncClient(base_url=ALGOD_ADDRESS, transport=httpx.MockTransport(handle))
+            client = AsyncVoteChainClient(
+                async_algod, app_id=1, sender=address, signer=AccountTransactionSigner(private_key)
+            )
+            await get_voter_statuses(client, 0, [address])
+
+    with pytest.raises(Exception, match=failure_message):
+        asyncio.run(get_statuses())
+
+
+# Test case for reading voter statuses w/ a client that has no sender or signer
+def test_get_voter_statuses_without_signer() -> None:
+    _, address = account.generate_account()
+    status_type = abi.ABIType.from_string("(bool,uint64,bool,uint64)")
+    return_log = base64.b64encode(ABI_RETURN_PREFIX + status_type.encode([True, 1, True, 2])).decode()
+    simulate_requests: list[dict] = []
+
+    def handle(http_request: httpx.Request) -> httpx.Response:
+        if http_request.url.path == "/v2/transactions/params":
+            return suggested_params_response()
+        simulate_requests.append(msgpack.unpackb(http_request.content, strict_map_key=False))
+        return httpx.Response(200, json={"txn-groups": [{"txn-results": [{"txn-result": {"logs": [return_log]}}]}]})
+
+    async def get_statuses() -> dict[str, VoterStatus]:
+        async with AsyncAlgod(ALGOD_ADDRESS) as async_algod:
+            await async_algod.http.aclose()
+            async_algod.http = httpx.AsyncClient(base_url=ALGOD_ADDRESS, transport=httpx.MockTransport(handle))
+            return await get_voter_statuses(AsyncVoteChainClient(async_algod, app_id=1), 0, [address])
+
+    assert asyncio.run(get_statuses()) == {
+        address: VoterStatus(address=address, opted_in=True, votes_cast=1, voted=True, choice=2)
+    }, "Voter status read w/o a signer."
+
+    # Verify the read is simulated from the zero address w/ empty signatures
+    (simulate_request,) = simulate_requests
+    (signed_txn,) = simulate_request["txn-groups"][0]["txns"]
+    assert signed_txn["txn"]["snd"] == encoding.decode_address(ZERO_ADDRESS), "Zero address sender."
+    assert "sig" not in signed_txn, "No signature."
+    assert simulate_request["allow-empty-signatures"], "Empty signatures allowed."
+
+
+# Test case for sending the extra headers of the synchronous algod client w/ every async request
+def test_async_algod_from_algod_client_headers() -> None:
+    algod_client = AlgodClient("token", ALGOD_ADDRESS, headers={"X-API-Key": "key"})
+
+    async def get_headers() -> httpx.Headers:
+        async with AsyncAlgod.from_algod_client(algod_client) as async_algod:
+            return async_algod.http.headers
+
+    headers = asyncio.run(get_headers())
+    assert headers["X-API-Key"] == "key", "Extra header sent."
+    assert headers["X-Algo-API-Token"] == "token", "API token sent."
@@ -0,0 +1,250 @@
+# tests/benchmark_test.py
+import base64
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+from algokit_utils import TransactionParameters
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+from algosdk.v2client.models import SimulateTraceConfig
+
+from smart_contracts.artifacts.vote_chain.vote_chain_client import (
+    Composer,
+    SimulateOptions,
+    VoteChainClient,
+)
+from smart_contracts.vote_chain.state import (
+    get_ballot_box_name,
+    get_poll_box_name,
+    get_poll_box_references,
+    get_poll_tally_box_name,
+)
+
+from .merkle_utils import OPEN_POLL_ROOT
+from .test_utils import calc_poll_boxes_mbr, setup_logger, setup_stxn
+
+# Setup the logging.Logger
+logger = setup_logger()
+
+# Integration tier, every test needs a running localnet (see 'vote_chain_emulator_test.py' for the fast tier), the
+# benchmarks build on each other and collect one baseline, so they stay on a single xdist worker ('--dist loadgroup')
+pytestmark = [pytest.mark.localnet, pytest.mark.xdist_group("benchmark")]
+
+# Baseline of the per-method costs, committed w/ the tests (a missing baseline fails unless it is being updated)
+BASELINE_PATH = Path(__file__).parent / "benchmark_baseline.json"
+
+# A method regresses when any of its metrics grows past the baseline value by more than this ratio
+REGRESSION_THRESHOLD = 0.10
+
+# Set to '1' to (re)write the baseline with the measured costs instead of comparing against it
+UPDATE_BASELINE = os.environ.get("VOTECHAIN_BENCHMARK_UPDATE") == "1"
+
+# ID of the poll set up by 'test_benchmark_setup_poll'
+POLL_ID = 0
+
+
+# Helper function: Simulates a composed group w/ execution traces and returns the costs of its last (app call) txn
+def simulate_method_costs(composer: Composer) -> dict[str, int]:
+    result = composer.simulate(
+        SimulateOptions(
+            exec_trace_config=SimulateTraceConfig(enable=True, state_change=True)
+        )
+    )
+    assert result.failure_message is None, f"Simulate failed: {result.failure_message}"
+
+    txn_result = result.simulate_response["txn-groups"][0]["txn-results"][-1]
+    applied_txn = txn_result["txn-result"]
+    trace = txn_result.get("exec-trace", {})
+
+    inner_txns = applied_txn.get("inner-txns", [])
+
+    return {
+        # Opcode budget consumed by the app call (includes the budget consumed by op-up inner transactions)
+        "opcode_cost": txn_result.get("app-budget-consumed", 0),
+        # Number of approval program steps recorded by the execution trace
+        "trace_steps": len(trace.get("approval-program-trace", [])),
+        "log_bytes": sum(len(base64.b64decode(log)) for log in applied_txn.get("logs", [])),
+        "fee": applied_txn["txn"]["txn"].get("fee", 0),
+        "inner_fee": sum(inner["txn"]["txn"].get("fee", 0) for inner in inner_txns),
+    }
+
+
+# Collects the measured costs of every benchmarked method during the test session
+@pytest.fixture(scope="module")
+def costs() -> dict[str, dict[str, int]]:
+    return {}
+
+
+# Generate Algorand client that points to the default local net port and token
+@pytest.fixture(scope="module")
+def algorand() -> AlgorandClient:
+    return AlgorandClient.default_local_net()
+
+
+# Generate a creator account for benchmarking and fund it with some ALGO via the dispenser account
+@pytest.fixture(scope="module")
+def creator(algorand: AlgorandClient) -> AddressAndSigner:
+    creator = algorand.account.random()
+    algorand.send.payment(
+        setup_stxn(algorand, algorand.account.dispenser(), creator.address, 10_000_000)
+    )
+    return creator
+
+
+# Generate a fresh smart contract App client so every benchmark run starts from the same App state
+@pytest.fixture(scope="module")
+def app_client(algorand: AlgorandClient, creator: AddressAndSigner) -> VoteChainClient:
+    app_client = VoteChainClient(
+        algod_client=algorand.client.algod,
+        sender=creator.address,
+        signer=creator.signer,
+    )
+    app_client.create_generate()
+    return app_client
+
+
+# Benchmark case for the 'global_storage_mbr' abimethod
+def test_benchmark_global_storage_mbr(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    creator: AddressAndSigner,
+    costs: dict[str, dict[str, int]],
+) -> None:
+    composer = app_client.compose().global_storage_mbr(
+        mbr_pay=setup_stxn(algorand, creator, app_client.app_address, 314_000, 1000)
+    )
+
+    costs["global_storage_mbr"] = simulate_method_costs(composer)
+    composer.execute()
+
+
+# Benchmark case for the 'local_storage_mbr' opt-in abimethod
+def test_benchmark_local_storage_mbr(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    creator: AddressAndSigner,
+    costs: dict[str, dict[str, int]],
+) -> None:
+    composer = app_client.compose().opt_in_local_storage_mbr(
+        account=creator.address,
+        mbr_pay=setup_stxn(algorand, creator, app_client.app_address, 278_500, 1000),
+        transaction_parameters=TransactionParameters(foreign_apps=[app_client.app_id]),
+    )
+
+    costs["local_storage_mbr"] = simulate_method_costs(composer)
+    composer.execute()
+
+
+# Benchmark case for the 'setup_poll' abimethod (the poll is open for voting so 'submit_vote' can be benchmarked)
+def test_benchmark_setup_poll(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    creator: AddressAndSigner,
+    costs: dict[str, dict[str, int]],
+) -> None:
+    title = b"Benchmark poll"
+    choices = [b"Yes", b"No", b"Abstain"]
+
+    # Voting period started a day ago and ends in 6 days
+    start_date_unix = int(time.time()) - 24 * 60 * 60
+    end_date_unix = start_date_unix + 7 * 24 * 60 * 60
+
+    composer = app_client.compose().setup_poll(
+        mbr_pay=setup_stxn(
+            algorand,
+            creator,
+            app_client.app_address,
+            calc_poll_boxes_mbr(title, choices),
+            1000,
+        ),
+        title=title,
+        choices=choices,
+        require_opt_in=False,
+        eligibility_root=OPEN_POLL_ROOT,
+        start_date_str=time.strftime("%m/%d/%Y", time.localtime(start_date_unix)),
+        start_date_unix=start_date_unix,
+        end_date_str=time.strftime("%m/%d/%Y", time.localtime(end_date_unix)),
+        end_date_unix=end_date_unix,
+        transaction_parameters=TransactionParameters(
+            boxes=get_poll_box_references(POLL_ID, app_client.app_id)
+        ),
+    )
+
+    costs["setup_poll"] = simulate_method_costs(composer)
+    composer.execute()
+
+
+# Benchmark case for the 'submit_vote' abimethod
+def test_benchmark_submit_vote(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    creator: AddressAndSigner,
+    costs: dict[str, dict[str, int]],
+) -> None:
+    composer = app_client.compose().submit_vote(
+        poll_id=POLL_ID,
+        account=creator.address,
+        mbr_pay=setup_stxn(algorand, creator, app_client.app_address, 34_900, 1000),
+        choice=1,
+        proof=[],
+        transaction_parameters=TransactionParameters(
+            boxes=[
+                (app_client.app_id, get_poll_box_name(POLL_ID)),
+                (app_client.app_id, get_poll_tally_box_name(POLL_ID)),
+                (app_client.app_id, get_ballot_box_name(POLL_ID, creator.address)),
+            ]
+        ),
+    )
+
+    costs["submit_vote"] = simulate_method_costs(composer)
+    composer.execute()
+
+
+# Benchmark case for the 'opt_out' close out abimethod
+def test_benchmark_opt_out(
+    app_client: VoteChainClient,
+    creator: AddressAndSigner,
+    costs: dict[str, dict[str, int]],
+) -> None:
+    composer = app_client.compose().close_out_opt_out(account=creator.address)
+
+    costs["opt_out"] = simulate_method_costs(composer)
+    composer.execute()
+
+
+# Compares the measured costs against the baseline (or writes the baseline when asked to update it)
+def test_benchmark_baseline(costs: dict[str, dict[str, int]]) -> None:
+    logger.info(f"Benchmark costs: {json.dumps(costs, indent=2)}")
+
+    if UPDATE_BASELINE:
+        BASELINE_PATH.write_text(json.dumps(costs, indent=2, sort_keys=True) + "\n")
+        logger.info(f"Benchmark baseline written to: {BASELINE_PATH}")
+        return
+
+    if not BASELINE_PATH.exists():
+        pytest.fail(f"No benchmark baseline at {BASELINE_PATH}, run w/ 'VOTECHAIN_BENCHMARK_UPDATE=1' to record it")
+
+    baseline: dict[str, dict[str, int]] = json.loads(BASELINE_PATH.read_text())
+
+    # Every measured metric of every benchmarked method needs a baseline value, otherwise it could never regress
+    missing = [
+        f"{method}.{metric}"
+        for method, metrics in costs.items()
+        for metric in metrics
+        if metric not in baseline.get(method, {})
+    ]
+    assert not missing, f"Metrics missing from the benchmark baseline: {missing}"
+
+    regressions = [
+        f"{method}.{metric}: {value} (baseline {baseline[method][metric]})"
+        for method, metrics in costs.items()
+        for metric, value in metrics.items()
+        if value > baseline[method][metric] * (1 + REGRESSION_THRESHOLD)
+    ]
+
+    assert not regressions, "Methods regressed past the benchmark baseline:\n" + "\n".join(
+        regressions
+    )
@@ -0,0 +1,84 @@
+import base64
+from pathlib import Path
+
+import msgpack
+import pytest
+from algosdk import account, encoding
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.transaction import ApplicationNoOpTxn, PaymentTxn, SignedTransaction, SuggestedParams
+
+from smart_contracts.vote_chain.blocks import BlockCache
+
+APP_ID = 1234
+GENESIS_ID = "dockernet-v1"
+GENESIS_HASH = "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI="
+SUGGESTED_PARAMS = SuggestedParams(fee=1_000, first=1, last=1_001, gh=GENESIS_HASH, gen=GENESIS_ID, flat_fee=True)
+
+
+# Algod stand-in that serves one msgpack encoded block and counts the block fetches (strs holding binary data, see
+# 'go_codec_str', are packed as str-typed bytes like go-codec does)
+class BlockAlgod:
+    def __init__(self, block: dict) -> None:
+        self.blob = msgpack.packb({"block": block}, use_bin_type=True, unicode_errors="surrogateescape")
+        self.block_fetches = 0
+
+    def versions(self) -> dict:
+        return {"genesis_hash_b64": GENESIS_HASH}
+
+    def block_info(self, round_num: int, response_format: str) -> bytes:
+        assert response_format == "msgpack", "Blocks are fetched as msgpack."
+        self.block_fetches += 1
+        return self.blob
+
+
+# Returns binary data that is packed as a msgpack str, as go-codec encodes the 'lg' logs of a block
+def go_codec_str(data: bytes) -> str:
+    return data.decode(errors="surrogateescape")
+
+
+# Returns a signed transaction laid out as in a block (genesis hash and ID left out) w/ its apply data
+def block_txn(signed_txn: SignedTransaction, apply_data: dict | None = None) -> dict:
+    encoded = msgpack.unpackb(base64.b64decode(encoding.msgpack_encode(signed_txn)), raw=False)
+    txn = {key: value for key, value in encoded["txn"].items() if key not in ("gh", "gen")}
+    return {"txn": txn, "sig": encoded["sig"], "hgi": True, **({"dt": apply_data} if apply_data else {})}
+
+
+# Test case for fetching a round once and decoding tx IDs, fees and App logs (str-typed binary data, as encoded by
+# algod) from the cached msgpack blob
+def test_block_cache(tmp_path: Path) -> None:
+    private_key, address = account.generate_account()
+    signer = AccountTransactionSigner(private_key)
+
+    payment = PaymentTxn(sender=address, sp=SUGGESTED_PARAMS, receiver=address, amt=1_000)
+    app_call = ApplicationNoOpTxn(sender=address, sp=SUGGESTED_PARAMS, index=APP_ID, app_args=[b"vote"])
+    signed_payment, signed_app_call = signer.sign_transactions([payment, app_call], [0, 1])
+
+    # An event log that is not valid UTF-8 and an 'itob' log that is
+    logs = [bytes.fromhex("8a0f3cff00000000000000010000000000000002"), (42).to_bytes(8, "big")]
+
+    algod = BlockAlgod(
+        {
+            "gen": GENESIS_ID,
+            "gh": base64.b64decode(GENESIS_HASH),
+            "rnd": 10,
+            "txns": [
+                block_txn(signed_payment),
+                block_txn(signed_app_call, {"lg": [go_codec_str(entry) for entry in logs]}),
+            ],
+        }
+    )
+
+    # Verify the logs are str-typed in the blob, so a plain UTF-8 decode of the block fails
+    with pytest.raises(UnicodeDecodeError):
+        msgpack.unpackb(algod.blob, raw=False, strict_map_key=False)
+
+    # Verify the round is fetched once, however often it is read
+    cache = BlockCache(algod, tmp_path)
+    block = cache.get_block(10)
+    assert BlockCache(algod, tmp_path).get_block(10).block == block.block, "Cached block read back."
+    assert algod.block_fetches == 1 and cache.fetches == 1, "Round fetched once."
+
+    # Verify the locally computed tx IDs match the transaction IDs computed by the SDK
+    assert block.tx_ids == [payment.get_txid(), app_call.get_txid()], "Tx IDs computed from the block."
+    assert block.fees == [1_000, 1_000], "Fees decoded."
+    assert block.app_logs(APP_ID) == logs, "App call logs decoded to the bytes they hold."
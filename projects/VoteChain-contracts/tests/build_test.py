@@ -0,0 +1,180 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers import build as build_helper
+
+CONTRACT_SOURCE = """\
+from algopy import ARC4Contract
+
+from smart_contracts.demo.state import Record
+from . import helpers
+"""
+
+
+# Returns a contract package w/ an absolute and a relative import of project modules (and a module it does not import)
+def create_contract(root_dir: Path, name: str = "demo") -> Path:
+    package_dir = root_dir / "smart_contracts" / name
+    package_dir.mkdir(parents=True)
+    (root_dir / "pyproject.toml").write_text("")
+    (root_dir / "smart_contracts" / "__init__.py").write_text("")
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "contract.py").write_text(CONTRACT_SOURCE.replace("demo", name))
+    (package_dir / "state.py").write_text("Record = bytes\n")
+    (package_dir / "helpers.py").write_text("")
+    (package_dir / "deploy_config.py").write_text("")
+    return package_dir / "contract.py"
+
+
+# Stand-in for the AlgoKit CLI: writes placeholder artifacts and records every compile and client generation
+class FakeToolchain:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.version = "puyapy 3.0.0"
+        self.broken_contract: str | None = None  # Name of a contract that fails to compile
+
+    def run(self, args: list[object], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        command = [str(arg) for arg in args]
+        if "--version" in command:
+            return subprocess.CompletedProcess(command, 0, stdout=self.version)
+
+        if "compile" in command:
+            out_dir = Path(next(arg for arg in command if arg.startswith("--out-dir="))[len("--out-dir=") :])
+            if out_dir.name == self.broken_contract:
+                return subprocess.CompletedProcess(command, 1, stdout="error: invalid syntax")
+            (out_dir / "Demo.arc32.json").write_text("{}")
+            (out_dir / "Demo.approval.teal").write_text("#pragma version 10")
+            self.calls.append("compile")
+        else:
+            # The generator fills in the contract name of the output path
+            output_path = Path(command[command.index("--output") + 1].replace("{contract_name}", "demo"))
+            output_path.write_text("# client")
+            self.calls.append("generate")
+
+        return subprocess.CompletedProcess(command, 0, stdout="")
+
+
+@pytest.fixture()
+def toolchain(monkeypatch: pytest.MonkeyPatch) -> FakeToolchain:
+    fake = FakeToolchain()
+    monkeypatch.delenv(build_helper.typescript_client_env, raising=False)
+    monkeypatch.setattr(build_helper.subprocess, "run", fake.run)
+    monkeypatch.setattr(build_helper, "toolchain_packages", ("puyapy",))
+    monkeypatch.setattr(build_helper.metadata, "version", _package_not_found)
+    return fake
+
+
+def _package_not_found(package: str) -> str:
+    raise build_helper.metadata.PackageNotFoundError(package)
+
+
+# Test case for hashing the contract module and the project modules it imports (directly or via another module)
+def test_source_paths(tmp_path: Path) -> None:
+    contract_path = create_contract(tmp_path)
+    package_dir = contract_path.parent
+
+    source_names = {path.name for path in build_helper._get_source_paths(contract_path)}
+    assert {"contract.py", "state.py", "helpers.py"} <= source_names, "Imported project modules are sources."
+    assert "deploy_config.py" not in source_names, "Modules the contract does not import are not sources."
+
+    # Verify modules imported by an imported module are followed
+    (package_dir / "helpers.py").write_text("from .deploy_config import *\n")
+    source_names = {path.name for path in build_helper._get_source_paths(contract_path)}
+    assert "deploy_config.py" in source_names, "Transitive imports are sources."
+
+
+# Test case for resolving project imports of a contract in a namespace package (no '__init__.py' next to it)
+def test_source_paths_namespace_package(tmp_path: Path) -> None:
+    contract_path = create_contract(tmp_path)
+    (contract_path.parent / "__init__.py").unlink()
+
+    # Verify module names are resolved from the project directory, not from the contract directory
+    assert build_helper._get_root_dir(contract_path) == tmp_path.resolve(), "Project directory is the root."
+    source_names = {path.name for path in build_helper._get_source_paths(contract_path)}
+    assert {"contract.py", "state.py", "helpers.py"} <= source_names, "Imported project modules are sources."
+
+
+# Test case for skipping unchanged builds and rebuilding on source, toolchain and artifact changes
+def test_incremental_build(tmp_path: Path, toolchain: FakeToolchain) -> None:
+    contract_path = create_contract(tmp_path)
+    output_dir = tmp_path / "artifacts" / "demo"
+
+    # Verify the first build compiles, generates the client and writes the manifest
+    app_spec_path = build_helper.build(output_dir, contract_path)
+    assert sorted(toolchain.calls) == ["compile", "generate"], "First build runs the toolchain."
+    assert not (output_dir / "demoClient.ts").exists(), "TypeScript client not generated by default."
+    assert app_spec_path == output_dir / "Demo.arc32.json", "App spec returned."
+    build_helper.verify_build(output_dir, contract_path)
+
+    # Verify an unchanged build leaves the artifacts untouched
+    client_mtime = (output_dir / "demo_client.py").stat().st_mtime_ns
+    assert build_helper.build(output_dir, contract_path) == app_spec_path, "App spec returned w/o building."
+    assert len(toolchain.calls) == 2, "Unchanged build skipped."
+    assert (output_dir / "demo_client.py").stat().st_mtime_ns == client_mtime, "Artifacts untouched."
+
+    # Verify a changed imported module makes the artifacts stale until rebuilt
+    (contract_path.parent / "state.py").write_text("Record = str\n")
+    with pytest.raises(Exception, match="contract sources or toolchain changed"):
+        build_helper.verify_build(output_dir, contract_path)
+    build_helper.build(output_dir, contract_path)
+    assert toolchain.calls.count("compile") == 2, "Source change rebuilt."
+    build_helper.verify_build(output_dir, contract_path)
+
+    # Verify a new compiler version and modified artifacts both trigger a rebuild
+    toolchain.version = "puyapy 3.1.0"
+    build_helper.build(output_dir, contract_path)
+    assert toolchain.calls.count("compile") == 3, "Toolchain change rebuilt."
+
+    (output_dir / "Demo.approval.teal").write_text("#pragma version 9")
+    with pytest.raises(Exception, match="artifacts were modified"):
+        build_helper.verify_build(output_dir, contract_path)
+    build_helper.build(output_dir, contract_path)
+    assert toolchain.calls.count("compile") == 4, "Artifact change rebuilt."
+
+    # Verify a forced build always runs the toolchain
+    build_helper.build(output_dir, contract_path, force=True)
+    assert toolchain.calls.count("compile") == 5, "Forced build rebuilt."
+
+
+# Test case for building several contracts w/ logs kept per contract and failures reported after every build finished
+def test_build_all(tmp_path: Path, toolchain: FakeToolchain) -> None:
+    contract_paths = [create_contract(tmp_path, name) for name in ("first", "second")]
+    builds = [(tmp_path / "artifacts" / path.parent.name, path) for path in contract_paths]
+
+    # The stand-in toolchain is patched in this process, so the builds run w/o a process pool
+    app_spec_paths = build_helper.build_all(builds, max_workers=1)
+    assert app_spec_paths == [output_dir / "Demo.arc32.json" for output_dir, _ in builds], "Paths in build order."
+    assert toolchain.calls.count("compile") == 2, "Every contract compiled."
+
+    # Verify a failing contract does not stop the other builds
+    toolchain.broken_contract = "first"
+    (contract_paths[0].parent / "state.py").write_text("Record = str\n")
+    (contract_paths[1].parent / "state.py").write_text("Record = str\n")
+    with pytest.raises(Exception, match="1 of 2 contract builds failed"):
+        build_helper.build_all(builds, max_workers=1)
+    assert toolchain.calls.count("compile") == 3, "Second contract still built."
+    build_helper.verify_build(*builds[1])
+
+
+# Test case for collecting the log lines of a build instead of writing them
+def test_build_logs_collected(tmp_path: Path, toolchain: FakeToolchain) -> None:
+    contract_path = create_contract(tmp_path)
+    result = build_helper._build_in_worker(tmp_path / "artifacts" / "demo", contract_path)
+
+    assert result.error is None, "Build succeeded."
+    assert any("Exporting" in line for line in result.logs), "Build logs collected."
+    assert sum("Generated typed client" in line for line in result.logs) == 1, "Client generation logs collected."
+    assert build_helper.logger.propagate, "Logger restored."
+
+
+# Test case for opting in to the TypeScript client, generated next to the Python client
+def test_typescript_client_opt_in(tmp_path: Path, toolchain: FakeToolchain, monkeypatch: pytest.MonkeyPatch) -> None:
+    contract_path = create_contract(tmp_path)
+    output_dir = tmp_path / "artifacts" / "demo"
+    monkeypatch.setenv(build_helper.typescript_client_env, "1")
+
+    build_helper.build(output_dir, contract_path)
+    assert toolchain.calls.count("generate") == 2, "Both typed clients generated."
+    assert (output_dir / "demo_client.py").exists(), "Python client generated."
+    assert (output_dir / "demoClient.ts").exists(), "TypeScript client generated."
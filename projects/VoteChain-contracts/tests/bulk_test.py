@@ -0,0 +1,56 @@
+from algosdk import account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner, TransactionWithSigner
+from algosdk.transaction import PaymentTxn, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.vote_chain.vote_chain_client import Composer, VoteChainClient
+from smart_contracts.vote_chain.bulk import BulkComposer
+
+APP_ID = 1234
+SUGGESTED_PARAMS = SuggestedParams(
+    fee=1_000, first=1, last=1_001, gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=", flat_fee=True
+)
+
+
+# Test case for composing every call exactly once while packing the calls into groups of at most 16 transactions
+def test_bulk_composer_groups() -> None:
+    private_key, address = account.generate_account()
+    signer = AccountTransactionSigner(private_key)
+
+    # Transactions are only built, so the App client never talks to algod
+    app_client = VoteChainClient(
+        algod_client=AlgodClient("", "http://localhost:4001"),
+        app_id=APP_ID,
+        sender=address,
+        signer=signer,
+        suggested_params=SUGGESTED_PARAMS,
+    )
+
+    # Every opt-in is a MBR payment + app call pair, the number of times a call composes is counted per call
+    call_counts = [0] * 9
+
+    def opt_in(composer: Composer, index: int) -> None:
+        call_counts[index] += 1
+        mbr_pay = PaymentTxn(
+            sender=address, sp=SUGGESTED_PARAMS, receiver=app_client.app_address, amt=278_500, note=bytes([index])
+        )
+        composer.opt_in_local_storage_mbr(
+            account=address, mbr_pay=TransactionWithSigner(txn=mbr_pay, signer=signer)
+        )
+
+    bulk = BulkComposer(app_client)
+    for index in range(len(call_counts)):
+        bulk.add(lambda composer, index=index: opt_in(composer, index))
+    groups = bulk._build_groups()
+
+    # Verify every call ran once and the pairs were packed into a full group and a group w/ the remaining pair
+    assert call_counts == [1] * 9, "Every call composed once."
+    assert [group.atc.get_tx_count() for group in groups] == [16, 2], "Calls packed into 16 transaction groups."
+    assert [group.call_indexes for group in groups] == [list(range(8)), [8]], "Calls keep their input order."
+
+    # Verify the ABI methods moved w/ their app calls, which follow their MBR payments
+    for group in groups:
+        assert sorted(group.atc.method_dict) == group.app_call_positions, "Methods at the app call positions."
+        assert group.app_call_positions == list(range(1, group.atc.get_tx_count(), 2)), "App calls follow payments."
+        assert all(method.name == "local_storage_mbr" for method in group.atc.method_dict.values())
+    assert [txn.txn.note for txn in groups[1].atc.txn_list] == [bytes([8]), None], "Last pair moved intact."
@@ -0,0 +1,156 @@
+import types
+
+import pytest
+from algosdk import account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.transaction import PaymentTxn, SuggestedParams
+
+from smart_contracts.vote_chain import cache as cache_module
+from smart_contracts.vote_chain.cache import CachingAlgodClient, RoundCache
+
+APP_ID = 1234
+GENESIS_HASH = "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI="
+
+
+# Caching client stand-in that answers the requests algod would get at 'last_round' and counts them per path
+class StubCachingAlgod(CachingAlgodClient):
+    def __init__(self, last_round: int) -> None:
+        super().__init__("", "http://localhost:4001")
+        self.last_round = last_round
+        self.requests: dict[str, int] = {}
+
+    def algod_request(self, method: str, requrl: str, *args: object, **kwargs: object) -> dict:
+        self.requests[requrl] = self.requests.get(requrl, 0) + 1
+        if requrl in ("/status", f"/status/wait-for-block-after/{self.last_round - 1}"):
+            return {"last-round": self.last_round}
+        if requrl == "/transactions/params":
+            return {
+                "consensus-version": "future",
+                "fee": 0,
+                "genesis-hash": GENESIS_HASH,
+                "genesis-id": "dockernet-v1",
+                "last-round": self.last_round,
+                "min-fee": 1_000,
+            }
+        if requrl == f"/applications/{APP_ID}":
+            return {"id": APP_ID, "params": {"global-state": []}}
+        if requrl == "/transactions":
+            return {"txId": "TXID"}
+        # Local state responses report the round they were read at
+        return {"app-local-state": {"key-value": []}, "round": self.last_round}
+
+
+# Freezes the monotonic clock of the caching client (advance it by setting 'clock.now')
+@pytest.fixture(autouse=True)
+def clock(monkeypatch: pytest.MonkeyPatch) -> types.SimpleNamespace:
+    clock = types.SimpleNamespace(now=1_000.0)
+    monkeypatch.setattr(cache_module, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+# Test case for round tagged cache entries expiring once a newer round is seen
+def test_round_cache_expiry() -> None:
+    cache = RoundCache()
+    cache.put(("app", 1), 100, {"params": {}})
+    cache.put(("params",), 100, "suggested params")
+
+    # Verify state entries are only served for the round they were read at
+    assert cache.get(("app", 1), 100) == {"params": {}}, "Same round hit."
+    assert cache.get(("app", 1), 101) is None, "New round miss."
+
+    # Verify entries w/ a max age keep being served for that many rounds
+    assert cache.get(("params",), 105, max_age_rounds=10) == "suggested params", "Within max age hit."
+    assert cache.get(("params",), 111, max_age_rounds=10) is None, "Past max age miss."
+
+
+# Test case for the bounded size w/ least recently used eviction and write invalidation
+def test_round_cache_eviction_and_invalidation() -> None:
+    cache = RoundCache(max_size=2)
+    cache.put(("app", 1), 100, "first")
+    cache.put(("app", 2), 100, "second")
+
+    # Reading the first entry makes the second one the least recently used
+    assert cache.get(("app", 1), 100) == "first", "First entry hit."
+    cache.put(("app", 3), 100, "third")
+
+    # Verify the least recently used entry was evicted
+    assert len(cache) == 2, "Cache is bounded."
+    assert cache.get(("app", 2), 100) is None, "Least recently used entry evicted."
+
+    # Verify invalidation keeps the requested entry kinds only
+    cache.put(("params",), 100, "suggested params")
+    cache.invalidate(keep=("params",))
+    assert len(cache) == 1 and cache.get(("params",), 100) == "suggested params", "Only params kept."
+
+
+# Test case for tagging cached reads w/ the round of their algod response and dropping them once a newer round is seen
+def test_caching_algod_response_rounds() -> None:
+    algod = StubCachingAlgod(last_round=100)
+    address = "A" * 58
+    local_path = f"/accounts/{address}/applications/{APP_ID}"
+
+    # Verify repeated reads in a round are served from the cache, w/ one status request before the first read
+    for _ in range(3):
+        algod.application_info(APP_ID)
+        algod.account_application_info(address, APP_ID)
+        params = algod.suggested_params()
+    assert algod.requests == {"/status": 1, f"/applications/{APP_ID}": 1, local_path: 1, "/transactions/params": 1}
+    assert algod.current_round() == 100 and params.first == 100, "Round taken from the responses."
+
+    # Verify the wait for a new round drops the cached state, suggested params are kept for 10 rounds
+    algod.last_round = 101
+    assert algod.status_after_block(100)["last-round"] == 101, "New round seen."
+    algod.application_info(APP_ID)
+    algod.suggested_params()
+    assert algod.requests[f"/applications/{APP_ID}"] == 2, "App state read again."
+    assert algod.requests["/transactions/params"] == 1, "Suggested params still cached."
+
+    # Verify a newer round reported by a state read drops the entries read at older rounds
+    algod.last_round = 102
+    algod.account_application_info("B" * 58, APP_ID)
+    assert algod.current_round() == 102, "Round of the local state response seen."
+    algod.application_info(APP_ID)
+    assert algod.requests[f"/applications/{APP_ID}"] == 3, "App state of an older round dropped."
+    assert algod.requests.get("/status") == 1, "No further status requests."
+
+
+# Test case for dropping the cached state once a transaction is sent through the client
+def test_caching_algod_send_invalidation() -> None:
+    algod = StubCachingAlgod(last_round=100)
+    algod.application_info(APP_ID)
+    algod.suggested_params()
+
+    # Verify a sent transaction drops the App state in the same round, suggested params are kept
+    private_key, address = account.generate_account()
+    sp = SuggestedParams(fee=1_000, first=100, last=1_100, gh=GENESIS_HASH, flat_fee=True)
+    payment = PaymentTxn(sender=address, sp=sp, receiver=address, amt=0)
+    (signed_payment,) = AccountTransactionSigner(private_key).sign_transactions([payment], [0])
+    assert algod.send_transaction(signed_payment) == "TXID", "Transaction sent."
+    algod.application_info(APP_ID)
+    algod.suggested_params()
+    assert algod.requests[f"/applications/{APP_ID}"] == 2, "App state read again after the send."
+    assert algod.requests["/transactions/params"] == 1, "Suggested params still cached."
+
+
+# Test case for asking algod for the current round once no response has reported it for a while
+def test_caching_algod_round_refresh(clock: types.SimpleNamespace) -> None:
+    algod = StubCachingAlgod(last_round=100)
+    algod.application_info(APP_ID)
+    assert algod.requests == {"/status": 1, f"/applications/{APP_ID}": 1}
+
+    # Verify the App state is served from the cache within the refresh interval, even though the chain advanced
+    algod.last_round = 101
+    clock.now += cache_module.ROUND_REFRESH_SECONDS / 2
+    algod.application_info(APP_ID)
+    assert algod.requests == {"/status": 1, f"/applications/{APP_ID}": 1}, "Served from the cache."
+
+    # Verify the chain advancing w/o this client seeing it is picked up once the refresh interval passed
+    clock.now += cache_module.ROUND_REFRESH_SECONDS
+    algod.application_info(APP_ID)
+    assert algod.current_round() == 101, "Current round asked from algod."
+    assert algod.requests == {"/status": 2, f"/applications/{APP_ID}": 2}, "App state of the older round dropped."
+
+    # Verify an unchanged round keeps the cached state after the refresh
+    clock.now += cache_module.ROUND_REFRESH_SECONDS
+    algod.application_info(APP_ID)
+    assert algod.requests == {"/status": 3, f"/applications/{APP_ID}": 2}, "Same round still cached."
@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 from algokit_utils import (
     get_algod_client,
@@ -24,3 +27,10 @@ def algod_client() -> AlgodClient:
 @pytest.fixture(scope="session")
 def indexer_client() -> IndexerClient:
     return get_indexer_client(get_default_localnet_config("indexer"))
+
+
+# Process pool shared by every 'ParallelTransactionSigner' of the test session
+@pytest.fixture(scope="session")
+def signing_pool() -> Iterator[ProcessPoolExecutor]:
+    with ProcessPoolExecutor() as executor:
+        yield executor
@@ -0,0 +1,100 @@
+import base64
+import csv
+from pathlib import Path
+
+from algosdk import account
+from algosdk.encoding import decode_address
+
+from smart_contracts.vote_chain.events import EVENT_LAYOUTS
+from smart_contracts.vote_chain.export import (
+    EXPORT_COLUMNS,
+    iter_column_batches,
+    iter_export_rows,
+    write_csv,
+)
+
+APP_ID = 1234
+LAYOUTS = {layout.name: layout for layout in EVENT_LAYOUTS}
+
+
+# Returns a base64 encoded event log entry like the ones in indexer responses
+def event_log(name: str, *values: int | bytes) -> str:
+    layout = LAYOUTS[name]
+    return base64.b64encode(layout.selector + layout.body.pack(*values)).decode()
+
+
+# Returns an indexer transaction calling 'app_id' w/ the given logs
+def indexer_txn(tx_id: str, round_num: int, app_id: int, logs: list[str], inner_txns: list[dict] | None = None) -> dict:
+    return {
+        "id": tx_id,
+        "confirmed-round": round_num,
+        "round-time": 1_700_000_000 + round_num,
+        "fee": 1_000,
+        "application-transaction": {"application-id": app_id},
+        "logs": logs,
+        "inner-txns": inner_txns or [],
+    }
+
+
+# Test case for decoding ballots and opt-outs (incl. inner App calls) into rows filtered by poll
+def test_iter_export_rows() -> None:
+    _, voter = account.generate_account()
+    _, other_voter = account.generate_account()
+
+    txns = [
+        # Direct vote w/ a plain log entry and an ABI return that must be skipped
+        indexer_txn(
+            "TX1",
+            10,
+            APP_ID,
+            [
+                base64.b64encode(b"Final poll tally: ").decode(),
+                event_log("VoteCast", 0, decode_address(voter), 2),
+                base64.b64encode(bytes.fromhex("151f7c75") + (1).to_bytes(8, "big")).decode(),
+            ],
+        ),
+        # Another App calling VoteChain w/ an inner transaction, one vote for a different poll
+        indexer_txn(
+            "TX2",
+            11,
+            999,
+            [],
+            [
+                indexer_txn("", 11, APP_ID, [event_log("VoteCast", 1, decode_address(other_voter), 0)]),
+            ],
+        ),
+        indexer_txn("TX3", 12, APP_ID, [event_log("OptedOut", decode_address(voter))]),
+    ]
+
+    rows = list(iter_export_rows(txns, APP_ID, poll_id=0))
+
+    # Verify the poll 1 ballot is filtered out while the opt-out is kept for every poll
+    assert [(row.tx_id, row.event, row.poll_id, row.account, row.choice) for row in rows] == [
+        ("TX1", "VoteCast", 0, voter, 2),
+        ("TX3", "OptedOut", None, voter, None),
+    ], "Rows decoded and filtered."
+
+    # Verify the inner call ballot is exported under the top level transaction ID
+    all_rows = list(iter_export_rows(txns, APP_ID))
+    assert [row.tx_id for row in all_rows] == ["TX1", "TX2", "TX3"], "Inner App call ballot exported."
+
+
+# Test case for writing rows in bounded batches to CSV
+def test_write_csv_batches(tmp_path: Path) -> None:
+    _, voter = account.generate_account()
+    txns = [
+        indexer_txn(f"TX{round_num}", round_num, APP_ID, [event_log("VoteCast", 0, decode_address(voter), 1)])
+        for round_num in range(5)
+    ]
+
+    # Verify rows are grouped into batches of at most 2 rows
+    batches = list(iter_column_batches(iter_export_rows(txns, APP_ID), batch_size=2))
+    assert [len(batch["round"]) for batch in batches] == [2, 2, 1], "Rows batched."
+
+    # Verify every row is written once w/ a header row
+    path = tmp_path / "votes.csv"
+    assert write_csv(batches, path) == 5, "Every row written."
+    with path.open() as file:
+        written = list(csv.reader(file))
+    assert written[0] == list(EXPORT_COLUMNS), "Header written."
+    assert [row[2] for row in written[1:]] == [f"TX{round_num}" for round_num in range(5)], "Rows in order."
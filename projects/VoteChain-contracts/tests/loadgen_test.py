@@ -0,0 +1,59 @@
+import collections
+
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algosdk import account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.vote_chain.vote_chain_client import VoteChainClient
+from smart_contracts.vote_chain.loadgen import WAVES, InProcessTarget, LoadGenerator, WaveReport
+
+APP_ID = 1234
+
+
+# Returns a load generator against the in-process stand-in (the App client never reaches a node)
+def in_process_generator(target: InProcessTarget) -> LoadGenerator:
+    private_key, address = account.generate_account()
+    app_client = VoteChainClient(
+        algod_client=AlgodClient("", "http://localhost:1"),
+        app_id=APP_ID,
+        sender=address,
+        signer=AccountTransactionSigner(private_key),
+    )
+    funder = AddressAndSigner(address=address, signer=AccountTransactionSigner(private_key))
+    return LoadGenerator(app_client, funder, target)
+
+
+# Test case for running every wave w/ 20 voters (opt-in and vote waves need 3 groups of up to 8 call pairs)
+def test_load_generator_waves() -> None:
+    reports = in_process_generator(InProcessTarget()).run(voter_count=20, rate=5_000, poll_id=0)
+
+    # Verify every wave confirmed all of its transactions
+    assert [report.wave for report in reports] == list(WAVES), "Every wave ran in order."
+    assert [report.submitted_txns for report in reports] == [20, 40, 40, 20], "Every voter sent its transactions."
+    assert all(report.confirmed_txns == report.submitted_txns for report in reports), "Every transaction confirmed."
+    assert all(report.tps > 0 and len(report.latencies) > 0 for report in reports), "Throughput and latency measured."
+
+
+# Test case for grouping rejected transactions by failure reason
+def test_load_generator_failures() -> None:
+    reports = in_process_generator(InProcessTarget(reject_rate=0.5, seed=1)).run(
+        voter_count=40, rate=5_000, poll_id=0
+    )
+
+    for report in reports:
+        assert report.confirmed_txns + report.failed_txns == report.submitted_txns, "Every transaction accounted for."
+
+    # Verify the rejections of different transactions are counted under a single reason
+    failures = sum((report.failures for report in reports), start=collections.Counter[str]())
+    assert list(failures) == ["TransactionPool.Remember: transaction <txid>: simulated rejection"], "One reason."
+
+
+# Test case for nearest-rank latency percentiles
+def test_wave_report_percentiles() -> None:
+    report = WaveReport(wave="vote", latencies=[float(latency) for latency in range(1, 101)])
+
+    assert report.latency_percentile(50) == 50.0, "p50"
+    assert report.latency_percentile(95) == 95.0, "p95"
+    assert report.latency_percentile(99) == 99.0, "p99"
+    assert WaveReport(wave="vote").latency_percentile(99) == 0.0, "No latencies."
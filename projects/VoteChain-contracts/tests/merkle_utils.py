@@ -0,0 +1,85 @@
+import hashlib
+from collections.abc import Iterable, Iterator
+
+from algosdk.encoding import decode_address
+
+# Domain separation prefixes of leaf and inner node hashes (must match 'MERKLE_*_PREFIX' in contract.py)
+MERKLE_LEAF_PREFIX = b"\x00"
+MERKLE_NODE_PREFIX = b"\x01"
+
+# Merkle root stored by polls that are open to every account
+OPEN_POLL_ROOT = bytes(32)
+
+
+# Helper function: Returns the Merkle leaf hash of an account address
+def hash_leaf(address: str) -> bytes:
+    return hashlib.sha256(MERKLE_LEAF_PREFIX + decode_address(address)).digest()
+
+
+# Helper function: Returns the Merkle inner node hash of two child hashes (children are hashed in sorted order)
+def hash_node(a: bytes, b: bytes) -> bytes:
+    low, high = (a, b) if a < b else (b, a)
+    return hashlib.sha256(MERKLE_NODE_PREFIX + low + high).digest()
+
+
+# Helper function: Streams account addresses from a text file holding one address per line
+def read_addresses(path: str) -> Iterator[str]:
+    with open(path) as file:
+        for line in file:
+            address = line.strip()
+            if address:
+                yield address
+
+
+# Helper function: Builds the Merkle root of the eligible addresses and the inclusion proofs of the target addresses
+# in a single streaming pass over the addresses.
+# Subtrees are merged as soon as two of the same height exist (left-balanced tree, odd nodes are carried up), so
+# memory stays bounded by the tree height plus the target proofs no matter how many millions of addresses stream in.
+def build_merkle_proofs(
+    addresses: Iterable[str], targets: Iterable[str] = ()
+) -> tuple[bytes, dict[str, list[bytes]]]:
+    proofs: dict[str, list[bytes]] = {target: [] for target in targets}
+
+    # Every stack entry is a finished subtree: (height, root hash, target addresses inside the subtree)
+    stack: list[tuple[int, bytes, list[str]]] = []
+
+    def merge(
+        left: tuple[int, bytes, list[str]], right: tuple[int, bytes, list[str]]
+    ) -> tuple[int, bytes, list[str]]:
+        # Every target in one subtree gets the root hash of the other subtree as its next proof node
+        for target in left[2]:
+            proofs[target].append(right[1])
+        for target in right[2]:
+            proofs[target].append(left[1])
+        return max(left[0], right[0]) + 1, hash_node(left[1], right[1]), left[2] + right[2]
+
+    for address in addresses:
+        entry = (0, hash_leaf(address), [address] if address in proofs else [])
+        while stack and stack[-1][0] == entry[0]:
+            entry = merge(stack.pop(), entry)
+        stack.append(entry)
+
+    assert stack, "Merkle tree must contain at least one address."
+
+    # Fold the remaining subtrees (decreasing in height) from right to left into the root
+    entry = stack.pop()
+    while stack:
+        entry = merge(stack.pop(), entry)
+
+    missing = [target for target in proofs if target not in entry[2]]
+    assert not missing, f"Target addresses are not in the Merkle tree: {missing}"
+
+    return entry[1], proofs
+
+
+# Helper function: Returns the Merkle root of the eligible addresses
+def build_merkle_root(addresses: Iterable[str]) -> bytes:
+    return build_merkle_proofs(addresses)[0]
+
+
+# Helper function: Verifies a Merkle inclusion proof the same way the 'verify_eligibility' subroutine does
+def verify_merkle_proof(root: bytes, address: str, proof: list[bytes]) -> bool:
+    node = hash_leaf(address)
+    for sibling in proof:
+        node = hash_node(node, sibling)
+    return node == root
@@ -0,0 +1,42 @@
+from algosdk.account import generate_account
+
+from .merkle_utils import (
+    build_merkle_proofs,
+    build_merkle_root,
+    hash_leaf,
+    verify_merkle_proof,
+)
+
+
+# Helper function: Returns a number of random account addresses
+def random_addresses(count: int) -> list[str]:
+    return [generate_account()[1] for _ in range(count)]
+
+
+# Test case for building inclusion proofs of every address in trees of both even and odd sizes
+def test_merkle_proofs() -> None:
+    for size in range(1, 18):
+        addresses = random_addresses(size)
+        root, proofs = build_merkle_proofs(iter(addresses), addresses)
+
+        # Verify the streaming root matches the root built without proofs
+        assert root == build_merkle_root(iter(addresses)), "Merkle roots match."
+
+        for address in addresses:
+            # Verify every proof folds up to the root and stays within the tree height
+            assert verify_merkle_proof(root, address, proofs[address]), "Proof is valid."
+            assert len(proofs[address]) <= (size - 1).bit_length(), "Proof fits tree height."
+
+
+# Test case for rejecting accounts that are not part of the eligible addresses
+def test_merkle_proof_non_member() -> None:
+    addresses = random_addresses(8)
+    outsider = random_addresses(1)[0]
+    root, proofs = build_merkle_proofs(addresses, [addresses[0]])
+
+    # Verify a proof of one account does not prove the inclusion of another account
+    assert not verify_merkle_proof(root, outsider, proofs[addresses[0]]), "Proof is invalid."
+
+    # Verify a single address tree has the leaf hash as its root and an empty proof
+    root, proofs = build_merkle_proofs([outsider], [outsider])
+    assert root == hash_leaf(outsider) and proofs[outsider] == [], "Single leaf tree."
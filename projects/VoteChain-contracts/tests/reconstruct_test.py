@@ -0,0 +1,56 @@
+import csv
+from pathlib import Path
+
+import pytest
+
+from smart_contracts.vote_chain.reconstruct import load_ballots, reconstruct_poll
+
+EXPORT_COLUMNS = ("round", "round_time", "tx_id", "event", "poll_id", "account", "choice", "fee")
+
+
+# Writes export rows to a CSV file laid out like the 'export' command output
+def write_export(path: Path, rows: list[tuple[int, str, int, str, int | None, int]]) -> None:
+    with path.open("w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(EXPORT_COLUMNS)
+        for round_num, event, poll_id, account, choice, fee in rows:
+            writer.writerow([round_num, 0, f"TX{round_num}", event, poll_id, account, choice, fee])
+
+
+# Test case for reconstructing a poll tally w/ duplicate ballots, other polls and opt-outs in the export
+def test_reconstruct_poll(tmp_path: Path) -> None:
+    path = tmp_path / "votes.csv"
+    write_export(
+        path,
+        [
+            (10, "VoteCast", 0, "ALICE", 1, 1_000),
+            (10, "VoteCast", 0, "BOB", 2, 0),  # Sponsored vote (zero fee app call)
+            (11, "VoteCast", 1, "CAROL", 3, 1_000),  # Vote for another poll
+            (12, "VoteCast", 0, "ALICE", 2, 1_000),  # Second ballot of the same voter is not counted
+            (12, "OptedOut", 0, "BOB", None, 1_000),
+            (13, "VoteCast", 0, "CAROL", 2, 2_000),
+        ],
+    )
+
+    ballots = load_ballots(path, poll_id=0)
+    reconstruction = reconstruct_poll(ballots, choice_count=3)
+
+    # Verify the first ballot of every voter is counted
+    assert reconstruction.tally.tolist() == [1, 2, 0], "Tally reconstructed."
+    assert reconstruction.matches([1, 2, 0]), "Tally matches the on-chain tally."
+    assert reconstruction.voter_count == 3 and reconstruction.duplicate_ballots == 1, "Duplicate ballot dropped."
+
+    # Verify the per-round cumulative curves and fee totals
+    assert reconstruction.rounds.tolist() == [10, 13], "Rounds w/ counted ballots."
+    assert reconstruction.cumulative_tally.tolist() == [[1, 1, 0], [1, 2, 0]], "Cumulative tally per round."
+    assert reconstruction.fees_by_round.tolist() == [1_000, 2_000], "Fees per round."
+    assert reconstruction.total_fees == 3_000, "Total fees."
+
+
+# Test case for rejecting ballots w/ a choice outside of the poll choices
+def test_reconstruct_poll_invalid_choice(tmp_path: Path) -> None:
+    path = tmp_path / "votes.csv"
+    write_export(path, [(10, "VoteCast", 0, "ALICE", 4, 1_000)])
+
+    with pytest.raises(ValueError):
+        reconstruct_poll(load_ballots(path, poll_id=0), choice_count=3)
@@ -0,0 +1,134 @@
+import dataclasses
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any
+
+from algokit_utils import TransactionParameters
+from algosdk import account, encoding
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.transaction import PaymentTxn, SuggestedParams
+
+from smart_contracts.vote_chain.signing import ParallelTransactionSigner, gather_signatures
+
+SUGGESTED_PARAMS = SuggestedParams(
+    fee=1_000, first=1, last=1_001, gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=", flat_fee=True
+)
+
+
+# Returns a payment from 'sender' w/ a distinct note so every transaction has its own signature
+def make_payment(sender: str, receiver: str, note: int) -> PaymentTxn:
+    return PaymentTxn(sender=sender, sp=SUGGESTED_PARAMS, receiver=receiver, amt=1_000, note=note.to_bytes(8, "big"))
+
+
+# Executor that records the number of chunks submitted to the wrapped process pool ('Executor.map' submits every
+# chunk through 'submit', so the wrapper does not have to shadow 'map')
+class RecordingExecutor(Executor):
+    def __init__(self, executor: Executor) -> None:
+        self.executor = executor
+        self.submitted_chunks = 0
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+        self.submitted_chunks += 1
+        return self.executor.submit(fn, *args, **kwargs)
+
+
+# Test case for batch signatures matching the signatures of serial 'Transaction.sign' calls
+def test_parallel_signer_matches_serial_signing(signing_pool: ProcessPoolExecutor) -> None:
+    private_key, address = account.generate_account()
+    _, receiver = account.generate_account()
+    txns = [make_payment(address, receiver, note) for note in range(10)]
+
+    # Sign in chunks of 3 across the pool (a min parallel of 1 forces the pool for this small batch)
+    signer = ParallelTransactionSigner(private_key, signing_pool, chunk_size=3, min_parallel=1)
+    signed_txns = signer.sign_batch(txns)
+
+    # Verify every signature and the input order match serial signing (ed25519 signatures are deterministic)
+    assert [encoding.msgpack_encode(signed_txn) for signed_txn in signed_txns] == [
+        encoding.msgpack_encode(signed_txn)
+        for signed_txn in AccountTransactionSigner(private_key).sign_transactions(txns, list(range(len(txns))))
+    ], "Parallel and serial signatures match."
+
+
+# Test case for passing a signer backed by a process pool as the 'signer' of 'TransactionParameters' (the generated
+# client copies the parameters w/ 'dataclasses.asdict')
+def test_parallel_signer_transaction_parameters(signing_pool: ProcessPoolExecutor) -> None:
+    private_key, address = account.generate_account()
+    signer = ParallelTransactionSigner(private_key, signing_pool)
+
+    # Verify the copied parameters keep the signer and its process pool
+    parameters = dataclasses.asdict(TransactionParameters(sender=address, signer=signer))
+    assert parameters["signer"] is signer, "Signer shared by the copy."
+
+
+# Test case for signing many groups w/ parallel and regular signers mixed in every group
+def test_gather_signatures_mixed_signers(signing_pool: ProcessPoolExecutor) -> None:
+    parallel_key, parallel_address = account.generate_account()
+    serial_key, serial_address = account.generate_account()
+    parallel_signer = ParallelTransactionSigner(parallel_key, signing_pool, min_parallel=1)
+
+    # Build the same 3 groups twice, once w/ the parallel signer and once w/ regular signers only
+    atcs, expected_atcs = [], []
+    for note in range(3):
+        atc, expected_atc = AtomicTransactionComposer(), AtomicTransactionComposer()
+        atc.add_transaction(
+            TransactionWithSigner(make_payment(parallel_address, serial_address, note), parallel_signer)
+        )
+        expected_atc.add_transaction(
+            TransactionWithSigner(
+                make_payment(parallel_address, serial_address, note), AccountTransactionSigner(parallel_key)
+            )
+        )
+        for composer in (atc, expected_atc):
+            composer.add_transaction(
+                TransactionWithSigner(
+                    make_payment(serial_address, parallel_address, note), AccountTransactionSigner(serial_key)
+                )
+            )
+        atcs.append(atc)
+        expected_atcs.append(expected_atc)
+
+    # Verify every group is signed exactly like 'AtomicTransactionComposer.gather_signatures' signs it
+    assert [
+        [encoding.msgpack_encode(signed_txn) for signed_txn in signed_group]
+        for signed_group in gather_signatures(atcs)
+    ] == [
+        [encoding.msgpack_encode(signed_txn) for signed_txn in expected_atc.gather_signatures()]
+        for expected_atc in expected_atcs
+    ], "Every group signed in order."
+
+
+# Test case for signing the groups of many distinct signers (one per voter) in parallel across one shared pool
+def test_gather_signatures_many_signers(signing_pool: ProcessPoolExecutor) -> None:
+    executor = RecordingExecutor(signing_pool)
+    _, receiver = account.generate_account()
+    keys = [account.generate_account() for _ in range(200)]
+
+    # One single transaction group per signer, every signer alone stays below the default min parallel of 64
+    atcs, expected_atcs = [], []
+    for note, (private_key, address) in enumerate(keys):
+        atc, expected_atc = AtomicTransactionComposer(), AtomicTransactionComposer()
+        atc.add_transaction(
+            TransactionWithSigner(
+                make_payment(address, receiver, note), ParallelTransactionSigner(private_key, executor, chunk_size=64)
+            )
+        )
+        expected_atc.add_transaction(
+            TransactionWithSigner(make_payment(address, receiver, note), AccountTransactionSigner(private_key))
+        )
+        atcs.append(atc)
+        expected_atcs.append(expected_atc)
+
+    signed_groups = gather_signatures(atcs)
+
+    # Verify the transactions of every signer were chunked across the pool in one pass and signed in order
+    assert executor.submitted_chunks == 4, "200 transactions signed in 4 chunks of at most 64."
+    assert [
+        [encoding.msgpack_encode(signed_txn) for signed_txn in signed_group] for signed_group in signed_groups
+    ] == [
+        [encoding.msgpack_encode(signed_txn) for signed_txn in expected_atc.gather_signatures()]
+        for expected_atc in expected_atcs
+    ], "Every group signed by its own signer."
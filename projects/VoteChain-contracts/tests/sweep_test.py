@@ -0,0 +1,97 @@
+import base64
+from types import SimpleNamespace
+
+from algosdk import account
+from algosdk.encoding import decode_address
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.vote_chain.state import get_ballot_box_name, get_poll_box_name
+from smart_contracts.vote_chain.sweep import sweep_poll
+
+APP_ID = 1234
+POLL_ID = 7
+
+
+# Algod stand-in that serves the App's boxes and counts the box listings (boxes in 'reclaimed' are deleted right
+# after the first listing, as if their voters reclaimed them while the sweep runs)
+class SweepAlgod:
+    def __init__(self, boxes: dict[bytes, bytes], reclaimed: list[bytes]) -> None:
+        self.boxes = boxes
+        self.reclaimed = reclaimed
+        self.box_listings = 0
+
+    def application_boxes(self, app_id: int) -> dict:
+        self.box_listings += 1
+        listing = {"boxes": [{"name": base64.b64encode(name).decode()} for name in self.boxes]}
+        for name in self.reclaimed:
+            del self.boxes[name]
+        self.reclaimed = []
+        return listing
+
+    def application_box_by_name(self, app_id: int, box_name: bytes) -> dict:
+        if box_name not in self.boxes:
+            raise AlgodHTTPError("box not found", 404)
+        return {"value": base64.b64encode(self.boxes[box_name]).decode()}
+
+
+# Composer stand-in that records the 'sweep' calls of a group and releases their ballot boxes on execute
+class SweepComposer:
+    def __init__(self, app_client: "SweepAppClient") -> None:
+        self.app_client = app_client
+        self.calls: list[SimpleNamespace] = []
+
+    def sweep(self, *, poll_id: int, accounts: list[str], transaction_parameters: object) -> None:
+        self.calls.append(SimpleNamespace(accounts=accounts, transaction_parameters=transaction_parameters))
+
+    def execute(self) -> SimpleNamespace:
+        self.app_client.groups.append(self.calls)
+        boxes = self.app_client.algod_client.boxes
+        results = [
+            SimpleNamespace(
+                return_value=sum(
+                    boxes.pop(get_ballot_box_name(POLL_ID, address), None) is not None for address in call.accounts
+                )
+            )
+            for call in self.calls
+        ]
+        return SimpleNamespace(abi_results=results, confirmed_round=1)
+
+
+class SweepAppClient:
+    def __init__(self, algod_client: SweepAlgod) -> None:
+        self.app_id = APP_ID
+        self.algod_client = algod_client
+        self.groups: list[list[SimpleNamespace]] = []
+
+    def compose(self) -> SweepComposer:
+        return SweepComposer(self)
+
+
+# Test case for listing the ballot boxes once and releasing them 48 per group w/ their MBR payers referenced
+def test_sweep_poll() -> None:
+    _, sponsor = account.generate_account()
+    voters = [account.generate_account()[1] for _ in range(101)]
+    mbr_payers = {voter: sponsor if index % 2 else voter for index, voter in enumerate(voters)}
+
+    # Every other vote was sponsored, the poll record and a ballot box of another poll are not swept
+    boxes = {
+        get_poll_box_name(POLL_ID): b"poll",
+        get_ballot_box_name(POLL_ID + 1, voters[0]): bytes(40),
+    }
+    for voter, mbr_payer in mbr_payers.items():
+        boxes[get_ballot_box_name(POLL_ID, voter)] = (1).to_bytes(8, "big") + decode_address(mbr_payer)
+
+    # The last voter reclaims their ballot box after the sweep listed it
+    algod = SweepAlgod(boxes, reclaimed=[get_ballot_box_name(POLL_ID, voters[-1])])
+    app_client = SweepAppClient(algod)
+
+    assert sweep_poll(app_client, POLL_ID) == 100, "Every listed ballot box swept."  # type: ignore[arg-type]
+    assert algod.box_listings == 1, "Ballot boxes listed once."
+    assert [sum(len(call.accounts) for call in group) for group in app_client.groups] == [48, 48, 4], "48 per group."
+    assert get_ballot_box_name(POLL_ID + 1, voters[0]) in algod.boxes, "Other polls not swept."
+
+    # Verify every sweep call references the MBR payers of its ballot boxes (a shared sponsor once)
+    for call in (call for group in app_client.groups for call in group):
+        assert sorted(call.transaction_parameters.accounts) == sorted(
+            {mbr_payers[address] for address in call.accounts}
+        ), "MBR payers referenced."
@@ -1,13 +1,22 @@
 import base64
 import logging
 import sys
+import tempfile
+from pathlib import Path
 
 from algokit_utils.beta.account_manager import AddressAndSigner
 from algokit_utils.beta.algorand_client import AlgorandClient, PayParams
 from algosdk.atomic_transaction_composer import TransactionWithSigner
 from algosdk.encoding import encode_address
+from nacl.signing import SigningKey
 
 from smart_contracts.artifacts.vote_chain.vote_chain_client import VoteChainClient
+from smart_contracts.vote_chain.blocks import BlockCache
+from smart_contracts.vote_chain.events import decode_events
+
+# Blocks fetched by the tests are kept on disk, so every round is fetched once across test runs
+BLOCK_CACHE_DIR = Path(tempfile.gettempdir()) / "votechain-blocks"
+_block_caches: dict[str, BlockCache] = {}
 
 
 # Helper function: Sets up a logging.Logger for console and isolated file debugging
@@ -69,17 +78,14 @@ def get_block_txn_info(
     # Wait until round is confirmed to get specific block number from the blockchain
     block_num = transaction_response.confirmed_round
 
-    # Get all individual transaction IDs from the block (group ids don't count)
-    block_txids = algorand.client.algod.get_block_txids(block_num)
-
-    # Get block info from a specific block in the blockchain
-    block_info = algorand.client.algod.block_info(block_num)
+    # Get the block from the on-disk block cache (fetched from algod as msgpack once per round)
+    algod = algorand.client.algod
+    if algod.algod_address not in _block_caches:
+        _block_caches[algod.algod_address] = BlockCache(algod, BLOCK_CACHE_DIR)
+    block = _block_caches[algod.algod_address].get_block(block_num)
 
-    # From block information extract the fee field out of every transaction
-    block_fees = [txn["txn"].get("fee", 0) for txn in block_info["block"]["txns"]]
-
-    # Return all block individual ids and fees as a Tuple with list types
-    return block_txids["blockTxids"], block_fees
+    # Return all block individual ids (group ids don't count) and fees as a Tuple with list types
+    return block.tx_ids, block.fees
 
 
 # Helper function: Sets up payment paramaters and returns a TransactionWithSigner object
@@ -109,6 +115,96 @@ def setup_stxn(
     return stxn
 
 
+# Pool of random accounts funded by the dispenser in batched atomic groups (one group funds up to 16 accounts), every
+# account is handed out once so tests never share state through an account
+class AccountPool:
+    def __init__(
+        self,
+        algorand: AlgorandClient,
+        dispenser: AddressAndSigner,
+        amount: int = 10_000_000,
+        batch_size: int = 16,
+    ) -> None:
+        self.algorand = algorand
+        self.dispenser = dispenser
+        self.amount = amount  # MicroALGO funded to every account
+        self.batch_size = batch_size
+        self._accounts: list[AddressAndSigner] = []
+
+    # Creates and funds a batch of random accounts w/ a single atomic group of payments
+    def _refill(self) -> None:
+        accounts = [self.algorand.account.random() for _ in range(self.batch_size)]
+
+        group = self.algorand.new_group()
+        for account in accounts:
+            group.add_payment(
+                PayParams(
+                    sender=self.dispenser.address,
+                    signer=self.dispenser.signer,
+                    receiver=account.address,
+                    amount=self.amount,
+                )
+            )
+        group.execute()
+
+        self._accounts.extend(accounts)
+
+    def take(self, count: int = 1) -> list[AddressAndSigner]:
+        """Returns funded accounts that were not handed out before (funding new batches as needed)"""
+
+        while len(self._accounts) < count:
+            self._refill()
+
+        accounts, self._accounts = self._accounts[:count], self._accounts[count:]
+        return accounts
+
+
+# Helper function: Calculates the minimum balance requirement cost of a box (mirrors 'calc_box_mbr' in contract.py)
+def calc_box_mbr(key_size: int, value_size: int) -> int:
+    return 2_500 + 400 * (key_size + value_size)
+
+
+# Helper function: Calculates the minimum balance requirement cost of the poll record, choices and tally boxes
+def calc_poll_boxes_mbr(title: bytes, choices: list[bytes]) -> int:
+
+    # Poll record is stored as the ARC-4 'Poll' struct (2 byte title head offset + 2 byte title length + title,
+    # 7 UInt64 fields, 2 Bool fields, the 32 byte eligibility root and the 32 byte ballot hash)
+    poll_size = 4 + len(title) + 7 * 8 + 2 + 2 * 32
+
+    # Choices are stored as ARC-4 'byte[][]' (2 byte length + 2 byte head offset and 2 byte length per choice)
+    choices_size = 2 + sum(4 + len(choice) for choice in choices)
+
+    # Tally is stored as one UInt64 (8 bytes) per choice
+    tally_size = 8 * len(choices)
+
+    # Every poll box key is 1 byte prefix + 8 byte poll ID
+    return (
+        calc_box_mbr(9, poll_size)
+        + calc_box_mbr(9, choices_size)
+        + calc_box_mbr(9, tally_size)
+    )
+
+
+# Helper function: Signs the ballot message a relayer submits on behalf of a voter via 'submit_vote_batch'
+def sign_ballot(
+    voter: AddressAndSigner, app_id: int, poll_id: int, choice: int
+) -> bytes:
+
+    # Ballot message is the 'VoteChain ballot' prefix + 8 byte App ID + 8 byte poll ID + 8 byte choice (see contract.py)
+    ballot_message = (
+        b"VoteChain ballot"
+        + app_id.to_bytes(8, "big")
+        + poll_id.to_bytes(8, "big")
+        + choice.to_bytes(8, "big")
+    )
+
+    # Algorand private keys are the base64 encoded 32 byte ed25519 seed followed by the 32 byte public key
+    signing_key = SigningKey(base64.b64decode(voter.signer.private_key)[:32])
+
+    # Return the raw 64 byte ed25519 signature (verified on-chain with 'ed25519verify_bare')
+    return signing_key.sign(ballot_message).signature
+
+
 # Helper function: Get asset information from a specific account address and check this account's asset amount
 def verify_asset_holding(
     algorand: AlgorandClient, address: str, test_asset_id: int, expected_amount: int
@@ -214,23 +310,34 @@ def log_local_state_info(
     # Fetch local state for the account
     local_state = app_client.get_local_state(address)
 
-    # Log the local vote status and choice for the account
-    logger.info(f"{address} LOCAL VOTE STATUS: {local_state.local_vote_status}")
-    logger.info(f"{address} LOCAL VOTE CHOICE: {local_state.local_vote_choice}")
+    # Log the local vote count for the account
+    logger.info(f"{address} LOCAL VOTES CAST: {local_state.local_votes_cast}")
 
 
 def get_txn_logs(algorand: AlgorandClient, tx_id: str, logger: logging.Logger) -> None:
 
     txn_info = algorand.client.algod.pending_transaction_info(tx_id)
-    txn_logs = txn_info["logs"]
-
+    txn_logs = [base64.b64decode(log) for log in txn_info.get("logs", [])]
+
+    # Log the ARC-28 events emitted by the transaction
+    for event_name, columns in decode_events(txn_logs).items():
+        for row in zip(*columns.values(), strict=True):
+            event = dict(zip(columns.keys(), row, strict=True))
+            for field, value in event.items():
+                if isinstance(value, bytes):
+                    event[field] = value.hex() if field == "ballot_hash" else encode_address(value)
+            logger.info(f"{event_name} event in logs: {event}")
+
+    # Log the values of the plain text logs ('<text>: <value>')
     for log in txn_logs:
-        base64_log = base64.b64decode(log)
-        base64_log_bytes = base64_log.split(b": ")[1]
+        if b": " not in log:
+            continue
+
+        log_value = log.split(b": ", 1)[1]
 
-        if len(base64_log_bytes) == 32:
-            logged_address = encode_address(base64_log_bytes)
+        if len(log_value) == 32:
+            logged_address = encode_address(log_value)
             logger.info(f"Address in logs: {logged_address}")
         else:
-            logged_int = int.from_bytes(base64_log_bytes)
+            logged_int = int.from_bytes(log_value)
             logger.info(f"Int in logs: {logged_int}")
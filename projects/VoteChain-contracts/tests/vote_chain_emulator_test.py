@@ -0,0 +1,339 @@
+# tests/vote_chain_emulator_test.py
+import random
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, Bytes, String, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.vote_chain.contract import Hash32, VoteChain
+from smart_contracts.vote_chain.state import BALLOT_BOX_MBR, LOCAL_STORAGE_MBR
+from smart_contracts.vote_chain.verify import recompute_results
+
+from .test_utils import calc_poll_boxes_mbr
+
+# Fast test tier: 'VoteChain' methods run in-process on the 'algorand-python-testing' emulator (no localnet needed,
+# 'latest_timestamp' is patched directly), 'vote_chain_test.py' stays the integration tier ('pytest -m "not localnet"')
+
+DAY = 24 * 60 * 60
+
+# Voting period of the polls set up by default (a 7 day window starting at a fixed timestamp)
+START_DATE = 1_800_000_000
+END_DATE = START_DATE + 7 * DAY
+
+TITLE = b"Emulated poll"
+CHOICES = [b"Yes", b"No", b"Abstain"]
+
+
+# Run every test in a fresh emulator context (ledger, transactions and global fields are reset between tests)
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+# Create the App (the default sender of the context is the creator), 'generate' emits a single argument 'View(uint64)'
+# event, which 'algorand-python-testing' 0.4 can not encode (one element ARC-4 tuple), so the event is recorded instead
+@pytest.fixture()
+def contract(context: AlgopyTestContext, monkeypatch: pytest.MonkeyPatch) -> VoteChain:
+    contract = VoteChain()
+    events: list[str] = []
+    with monkeypatch.context() as patch:
+        patch.setattr(arc4, "emit", lambda event, *_args: events.append(event))
+        contract.generate()
+
+    # Verify the create method emitted its event and reset the global counters
+    assert events == ["View(uint64)"], "Generate event emitted."
+    assert (
+        contract.next_poll_id == 0
+        and contract.total_polls == 0
+        and contract.total_accounts_opted_in == 0
+        and contract.total_ballot_boxes == 0
+    ), "Global state set."
+    return contract
+
+
+# Helper function: Sets the timestamp of the latest block as seen by the App
+def set_timestamp(context: AlgopyTestContext, timestamp: int) -> None:
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(timestamp))
+
+
+# Helper function: Sets up a poll as the creator (paying the exact poll boxes MBR) and returns its poll ID
+def setup_poll(
+    context: AlgopyTestContext,
+    contract: VoteChain,
+    *,
+    start_date: int = START_DATE,
+    end_date: int = END_DATE,
+    choices: list[bytes] = CHOICES,
+    require_opt_in: bool = False,
+) -> int:
+    mbr_pay = context.any.txn.payment(
+        sender=context.default_sender,
+        receiver=context.ledger.get_app(contract).address,
+        amount=UInt64(calc_poll_boxes_mbr(TITLE, choices)),
+    )
+
+    poll_id = contract.setup_poll(
+        mbr_pay,
+        Bytes(TITLE),
+        arc4.DynamicArray(*[arc4.DynamicBytes(choice) for choice in choices]),
+        arc4.Bool(require_opt_in),
+        Hash32.from_bytes(bytes(32)),
+        String("start"),
+        UInt64(start_date),
+        String("end"),
+        UInt64(end_date),
+    )
+    return poll_id.value
+
+
+# Helper function: Creates a voter account (opted in to the App's local storage if 'opt_in' is set, the local state is
+# set the way 'local_storage_mbr' sets it since 'algorand-python-testing' 0.4 can not encode its single field event)
+def create_voter(context: AlgopyTestContext, contract: VoteChain, *, opt_in: bool = False) -> Account:
+    if not opt_in:
+        return context.any.account()
+
+    voter = context.any.account(opted_apps=[context.ledger.get_app(contract)])
+    contract.local_votes_cast[voter] = UInt64(0)
+    contract.local_mbr_payer[voter] = voter
+    return voter
+
+
+# Helper function: Submits a vote as the voter (the voter or a sponsor pays the exact ballot box MBR)
+def submit_vote(
+    context: AlgopyTestContext,
+    contract: VoteChain,
+    poll_id: int,
+    voter: Account,
+    choice: int,
+    *,
+    mbr_payer: Account | None = None,
+) -> None:
+    mbr_pay = context.any.txn.payment(
+        sender=mbr_payer or voter,
+        receiver=context.ledger.get_app(contract).address,
+        amount=contract.calc_ballot_box_mbr(),
+    )
+    with context.txn.create_group(active_txn_overrides={"sender": voter}):
+        contract.submit_vote(UInt64(poll_id), voter, mbr_pay, UInt64(choice), arc4.DynamicArray[Hash32]())
+
+
+# Helper function: Reads a poll's packed tally box as a list of vote totals (choice 1 at index 0)
+def get_tally(context: AlgopyTestContext, contract: VoteChain, poll_id: int) -> list[int]:
+    tally = context.ledger.get_box(contract, b"t" + poll_id.to_bytes(8, "big"))
+    return [int.from_bytes(tally[i : i + 8], "big") for i in range(0, len(tally), 8)]
+
+
+# Returns the error 'submit_vote' is expected to fail with at a timestamp (None if the vote is counted)
+def expected_vote_error(timestamp: int, choice: int, choice_count: int = len(CHOICES)) -> str | None:
+    if timestamp <= START_DATE:
+        return "Voting period has not started yet."
+    if timestamp >= END_DATE:
+        return "Voting period has ended."
+    if not 1 <= choice <= choice_count:
+        return "Invalid choice."
+    return None
+
+
+# Test case for the voting period bounds of 'setup_poll' (at least 3 and at most 14 days, start before end)
+@pytest.mark.parametrize(
+    ("duration", "error"),
+    [
+        (-DAY, "Start date must be earlier than end date."),
+        (0, "Start date must be earlier than end date."),
+        (3 * DAY - 1, "End date must be at least 3 days later than the start date."),
+        (3 * DAY, None),
+        (7 * DAY, None),
+        (14 * DAY, None),
+        (14 * DAY + 1, "Voting period can not exceed 14 days."),
+    ],
+)
+def test_setup_poll_date_window(
+    context: AlgopyTestContext, contract: VoteChain, duration: int, error: str | None
+) -> None:
+    if error is not None:
+        with pytest.raises(AssertionError, match=error):
+            setup_poll(context, contract, end_date=START_DATE + duration)
+        return
+
+    poll_id = setup_poll(context, contract, end_date=START_DATE + duration)
+
+    # Verify the poll record holds the voting period and an empty tally box was created
+    poll = contract.box_poll[UInt64(poll_id)]
+    assert poll.start_date_unix.native == START_DATE, "Start date stored."
+    assert poll.end_date_unix.native == START_DATE + duration, "End date stored."
+    assert get_tally(context, contract, poll_id) == [0] * len(CHOICES), "Empty tally."
+    assert contract.next_poll_id == poll_id + 1, "Next poll ID incremented."
+
+
+# Test case for only the creator being able to set up polls
+def test_setup_poll_not_creator(context: AlgopyTestContext, contract: VoteChain) -> None:
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": context.any.account()}),
+        pytest.raises(AssertionError, match="Only App creator can set vote dates."),
+    ):
+        setup_poll(context, contract)
+
+
+# Test case for the voting period bounds of 'submit_vote' (both the start and end dates are exclusive)
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        0,
+        START_DATE - DAY,
+        START_DATE - 1,
+        START_DATE,
+        START_DATE + 1,
+        (START_DATE + END_DATE) // 2,
+        END_DATE - 1,
+        END_DATE,
+        END_DATE + 1,
+        END_DATE + DAY,
+    ],
+)
+def test_submit_vote_date_window(context: AlgopyTestContext, contract: VoteChain, timestamp: int) -> None:
+    poll_id = setup_poll(context, contract)
+    voter = create_voter(context, contract)
+    set_timestamp(context, timestamp)
+
+    error = expected_vote_error(timestamp, choice=1)
+    if error is not None:
+        with pytest.raises(AssertionError, match=error):
+            submit_vote(context, contract, poll_id, voter, 1)
+        assert get_tally(context, contract, poll_id) == [0, 0, 0], "Rejected vote not counted."
+        return
+
+    submit_vote(context, contract, poll_id, voter, 1)
+    assert get_tally(context, contract, poll_id) == [1, 0, 0], "Vote counted."
+    assert contract.total_ballot_boxes == 1, "Ballot box counted."
+
+
+# Test case for rejecting choices outside of 1 to the poll choice count
+@pytest.mark.parametrize("choice", [0, 1, len(CHOICES), len(CHOICES) + 1, 2**64 - 1])
+def test_submit_vote_choice_range(context: AlgopyTestContext, contract: VoteChain, choice: int) -> None:
+    poll_id = setup_poll(context, contract)
+    set_timestamp(context, START_DATE + DAY)
+
+    error = expected_vote_error(START_DATE + DAY, choice)
+    if error is not None:
+        with pytest.raises(AssertionError, match=error):
+            submit_vote(context, contract, poll_id, create_voter(context, contract), choice)
+        return
+
+    submit_vote(context, contract, poll_id, create_voter(context, contract), choice)
+    assert get_tally(context, contract, poll_id)[choice - 1] == 1, "Vote counted for the choice."
+
+
+# Test case for rejecting a second vote of the same account and a vote on an opt-in poll w/o opting in
+def test_submit_vote_double_vote_and_opt_in(context: AlgopyTestContext, contract: VoteChain) -> None:
+    poll_id = setup_poll(context, contract, require_opt_in=True)
+    set_timestamp(context, START_DATE + DAY)
+
+    with pytest.raises(AssertionError, match="Account must be opted-in before voting."):
+        submit_vote(context, contract, poll_id, create_voter(context, contract), 1)
+
+    voter = create_voter(context, contract, opt_in=True)
+    submit_vote(context, contract, poll_id, voter, 2)
+    with pytest.raises(AssertionError, match="This account already submitted a vote."):
+        submit_vote(context, contract, poll_id, voter, 1)
+
+    assert get_tally(context, contract, poll_id) == [0, 1, 0], "Only the first vote counted."
+    assert contract.local_votes_cast[voter] == 1, "Opted in voter vote count incremented."
+
+
+# Test case for finalizing a poll only after its voting period
+def test_finalize_results_date_window(context: AlgopyTestContext, contract: VoteChain) -> None:
+    poll_id = setup_poll(context, contract)
+
+    set_timestamp(context, START_DATE + DAY)
+    submit_vote(context, contract, poll_id, create_voter(context, contract), 2)
+
+    for timestamp in (START_DATE + DAY, END_DATE):
+        set_timestamp(context, timestamp)
+        with pytest.raises(AssertionError, match="Poll results can only be finalized after the voting period is over."):
+            contract.finalize_results(UInt64(poll_id))
+
+    set_timestamp(context, END_DATE + 1)
+    assert contract.finalize_results(UInt64(poll_id)) == 2, "Choice 2 won."
+    with pytest.raises(AssertionError, match="Poll results are already finalized."):
+        contract.finalize_results(UInt64(poll_id))
+
+
+# Test case for refunding the ballot box MBR to the account that paid it (a sponsor or the voter) on release
+@pytest.mark.parametrize("sponsored", [True, False])
+def test_ballot_box_refund_to_mbr_payer(context: AlgopyTestContext, contract: VoteChain, *, sponsored: bool) -> None:
+    poll_id = setup_poll(context, contract)
+    voter = create_voter(context, contract)
+    mbr_payer = context.any.account() if sponsored else voter
+
+    set_timestamp(context, START_DATE + DAY)
+    submit_vote(context, contract, poll_id, voter, 1, mbr_payer=mbr_payer)
+
+    # Verify the ballot box holds the choice and the MBR payer
+    ballot = contract.box_vote_choice[Bytes(poll_id.to_bytes(8, "big")) + voter.bytes]
+    assert ballot.choice.native == 1, "Choice stored."
+    assert ballot.mbr_payer.native == mbr_payer, "MBR payer stored."
+
+    # Verify reclaiming the ballot box refunds the MBR payer (less the inner transaction fee)
+    set_timestamp(context, END_DATE + 1)
+    with context.txn.create_group(active_txn_overrides={"sender": voter}):
+        contract.box_opt_out(UInt64(poll_id), voter)
+
+    refund = context.txn.last_group.last_itxn.payment
+    assert refund.receiver == mbr_payer, "MBR payer refunded."
+    assert refund.amount == contract.calc_ballot_box_mbr() - 1000, "Ballot box MBR refunded."
+    assert contract.total_ballot_boxes == 0, "Ballot box released."
+
+
+# Test case for the MBR costs derived off-chain (paid by relayers and the load generator) matching the amounts the
+# contract asserts ('local_storage_mbr' asserts the MBR of 1 byte slice and 1 UInt64 key-value)
+def test_mbr_constants(contract: VoteChain) -> None:
+    assert BALLOT_BOX_MBR == contract.calc_ballot_box_mbr(), "Ballot box MBR matches."
+    assert LOCAL_STORAGE_MBR == contract.calc_mbr(UInt64(1), UInt64(1)), "Local storage MBR matches."
+
+
+# Test case for thousands of random ballots (random timestamps, choices and repeat voters) checked one by one against
+# the expected outcome, then the final tally, ballot hash chain and results against an off-chain recomputation
+@pytest.mark.parametrize("seed", range(5))
+def test_random_ballots(context: AlgopyTestContext, contract: VoteChain, seed: int) -> None:
+    rng = random.Random(seed)
+    choices = CHOICES[: rng.randint(2, len(CHOICES))]
+    poll_id = setup_poll(context, contract, choices=choices)
+
+    voters: list[Account] = []
+    counted: list[tuple[bytes, int]] = []  # Ballots counted by the App, in order
+    for _ in range(500):
+        # Roughly one in ten ballots comes from an account whose vote was already counted
+        repeat = bool(voters) and rng.random() < 0.1
+        voter = rng.choice(voters) if repeat else create_voter(context, contract)
+        timestamp = rng.randint(START_DATE - DAY, END_DATE + DAY)
+        choice = rng.randint(0, len(choices) + 1)
+        set_timestamp(context, timestamp)
+
+        # The ballot box of a repeat voter is checked before the voting period and choice
+        error = (
+            "This account already submitted a vote." if repeat else expected_vote_error(timestamp, choice, len(choices))
+        )
+
+        if error is not None:
+            with pytest.raises(AssertionError, match=error):
+                submit_vote(context, contract, poll_id, voter, choice)
+            continue
+
+        submit_vote(context, contract, poll_id, voter, choice)
+        voters.append(voter)
+        counted.append((voter.bytes.value, choice))
+
+    ballot_hash, tally, winner, winner_margin = recompute_results(counted, len(choices))
+
+    # Verify the on-chain tally and poll record match the recomputation
+    assert get_tally(context, contract, poll_id) == tally, "Tally matches."
+    poll = contract.box_poll[UInt64(poll_id)]
+    assert poll.total_votes.native == len(counted), "Total votes match."
+    assert poll.open_ballots.native == len(counted), "Open ballots match."
+    assert poll.ballot_hash.bytes.value == ballot_hash, "Ballot hash chain matches."
+
+    set_timestamp(context, END_DATE + 1)
+    assert contract.finalize_results(UInt64(poll_id)) == winner, "Winner matches."
+    assert contract.box_poll[UInt64(poll_id)].winner_margin.native == winner_margin, "Winner margin matches."
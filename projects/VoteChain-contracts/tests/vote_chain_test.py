@@ -1,18 +1,66 @@
 # tests/vote_chain_test.py
+import asyncio
+import base64
 import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 import pytest
-from algokit_utils import TransactionParameters
+from algokit_utils import LogicError, TransactionParameters
 from algokit_utils.beta.account_manager import AddressAndSigner
 from algokit_utils.beta.algorand_client import AlgorandClient
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.encoding import decode_address
+from algosdk.v2client.indexer import IndexerClient
 
 from smart_contracts.artifacts.vote_chain.vote_chain_client import VoteChainClient
-
-from .test_utils import get_txn_logs, log_local_state_info, setup_logger, setup_stxn
+from smart_contracts.vote_chain import async_client
+from smart_contracts.vote_chain.blocks import BlockCache
+from smart_contracts.vote_chain.bulk import BulkComposer
+from smart_contracts.vote_chain.events import decode_events
+from smart_contracts.vote_chain.follower import BlockFollower
+from smart_contracts.vote_chain.relayer import (
+    SponsoredBallot,
+    compose_sponsored_opt_in,
+    submit_sponsored_votes,
+)
+from smart_contracts.vote_chain.signing import ParallelTransactionSigner
+from smart_contracts.vote_chain.state import (
+    LOCAL_STORAGE_MBR,
+    Ballot,
+    get_ballot,
+    get_ballot_box_name,
+    get_poll,
+    get_poll_box_name,
+    get_poll_box_references,
+    get_poll_snapshot,
+    get_poll_tally,
+    get_poll_tally_box_name,
+    get_voter_statuses,
+)
+from smart_contracts.vote_chain.sweep import sweep_poll
+from smart_contracts.vote_chain.verify import verify_poll_results
+
+from .merkle_utils import OPEN_POLL_ROOT, build_merkle_proofs
+from .test_utils import (
+    AccountPool,
+    calc_poll_boxes_mbr,
+    get_txn_logs,
+    log_local_state_info,
+    setup_logger,
+    setup_stxn,
+    sign_ballot,
+)
 
 # Setup the logging.Logger
 logger = setup_logger()
 
+# Integration tier, every test needs a running localnet (see 'vote_chain_emulator_test.py' for the fast tier)
+pytestmark = pytest.mark.localnet
+
+# NOTE: Session fixtures are set up once per process, so every pytest-xdist worker ('pytest -n auto') gets its own
+# funded creator and 'VoteChain' App, and every test sets up the accounts and polls it needs (tests run in any order)
+
 
 # Generate Algorand client that points to the default local net port and token
 @pytest.fixture(scope="session")
@@ -26,35 +74,81 @@ def dispenser(algorand: AlgorandClient) -> AddressAndSigner:
     return algorand.account.dispenser()
 
 
-# Generate a creator account for testing and fund it with some ALGO via the dispenser account
+# Generate the pool of funded accounts the tests draw from (funded by the dispenser 16 accounts per atomic group)
 @pytest.fixture(scope="session")
-def creator(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
-    # Create a random Algorand account for the creator
-    creator = algorand.account.random()
-    # Setup signed transaction that funds the creator account (Dispenser is funding 10 ALGO to creator account address)
-    fund_creator_acc = setup_stxn(algorand, dispenser, creator.address, 10_000_000)
-    # Send the signed transaction using the Algorand client
-    algorand.send.payment(fund_creator_acc)
+def account_pool(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AccountPool:
+    return AccountPool(algorand, dispenser)
 
-    return creator
 
-
-# Generate a random dummy account for testing and fund it with some ALGO via the dispenser account
+# Generate a creator account for testing (funded w/ 10 ALGO by the account pool)
 @pytest.fixture(scope="session")
-def dummy(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
-    # Create a random Algorand account for the dummy
-    dummy = algorand.account.random()
-    # Setup signed transaction that funds the dummy account (Dispenser is funding 15 ALGO to dummy account address)
-    fund_dummy_acc = setup_stxn(algorand, dispenser, dummy.address, 15_000_000)
-    # Send the signed transaction using the Algorand client
-    algorand.send.payment(fund_dummy_acc)
+def creator(account_pool: AccountPool) -> AddressAndSigner:
+    return account_pool.take()[0]
+
 
-    return dummy
+# Generate a random dummy account for testing (a fresh funded account for every test)
+@pytest.fixture()
+def dummy(account_pool: AccountPool) -> AddressAndSigner:
+    return account_pool.take()[0]
 
 
-# Generate the first instance of the smart contract App client
+# Generate the smart contract App client of the worker (created once per test session process)
 @pytest.fixture(scope="session")
 def app_client(algorand: AlgorandClient, creator: AddressAndSigner) -> VoteChainClient:
+    app_client = create_app(algorand, creator)
+
+    # Log
+    logger.info(f"DAPP ID: {app_client.app_id}")  # Check App ID
+    logger.info(
+        f"Global State attributes: {vars(app_client.get_global_state())}"
+    )  # Check App Global State
+
+    return app_client
+
+
+# Generate a second instance of the smart contract App client (by passing first instance client app id as the reference)
+@pytest.fixture()
+def app_client2(
+    algorand: AlgorandClient, app_client: VoteChainClient, dummy: AddressAndSigner
+) -> VoteChainClient:
+    return account_app_client(algorand, app_client, dummy)
+
+
+# Generate a poll whose voting period has passed (set up by the creator for the test that uses it)
+@pytest.fixture()
+def closed_poll(
+    algorand: AlgorandClient, app_client: VoteChainClient, creator: AddressAndSigner
+) -> int:
+    return setup_closed_poll(algorand, app_client, creator, title=b"Closed poll", choices=[b"Yes", b"No", b"Abstain"])
+
+
+# Generate a poll that is open for voting (set up by the creator for the test that uses it)
+@pytest.fixture()
+def open_poll(
+    algorand: AlgorandClient, app_client: VoteChainClient, creator: AddressAndSigner
+) -> int:
+    return setup_open_poll(algorand, app_client, creator, title=b"Open poll", choices=[b"Yes", b"No", b"Abstain"])
+
+
+# Generate a closed poll w/ finalized results
+@pytest.fixture()
+def finalized_poll(algorand: AlgorandClient, app_client: VoteChainClient, closed_poll: int) -> int:
+    finalize_poll(algorand, app_client, closed_poll)
+    return closed_poll
+
+
+# Generate an account that is opted in to the App's local storage
+@pytest.fixture()
+def opted_in_account(
+    algorand: AlgorandClient, app_client: VoteChainClient, account_pool: AccountPool
+) -> AddressAndSigner:
+    account = account_pool.take()[0]
+    opt_in(algorand, account_app_client(algorand, app_client, account), account)
+    return account
+
+
+# Helper function: Creates a 'VoteChain' App w/ the creator account and returns its App client
+def create_app(algorand: AlgorandClient, creator: AddressAndSigner) -> VoteChainClient:
     # Creator evokes an instance of the smart contract client by sending a signed transaction to the algod network
     app_client = VoteChainClient(
         algod_client=algorand.client.algod,
@@ -70,29 +164,165 @@ def app_client(algorand: AlgorandClient, creator: AddressAndSigner) -> VoteChain
         generate_app_txn.confirmed_round
     ), "Create generate App txn round successfully confirmed."
 
-    # Log
-    logger.info(f"DAPP ID: {app_client.app_id}")  # Check App ID
-    logger.info(
-        f"Global State attributes: {vars(app_client.get_global_state())}"
-    )  # Check App Global State
-
     return app_client
 
 
-# Generate a second instance of the smart contract App client (by passing first instance client app id as the reference)
-@pytest.fixture(scope="session")
-def app_client2(
-    algorand: AlgorandClient, app_client: VoteChainClient, dummy: AddressAndSigner
+# Helper function: Returns an App client of the same App that sends transactions as another account
+def account_app_client(
+    algorand: AlgorandClient, app_client: VoteChainClient, account: AddressAndSigner
 ) -> VoteChainClient:
-    # Dummy evokes an instance of the smart contract client by sending a signed transaction to the algod network
-    app_client2 = VoteChainClient(
+    return VoteChainClient(
         algod_client=algorand.client.algod,
-        sender=dummy.address,
-        signer=dummy.signer,
-        app_id=app_client.app_id,  # Dummy references creator's App client by ID to evoke their own client of same App
+        sender=account.address,
+        signer=account.signer,
+        app_id=app_client.app_id,  # Account references the App client by ID to evoke their own client of same App
+    )
+
+
+# Helper function: Opts an account in to the App's local storage w/ the local storage MBR payment (returns the tx ID)
+def opt_in(algorand: AlgorandClient, app_client: VoteChainClient, account: AddressAndSigner) -> str:
+    # Prepare transaction with signer for the account's local schema MBR payment
+    local_mbr_pay_stxn = setup_stxn(
+        algorand,
+        account,
+        app_client.app_address,
+        278_500,
+        1000,  # 0.2785 ALGO for every key-value + 0.001 extra fee
+    )
+
+    # Use App client to send a group transaction that executes the 'local_storage_mbr' opt-in abimethod and pays the MBR
+    opt_in_local_mbr_gtxn = app_client.opt_in_local_storage_mbr(
+        account=account.address,
+        mbr_pay=local_mbr_pay_stxn,
+        transaction_parameters=TransactionParameters(foreign_apps=[app_client.app_id]),
+    )
+
+    # Verify transaction was confirmed by the network
+    assert (
+        opt_in_local_mbr_gtxn.confirmed_round
+    ), "Local Opt-In gtxn round successfully confirmed."
+
+    return opt_in_local_mbr_gtxn.tx_id
+
+
+# Helper function: Sets up a poll whose voting period has already passed and returns its poll ID
+def setup_closed_poll(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    creator: AddressAndSigner,
+    title: bytes,
+    choices: list[bytes],
+) -> int:
+    date_format = "%m/%d/%Y"  # define the desired date format ~ motnh/day/year
+
+    # Choose a start date that won't trip method assertions
+    start_date_str = "12/22/2024"  #  write date as a string in specified format
+    start_date_unix = int(
+        time.mktime(time.strptime(start_date_str, date_format))
+    )  # Obtain start date unix via time module by passing the start date string and the date format
+
+    # Choose an end date that won't trip method assertions
+    end_date_str = "01/05/2025"  #  write date as a string in specified format
+    end_date_unix = int(
+        time.mktime(time.strptime(end_date_str, date_format))
+    )  # Obtain end date unix via time module by passing the start date string and the date format
+
+    return setup_poll(algorand, app_client, creator, title, choices, start_date_unix, end_date_unix)
+
+
+# Helper function: Sets up a poll that is open for voting (for the minimum 3 day voting period) and returns its poll ID
+def setup_open_poll(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    creator: AddressAndSigner,
+    title: bytes,
+    choices: list[bytes],
+    eligibility_root: bytes = OPEN_POLL_ROOT,
+) -> int:
+    # The voting period starts an hour ago, so a localnet clock running behind the host clock already accepts votes
+    start_date_unix = int(time.time()) - 60 * 60
+    end_date_unix = start_date_unix + 3 * 24 * 60 * 60
+
+    return setup_poll(
+        algorand, app_client, creator, title, choices, start_date_unix, end_date_unix, eligibility_root
     )
 
-    return app_client2
+
+# Helper function: Sets up a poll w/ the given voting period (as unix timestamps) and returns its poll ID
+def setup_poll(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    creator: AddressAndSigner,
+    title: bytes,
+    choices: list[bytes],
+    start_date_unix: int,
+    end_date_unix: int,
+    eligibility_root: bytes = OPEN_POLL_ROOT,
+) -> int:
+    date_format = "%m/%d/%Y"  # define the desired date format ~ motnh/day/year
+
+    # The App assigns the next poll ID to the poll (needed upfront for the box references)
+    poll_id = app_client.get_global_state().next_poll_id
+
+    # Prepare transaction with signer for creator poll record, poll choices and poll tally boxes MBR payment
+    creator_poll_boxes_mbr_pay_stxn = setup_stxn(
+        algorand,
+        creator,
+        app_client.app_address,
+        calc_poll_boxes_mbr(title, choices),
+        1000,  # 0.0025 ALGO per box + 0.0004 ALGO per box byte + 0.001 extra fee
+    )
+
+    # Use App client to send a group transaction that executes the 'setup_poll' abimethod and pays the MBR
+    setup_poll_txn = app_client.setup_poll(
+        mbr_pay=creator_poll_boxes_mbr_pay_stxn,
+        title=title,
+        choices=choices,
+        require_opt_in=False,
+        eligibility_root=eligibility_root,
+        start_date_str=time.strftime(date_format, time.localtime(start_date_unix)),
+        start_date_unix=start_date_unix,
+        end_date_str=time.strftime(date_format, time.localtime(end_date_unix)),
+        end_date_unix=end_date_unix,
+        transaction_parameters=TransactionParameters(
+            boxes=get_poll_box_references(poll_id, app_client.app_id)
+        ),
+    )
+
+    # Verify transaction was confirmed by the network
+    assert (
+        setup_poll_txn.confirmed_round
+    ), "Setup poll transaction round successfully confirmed."
+
+    # Verify the App assigned the next poll ID to the poll
+    assert setup_poll_txn.return_value == poll_id, "Poll gets the next poll ID."
+
+    # Log
+    get_txn_logs(algorand, setup_poll_txn.tx_id, logger)
+
+    return poll_id
+
+
+# Helper function: Finalizes the results of a closed poll and returns the winning choice
+def finalize_poll(algorand: AlgorandClient, app_client: VoteChainClient, poll_id: int) -> int:
+    # Pay the fee of the op-up inner transaction that extends the opcode budget for scanning the tally
+    suggested_params = algorand.client.algod.suggested_params()
+    suggested_params.flat_fee = True
+    suggested_params.fee = 2 * suggested_params.min_fee
+
+    # Use App client to send a transaction that executes the 'finalize_results' abimethod
+    finalize_txn = app_client.finalize_results(
+        poll_id=poll_id,
+        transaction_parameters=TransactionParameters(
+            suggested_params=suggested_params,
+            boxes=get_poll_box_references(poll_id, app_client.app_id),
+        ),
+    )
+
+    # Log
+    get_txn_logs(algorand, finalize_txn.tx_id, logger)
+
+    return finalize_txn.return_value
 
 
 # Test case for creator global storage allocation minimum balance requirement payment
@@ -105,8 +335,8 @@ def test_global_storage_mbr(
         algorand,
         creator,
         app_client.app_address,
-        628_000,
-        1000,  # 0.628 ALGO for every key-value + 0.001 extra fee
+        314_000,
+        1000,  # 0.314 ALGO for every key-value + 0.001 extra fee
     )
 
     # Use App client to send a group transaction that executes the 'global_storage_mbr' abimethod and pays the MBR
@@ -123,48 +353,25 @@ def test_opt_in_local_storage_mbr(
     algorand: AlgorandClient,
     app_client: VoteChainClient,
     app_client2: VoteChainClient,
-    creator: AddressAndSigner,
     dummy: AddressAndSigner,
 ) -> None:
 
-    # Prepare transaction with signer for creator local schema MBR payment
-    creator_local_mbr_pay_app_stxn = setup_stxn(
-        algorand,
-        creator,
-        app_client.app_address,
-        257_000,
-        1000,  # 0.257 ALGO for every key-value + 0.001 extra fee
-    )
-
-    # Use App client to send a group transaction that executes the 'local_storage_mbr' opt-in abimethod and pays the MBR
-    creator_opt_in_local_mbr_gtxn = app_client.opt_in_local_storage_mbr(
-        account=creator.address,
-        mbr_pay=creator_local_mbr_pay_app_stxn,
-        transaction_parameters=TransactionParameters(foreign_apps=[app_client.app_id]),
-    )
+    opted_in_before = app_client.get_global_state().total_accounts_opted_in
 
-    # Verify transaction was confirmed by the network
-    assert (
-        creator_opt_in_local_mbr_gtxn.confirmed_round
-    ), "Creator Local Opt-In gtxn round successfully confirmed."
-
-    # Do the same for the dummy account by using app_client2 (which references app_client by ID)
-    dummy_local_mbr_pay_app_stxn = setup_stxn(
-        algorand, dummy, app_client2.app_address, 257_000, 1000
-    )
+    # Opt the dummy account in by using app_client2 (which references app_client by ID)
+    dummy_opt_in_tx_id = opt_in(algorand, app_client2, dummy)
 
-    dummy_opt_in_local_mbr_gtxn = app_client2.opt_in_local_storage_mbr(
-        account=dummy.address,
-        mbr_pay=dummy_local_mbr_pay_app_stxn,
-        transaction_parameters=TransactionParameters(foreign_apps=[app_client2.app_id]),
-    )
+    # Verify the opt-in emitted an 'OptedIn' event for the dummy account
+    dummy_opt_in_logs = algorand.client.algod.pending_transaction_info(dummy_opt_in_tx_id)["logs"]
+    opted_in_events = decode_events(base64.b64decode(log) for log in dummy_opt_in_logs)["OptedIn"]
+    assert opted_in_events["account"] == [decode_address(dummy.address)], "OptedIn event emitted."
 
+    # Verify the App counts the opted in account
     assert (
-        dummy_opt_in_local_mbr_gtxn.confirmed_round
-    ), "Dummy Local Opt-In gtxn round successfully confirmed."
+        app_client.get_global_state().total_accounts_opted_in == opted_in_before + 1
+    ), "Dummy account opted in."
 
     # Log
-    log_local_state_info(app_client, creator.address, logger)
     log_local_state_info(app_client, dummy.address, logger)
 
 
@@ -172,52 +379,129 @@ def test_opt_in_local_storage_mbr(
 def test_opt_out_local_storage(
     algorand: AlgorandClient,
     app_client: VoteChainClient,
-    app_client2: VoteChainClient,
-    creator: AddressAndSigner,
-    dummy: AddressAndSigner,
+    opted_in_account: AddressAndSigner,
 ) -> None:
 
-    # Get creator account balance before close out method is called
-    creator_before_balance = algorand.account.get_information(creator.address)["amount"]
-    logger.info(f"Creator account balance before close out: {creator_before_balance}")
+    opted_in_before = app_client.get_global_state().total_accounts_opted_in
+    account_app_client2 = account_app_client(algorand, app_client, opted_in_account)
+
+    # Get account balance before close out method is called
+    before_balance = algorand.account.get_information(opted_in_account.address)["amount"]
+    logger.info(f"Account balance before close out: {before_balance}")
 
-    # Use App client to send a transaction that executes the 'out-out' close out abimethod for creator
-    creator_close_out_txn = app_client.close_out_opt_out(account=creator.address)
+    # Use App client to send a transaction that executes the 'out-out' close out abimethod for the account
+    close_out_txn = account_app_client2.close_out_opt_out(account=opted_in_account.address)
 
     # Verify transaction was confirmed by the network
     assert (
-        creator_close_out_txn.confirmed_round
-    ), "Creator opt out gtxn round successfully confirmed."
+        close_out_txn.confirmed_round
+    ), "Opt out gtxn round successfully confirmed."
 
-    # Get creator account balance after close out method is called
-    creator_after_balance = algorand.account.get_information(creator.address)["amount"]
+    # Verify the App no longer counts the account as opted in
+    assert (
+        app_client.get_global_state().total_accounts_opted_in == opted_in_before - 1
+    ), "Account opted out."
+
+    # Get account balance after close out method is called
+    after_balance = algorand.account.get_information(opted_in_account.address)["amount"]
 
     # Log
-    logger.info(f"Creator account balance after close out: {creator_after_balance}")
+    logger.info(f"Account balance after close out: {after_balance}")
     logger.info(f"Global State attributes: {vars(app_client.get_global_state())}")
-    get_txn_logs(algorand, creator_close_out_txn.tx_id, logger)
+    get_txn_logs(algorand, close_out_txn.tx_id, logger)
 
-    # Do the same test for dummy account
-    dummy_before_balance = algorand.account.get_information(dummy.address)["amount"]
-    logger.info(f"Dummy account balance before close out: {dummy_before_balance}")
 
-    dummy_close_out_txn = app_client2.close_out_opt_out(account=dummy.address)
+# Test case for a sponsored opt-in whose local storage MBR is refunded to the sponsor (not the account) on close out
+def test_sponsored_opt_in_opt_out(
+    algorand: AlgorandClient, app_client: VoteChainClient, account_pool: AccountPool
+) -> None:
+    sponsor, account = account_pool.take(2)
+
+    # Use the relayer helper to assemble the (sponsor MBR payment, zero fee opt-in call) pair and submit it
+    atc = AtomicTransactionComposer()
+    compose_sponsored_opt_in(
+        app_client,
+        atc,
+        algorand.client.algod.suggested_params(),
+        sponsor.address,
+        sponsor.signer,
+        account.address,
+        account.signer,
+    )
+    app_client.app_client.execute_atc(atc)
 
-    assert (
-        dummy_close_out_txn.confirmed_round
-    ), "Dummy opt out gtxn round successfully confirmed."
+    # Use App client to send a transaction that executes the 'out-out' close out abimethod for the account
+    close_out_txn = account_app_client(algorand, app_client, account).close_out_opt_out(account=account.address)
 
-    dummy_after_balance = algorand.account.get_information(dummy.address)["amount"]
+    # Verify the inner transaction refunds the local storage MBR (less its fee) to the sponsor
+    refund = algorand.client.algod.pending_transaction_info(close_out_txn.tx_id)["inner-txns"][0]["txn"]["txn"]
+    assert refund["rcv"] == sponsor.address, "Sponsor refunded."
+    assert refund["amt"] == LOCAL_STORAGE_MBR - 1000, "Local storage MBR refunded."
 
-    # Log
-    logger.info(f"Dummy account balance after close out: {dummy_after_balance}")
-    logger.info(f"Global State attributes: {vars(app_client.get_global_state())}")
-    get_txn_logs(algorand, dummy_close_out_txn.tx_id, logger)
+
+# Test case for mass opt-ins and opt-outs packed into 16 transaction groups by the bulk composer
+def test_bulk_opt_in_opt_out(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    account_pool: AccountPool,
+    signing_pool: ProcessPoolExecutor,
+) -> None:
+
+    # Take funded accounts from the pool (every opt-in is a MBR payment + app call pair, so 9 opt-ins need 2 groups),
+    # every account signs through the session's signing pool
+    accounts = [
+        AddressAndSigner(
+            address=account.address,
+            signer=ParallelTransactionSigner(account.signer.private_key, signing_pool),
+        )
+        for account in account_pool.take(9)
+    ]
+
+    opted_in_before = app_client.get_global_state().total_accounts_opted_in
+
+    # Add an opt-in call per account (every account signs its own MBR payment and app call)
+    bulk_opt_in = BulkComposer(app_client)
+    for account in accounts:
+        bulk_opt_in.add(
+            lambda composer, account=account: composer.opt_in_local_storage_mbr(
+                account=account.address,
+                mbr_pay=setup_stxn(algorand, account, app_client.app_address, 278_500),
+                transaction_parameters=TransactionParameters(
+                    sender=account.address, signer=account.signer
+                ),
+            )
+        )
+
+    # Verify every opt-in was confirmed and its result maps back to its input position
+    opt_in_results = bulk_opt_in.execute()
+    assert all(result.confirmed for result in opt_in_results), "Every opt-in confirmed."
+    assert [result.index for result in opt_in_results] == list(range(len(accounts))), "Results keep input order."
+    assert (
+        app_client.get_global_state().total_accounts_opted_in == opted_in_before + len(accounts)
+    ), "Every account opted in."
+
+    # Opt every account out again (single transaction calls)
+    bulk_opt_out = BulkComposer(app_client)
+    for account in accounts:
+        bulk_opt_out.add(
+            lambda composer, account=account: composer.close_out_opt_out(
+                account=account.address,
+                transaction_parameters=TransactionParameters(
+                    sender=account.address, signer=account.signer
+                ),
+            )
+        )
+
+    assert all(result.confirmed for result in bulk_opt_out.execute()), "Every opt-out confirmed."
+    assert (
+        app_client.get_global_state().total_accounts_opted_in == opted_in_before
+    ), "Every account opted out."
 
 
 # Test case for set vote dates method
-def test_setup_poll(algorand: AlgorandClient, app_client: VoteChainClient) -> None:
-    date_format = "%m/%d/%Y"  # define the desired date format ~ motnh/day/year
+def test_setup_poll(
+    algorand: AlgorandClient, app_client: VoteChainClient, creator: AddressAndSigner
+) -> None:
 
     title = (
     b"01234567890123456789012345678901234567890123456789012345678"
@@ -229,69 +513,464 @@ def test_setup_poll(algorand: AlgorandClient, app_client: VoteChainClient) -> No
 
     choice2 = b"Twice"
     choice3 = b""
+    choices = [choice1, choice2, choice3]
 
-    # Choose a start date that won't trip method assertions
-    start_date_str = "12/22/2024"  #  write date as a string in specified format
-    start_date_unix = int(
-        time.mktime(time.strptime(start_date_str, date_format))
-    )  # Obtain start date unix via time module by passing the start date string and the date format
+    total_polls_before = app_client.get_global_state().total_polls
 
-    # Choose an end date that won't trip method assertions
-    end_date_str = "01/05/2025"  #  write date as a string in specified format
-    end_date_unix = int(
-        time.mktime(time.strptime(end_date_str, date_format))
-    )  # Obtain end date unix via time module by passing the start date string and the date format
+    # Set up a poll w/ max size title and choice (voting period dates won't trip method assertions)
+    poll_id = setup_closed_poll(algorand, app_client, creator, title, choices)
 
-    # Use App client to send a transaction that executes the 'set_vote_dates' abimethod
-    setup_poll_txn = app_client.setup_poll(
-        title=title,
-        choice1=choice1,
-        choice2=choice2,
-        choice3=choice3,
-        start_date_str=start_date_str,
-        start_date_unix=start_date_unix,
-        end_date_str=end_date_str,
-        end_date_unix=end_date_unix,
+    # Verify the poll record and the poll tally holding a zero vote total for every choice
+    poll = get_poll(app_client, poll_id)
+    assert poll.title == title and poll.choice_count == 3, "Poll record matches."
+    assert poll.eligibility_root == OPEN_POLL_ROOT, "Poll is open to every account."
+    assert get_poll_tally(app_client, poll_id) == [0, 0, 0], "Poll tally starts at zero."
+    assert app_client.get_global_state().total_polls == total_polls_before + 1, "Poll counted."
+
+    # Verify the read-only snapshot returns the same poll state in one simulated call
+    snapshot = get_poll_snapshot(app_client, poll_id)
+    assert snapshot.choices == choices, "Snapshot choices match."
+    assert snapshot.tally == [0, 0, 0], "Snapshot tally starts at zero."
+    assert not snapshot.finalized, "Results are not finalized until 'finalize_results' is called."
+
+    # Verify the snapshot of the finalized poll holds the frozen results (a zero tally tie goes to choice 1)
+    assert finalize_poll(algorand, app_client, poll_id) == 1, "Choice 1 won the tie."
+    snapshot = get_poll_snapshot(app_client, poll_id)
+    assert snapshot.finalized, "Snapshot is finalized."
+    assert (snapshot.winner, snapshot.winner_margin) == (1, 0), "Snapshot results match."
+
+
+# Test case for submit vote method (poll end date has passed, so the vote gets rejected)
+def test_submit_vote(
+    algorand: AlgorandClient,
+    app_client2: VoteChainClient,
+    dummy: AddressAndSigner,
+    closed_poll: int,
+) -> None:
+
+    ballot_boxes_before = app_client2.get_global_state().total_ballot_boxes
+
+    # Prepare transaction with signer for dummy ballot box MBR payment
+    dummy_box_mbr_pay_stxn = setup_stxn(
+        algorand,
+        dummy,
+        app_client2.app_address,
+        34_900,
+        1000,  # 0.0349 ALGO for the ballot box key-value + 0.001 extra fee
     )
 
-    # Verify transaction was confirmed by the network
+    # Use App client to send a group transaction that executes the 'submit_vote' abimethod and pays the MBR
+    with pytest.raises(LogicError):
+        app_client2.submit_vote(
+            poll_id=closed_poll,
+            account=dummy.address,
+            mbr_pay=dummy_box_mbr_pay_stxn,
+            choice=2,
+            proof=[],
+            transaction_parameters=TransactionParameters(
+                boxes=[
+                    (app_client2.app_id, get_poll_box_name(closed_poll)),
+                    (app_client2.app_id, get_poll_tally_box_name(closed_poll)),
+                    (app_client2.app_id, get_ballot_box_name(closed_poll, dummy.address)),
+                ]
+            ),
+        )
+
+    # Verify no ballot box was created for the dummy account
     assert (
-        setup_poll_txn.confirmed_round
-    ), "Setup poll transaction round successfully confirmed."
+        app_client2.get_global_state().total_ballot_boxes == ballot_boxes_before
+    ), "Rejected vote must not create a ballot box."
+
+    # Verify the bulk voter status read reports the (never opted in) dummy account as not having voted
+    status = get_voter_statuses(app_client2, closed_poll, [dummy.address])[dummy.address]
+    assert not status.opted_in and not status.voted and status.choice == 0, "Dummy has not voted."
 
-    # Log
-    logger.info("TEST SETUP POLL BELOW:")
-    get_txn_logs(algorand, setup_poll_txn.tx_id, logger)
 
+# Test case for relayer submit vote batch method (poll end date has passed, so the whole batch gets rejected)
+def test_submit_vote_batch(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    creator: AddressAndSigner,
+    closed_poll: int,
+) -> None:
 
+    ballot_boxes_before = app_client.get_global_state().total_ballot_boxes
 
-# Test case for submit vote method
-# def test_submit_vote(
-#     algorand: AlgorandClient,
-#     app_client: VoteChainClient,
-#     app_client2: VoteChainClient,
-#     creator: AddressAndSigner,
-#     dummy: AddressAndSigner,
-# ) -> None:
-#     creator_submit_vote_txn = app_client.submit_vote(account=creator.address, choice=1)
-#     assert creator_submit_vote_txn.confirmed_round
+    # Create random voter accounts that never opt in or hold ALGO (the creator acts as the relayer for the batch)
+    voters = [algorand.account.random() for _ in range(3)]
+    choices = [1, 2, 3]
 
-#     # dummy_submit_vote_txn = app_client2.submit_vote(account=dummy.address, choice=2)
-#     # assert dummy_submit_vote_txn.confirmed_round
+    # Every voter signs their own ballot off-chain
+    signatures = [
+        sign_ballot(voter, app_client.app_id, closed_poll, choice)
+        for voter, choice in zip(voters, choices, strict=True)
+    ]
 
-#     # Log info
-#     logger.info(f"Global State attributes: {vars(app_client.get_global_state())}")
-#     log_local_state_info(app_client, creator.address, logger)
-#     # log_local_state_info(app_client, dummy.address, logger)
+    # Prepare transaction with signer for the relayer paying the ballot box MBR of the whole batch
+    relayer_box_mbr_pay_stxn = setup_stxn(
+        algorand,
+        creator,
+        app_client.app_address,
+        34_900 * len(voters),
+        1000,  # 0.0349 ALGO for every ballot box key-value + 0.001 extra fee
+    )
 
-#     get_txn_logs(algorand, creator_submit_vote_txn.tx_id, logger)
+    # Use App client to send a group transaction that executes the 'submit_vote_batch' abimethod and pays the MBR
+    with pytest.raises(LogicError):
+        app_client.submit_vote_batch(
+            poll_id=closed_poll,
+            mbr_pay=relayer_box_mbr_pay_stxn,
+            voters=[voter.address for voter in voters],
+            choices=choices,
+            signatures=signatures,
+            transaction_parameters=TransactionParameters(
+                accounts=[voter.address for voter in voters],
+                boxes=[
+                    (app_client.app_id, get_poll_box_name(closed_poll)),
+                    (app_client.app_id, get_poll_tally_box_name(closed_poll)),
+                ]
+                + [
+                    (app_client.app_id, get_ballot_box_name(closed_poll, voter.address))
+                    for voter in voters
+                ],
+            ),
+        )
+
+    # Verify no ballot boxes were created for the batch voters
+    assert (
+        app_client.get_global_state().total_ballot_boxes == ballot_boxes_before
+    ), "Rejected vote batch must not create ballot boxes."
 
 
-# Test case for deleting the smart contract App client
-def test_delete_app(
-    algorand: AlgorandClient, app_client: VoteChainClient, creator: AddressAndSigner
+# Test case for sponsored votes (poll end date has passed, so the sponsored vote group gets rejected)
+def test_submit_sponsored_votes(
+    app_client: VoteChainClient,
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    closed_poll: int,
+) -> None:
+
+    ballot_boxes_before = app_client.get_global_state().total_ballot_boxes
+
+    # Create random voter accounts that hold no ALGO (the creator sponsors the MBR and every fee of the group)
+    voters = [algorand.account.random() for _ in range(2)]
+    ballots = [
+        SponsoredBallot(voter=voter.address, signer=voter.signer, poll_id=closed_poll, choice=1)
+        for voter in voters
+    ]
+
+    # Use the relayer helper to assemble the (sponsor MBR payment, zero fee vote call) pairs and submit the group
+    with pytest.raises(LogicError):
+        submit_sponsored_votes(app_client, creator.address, creator.signer, ballots)
+
+    # Verify no ballot boxes were created for the sponsored voters
+    assert (
+        app_client.get_global_state().total_ballot_boxes == ballot_boxes_before
+    ), "Rejected sponsored votes must not create ballot boxes."
+
+
+# Test case for submit vote method on an open poll (the vote is counted and a second vote of the account is rejected)
+def test_submit_vote_open_poll(
+    algorand: AlgorandClient,
+    app_client2: VoteChainClient,
+    dummy: AddressAndSigner,
+    open_poll: int,
 ) -> None:
 
+    ballot_boxes_before = app_client2.get_global_state().total_ballot_boxes
+
+    # Helper function: Submits the dummy's vote w/ the ballot box MBR payment
+    def submit_vote(choice: int) -> None:
+        app_client2.submit_vote(
+            poll_id=open_poll,
+            account=dummy.address,
+            mbr_pay=setup_stxn(algorand, dummy, app_client2.app_address, 34_900, 1000),
+            choice=choice,
+            proof=[],
+            transaction_parameters=TransactionParameters(
+                boxes=[
+                    (app_client2.app_id, get_poll_box_name(open_poll)),
+                    (app_client2.app_id, get_poll_tally_box_name(open_poll)),
+                    (app_client2.app_id, get_ballot_box_name(open_poll, dummy.address)),
+                ]
+            ),
+        )
+
+    submit_vote(2)
+
+    # Verify the vote was counted and the ballot box holds the choice and the account that paid its MBR
+    assert get_poll_tally(app_client2, open_poll) == [0, 1, 0], "Vote counted for choice 2."
+    assert get_ballot(app_client2, open_poll, dummy.address) == Ballot(
+        choice=2, mbr_payer=dummy.address
+    ), "Ballot box holds the vote."
+    assert (
+        app_client2.get_global_state().total_ballot_boxes == ballot_boxes_before + 1
+    ), "Ballot box counted."
+    status = get_voter_statuses(app_client2, open_poll, [dummy.address])[dummy.address]
+    assert status.voted and status.choice == 2, "Dummy has voted."
+
+    # Verify the account can not vote twice in the same poll
+    with pytest.raises(LogicError):
+        submit_vote(1)
+    assert get_poll_tally(app_client2, open_poll) == [0, 1, 0], "Second vote not counted."
+
+
+# Test case for relayer submit vote batch method on an open poll (every signed ballot of the batch is counted)
+def test_submit_vote_batch_open_poll(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    creator: AddressAndSigner,
+    open_poll: int,
+) -> None:
+
+    ballot_boxes_before = app_client.get_global_state().total_ballot_boxes
+
+    # Create random voter accounts that never opt in or hold ALGO (the creator acts as the relayer for the batch)
+    voters = [algorand.account.random() for _ in range(3)]
+    choices = [1, 2, 2]
+    signatures = [
+        sign_ballot(voter, app_client.app_id, open_poll, choice)
+        for voter, choice in zip(voters, choices, strict=True)
+    ]
+
+    # The relayer pays the op-up inner transactions that extend the opcode budget for verifying every signature
+    suggested_params = algorand.client.algod.suggested_params()
+    suggested_params.flat_fee = True
+    suggested_params.fee = 12 * suggested_params.min_fee
+
+    # Use App client to send a group transaction that executes the 'submit_vote_batch' abimethod and pays the MBR
+    app_client.submit_vote_batch(
+        poll_id=open_poll,
+        mbr_pay=setup_stxn(algorand, creator, app_client.app_address, 34_900 * len(voters), 1000),
+        voters=[voter.address for voter in voters],
+        choices=choices,
+        signatures=signatures,
+        transaction_parameters=TransactionParameters(
+            suggested_params=suggested_params,
+            accounts=[voter.address for voter in voters],
+            boxes=[
+                (app_client.app_id, get_poll_box_name(open_poll)),
+                (app_client.app_id, get_poll_tally_box_name(open_poll)),
+            ]
+            + [(app_client.app_id, get_ballot_box_name(open_poll, voter.address)) for voter in voters],
+        ),
+    )
+
+    # Verify every ballot was counted and the relayer is refunded the ballot box MBR on release
+    assert get_poll_tally(app_client, open_poll) == [1, 2, 0], "Batch votes counted."
+    for voter, choice in zip(voters, choices, strict=True):
+        assert get_ballot(app_client, open_poll, voter.address) == Ballot(
+            choice=choice, mbr_payer=creator.address
+        ), "Ballot box holds the relayed vote."
+    assert (
+        app_client.get_global_state().total_ballot_boxes == ballot_boxes_before + len(voters)
+    ), "Ballot boxes counted."
+
+
+# Test case for submit vote method on a poll w/ an eligibility root (a valid Merkle proof is accepted, a proof of
+# another account and an empty proof are rejected)
+def test_submit_vote_merkle_eligibility(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    creator: AddressAndSigner,
+    account_pool: AccountPool,
+) -> None:
+
+    # Only the first 3 of 5 accounts are eligible (a tree of 3 leaves gives proofs of different lengths)
+    accounts = account_pool.take(5)
+    eligible, ineligible = accounts[:3], accounts[3:]
+    root, proofs = build_merkle_proofs(
+        (account.address for account in eligible), [account.address for account in eligible]
+    )
+    poll_id = setup_open_poll(
+        algorand, app_client, creator, title=b"Eligible poll", choices=[b"Yes", b"No"], eligibility_root=root
+    )
+    assert get_poll(app_client, poll_id).eligibility_root == root, "Poll stores the eligibility root."
+
+    # Helper function: Submits an account's vote for choice 1 w/ the given Merkle proof
+    def submit_vote(account: AddressAndSigner, proof: list[bytes]) -> None:
+        account_app_client(algorand, app_client, account).submit_vote(
+            poll_id=poll_id,
+            account=account.address,
+            mbr_pay=setup_stxn(algorand, account, app_client.app_address, 34_900, 1000),
+            choice=1,
+            proof=proof,
+            transaction_parameters=TransactionParameters(
+                boxes=[
+                    (app_client.app_id, get_poll_box_name(poll_id)),
+                    (app_client.app_id, get_poll_tally_box_name(poll_id)),
+                    (app_client.app_id, get_ballot_box_name(poll_id, account.address)),
+                ]
+            ),
+        )
+
+    # Verify eligible accounts voting w/ their own proofs are counted
+    for account in eligible:
+        submit_vote(account, proofs[account.address])
+    assert get_poll_tally(app_client, poll_id) == [3, 0], "Eligible votes counted."
+
+    # Verify an ineligible account is rejected w/ the proof of an eligible account or w/o a proof
+    with pytest.raises(LogicError):
+        submit_vote(ineligible[0], proofs[eligible[0].address])
+    with pytest.raises(LogicError):
+        submit_vote(ineligible[1], [])
+    assert get_poll_tally(app_client, poll_id) == [3, 0], "Ineligible votes not counted."
+
+
+# Test case for finalizing the results of a closed poll and verifying them against the (empty) exported ballots
+def test_finalize_results(algorand: AlgorandClient, app_client: VoteChainClient, closed_poll: int) -> None:
+
+    # Verify a poll without votes is a tie won by choice number 1 w/ a zero margin
+    assert finalize_poll(algorand, app_client, closed_poll) == 1, "Tie goes to the lowest choice number."
+
+    poll = get_poll(app_client, closed_poll)
+    assert poll.finalized and poll.winner_margin == 0, "Poll results are frozen."
+
+    # Verify the recomputed ballot hash chain and results match the finalized poll record
+    verification = verify_poll_results(app_client, closed_poll, [])
+    assert verification.verified, "Poll results verified."
+
+
+# Test case for rebuilding the poll tally and opted in accounts by following every block since the App creation
+def test_block_follower(
+    algorand: AlgorandClient,
+    app_client: VoteChainClient,
+    indexer_client: IndexerClient,
+    tmp_path: Path,
+    finalized_poll: int,
+    opted_in_account: AddressAndSigner,
+) -> None:
+
+    # Follow every round from the App creation round up to the current round
+    created_at_round = indexer_client.applications(app_client.app_id)["application"]["created-at-round"]
+    last_round = algorand.client.algod.status()["last-round"]
+    checkpoint_path = tmp_path / "follower.json"
+    block_cache = BlockCache(algorand.client.algod, tmp_path / "blocks")
+
+    follower = BlockFollower(
+        algorand.client.algod,
+        app_client.app_id,
+        start_round=created_at_round,
+        checkpoint_path=checkpoint_path,
+        block_cache=block_cache,
+    )
+    updates = list(follower.follow(max_rounds=last_round - created_at_round + 1))
+    poll = follower.state.polls[finalized_poll]
+
+    # Verify the followed state matches the App state
+    assert updates[-1].round_num == last_round, "Followed up to the current round."
+    assert poll.tally == get_poll_tally(app_client, finalized_poll), "Tally matches."
+    assert poll.winner == get_poll(app_client, finalized_poll).winner, "Winner matches."
+    assert opted_in_account.address in follower.state.opted_in, "Opted in account followed."
+    assert (
+        len(follower.state.opted_in) == app_client.get_global_state().total_accounts_opted_in
+    ), "Opted in accounts match."
+
+    # Verify a follower resumed from the checkpoint continues w/ the same state
+    resumed = BlockFollower(algorand.client.algod, app_client.app_id, checkpoint_path=checkpoint_path)
+    assert resumed.state.last_round <= last_round, "Resumes from a processed round."
+    assert resumed.state.polls[finalized_poll].tally == poll.tally, "Checkpoint keeps the tally."
+
+    # Verify replaying the followed rounds reads the cached blocks instead of fetching them again
+    fetches = block_cache.fetches
+    replay = BlockFollower(
+        algorand.client.algod, app_client.app_id, start_round=created_at_round, block_cache=block_cache
+    )
+    list(replay.follow(max_rounds=last_round - created_at_round + 1))
+    assert block_cache.fetches == fetches, "Replay served from the block cache."
+    assert replay.state.polls[finalized_poll].tally == poll.tally, "Replay keeps the tally."
+
+
+# Test case for reading the App and poll state through the async client (results must match the synchronous readers)
+def test_async_client_reads(
+    algorand: AlgorandClient, app_client: VoteChainClient, dummy: AddressAndSigner, closed_poll: int
+) -> None:
+
+    async def read_state() -> tuple:
+        async with async_client.AsyncAlgod.from_algod_client(algorand.client.algod) as async_algod:
+            client = async_client.AsyncVoteChainClient(async_algod, app_id=app_client.app_id)
+            return await asyncio.gather(
+                client.get_global_state(),
+                async_client.get_poll_state(client, closed_poll),
+                async_client.get_voter_statuses(client, closed_poll, [dummy.address]),
+            )
+
+    global_state, poll_state, statuses = asyncio.run(read_state())
+
+    # Verify the async readers return the same state as the synchronous readers
+    assert vars(global_state) == vars(app_client.get_global_state()), "Global state matches."
+    assert poll_state.poll == get_poll(app_client, closed_poll), "Poll record matches."
+    assert poll_state.tally == get_poll_tally(app_client, closed_poll), "Poll tally matches."
+    assert statuses == get_voter_statuses(app_client, closed_poll, [dummy.address]), "Voter status matches."
+
+
+# Test case for sweeping the ballot boxes of a closed poll (nobody voted, so there is nothing to release)
+def test_sweep(app_client: VoteChainClient, dummy: AddressAndSigner, closed_poll: int) -> None:
+
+    # Use App client to send a transaction that executes the 'sweep' abimethod for an account without a ballot box
+    sweep_txn = app_client.sweep(
+        poll_id=closed_poll,
+        accounts=[dummy.address],
+        transaction_parameters=TransactionParameters(
+            accounts=[dummy.address],
+            boxes=[
+                (app_client.app_id, get_poll_box_name(closed_poll)),
+                (app_client.app_id, get_poll_tally_box_name(closed_poll)),
+                (app_client.app_id, get_ballot_box_name(closed_poll, dummy.address)),
+            ],
+        ),
+    )
+
+    # Verify accounts without a ballot box are skipped
+    assert sweep_txn.return_value == 0, "No ballot boxes were swept."
+
+    # Verify the sweep driver finds no ballot boxes left to release
+    assert sweep_poll(app_client, closed_poll) == 0, "Poll has no ballot boxes."
+
+
+# Test case for deleting a closed poll w/ poll boxes minimum balance requirement payment refund
+def test_delete_poll(
+    algorand: AlgorandClient, app_client: VoteChainClient, creator: AddressAndSigner, closed_poll: int
+) -> None:
+
+    total_polls_before = app_client.get_global_state().total_polls
+
+    # Get creator account balance before delete poll method is called
+    creator_before_balance = algorand.account.get_information(creator.address)["amount"]
+    logger.info(f"Creator account balance before poll deletion: {creator_before_balance}")
+
+    # Use App client to send a transaction that executes the 'delete_poll' abimethod
+    delete_poll_txn = app_client.delete_poll(
+        poll_id=closed_poll,
+        transaction_parameters=TransactionParameters(
+            boxes=get_poll_box_references(closed_poll, app_client.app_id)
+        ),
+    )
+
+    # Verify transaction was confirmed by the network
+    assert (
+        delete_poll_txn.confirmed_round
+    ), "Delete poll transaction round successfully confirmed."
+
+    # Verify the App no longer holds the poll
+    assert app_client.get_global_state().total_polls == total_polls_before - 1, "Poll was deleted."
+
+    # Get creator account balance after delete poll method is called
+    creator_after_balance = algorand.account.get_information(creator.address)["amount"]
+
+    # Log
+    logger.info(f"Creator account balance after poll deletion: {creator_after_balance}")
+
+
+# Test case for deleting a smart contract App (a throwaway App, the worker's App stays available to other tests)
+def test_delete_app(algorand: AlgorandClient, creator: AddressAndSigner) -> None:
+
+    # Create the App and pay its global schema MBR (refunded to the creator when the App is deleted)
+    app_client = create_app(algorand, creator)
+    app_client.global_storage_mbr(
+        mbr_pay=setup_stxn(algorand, creator, app_client.app_address, 314_000, 1000)
+    )
+
     # Get creator account balance before delete method is called
     creator_before_balance = algorand.account.get_information(creator.address)["amount"]
     logger.info(f"Creator account balance before deletion: {creator_before_balance}")